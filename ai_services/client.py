@@ -1,6 +1,5 @@
 # ai_services/client.py
 import os
-import time
 import asyncio
 import logging
 from typing import Optional
@@ -8,6 +7,8 @@ from typing import Optional
 from dotenv import load_dotenv
 from google import genai  # NEW: google-genai SDK
 
+from app.shared.resilience import CircuitBreaker, CircuitBreakerOpenError, get_circuit_breaker
+
 # --- Configuration ---
 load_dotenv()
 API_KEY = os.getenv("GOOGLE_API_KEY")
@@ -24,43 +25,15 @@ if not logger.handlers:
     logger.setLevel(logging.INFO)
 
 # --- Circuit Breaker Pattern ---
-class CircuitBreakerOpen(Exception):
-    pass
-
-
-class CircuitBreaker:
-    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60):
-        self.failure_threshold = failure_threshold
-        self.recovery_timeout = recovery_timeout
-        self.failures = 0
-        self.last_failure_time = 0.0
-        self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
-
-    def record_failure(self) -> None:
-        self.failures += 1
-        self.last_failure_time = time.time()
-        if self.failures >= self.failure_threshold:
-            self.state = "OPEN"
-            logger.warning("🔥 Circuit Breaker OPENED. AI Service paused.")
-
-    def record_success(self) -> None:
-        if self.state != "CLOSED":
-            logger.info("✅ Circuit Breaker RECOVERED.")
-        self.failures = 0
-        self.state = "CLOSED"
-
-    def check(self) -> bool:
-        if self.state == "OPEN":
-            if time.time() - self.last_failure_time > self.recovery_timeout:
-                self.state = "HALF_OPEN"
-                return True  # Try one request
-            raise CircuitBreakerOpen("AI Service is temporarily down.")
-        return True
+# Shared sliding-window breaker (app.shared.resilience): bounded half-open
+# probing, state-transition metrics. Back-compat name for callers catching
+# the old exception:
+CircuitBreakerOpen = CircuitBreakerOpenError
 
 
 # Global Singletons
 _client: Optional["genai.Client"] = None
-_breaker = CircuitBreaker()
+_breaker: CircuitBreaker = get_circuit_breaker("gemini", recovery_timeout=60)
 
 
 def _initialize() -> bool:
@@ -103,18 +76,12 @@ async def generate_async(prompt: str, max_retries: int = 3) -> str:
     if not _initialize():
         return ""
 
-    # 2. Circuit Breaker Check
-    try:
-        _breaker.check()
-    except CircuitBreakerOpen:
-        logger.error("Request blocked by Circuit Breaker.")
-        return ""
-
     wait_time = 2  # Start with 2 seconds wait
 
     for attempt in range(1, max_retries + 1):
         try:
-            # 3. Non-blocking Execution (run blocking call in a thread)
+            # 2. Non-blocking Execution (run blocking call in a thread), through
+            #    the circuit breaker: fails fast while the service is down.
             def _call():
                 # _client is guaranteed set if _initialize() returned True
                 return _client.models.generate_content(  # type: ignore[union-attr]
@@ -122,15 +89,17 @@ async def generate_async(prompt: str, max_retries: int = 3) -> str:
                     contents=prompt,
                 )
 
-            response = await asyncio.to_thread(_call)
+            response = await _breaker.a_call(asyncio.to_thread, _call)
 
             # Success!
-            _breaker.record_success()
             return _extract_text(response)
 
+        except CircuitBreakerOpenError:
+            logger.error("Request blocked by Circuit Breaker.")
+            return ""
+
         except Exception as e:
             logger.warning(f"Attempt {attempt}/{max_retries} failed: {e}")
-            _breaker.record_failure()
 
             if attempt < max_retries:
                 await asyncio.sleep(wait_time)
@@ -0,0 +1,459 @@
+# app/adapters/api/admission.py
+"""
+Admission control for the generation API.
+
+Every generation request ends up behind GF linearization or a family engine;
+accepting all of them under a burst only grows the queue (and p99) without
+bound. `AdmissionControlMiddleware` sits in front of the generation routes and:
+
+- caps in-flight requests per route group (`generate`, `document`) with an
+  adaptive limit: additive increase while latency stays under target,
+  multiplicative decrease when it does not (AIMD);
+- caps in-flight requests per language (`/generate/{lang_code}...`), so one
+  hot language cannot take every slot;
+- parks excess requests in a bounded FIFO queue, honouring the caller's
+  deadline (`X-Request-Deadline`: epoch seconds, or `X-Request-Timeout`:
+  seconds), and rejects with 503 + `Retry-After` as soon as the expected
+  queue wait would overrun it, instead of after the wait;
+- exposes the caller's deadline to handlers as `request.state.deadline`
+  (epoch seconds); the generation router bounds generation by it and answers
+  504 when it passes mid-generation. Without either header the state is None:
+  `ADMISSION_DEFAULT_TIMEOUT_SEC` then bounds only the queue wait, never
+  generation itself.
+
+Only the path is inspected: requests to `POST /generate` (language in the
+payload) are limited per route, not per language.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import structlog
+
+from app.shared.config import settings
+from app.shared.telemetry import record_admission, record_admission_limit
+
+logger = structlog.get_logger()
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# POST <prefix>/generate, <prefix>/generate/{lang}, <prefix>/generate/{lang}/document
+_GENERATION_PATH = re.compile(r"/generate(?:/(?P<lang>[^/]+)(?P<document>/document)?)?/?$")
+
+# Latency estimate used before the first request on a limiter completes.
+_INITIAL_LATENCY_SEC = 0.1
+_EWMA_ALPHA = 0.2
+_MAX_LANGUAGE_LIMITERS = 512
+
+
+class AdmissionRejected(Exception):
+    """Raised by `Limiter.acquire` when a request is shed."""
+
+    def __init__(self, reason: str, retry_after_sec: float) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after_sec = retry_after_sec
+
+
+class AIMDLimit:
+    """
+    Adaptive concurrency limit.
+
+    Each request that finishes under `target_latency_sec` adds `1 / limit`
+    (about +1 per round of `limit` requests); a slow or failed one multiplies
+    the limit by `backoff`, at most once per `target_latency_sec` so a single
+    burst of slow completions counts as one congestion signal.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        target_latency_sec: float = 0.5,
+        backoff: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.target_latency_sec = float(target_latency_sec)
+        self.backoff = min(max(float(backoff), 0.1), 0.99)
+        self.clock = clock
+        self._limit = float(min(max(int(initial), self.min_limit), self.max_limit))
+        self._last_decrease = float("-inf")
+
+    @property
+    def value(self) -> int:
+        return int(self._limit)
+
+    def on_sample(self, latency_sec: float, *, ok: bool = True) -> None:
+        if ok and latency_sec <= self.target_latency_sec:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            return
+        now = self.clock()
+        if now - self._last_decrease < self.target_latency_sec:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+
+
+class FixedLimit:
+    def __init__(self, limit: int) -> None:
+        self._limit = max(1, int(limit))
+
+    @property
+    def value(self) -> int:
+        return self._limit
+
+    def on_sample(self, latency_sec: float, *, ok: bool = True) -> None:
+        return None
+
+
+class Limiter:
+    """Concurrency limit + bounded FIFO wait queue with deadline-aware admission."""
+
+    def __init__(
+        self,
+        name: str,
+        limit: Any,
+        *,
+        max_queue: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.limit = limit
+        self.max_queue = max(0, int(max_queue))
+        self.clock = clock
+        self.inflight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._latency_ewma = _INITIAL_LATENCY_SEC
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def idle(self) -> bool:
+        return self.inflight == 0 and not self._waiters
+
+    def estimated_wait(self, position: int) -> float:
+        """Expected wait for the `position`-th queued request (1-based)."""
+        if position <= 0:
+            return 0.0
+        return position * self._latency_ewma / max(1, self.limit.value)
+
+    async def acquire(self, deadline: Optional[float]) -> float:
+        """
+        Take a slot, waiting in line if needed. Returns the time spent queued.
+        `deadline` is on this limiter's clock. Raises AdmissionRejected.
+        """
+        if self.inflight < self.limit.value and not self._waiters:
+            self.inflight += 1
+            return 0.0
+
+        position = len(self._waiters) + 1
+        expected = self.estimated_wait(position)
+        if position > self.max_queue:
+            raise AdmissionRejected("queue_full", expected)
+        started = self.clock()
+        if deadline is not None and started + expected > deadline:
+            raise AdmissionRejected("deadline", expected)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        timeout = None if deadline is None else max(0.0, deadline - started)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except asyncio.TimeoutError:
+            if not waiter.done():
+                self._remove(waiter)
+                raise AdmissionRejected("deadline_expired", self.estimated_wait(len(self._waiters) + 1))
+            # Granted just as the deadline hit: keep the slot.
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # slot was handed to us; pass it on
+            else:
+                self._remove(waiter)
+            raise
+        return self.clock() - started
+
+    def release(self, latency_sec: Optional[float] = None, *, ok: bool = True) -> None:
+        self.inflight = max(0, self.inflight - 1)
+        if latency_sec is not None:
+            self._latency_ewma += _EWMA_ALPHA * (latency_sec - self._latency_ewma)
+            self.limit.on_sample(latency_sec, ok=ok)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.inflight < self.limit.value:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.inflight += 1
+            waiter.set_result(None)
+
+    def _remove(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        waiter.cancel()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit.value,
+            "inflight": self.inflight,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "latency_ewma_ms": round(self._latency_ewma * 1000.0, 1),
+        }
+
+
+@dataclass
+class AdmissionTicket:
+    route: str
+    limiters: List[Limiter]
+    admitted_at: float
+    queue_sec: float
+
+
+class AdmissionController:
+    """Per-route adaptive limiters plus per-(route, language) fixed limiters."""
+
+    ROUTES = ("generate", "document")
+
+    def __init__(
+        self,
+        *,
+        route_limit: int = 64,
+        route_initial_limit: int = 16,
+        route_min_limit: int = 2,
+        language_limit: int = 8,
+        max_queue: int = 128,
+        adaptive: bool = True,
+        target_latency_sec: float = 0.5,
+        default_timeout_sec: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.language_limit = max(1, int(language_limit))
+        self.max_queue = max(0, int(max_queue))
+        self.default_timeout_sec = float(default_timeout_sec)
+        self.clock = clock
+        self.routes: Dict[str, Limiter] = {}
+        for route in self.ROUTES:
+            limit: Any
+            if adaptive:
+                limit = AIMDLimit(
+                    route_initial_limit,
+                    min_limit=route_min_limit,
+                    max_limit=route_limit,
+                    target_latency_sec=target_latency_sec,
+                    clock=clock,
+                )
+            else:
+                limit = FixedLimit(route_limit)
+            self.routes[route] = Limiter(route, limit, max_queue=self.max_queue, clock=clock)
+        self._languages: "OrderedDict[Tuple[str, str], Limiter]" = OrderedDict()
+
+    @classmethod
+    def from_settings(cls) -> "AdmissionController":
+        return cls(
+            route_limit=settings.ADMISSION_MAX_CONCURRENCY,
+            route_initial_limit=settings.ADMISSION_INITIAL_CONCURRENCY,
+            route_min_limit=settings.ADMISSION_MIN_CONCURRENCY,
+            language_limit=settings.ADMISSION_PER_LANGUAGE_CONCURRENCY,
+            max_queue=settings.ADMISSION_MAX_QUEUE,
+            adaptive=settings.ADMISSION_ADAPTIVE,
+            target_latency_sec=settings.ADMISSION_TARGET_LATENCY_SEC,
+            default_timeout_sec=settings.ADMISSION_DEFAULT_TIMEOUT_SEC,
+        )
+
+    @staticmethod
+    def classify(method: str, path: str) -> Optional[Tuple[str, Optional[str]]]:
+        """(route, lang_code) for limited requests, None for everything else."""
+        if method != "POST":
+            return None
+        match = _GENERATION_PATH.search(path)
+        if match is None:
+            return None
+        lang = (match.group("lang") or "").strip().lower() or None
+        return ("document" if match.group("document") else "generate"), lang
+
+    def _language_limiter(self, route: str, lang: str) -> Limiter:
+        key = (route, lang)
+        limiter = self._languages.get(key)
+        if limiter is None:
+            limiter = Limiter(
+                f"{route}:{lang}",
+                FixedLimit(self.language_limit),
+                max_queue=self.max_queue,
+                clock=self.clock,
+            )
+            self._languages[key] = limiter
+            if len(self._languages) > _MAX_LANGUAGE_LIMITERS:
+                # Path segments are caller-controlled: drop idle limiters.
+                for stale in [k for k, v in self._languages.items() if v.idle and k != key]:
+                    del self._languages[stale]
+                    if len(self._languages) <= _MAX_LANGUAGE_LIMITERS // 2:
+                        break
+        self._languages.move_to_end(key)
+        return limiter
+
+    async def admit(self, route: str, lang: Optional[str], deadline: Optional[float]) -> AdmissionTicket:
+        # Language first: a request stuck behind its language's cap must not
+        # hold a route-wide slot while it waits.
+        limiters = ([self._language_limiter(route, lang)] if lang else []) + [self.routes[route]]
+        held: List[Limiter] = []
+        queue_sec = 0.0
+        try:
+            for limiter in limiters:
+                queue_sec += await limiter.acquire(deadline)
+                held.append(limiter)
+        except BaseException:
+            for limiter in held:
+                limiter.release()
+            raise
+        return AdmissionTicket(route=route, limiters=held, admitted_at=self.clock(), queue_sec=queue_sec)
+
+    def release(self, ticket: AdmissionTicket, *, ok: bool) -> float:
+        latency = self.clock() - ticket.admitted_at
+        for limiter in reversed(ticket.limiters):
+            limiter.release(latency, ok=ok)
+        route = self.routes[ticket.route]
+        record_admission_limit(ticket.route, limit=route.limit.value, inflight=route.inflight, queued=route.queued)
+        return latency
+
+    def overloaded(self) -> bool:
+        """True while a route's wait queue is full (new requests are being shed)."""
+        return any(limiter.max_queue and limiter.queued >= limiter.max_queue for limiter in self.routes.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "routes": {name: limiter.snapshot() for name, limiter in self.routes.items()},
+            "languages": {limiter.name: limiter.snapshot() for limiter in self._languages.values() if not limiter.idle},
+        }
+
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers") or ():
+        if key.lower() == name:
+            return value.decode("latin-1").strip()
+    return None
+
+
+def request_deadline(scope: Scope, default_timeout_sec: float, *, now: Optional[float] = None) -> Optional[float]:
+    """
+    Absolute deadline (epoch seconds) from `X-Request-Deadline` (epoch seconds
+    or milliseconds) or `X-Request-Timeout` (seconds), else now + default.
+    Invalid values fall back to the default.
+    """
+    now = time.time() if now is None else now
+    raw = _header(scope, b"x-request-deadline")
+    if raw:
+        try:
+            value = float(raw)
+            return value / 1000.0 if value > 1e11 else value
+        except ValueError:
+            pass
+    raw = _header(scope, b"x-request-timeout")
+    if raw:
+        try:
+            return now + max(0.0, float(raw))
+        except ValueError:
+            pass
+    return now + default_timeout_sec if default_timeout_sec > 0 else None
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware applying an AdmissionController to generation routes."""
+
+    def __init__(self, app: ASGIApp, controller: Optional[AdmissionController] = None) -> None:
+        self.app = app
+        self.controller = controller or AdmissionController.from_settings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        target = self.controller.classify(scope.get("method", ""), scope.get("path", ""))
+        if target is None:
+            await self.app(scope, receive, send)
+            return
+        route, lang = target
+
+        wall_now, mono_now = time.time(), self.controller.clock()
+        # Only a deadline the caller sent bounds generation; the default only
+        # bounds how long the request may wait for a slot.
+        client_deadline = request_deadline(scope, 0.0, now=wall_now)
+        scope.setdefault("state", {})["deadline"] = client_deadline
+        deadline = (
+            client_deadline
+            if client_deadline is not None
+            else request_deadline(scope, self.controller.default_timeout_sec, now=wall_now)
+        )
+        local_deadline = None if deadline is None else mono_now + (deadline - wall_now)
+
+        try:
+            ticket = await self.controller.admit(route, lang, local_deadline)
+        except AdmissionRejected as rejected:
+            record_admission(route, "shed", reason=rejected.reason)
+            logger.warning("admission_shed", route=route, lang=lang, reason=rejected.reason)
+            await self._reject(send, rejected)
+            return
+        record_admission(route, "admitted", queue_sec=ticket.queue_sec)
+
+        status_code = 500
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = int(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.controller.release(ticket, ok=status_code < 500)
+
+    @staticmethod
+    async def _reject(send: Send, rejected: AdmissionRejected) -> None:
+        retry_after = max(1, math.ceil(rejected.retry_after_sec))
+        body = json.dumps(
+            {"detail": "Server is at capacity; retry later.", "reason": rejected.reason}
+        ).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("ascii")),
+                    (b"retry-after", str(retry_after).encode("ascii")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+__all__ = [
+    "AIMDLimit",
+    "AdmissionControlMiddleware",
+    "AdmissionController",
+    "AdmissionRejected",
+    "AdmissionTicket",
+    "FixedLimit",
+    "Limiter",
+    "request_deadline",
+]
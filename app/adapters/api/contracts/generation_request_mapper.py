@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 import structlog
 
@@ -87,6 +87,62 @@ def map_generation_request(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class MappedDocumentRequest:
+    """
+    HTTP-to-domain document generation request envelope.
+
+    `frames` keep the payload order; the discourse planner decides the final
+    sentence order.
+    """
+
+    lang_code: str
+    frames: List[Union[BioFrame, Frame]]
+    domain: str
+
+
+def map_document_request(
+    payload: Mapping[str, Any],
+    *,
+    path_lang_code: str,
+) -> MappedDocumentRequest:
+    """
+    Convert a document payload `{"frames": [...], "domain": "auto"}` into a
+    normalized document generation command.
+
+    Every frame is parsed exactly like a single `/generate` payload. A language
+    given at the top level or inside a frame must match the URL language.
+    """
+    if not isinstance(payload, Mapping):
+        raise InvalidFrameError("Payload must be a JSON object.")
+
+    lang_code = normalize_lang_code(path_lang_code)
+
+    raw_frames = payload.get("frames")
+    if not isinstance(raw_frames, list) or not raw_frames:
+        raise InvalidFrameError("Document payload requires a non-empty `frames` list.")
+
+    frames: List[Union[BioFrame, Frame]] = []
+    for index, raw in enumerate((payload, *raw_frames)):
+        if not isinstance(raw, Mapping):
+            raise InvalidFrameError(f"frames[{index - 1}] must be a JSON object.")
+        raw_lang = extract_lang_from_payload(raw)
+        if raw_lang and normalize_lang_code(raw_lang) != lang_code:
+            where = "payload" if index == 0 else f"frames[{index - 1}]"
+            raise InvalidFrameError(
+                f"Language mismatch: URL has '{path_lang_code}' -> '{lang_code}', "
+                f"{where} has '{raw_lang}'."
+            )
+        if index:
+            frames.append(parse_generation_payload(strip_lang_fields(raw), lang_code))
+
+    domain = payload.get("domain") or "auto"
+    if not isinstance(domain, str) or not domain.strip():
+        raise InvalidFrameError("`domain` must be a non-empty string.")
+
+    return MappedDocumentRequest(lang_code=lang_code, frames=frames, domain=domain.strip())
+
+
 def normalize_lang_code(lang_code: str) -> str:
     """
     Normalize common language-code variants without assuming a fixed width.
@@ -258,6 +314,8 @@ def is_non_empty_scalar(value: Any) -> bool:
 __all__ = [
     "MappedGenerationRequest",
     "map_generation_request",
+    "MappedDocumentRequest",
+    "map_document_request",
     "normalize_lang_code",
     "extract_lang_from_payload",
     "strip_lang_fields",
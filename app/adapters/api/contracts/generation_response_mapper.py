@@ -42,7 +42,12 @@ def _coerce_debug_info(value: Any) -> dict[str, Any]:
     return {"raw_debug_info": str(value)}
 
 
-def map_generation_response(result: Any, *, requested_lang_code: str | None = None) -> dict[str, Any]:
+def map_generation_response(
+    result: Any,
+    *,
+    requested_lang_code: str | None = None,
+    include_debug: bool = True,
+) -> dict[str, Any]:
     """
     Map a domain/use-case generation result into the public API response shape.
 
@@ -59,6 +64,9 @@ def map_generation_response(result: Any, *, requested_lang_code: str | None = No
     - dict-like results with equivalent keys
     - raw string results (best-effort compatibility)
 
+    With `include_debug=False` the lean shape `{"text", "lang_code"}` is
+    returned and debug_info is never assembled.
+
     Raises:
         ValueError: when required response fields cannot be derived.
     """
@@ -81,6 +89,9 @@ def map_generation_response(result: Any, *, requested_lang_code: str | None = No
     if not lang_code:
         raise ValueError("Generation result is missing required field 'lang_code'.")
 
+    if not include_debug:
+        return {"text": text, "lang_code": lang_code}
+
     debug_info = _coerce_debug_info(_get_value(result, "debug_info"))
 
     # Preserve important runtime metadata when it exists outside debug_info.
@@ -13,6 +13,7 @@ from fastapi.security import APIKeyHeader
 from app.adapters.llm_adapter import GeminiAdapter
 from app.core.ports.grammar_engine import IGrammarEngine
 from app.core.use_cases.build_language import BuildLanguage
+from app.core.use_cases.generate_document import GenerateDocument
 from app.core.use_cases.generate_text import GenerateText
 from app.core.use_cases.onboard_language_saga import OnboardLanguageSaga
 from app.shared.config import AppEnv, settings
@@ -152,6 +153,16 @@ def get_generate_text_use_case(
     return use_case
 
 
+def get_generate_document_use_case(
+    generate_text: GenerateText = Depends(get_generate_text_use_case),
+) -> GenerateDocument:
+    """
+    Resolve GenerateDocument around the request's GenerateText, so document
+    sentences share the BYOK-aware single-sentence runtime.
+    """
+    return _get_container().generate_document_use_case(sentence_generator=generate_text)
+
+
 def get_build_language_use_case() -> BuildLanguage:
     """Resolve BuildLanguage from the DI container."""
     return _get_container().build_language_use_case()
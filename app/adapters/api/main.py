@@ -1,13 +1,14 @@
 # app/adapters/api/main.py
+import asyncio
 import os
-import uvicorn
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
+from app.adapters.api.admission import AdmissionControlMiddleware, AdmissionController
 from app.shared.container import container
-from app.shared.config import settings
+from app.shared.config import StorageBackend, settings
 
 # Import Routers
 # Note: We import the modules directly to ensure 'container.wire' works correctly
@@ -41,17 +42,7 @@ def _parse_csv_env(name: str, default: list[str]) -> list[str]:
     return [x.strip() for x in raw.split(",") if x.strip()]
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """
-    Manages the application lifecycle.
-    1. Startup: Wires DI container, connects to infrastructure.
-    2. Shutdown: Closes connections.
-    """
-    env_name = getattr(settings, "APP_ENV", "development")
-    logger.info("app_startup", env=env_name)
-
-    # 1. Wire the Container
+def _wire_container() -> None:
     container.wire(
         modules=[
             "app.adapters.api.routers.generation",
@@ -66,6 +57,20 @@ async def lifespan(app: FastAPI):
         ]
     )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Manages the application lifecycle.
+    1. Startup: Wires DI container, connects to infrastructure.
+    2. Shutdown: Closes connections.
+    """
+    env_name = getattr(settings, "APP_ENV", "development")
+    logger.info("app_startup", env=env_name)
+
+    # 1. Wire the Container (again: tests unwire it between app instances)
+    _wire_container()
+
     # 2. Infrastructure Initialization (fail-fast-ish)
     broker = container.message_broker()
     try:
@@ -81,10 +86,61 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("task_queue_connection_failed", error=str(e))
 
+    # Warm the construction dispatch table so the first request per
+    # (construction, language) pair skips the backend capability probes.
+    from app.core.domain.constructions.construction_registry import KNOWN_RUNTIME_CONSTRUCTION_IDS
+
+    realizer = None
+    try:
+        realizer = container.construction_realizer()
+        langs = await container.grammar_engine().get_supported_languages()
+        pairs = realizer.precompute_dispatch_table(sorted(KNOWN_RUNTIME_CONSTRUCTION_IDS), langs)
+        logger.info("dispatch_table_warmed", pairs=pairs)
+    except Exception as e:
+        logger.error("dispatch_table_warmup_failed", error=str(e))
+
+    # Follow grammar rebuilds announced by the worker (zero-downtime PGF swap).
+    if settings.GRAMMAR_HOT_RELOAD:
+        from app.adapters.messaging.grammar_reload import GrammarReloadListener
+
+        try:
+            await GrammarReloadListener(
+                container.grammar_engine(),
+                broker,
+                on_reload=realizer.refresh_dispatch_table if realizer is not None else None,
+            ).start()
+        except Exception as e:
+            logger.error("grammar_reload_listener_failed", error=str(e))
+
+    # Precompute the GET /languages catalogue and rebuild it on build events.
+    catalog = app.state.language_catalog
+    try:
+        await catalog.refresh(container.language_repo())
+        await catalog.subscribe(broker)
+    except Exception as e:
+        logger.error("language_catalog_warmup_failed", error=str(e))
+
+    # S3 storage: pull every per-language PGF into the local cache in the
+    # background, so the first requests per language do not pay the download.
+    if settings.S3_PREFETCH_GRAMMARS and settings.STORAGE_BACKEND == StorageBackend.S3:
+        prefetch = getattr(container.language_repo(), "prefetch_grammars", None)
+        if callable(prefetch):
+            app.state.grammar_prefetch = asyncio.create_task(prefetch())
+
     yield
 
     # 3. Shutdown / Cleanup
     logger.info("app_shutdown")
+    prefetch_task = getattr(app.state, "grammar_prefetch", None)
+    if prefetch_task is not None and not prefetch_task.done():
+        prefetch_task.cancel()
+    # Journal-backed lexicon: fold the journal into lexicon.json and release handles.
+    close_repo = getattr(container.language_repo(), "close", None)
+    if callable(close_repo):
+        try:
+            await close_repo()
+        except Exception as e:
+            logger.error("language_repo_close_failed", error=str(e))
     await broker.disconnect()
     await task_queue.disconnect()
 
@@ -102,6 +158,9 @@ def create_app() -> FastAPI:
     #   so Swagger/OpenAPI generate correct URLs.
     root_path = _normalize_root_path(os.getenv("ARCHITECT_API_ROOT_PATH"))
 
+    # The container does not auto-wire on import; wire before any request.
+    _wire_container()
+
     app = FastAPI(
         title=app_name,
         version="2.1.0",
@@ -112,6 +171,15 @@ def create_app() -> FastAPI:
         redoc_url=None,
     )
 
+    app.state.language_catalog = languages.LanguageCatalog.from_settings()
+
+    # Admission control for the generation routes (added before CORS so that
+    # CORS stays outermost and 503 sheds still carry CORS headers).
+    app.state.admission = None
+    if settings.ADMISSION_CONTROL_ENABLED:
+        app.state.admission = AdmissionController.from_settings()
+        app.add_middleware(AdmissionControlMiddleware, controller=app.state.admission)
+
     # Global Middleware (CORS)
     #
     # IMPORTANT (browser CORS rule):
@@ -166,6 +234,8 @@ def start():
     """
     Entry point for the 'architect-api' CLI script defined in pyproject.toml.
     """
+    import uvicorn
+
     is_dev = getattr(settings, "APP_ENV", "development") == "development"
 
     uvicorn.run(
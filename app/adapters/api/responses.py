@@ -0,0 +1,28 @@
+# app/adapters/api/responses.py
+"""
+Response classes shared by API routers.
+
+`FastJSONResponse` serialises with orjson when it is installed and falls back
+to the stdlib encoder otherwise. Handlers return it directly for payloads that
+are already plain JSON types, which also skips response-model validation and
+FastAPI's `jsonable_encoder` walk.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if orjson is None:  # pragma: no cover - optional dependency
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+__all__ = ["FastJSONResponse"]
@@ -1,17 +1,25 @@
 # app/adapters/api/routers/generation.py
-from typing import Any, Callable, Dict, NoReturn, Optional
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, NoReturn, Optional, TypeVar, Union
 
 import structlog
-from fastapi import APIRouter, Body, Depends, Header, HTTPException, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, Response, status
 
 from app.adapters.api.contracts.generation_request_mapper import (
     MappedGenerationRequest,
+    map_document_request,
     map_generation_request,
 )
 from app.adapters.api.contracts.generation_response_mapper import (
     map_generation_response,
 )
-from app.adapters.api.dependencies import get_generate_text_use_case, verify_api_key
+from app.adapters.api.dependencies import (
+    get_generate_document_use_case,
+    get_generate_text_use_case,
+    verify_api_key,
+)
+from app.adapters.api.responses import FastJSONResponse
 from app.adapters.redis_bus import redis_bus
 from app.core.domain.context import DiscourseEntity
 from app.core.domain.exceptions import (
@@ -21,11 +29,16 @@ from app.core.domain.exceptions import (
     UnsupportedFrameTypeError,
 )
 from app.core.domain.frame import BioFrame
-from app.core.domain.models import Sentence
+from app.core.domain.models import Document, Sentence
+from app.core.use_cases.generate_document import GenerateDocument, pronoun_for_gender
 from app.core.use_cases.generate_text import GenerateText
+from app.shared.config import settings
+from app.shared.debug_payloads import debug_payloads
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
 router = APIRouter(
     prefix="/generate",
     tags=["Generation"],
@@ -40,6 +53,8 @@ router = APIRouter(
     summary="Generate Text (language in payload)",
 )
 async def generate_text_from_payload(
+    request: Request,
+    response: Response,
     payload: Dict[str, Any] = Body(
         ...,
         description=(
@@ -48,8 +63,13 @@ async def generate_text_from_payload(
         ),
     ),
     x_session_id: Optional[str] = Header(None, alias="X-Session-ID"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    debug: bool = Query(
+        settings.GENERATION_DEBUG_DEFAULT,
+        description="Include debug_info; false returns only text and lang_code",
+    ),
     use_case: GenerateText = Depends(get_generate_text_use_case),
-) -> Sentence:
+) -> Union[Sentence, Response]:
     """
     Same generator, but language is provided inside the payload:
       - top-level: lang | language | lang_code
@@ -58,8 +78,12 @@ async def generate_text_from_payload(
     return await _execute_generation(
         request_mapper=lambda: map_generation_request(payload),
         x_session_id=x_session_id,
+        if_none_match=if_none_match,
+        response=response,
         use_case=use_case,
         log_lang=None,
+        debug=debug,
+        deadline=_request_deadline(request),
     )
 
 
@@ -71,13 +95,20 @@ async def generate_text_from_payload(
 )
 async def generate_text(
     lang_code: str,
+    request: Request,
+    response: Response,
     payload: Dict[str, Any] = Body(
         ...,
         description="Abstract Semantic Frame or Ninai Protocol payload",
     ),
     x_session_id: Optional[str] = Header(None, alias="X-Session-ID"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    debug: bool = Query(
+        settings.GENERATION_DEBUG_DEFAULT,
+        description="Include debug_info; false returns only text and lang_code",
+    ),
     use_case: GenerateText = Depends(get_generate_text_use_case),
-) -> Sentence:
+) -> Union[Sentence, Response]:
     """
     Converts a semantic frame into a concrete sentence in the target language.
 
@@ -85,6 +116,9 @@ async def generate_text(
     - Ninai Protocol support via request mapping
     - Discourse planning via X-Session-ID
     - Domain validation via the use case
+    - ETag / If-None-Match when the result cache is enabled (304 skips generation)
+    - `?debug=false` lean mode: no debug payloads are built and the response
+      carries only `text` and `lang_code`
     """
     return await _execute_generation(
         request_mapper=lambda: map_generation_request(
@@ -92,36 +126,159 @@ async def generate_text(
             path_lang_code=lang_code,
         ),
         x_session_id=x_session_id,
+        if_none_match=if_none_match,
+        response=response,
         use_case=use_case,
         log_lang=lang_code,
+        debug=debug,
+        deadline=_request_deadline(request),
     )
 
 
+@router.post(
+    "/{lang_code}/document",
+    response_model=Document,
+    status_code=status.HTTP_200_OK,
+    summary="Generate a Multi-Sentence Document",
+)
+async def generate_document(
+    lang_code: str,
+    request: Request,
+    payload: Dict[str, Any] = Body(
+        ...,
+        description='Document payload: {"frames": [<frame>, ...], "domain": "auto" | "bio" | ...}',
+    ),
+    use_case: GenerateDocument = Depends(get_generate_document_use_case),
+) -> Document:
+    """
+    Plans a set of frames once, chooses referring expressions across the whole
+    document (first mention by name, later mentions by pronoun where safe),
+    then realizes all sentences concurrently.
+
+    Sentences are returned in discourse-plan order; `text` joins them.
+    No X-Session-ID is needed: discourse state lives within the request.
+    """
+    lang: Optional[str] = lang_code
+    try:
+        mapped = map_document_request(payload, path_lang_code=lang_code)
+        lang = mapped.lang_code
+        return await _before_deadline(
+            use_case.execute(lang, mapped.frames, domain=mapped.domain),
+            _request_deadline(request),
+        )
+    except Exception as exc:
+        _raise_generation_http_exception(exc, lang=lang)
+
+
 async def _execute_generation(
     *,
     request_mapper: Callable[[], MappedGenerationRequest],
     x_session_id: Optional[str],
     use_case: GenerateText,
     log_lang: Optional[str],
-) -> Sentence:
+    if_none_match: Optional[str] = None,
+    response: Optional[Response] = None,
+    debug: bool = True,
+    deadline: Optional[float] = None,
+) -> Union[Sentence, Response]:
     lang: Optional[str] = log_lang
+    etag: Optional[str] = None
 
     try:
         mapped = request_mapper()
         lang = mapped.lang_code
         frame = mapped.frame
 
-        if x_session_id and isinstance(frame, BioFrame):
+        # Discourse context rewrites the frame from session state, so the
+        # output is no longer a function of the payload alone.
+        discourse_applied = bool(x_session_id) and isinstance(frame, BioFrame)
+        if discourse_applied:
             await _apply_discourse_context(x_session_id, frame)
 
-        sentence = await use_case.execute(lang, frame)
-        return map_generation_response(sentence)
+        execute_kwargs: Dict[str, Any] = {}
+        result_cache_key = getattr(use_case, "result_cache_key", None)
+        if callable(result_cache_key):
+            if discourse_applied:
+                execute_kwargs["use_cache"] = False
+            else:
+                cache_key = result_cache_key(lang, frame)
+                if cache_key:
+                    etag = _etag_for(cache_key, lean=not debug)
+                    if _etag_matches(if_none_match, etag):
+                        return Response(
+                            status_code=status.HTTP_304_NOT_MODIFIED,
+                            headers={"ETag": etag},
+                        )
+                    if response is not None:
+                        response.headers["ETag"] = etag
+                    execute_kwargs["cache_key"] = cache_key
+
+        if debug:
+            sentence = await _before_deadline(use_case.execute(lang, frame, **execute_kwargs), deadline)
+            return map_generation_response(sentence)
+
+        with debug_payloads(False):
+            sentence = await _before_deadline(use_case.execute(lang, frame, **execute_kwargs), deadline)
+        # Returned directly: skips response-model validation and jsonable_encoder.
+        return FastJSONResponse(
+            map_generation_response(sentence, include_debug=False),
+            headers={"ETag": etag} if etag else None,
+        )
 
     except Exception as exc:
         _raise_generation_http_exception(exc, lang=lang)
 
 
+class GenerationDeadlineExceeded(Exception):
+    """The caller's deadline passed while generation was still running."""
+
+
+def _request_deadline(request: Request) -> Optional[float]:
+    """Caller-sent deadline (epoch seconds) passed on by AdmissionControlMiddleware, if any."""
+    return getattr(request.state, "deadline", None)
+
+
+async def _before_deadline(work: Awaitable[T], deadline: Optional[float]) -> T:
+    """
+    Await `work`, cancelling it once `deadline` passes. Cancellation lands at
+    the next await, so a synchronous realizer step runs to completion first.
+    """
+    if deadline is None:
+        return await work
+    try:
+        async with asyncio.timeout(deadline - time.time()):
+            return await work
+    except TimeoutError:
+        raise GenerationDeadlineExceeded("Request deadline exceeded during generation.") from None
+
+
+def _etag_for(cache_key: str, *, lean: bool = False) -> str:
+    # Weak: debug_info timings differ between otherwise identical responses.
+    # The lean body is a different representation, so it gets its own validator.
+    return f'W/"{cache_key};lean"' if lean else f'W/"{cache_key}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    opaque = etag[2:]
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
 def _raise_generation_http_exception(exc: Exception, *, lang: Optional[str]) -> NoReturn:
+    if isinstance(exc, GenerationDeadlineExceeded):
+        logger.warning("generation_deadline_exceeded", lang=lang)
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(exc),
+        )
+
     if isinstance(exc, (InvalidFrameError, UnsupportedFrameTypeError, ValueError)):
         logger.warning("generation_bad_request", lang=lang, error=str(exc))
         raise HTTPException(
@@ -199,20 +356,8 @@ async def _apply_discourse_context(session_id: str, frame: BioFrame) -> None:
         if frame.meta is None:
             frame.meta = {}
 
-        gender_map = {
-            "f": ("She", "she_Pron"),
-            "female": ("She", "she_Pron"),
-            "m": ("He", "he_Pron"),
-            "male": ("He", "he_Pron"),
-            "n": ("It", "it_Pron"),
-            "neuter": ("It", "it_Pron"),
-        }
-
         focus_gender = getattr(context.current_focus, "gender", None)
-        pronoun_label, gf_arg = gender_map.get(
-            str(focus_gender or "").strip().lower(),
-            ("It", "it_Pron"),
-        )
+        pronoun_label, gf_arg = pronoun_for_gender(focus_gender)
 
         frame.name = pronoun_label
         frame.meta["gf_function"] = "UsePron"
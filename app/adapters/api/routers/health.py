@@ -1,9 +1,12 @@
 # app/adapters/api/routers/health.py
-from fastapi import APIRouter, Depends, status, Response
+import asyncio
+import time
+from fastapi import APIRouter, Depends, Request, status, Response
 from dependency_injector.wiring import inject, Provide
-from typing import Dict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
 import structlog
 
+from app.shared.config import settings
 from app.shared.container import Container
 
 # [FIX] Consolidated imports: NO MORE 'lexicon_repository' or separate module files
@@ -13,6 +16,116 @@ logger = structlog.get_logger()
 
 router = APIRouter(prefix="/health", tags=["System"])
 
+# Readiness fails (503) unless all of these are "up".
+CRITICAL_CHECKS = ("broker", "storage", "engine")
+# Readiness is "degraded" unless all of these are "warm".
+WARM_CHECKS = ("grammar", "lexicon")
+
+Check = Callable[[], Awaitable[Union[bool, str]]]
+
+
+class ReadinessProbe:
+    """
+    Runs the readiness checks concurrently, each bounded by `timeout_sec`,
+    and caches the report for `ttl_sec`.
+
+    Concurrent probes during a refresh wait for that refresh instead of
+    starting their own, so a probe storm costs one round of checks. A check
+    that times out keeps running in the background (it may be loading the
+    PGF); the next refresh awaits the same task rather than stacking another.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_sec: float = 2.0,
+        timeout_sec: float = 1.0,
+        require_warm: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_sec = ttl_sec
+        self.timeout_sec = timeout_sec
+        self.require_warm = require_warm
+        self.clock = clock
+        self._lock = asyncio.Lock()
+        self._report: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._pending: Dict[str, "asyncio.Task[Union[bool, str]]"] = {}
+
+    @classmethod
+    def from_settings(cls) -> "ReadinessProbe":
+        return cls(
+            ttl_sec=settings.READINESS_CACHE_TTL_SEC,
+            timeout_sec=settings.READINESS_CHECK_TIMEOUT_SEC,
+            require_warm=settings.READINESS_REQUIRE_WARM,
+        )
+
+    async def report(self, checks: Dict[str, Check]) -> Dict[str, Any]:
+        if self._fresh():
+            return {**self._report, "cached": True}
+        async with self._lock:
+            if self._fresh():
+                return {**self._report, "cached": True}
+            report = await self._run(checks)
+            self._report = report
+            self._expires_at = self.clock() + self.ttl_sec
+            return {**report, "cached": False}
+
+    def _fresh(self) -> bool:
+        return self._report is not None and self.clock() < self._expires_at
+
+    async def _run(self, checks: Dict[str, Check]) -> Dict[str, Any]:
+        names = list(checks)
+        outcomes = await asyncio.gather(*(self._run_one(name, checks[name]) for name in names))
+
+        report: Dict[str, Any] = {}
+        latency_ms: Dict[str, float] = {}
+        for name, (component_status, elapsed_ms) in zip(names, outcomes):
+            report[name] = component_status
+            latency_ms[name] = elapsed_ms
+
+        if any(report.get(name, "up") != "up" for name in CRITICAL_CHECKS):
+            overall = "not_ready"
+        elif any(report.get(name, "warm") != "warm" for name in WARM_CHECKS):
+            overall = "degraded"
+        else:
+            overall = "ready"
+        report["status"] = overall
+        report["latency_ms"] = latency_ms
+        return report
+
+    async def _run_one(self, name: str, check: Check) -> Tuple[str, float]:
+        task = self._pending.get(name)
+        if task is None or task.done():
+            task = asyncio.ensure_future(check())
+            self._pending[name] = task
+
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task), self.timeout_sec)
+            component_status = result if isinstance(result, str) else ("up" if result else "down")
+        except asyncio.TimeoutError:
+            component_status = "timeout"
+            logger.warning("health_check_timeout", component=name, timeout_sec=self.timeout_sec)
+        except Exception as e:
+            component_status = "down"
+            logger.error("health_check_failed", component=name, error=str(e))
+        return component_status, round((time.perf_counter() - started) * 1000.0, 2)
+
+    def is_ready(self, report: Dict[str, Any]) -> bool:
+        if report["status"] == "not_ready":
+            return False
+        return not (self.require_warm and report["status"] == "degraded")
+
+
+def _readiness_probe(request: Request) -> ReadinessProbe:
+    # One per app: each app instance (and test client) gets its own cache.
+    probe = getattr(request.app.state, "readiness_probe", None)
+    if probe is None:
+        probe = request.app.state.readiness_probe = ReadinessProbe.from_settings()
+    return probe
+
+
 @router.get("/live", status_code=status.HTTP_200_OK)
 async def liveness_probe():
     """
@@ -24,54 +137,69 @@ async def liveness_probe():
 @router.get("/ready", status_code=status.HTTP_200_OK)
 @inject
 async def readiness_probe(
+    request: Request,
     response: Response,
     broker: IMessageBroker = Depends(Provide[Container.message_broker]),
     # [FIX] Updated type hint from ILexiconRepository to LexiconRepo
     repo: LexiconRepo = Depends(Provide[Container.lexicon_repository]),
     engine: IGrammarEngine = Depends(Provide[Container.grammar_engine]),
-) -> Dict[str, str]:
+) -> Dict[str, Any]:
     """
     K8s Readiness Probe.
-    Performs deep checks on dependencies (Redis, Storage, GF Engine).
-    Returns 503 Service Unavailable if any critical component is down.
+
+    Critical checks (broker, storage, engine) run concurrently with a
+    per-check timeout; any of them not "up" returns 503 Service Unavailable.
+    Warm checks report whether the grammar is loaded with languages and
+    lexicon indexes are in memory; if not, the status is "degraded" (200,
+    or 503 with READINESS_REQUIRE_WARM). Results are cached for
+    READINESS_CACHE_TTL_SEC; `latency_ms` has per-check timings.
     """
-    health_status = {
-        "broker": "down",
-        "storage": "down",
-        "engine": "down"
-    }
-    
-    # 1. Check Message Broker (Redis)
-    try:
-        if await broker.health_check():
-            health_status["broker"] = "up"
-    except Exception as e:
-        logger.error("health_check_failed", component="broker", error=str(e))
-
-    # 2. Check Storage (FileSystem)
-    try:
+
+    async def check_storage() -> bool:
         # Note: Ensure your LexiconRepo implementation has a health_check method
         # even if it's not strictly in the ABC yet.
-        if hasattr(repo, "health_check") and await repo.health_check():
-            health_status["storage"] = "up"
-        elif not hasattr(repo, "health_check"):
-             # Fallback if method missing in interface but object exists
-             health_status["storage"] = "up" 
-    except Exception as e:
-        logger.error("health_check_failed", component="storage", error=str(e))
-
-    # 3. Check Grammar Engine (GF Runtime)
-    try:
-        if await engine.health_check():
-            health_status["engine"] = "up"
-    except Exception as e:
-        logger.error("health_check_failed", component="engine", error=str(e))
-
-    # Determine overall status
-    is_healthy = all(status == "up" for status in health_status.values())
-
-    if not is_healthy:
+        if hasattr(repo, "health_check"):
+            return await repo.health_check()
+        return True
+
+    async def check_grammar() -> str:
+        engine_status = getattr(engine, "status", None)
+        if engine_status is None:
+            # Engines without a loadable artifact (Python/mock) are warm when healthy.
+            return "warm" if await engine.health_check() else "cold"
+        payload = await engine_status()
+        return "warm" if payload.get("loaded") and payload.get("language_count", 1) > 0 else "cold"
+
+    async def check_lexicon() -> str:
+        from app.adapters.persistence.lexicon.cache import cached_languages
+
+        return "warm" if cached_languages() else "cold"
+
+    probe = _readiness_probe(request)
+    health_status = await probe.report(
+        {
+            "broker": broker.health_check,
+            "storage": check_storage,
+            "engine": engine.health_check,
+            "grammar": check_grammar,
+            "lexicon": check_lexicon,
+        }
+    )
+    is_ready = probe.is_ready(health_status)
+
+    # Admission control: while generation requests are being shed because
+    # the wait queue is full, stop advertising this instance as ready.
+    # Live, never cached.
+    admission = getattr(request.app.state, "admission", None)
+    if admission is not None:
+        overloaded = admission.overloaded()
+        health_status["admission"] = "overloaded" if overloaded else "up"
+        if overloaded:
+            health_status["status"] = "not_ready"
+            is_ready = False
+
+    if not is_ready:
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
         logger.warning("readiness_probe_failed", status=health_status)
-    
-    return health_status
\ No newline at end of file
+
+    return health_status
@@ -1,19 +1,26 @@
 # app/adapters/api/routers/languages.py
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import time
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import structlog
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
 from pydantic import BaseModel
 
+from app.core.domain.events import EventType, SystemEvent
 from app.core.ports import LanguageRepo
 from app.shared.config import settings
 from app.shared.container import Container
 
+logger = structlog.get_logger()
+
 router = APIRouter()
 
 
@@ -106,46 +113,169 @@ def _normalize_to_iso2(code: str) -> Optional[str]:
     return None
 
 
+def _to_language_out(item: Any) -> Optional[LanguageOut]:
+    raw_code: str = ""
+    name: str = ""
+    z_id: Optional[str] = None
+
+    if isinstance(item, str):
+        raw_code = item
+        name = item
+    elif isinstance(item, dict):
+        raw_code = str(item.get("code", "") or item.get("lang_code", "") or item.get("language_code", ""))
+        name = str(item.get("name", "") or raw_code)
+        z_id = item.get("z_id")
+    else:
+        raw_code = str(getattr(item, "code", "") or getattr(item, "lang_code", "") or getattr(item, "language_code", ""))
+        name = str(getattr(item, "name", "") or raw_code)
+        z_id = getattr(item, "z_id", None)
+
+    iso2 = _normalize_to_iso2(raw_code)
+    if not iso2:
+        return None
+    return LanguageOut(code=iso2, name=name or iso2, z_id=z_id)
+
+
+def _source_token(repo: Any) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of the repo's matrix file, or None when there is none to stat (S3)."""
+    matrix_path = getattr(repo, "matrix_path", None)
+    if not isinstance(matrix_path, Path):
+        return None
+    try:
+        st = matrix_path.stat()
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+# Events after which the matrix (and so the catalogue) may have changed.
+CATALOG_REFRESH_EVENTS = (EventType.BUILD_COMPLETED, EventType.LEXICON_UPDATED, EventType.GRAMMAR_RELOADED)
+
+
+class LanguageCatalog:
+    """
+    The GET /languages response, built once and served as pre-encoded bytes.
+
+    Rebuilt (single-flight) when the repo's matrix file changes on disk, when
+    a build/lexicon broker event arrives, or after `ttl_sec` for repos with no
+    file to stat. A request on the hot path does one `stat` and no parsing,
+    normalisation or encoding, whatever the number of languages. If a rebuild
+    fails, the previous catalogue keeps being served.
+    """
+
+    def __init__(self, *, ttl_sec: float = 300.0, max_age_sec: int = 60, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl_sec = ttl_sec
+        self.max_age_sec = max_age_sec
+        self.clock = clock
+        self.languages: List[LanguageOut] = []
+        self.body: Optional[bytes] = None
+        self.etag = ""
+        self.builds = 0
+        self._token: Optional[Tuple[int, int]] = None
+        self._built_at = 0.0
+        self._stale = True
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "LanguageCatalog":
+        return cls(
+            ttl_sec=settings.LANGUAGES_CATALOG_TTL_SEC,
+            max_age_sec=settings.LANGUAGES_CACHE_MAX_AGE_SEC,
+        )
+
+    def invalidate(self) -> None:
+        self._stale = True
+
+    async def handle_event(self, event: SystemEvent) -> None:
+        logger.info("language_catalog_invalidated", event_id=event.id, type=event.type)
+        self.invalidate()
+
+    async def subscribe(self, broker: Any) -> None:
+        for event_type in CATALOG_REFRESH_EVENTS:
+            await broker.subscribe(event_type, self.handle_event)
+
+    def _needs_refresh(self, repo: Any) -> bool:
+        if self.body is None or self._stale:
+            return True
+        token = _source_token(repo)
+        if token is not None:
+            return token != self._token
+        return self.ttl_sec > 0 and self.clock() - self._built_at >= self.ttl_sec
+
+    async def get(self, repo: Any) -> "LanguageCatalog":
+        if self._needs_refresh(repo):
+            async with self._lock:
+                if self._needs_refresh(repo):
+                    await self.refresh(repo)
+        return self
+
+    async def refresh(self, repo: Any) -> None:
+        token = _source_token(repo)
+        self._stale = False
+        try:
+            items = await repo.list_languages()
+        except Exception:
+            if self.body is None:
+                self._stale = True
+                raise
+            logger.exception("language_catalog_refresh_failed")
+            return
+
+        # keep first occurrence; stable + de-duped
+        by_code: Dict[str, LanguageOut] = {}
+        for item in items:
+            out = _to_language_out(item)
+            if out is not None and out.code not in by_code:
+                by_code[out.code] = out
+
+        self.languages = [by_code[k] for k in sorted(by_code.keys())]
+        self.body = json.dumps([lang.model_dump() for lang in self.languages], separators=(",", ":")).encode("utf-8")
+        self.etag = '"' + hashlib.blake2b(self.body, digest_size=12).hexdigest() + '"'
+        self._token = token
+        self._built_at = self.clock()
+        self.builds += 1
+        logger.info("language_catalog_built", languages=len(self.languages), etag=self.etag)
+
+    def response(self, if_none_match: Optional[str]) -> Response:
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": f"public, max-age={self.max_age_sec}, must-revalidate",
+        }
+        if _etag_matches(if_none_match, self.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+def get_language_catalog(request: Request) -> LanguageCatalog:
+    # One per app (create_app sets it); created lazily for bare test apps.
+    catalog = getattr(request.app.state, "language_catalog", None)
+    if catalog is None:
+        catalog = request.app.state.language_catalog = LanguageCatalog.from_settings()
+    return catalog
+
+
 @router.get("/", response_model=List[LanguageOut])
 @inject
 async def list_languages(
+    request: Request,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
     repo: LanguageRepo = Depends(Provide[Container.language_repo]),
-) -> List[LanguageOut]:
+) -> Response:
     """
     List all languages available in the system.
     Public API returns ISO-639-1 (2-letter) codes only; other forms are normalized when possible.
+    Served from the precomputed catalogue with ETag / Cache-Control (304 on If-None-Match).
     """
     try:
-        items = await repo.list_languages()
-
-        by_code: dict[str, LanguageOut] = {}
-
-        for item in items:
-            raw_code: str = ""
-            name: str = ""
-            z_id: Optional[str] = None
-
-            if isinstance(item, str):
-                raw_code = item
-                name = item
-            elif isinstance(item, dict):
-                raw_code = str(item.get("code", "") or item.get("lang_code", "") or item.get("language_code", ""))
-                name = str(item.get("name", "") or raw_code)
-                z_id = item.get("z_id")
-            else:
-                raw_code = str(getattr(item, "code", "") or getattr(item, "lang_code", "") or getattr(item, "language_code", ""))
-                name = str(getattr(item, "name", "") or raw_code)
-                z_id = getattr(item, "z_id", None)
-
-            iso2 = _normalize_to_iso2(raw_code)
-            if not iso2:
-                continue
-
-            # keep first occurrence; stable + de-duped
-            if iso2 not in by_code:
-                by_code[iso2] = LanguageOut(code=iso2, name=name or iso2, z_id=z_id)
-
-        return [by_code[k] for k in sorted(by_code.keys())]
-
+        catalog = await get_language_catalog(request).get(repo)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+    return catalog.response(if_none_match)
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import json
 import re
 import shlex
 import uuid
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
-from starlette.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.adapters.api.dependencies import verify_api_key
 from app.adapters.api.tools.config import (
@@ -21,7 +22,6 @@ from app.adapters.api.tools.config import (
     iso_now,
     resolve_repo_path,
     safe_join_cmd,
-    truncate,
 )
 from app.adapters.api.tools.models import (
     ToolMeta,
@@ -34,7 +34,7 @@ from app.adapters.api.tools.models import (
     ToolSummary,
 )
 from app.adapters.api.tools.registry import TOOL_REGISTRY
-from app.adapters.api.tools.runner import run_process_extended
+from app.adapters.api.tools.runner import ToolProcess, ToolRunResult, tool_runs
 
 router = APIRouter(dependencies=[Depends(verify_api_key)])
 
@@ -114,10 +114,16 @@ _TOOL_ID_WORKFLOWS: Dict[str, Tuple[str, ...]] = {
     "lexicon_coverage": ("language_integration", "lexicon_work"),
     "harvest_lexicon": ("language_integration", "lexicon_work"),
     "gap_filler": ("language_integration", "lexicon_work"),
+    "render_corpus": ("lexicon_work",),
     "bootstrap_tier1": ("language_integration", "build_matrix", "debug_recovery"),
     "diagnostic_audit": ("debug_recovery",),
     "cleanup_root": ("debug_recovery",),
     "profiler": ("qa_validation",),
+    "pipeline_benchmark": ("qa_validation",),
+    "lexicon_repo_benchmark": ("qa_validation",),
+    "startup_latency": ("qa_validation",),
+    "discourse_benchmark": ("qa_validation",),
+    "normalization_benchmark": ("qa_validation",),
     "visualize_ast": ("debug_recovery",),
     "ai_refiner": ("language_integration", "debug_recovery", "ai_assist"),
     "rgl_scanner": ("build_matrix", "debug_recovery", "language_integration"),
@@ -410,7 +416,18 @@ def _workflow_tags_from_path(path: str) -> List[str]:
         tags.extend(["build_matrix", "debug_recovery"])
 
     if p.startswith("tools/qa/") or p.startswith("tests/") or any(
-        k in p for k in ("run_judge", "profiler", "ambiguity_detector", "batch_test_generator")
+        k in p
+        for k in (
+            "run_judge",
+            "profiler",
+            "pipeline_benchmark",
+            "lexicon_repo_benchmark",
+            "startup_latency",
+            "discourse_benchmark",
+            "normalization_benchmark",
+            "ambiguity_detector",
+            "batch_test_generator",
+        )
     ):
         tags.append("qa_validation")
 
@@ -875,8 +892,25 @@ async def list_tools() -> List[ToolMeta]:
     return metas
 
 
-@router.post("/run", response_model=ToolRunResponse)
-async def run_tool(payload: ToolRunRequest) -> ToolRunResponse:
+@dataclass
+class _PreparedRun:
+    trace_id: str
+    started_at: str
+    tool_id: str
+    spec: ToolSpec
+    events: List[ToolRunEvent]
+    cmd: List[str]
+    command: str
+    args_received: List[str]
+    args_accepted: List[str]
+    args_rejected: List[ToolRunArgsRejected]
+
+
+def _prepare_run(payload: ToolRunRequest) -> Union[JSONResponse, ToolRunResponse, _PreparedRun]:
+    """
+    Validate a run request. Returns the error envelope or dry-run response to
+    send as-is, or the resolved command to execute.
+    """
     trace_id = str(uuid.uuid4())
     started_at = iso_now()
     events: List[ToolRunEvent] = []
@@ -1076,66 +1110,218 @@ async def run_tool(payload: ToolRunRequest) -> ToolRunResponse:
             events=events,
         )
 
-    emit_event(events, "INFO", "process_spawned", f"Executing command with timeout {spec.timeout_sec}s")
+    return _PreparedRun(
+        trace_id=trace_id,
+        started_at=started_at,
+        tool_id=payload.tool_id,
+        spec=spec,
+        events=events,
+        cmd=final_cmd_list,
+        command=cmd_for_response,
+        args_received=normalized_args_log,
+        args_accepted=args_accepted_log,
+        args_rejected=args_rejected_log,
+    )
+
+
+def _start_process(run: _PreparedRun, *, stream: bool) -> Union[JSONResponse, ToolProcess]:
+    process = ToolProcess(
+        cmd=run.cmd,
+        timeout_sec=run.spec.timeout_sec,
+        env_updates={"TOOL_TRACE_ID": run.trace_id},
+        tool_id=run.tool_id,
+        trace_id=run.trace_id,
+        stream=stream,
+    )
+    if not tool_runs.admit(process, run.spec.max_concurrent):
+        running = [p.trace_id for p in tool_runs.running(run.tool_id)]
+        msg = f"Tool '{run.tool_id}' is already running ({len(running)} active); retry when it finishes or cancel it."
+        emit_event(run.events, "ERROR", "concurrency_limited", msg, {"running": running})
+        return error_envelope(
+            http_status=429,
+            trace_id=run.trace_id,
+            started_at=run.started_at,
+            ended_at=iso_now(),
+            tool_id=run.tool_id,
+            spec=run.spec,
+            command=run.command,
+            message=msg,
+            events=run.events,
+            args_received=run.args_received,
+            args_accepted=run.args_accepted,
+            args_rejected=run.args_rejected,
+        )
+
+    emit_event(
+        run.events,
+        "INFO",
+        "process_spawned",
+        f"Executing command with timeout {run.spec.timeout_sec}s",
+        {"streaming": stream},
+    )
+    return process
+
+
+def _run_response(run: _PreparedRun, result: ToolRunResult) -> ToolRunResponse:
+    events = run.events
+    if result.timed_out:
+        emit_event(events, "ERROR", "process_timeout", f"Process exceeded {run.spec.timeout_sec}s and was terminated.")
+    if result.cancelled:
+        emit_event(events, "WARN", "process_cancelled", "Process was cancelled.")
+    emit_event(
+        events,
+        "INFO",
+        "process_exited",
+        f"Process exited with code {result.exit_code}",
+        {"duration_ms": result.duration_ms},
+    )
+
+    if result.stdout.truncated:
+        emit_event(events, "WARN", "output_truncated", "Stdout exceeded limit; only the tail was kept.")
+    if result.stderr.truncated:
+        emit_event(events, "WARN", "output_truncated", "Stderr exceeded limit; only the tail was kept.")
+
+    stdout = result.stdout.text()
+    stderr = result.stderr.text()
+    return ToolRunResponse(
+        trace_id=run.trace_id,
+        success=(result.exit_code == 0),
+        command=run.command,
+        output=stdout,
+        error=stderr,
+        stdout=stdout,
+        stderr=stderr,
+        stdout_chars=result.stdout.total_chars,
+        stderr_chars=result.stderr.total_chars,
+        exit_code=result.exit_code,
+        duration_ms=result.duration_ms,
+        started_at=run.started_at,
+        ended_at=iso_now(),
+        cwd=str(REPO_ROOT),
+        repo_root=str(REPO_ROOT),
+        tool=tool_summary_from_spec(run.spec, run.tool_id),
+        args_received=run.args_received,
+        args_accepted=run.args_accepted,
+        args_rejected=run.args_rejected,
+        truncation=ToolRunTruncation(
+            stdout=result.stdout.truncated,
+            stderr=result.stderr.truncated,
+            limit_chars=MAX_OUTPUT_CHARS,
+        ),
+        events=events,
+    )
+
+
+def _sse(event: str, data: Any) -> str:
+    text = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return f"event: {event}\n" + "".join(f"data: {line}\n" for line in text.split("\n")) + "\n"
+
 
-    env_vars = {"TOOL_TRACE_ID": trace_id}
+async def _sse_run(run: _PreparedRun, process: ToolProcess) -> AsyncIterator[str]:
+    finished = False
     try:
-        exit_code, stdout, stderr, duration_ms = await run_in_threadpool(
-            run_process_extended,
-            final_cmd_list,
-            spec.timeout_sec,
-            env_vars,
+        # The pid only exists once the task has spawned the subprocess.
+        pid = await process.spawned()
+        yield _sse(
+            "start",
+            {
+                "trace_id": run.trace_id,
+                "tool_id": run.tool_id,
+                "command": run.command,
+                "timeout_sec": run.spec.timeout_sec,
+                "pid": pid,
+                "started_at": run.started_at,
+            },
         )
+        async for stream_name, text in process.events():
+            yield _sse(stream_name, text)
+        result = await process.wait()
+        finished = True
+        yield _sse("end", model_dump(_run_response(run, result)))
+    finally:
+        if not finished:
+            # Client disconnected: stop the tool instead of letting it run unobserved.
+            process.detach()
+            process.cancel()
+
+
+@router.post("/run", response_model=ToolRunResponse)
+async def run_tool(payload: ToolRunRequest) -> ToolRunResponse:
+    run = _prepare_run(payload)
+    if not isinstance(run, _PreparedRun):
+        return run  # type: ignore[return-value]
+
+    process = _start_process(run, stream=False)
+    if not isinstance(process, ToolProcess):
+        return process  # type: ignore[return-value]
+
+    try:
+        result = await process.wait()
+    except asyncio.CancelledError:
+        process.cancel()
+        raise
     except Exception as e:
-        ended_at = iso_now()
+        process.cancel()
         msg = f"Tool runner crashed while executing subprocess: {type(e).__name__}: {e}"
-        emit_event(events, "ERROR", "process_failed", msg)
-        return error_envelope(
+        emit_event(run.events, "ERROR", "process_failed", msg)
+        return error_envelope(  # type: ignore[return-value]
             http_status=500,
-            trace_id=trace_id,
-            started_at=started_at,
-            ended_at=ended_at,
-            tool_id=payload.tool_id,
-            spec=spec,
-            command=cmd_for_response,
+            trace_id=run.trace_id,
+            started_at=run.started_at,
+            ended_at=iso_now(),
+            tool_id=run.tool_id,
+            spec=run.spec,
+            command=run.command,
             message=msg,
-            events=events,
-            args_received=normalized_args_log,
-            args_accepted=args_accepted_log,
-            args_rejected=args_rejected_log,
+            events=run.events,
+            args_received=run.args_received,
+            args_accepted=run.args_accepted,
+            args_rejected=run.args_rejected,
         )
 
-    ended_at = iso_now()
-    emit_event(events, "INFO", "process_exited", f"Process exited with code {exit_code}", {"duration_ms": duration_ms})
+    return _run_response(run, result)
 
-    out_trunc, out_was_trunc = truncate(stdout)
-    err_trunc, err_was_trunc = truncate(stderr)
 
-    if out_was_trunc:
-        emit_event(events, "WARN", "output_truncated", "Stdout exceeded limit and was truncated.")
-    if err_was_trunc:
-        emit_event(events, "WARN", "output_truncated", "Stderr exceeded limit and was truncated.")
+@router.post("/run/stream")
+async def run_tool_stream(payload: ToolRunRequest) -> Any:
+    """
+    Same as `/run`, but streams output as Server-Sent Events:
 
-    return ToolRunResponse(
-        trace_id=trace_id,
-        success=(exit_code == 0),
-        command=cmd_for_response,
-        output=out_trunc,
-        error=err_trunc,
-        stdout=out_trunc,
-        stderr=err_trunc,
-        stdout_chars=len(stdout),
-        stderr_chars=len(stderr),
-        exit_code=exit_code,
-        duration_ms=duration_ms,
-        started_at=started_at,
-        ended_at=ended_at,
-        cwd=str(REPO_ROOT),
-        repo_root=str(REPO_ROOT),
-        tool=tool_summary_from_spec(spec, payload.tool_id),
-        args_received=normalized_args_log,
-        args_accepted=args_accepted_log,
-        args_rejected=args_rejected_log,
-        truncation=ToolRunTruncation(stdout=out_was_trunc, stderr=err_was_trunc, limit_chars=MAX_OUTPUT_CHARS),
-        events=events,
-    )
\ No newline at end of file
+    - `start`: trace_id, command, pid
+    - `stdout` / `stderr`: output chunks as the tool writes them
+    - `end`: the full ToolRunResponse envelope (output tails, exit code, events)
+
+    Validation failures and dry runs return the usual JSON envelope instead.
+    Disconnecting cancels the tool.
+    """
+    run = _prepare_run(payload)
+    if not isinstance(run, _PreparedRun):
+        return run
+
+    process = _start_process(run, stream=True)
+    if not isinstance(process, ToolProcess):
+        return process
+
+    return StreamingResponse(
+        _sse_run(run, process),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "X-Tool-Trace-Id": run.trace_id},
+    )
+
+
+@router.get("/runs")
+async def list_tool_runs() -> List[Dict[str, Any]]:
+    return [
+        {"trace_id": p.trace_id, "tool_id": p.tool_id, "pid": p.pid, "started_at": p.started_at}
+        for p in tool_runs.all()
+    ]
+
+
+@router.post("/runs/{trace_id}/cancel")
+async def cancel_tool_run(trace_id: str) -> Dict[str, Any]:
+    process = tool_runs.get(trace_id)
+    if process is None:
+        raise HTTPException(status_code=404, detail=f"No running tool with trace_id '{trace_id}'.")
+    process.cancel()
+    return {"trace_id": trace_id, "tool_id": process.tool_id, "cancelled": True}
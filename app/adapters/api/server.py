@@ -0,0 +1,427 @@
+# app/adapters/api/server.py
+"""
+Preload-then-fork API server.
+
+`uvicorn --workers N` imports the app separately in every worker, so each
+process reads the PGF, builds its own lexicon indexes and parses the family
+configs: N x memory and N x warm-up. This entry point does that work once in
+a parent process, freezes the GC so the preloaded objects are never touched
+by collections, and then forks N uvicorn workers that share the parent's
+pages copy-on-write on a single listening socket.
+
+The parent stays a small supervisor. It restarts workers that exit, forwards
+SIGTERM / SIGINT for a graceful stop, and periodically logs each worker's
+unique (private) versus shared memory from /proc/<pid>/smaps_rollup. Send
+SIGUSR1 for an immediate report.
+
+Usage:
+    python -m app.adapters.api.server --workers 4
+    architect-serve --workers 4 --preload-languages en,fr
+
+POSIX only (requires os.fork). Infrastructure connections (Redis broker, task
+queue) are opened per worker by the FastAPI lifespan, after the fork.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+import structlog
+import uvicorn
+
+from app.shared.config import settings
+
+logger = structlog.get_logger()
+
+_MB = 1024 * 1024
+
+
+# ---------------------------------------------------------------------------
+# Memory accounting
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryUsage:
+    """
+    Resident memory of one process, split by sharing.
+
+    unique: pages only this process maps (Private_Clean + Private_Dirty),
+        i.e. what killing it would free.
+    shared: resident pages also mapped by another process (Shared_Clean +
+        Shared_Dirty), e.g. preloaded state inherited from the parent.
+    pss: proportional set size (shared pages divided among their sharers).
+    """
+
+    pid: int
+    rss: int
+    pss: int
+    shared: int
+    unique: int
+
+    def as_mb(self) -> Dict[str, Any]:
+        return {
+            "pid": self.pid,
+            **{k: round(v / _MB, 1) for k, v in asdict(self).items() if k != "pid"},
+        }
+
+
+def parse_smaps(text: str, pid: int) -> MemoryUsage:
+    """Sum the fields of /proc/<pid>/smaps_rollup (or smaps) into a MemoryUsage."""
+    totals: Dict[str, int] = {}
+    for line in text.splitlines():
+        name, sep, rest = line.partition(":")
+        if not sep:
+            continue
+        parts = rest.split()
+        if len(parts) == 2 and parts[1] == "kB" and parts[0].isdigit():
+            totals[name] = totals.get(name, 0) + int(parts[0]) * 1024
+
+    return MemoryUsage(
+        pid=pid,
+        rss=totals.get("Rss", 0),
+        pss=totals.get("Pss", 0),
+        shared=totals.get("Shared_Clean", 0) + totals.get("Shared_Dirty", 0),
+        unique=totals.get("Private_Clean", 0) + totals.get("Private_Dirty", 0),
+    )
+
+
+def read_memory_usage(pid: int) -> Optional[MemoryUsage]:
+    """Return a process's MemoryUsage, or None where /proc is unavailable."""
+    for name in ("smaps_rollup", "smaps"):
+        try:
+            with open(f"/proc/{pid}/{name}", encoding="utf-8") as fh:
+                return parse_smaps(fh.read(), pid)
+        except (FileNotFoundError, PermissionError, ProcessLookupError):
+            continue
+        except OSError:
+            return None
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Preload
+# ---------------------------------------------------------------------------
+
+
+def _resolve_languages(spec: str) -> List[str]:
+    spec = (spec or "").strip()
+    if not spec:
+        return []
+    if spec == "*":
+        from app.shared.lexicon import lexicon
+
+        return lexicon.available_languages()
+    return [x.strip() for x in spec.split(",") if x.strip()]
+
+
+def preload_state(*, languages: str = "*") -> Dict[str, Any]:
+    """
+    Load process-wide read-mostly state so forked workers inherit it.
+
+    - grammar: the container's grammar engine, with the PGF read (outside an
+      event loop the GF engine's `grammar` property loads synchronously);
+    - lexicon: per-language indexes in the shared lexicon cache;
+    - family configs: engine modules and per-language config JSON.
+
+    Failures are logged and reported in the summary; a worker can still
+    load anything missing lazily.
+    """
+    from app.adapters.engines.family_construction_adapter import preload_family_configs
+    from app.adapters.persistence.lexicon.cache import get_or_build_index
+    from app.shared.container import container
+
+    summary: Dict[str, Any] = {}
+
+    started = time.perf_counter()
+    engine = container.grammar_engine()
+    grammar = getattr(engine, "grammar", None)
+    summary["grammar"] = {
+        "engine": type(engine).__name__,
+        "loaded": grammar is not None,
+        "languages": len(getattr(grammar, "languages", {}) or {}),
+        "error": getattr(engine, "last_load_error", None),
+        "ms": round((time.perf_counter() - started) * 1000.0, 1),
+    }
+
+    started = time.perf_counter()
+    loaded: List[str] = []
+    failed: List[str] = []
+    for lang in _resolve_languages(languages):
+        try:
+            get_or_build_index(lang)
+            loaded.append(lang)
+        except Exception as e:
+            failed.append(lang)
+            logger.warning("preload_lexicon_failed", lang=lang, error=str(e))
+    summary["lexicon"] = {
+        "languages": len(loaded),
+        "failed": failed,
+        "ms": round((time.perf_counter() - started) * 1000.0, 1),
+    }
+
+    started = time.perf_counter()
+    try:
+        summary["family_configs"] = preload_family_configs()
+    except Exception as e:
+        summary["family_configs"] = {"error": str(e)}
+        logger.warning("preload_family_configs_failed", error=str(e))
+    summary["family_configs"]["ms"] = round((time.perf_counter() - started) * 1000.0, 1)
+
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# Supervisor
+# ---------------------------------------------------------------------------
+
+
+class PreforkServer:
+    """
+    Fork `workers` uvicorn servers from a preloaded parent and supervise them.
+
+    The app object and listening socket are created in the parent; each child
+    re-enables the GC (objects frozen before the fork stay out of its
+    collections) and runs `uvicorn.Server` on the inherited socket.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        sock: socket.socket,
+        *,
+        workers: int,
+        memory_report_sec: float = 60.0,
+        graceful_timeout_sec: float = 30.0,
+        log_level: str = "info",
+    ) -> None:
+        self.app = app
+        self.sock = sock
+        self.workers = max(1, int(workers))
+        self.memory_report_sec = float(memory_report_sec)
+        self.graceful_timeout_sec = float(graceful_timeout_sec)
+        self.log_level = log_level
+
+        self._children: Dict[int, float] = {}  # pid -> start time (monotonic)
+        self._stopping = False
+        self._report_requested = False
+
+    # -- child ------------------------------------------------------------
+
+    def _run_worker(self) -> None:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        # `pkill -USR1` on the process group must not kill workers.
+        signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+        gc.enable()
+
+        config = uvicorn.Config(self.app, log_level=self.log_level, lifespan="on")
+        uvicorn.Server(config).run(sockets=[self.sock])
+
+    def _spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:  # child
+            code = 0
+            try:
+                self._run_worker()
+            except BaseException as e:  # noqa: BLE001 - report and exit the child
+                code = 1
+                logger.error("prefork_worker_crashed", error=str(e))
+            finally:
+                os._exit(code)
+
+        self._children[pid] = time.monotonic()
+        logger.info("prefork_worker_started", pid=pid)
+        return pid
+
+    # -- parent -----------------------------------------------------------
+
+    def _on_stop(self, signum: int, _frame: Any) -> None:
+        logger.info("prefork_stopping", signal=signal.Signals(signum).name)
+        self._stopping = True
+
+    def _on_report(self, _signum: int, _frame: Any) -> None:
+        self._report_requested = True
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+            started = self._children.pop(pid, None)
+            if started is None:
+                continue
+            log = logger.info if self._stopping else logger.warning
+            log("prefork_worker_exited", pid=pid, exit_code=os.waitstatus_to_exitcode(status))
+
+            if not self._stopping:
+                # Back off a little on crash loops (e.g. lifespan failing).
+                if time.monotonic() - started < 1.0:
+                    time.sleep(1.0)
+                self._spawn()
+
+    def memory_report(self) -> Dict[str, Any]:
+        """Log and return unique vs shared memory for the parent and every worker."""
+        parent = read_memory_usage(os.getpid())
+        workers = [m for m in (read_memory_usage(pid) for pid in sorted(self._children)) if m is not None]
+        report: Dict[str, Any] = {
+            "parent": parent.as_mb() if parent else None,
+            "workers": [m.as_mb() for m in workers],
+            "workers_unique_mb": round(sum(m.unique for m in workers) / _MB, 1),
+            "workers_shared_mb": round(sum(m.shared for m in workers) / _MB, 1),
+            "workers_pss_mb": round(sum(m.pss for m in workers) / _MB, 1),
+        }
+        logger.info("prefork_memory_report", **report)
+        return report
+
+    def _shutdown(self) -> None:
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._children.pop(pid, None)
+
+        deadline = time.monotonic() + self.graceful_timeout_sec
+        while self._children and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+
+        for pid in list(self._children):
+            logger.warning("prefork_worker_killed", pid=pid)
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self._children.pop(pid, None)
+
+        self.sock.close()
+        logger.info("prefork_stopped")
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGUSR1, self._on_report)
+
+        for _ in range(self.workers):
+            self._spawn()
+
+        # First report once workers have finished their lifespan startup.
+        next_report = (
+            time.monotonic() + min(5.0, self.memory_report_sec) if self.memory_report_sec > 0 else None
+        )
+        while not self._stopping:
+            self._reap()
+            now = time.monotonic()
+            if self._report_requested or (next_report is not None and now >= next_report):
+                self._report_requested = False
+                self.memory_report()
+                if next_report is not None:
+                    next_report = now + self.memory_report_sec
+            time.sleep(0.2)
+
+        self._shutdown()
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def serve(
+    *,
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: Optional[int] = None,
+    preload_languages: Optional[str] = None,
+    memory_report_sec: Optional[float] = None,
+    log_level: str = "info",
+) -> int:
+    if not hasattr(os, "fork"):
+        raise SystemExit("Preforking requires os.fork(); use `uvicorn --workers N` on this platform.")
+
+    # Keep the preload from leaving freed holes in pages the workers share.
+    gc.disable()
+    started = time.perf_counter()
+
+    from app.adapters.api.main import create_app
+
+    app = create_app()
+    summary = preload_state(
+        languages=preload_languages if preload_languages is not None else settings.API_PRELOAD_LANGUAGES
+    )
+
+    config = uvicorn.Config(app, host=host, port=port, log_level=log_level)
+    sock = config.bind_socket()
+
+    # Move everything preloaded to the permanent generation: worker
+    # collections never write to (and so never un-share) those pages.
+    gc.collect()
+    gc.freeze()
+
+    logger.info(
+        "prefork_preloaded",
+        preload_ms=round((time.perf_counter() - started) * 1000.0, 1),
+        frozen_objects=gc.get_freeze_count(),
+        **summary,
+    )
+
+    server = PreforkServer(
+        app,
+        sock,
+        workers=workers if workers is not None else settings.API_WORKERS,
+        memory_report_sec=(
+            memory_report_sec if memory_report_sec is not None else settings.API_MEMORY_REPORT_SEC
+        ),
+        log_level=log_level,
+    )
+    return server.run()
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Preload-then-fork API server.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None, help="Default: API_WORKERS.")
+    parser.add_argument(
+        "--preload-languages",
+        default=None,
+        help="Comma-separated lexicon languages to preload, '*' for all, '' for none. "
+        "Default: API_PRELOAD_LANGUAGES.",
+    )
+    parser.add_argument(
+        "--memory-report-sec",
+        type=float,
+        default=None,
+        help="Seconds between per-worker memory reports (0 disables). Default: API_MEMORY_REPORT_SEC.",
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    sys.exit(
+        serve(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            preload_languages=args.preload_languages,
+            memory_report_sec=args.memory_report_sec,
+            log_level=args.log_level,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ TOOL_ID_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_.-]{0,63}$")
 
 MAX_OUTPUT_CHARS = int(os.getenv("ARCHITECT_TOOLS_MAX_OUTPUT_CHARS", "200000"))
 DEFAULT_TIMEOUT_SEC = int(os.getenv("ARCHITECT_TOOLS_DEFAULT_TIMEOUT_SEC", "600"))
+MAX_CONCURRENT_PER_TOOL = int(os.getenv("ARCHITECT_TOOLS_MAX_CONCURRENT_PER_TOOL", "1"))
 AI_TOOLS_ENABLED = os.getenv("ARCHITECT_ENABLE_AI_TOOLS", "").strip().lower() in {"1", "true", "yes", "y"}
 
 
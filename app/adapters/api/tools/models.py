@@ -26,6 +26,9 @@ class ToolSpec:
     cmd: Tuple[str, ...]  # supports "{target}" placeholder
     timeout_sec: int
 
+    # Concurrent runs of this tool per API process (None: ARCHITECT_TOOLS_MAX_CONCURRENT_PER_TOOL).
+    max_concurrent: Optional[int] = None
+
     allow_args: bool = False
     allowed_flags: Tuple[str, ...] = ()
     allow_positionals: bool = False
@@ -128,9 +128,10 @@ def build_registry() -> Dict[str, ToolSpec]:
                 "--regen-lex",
                 "--regen-app",
                 "--regen-qa",
+                "--jobs",
             ),
             allow_positionals=False,
-            flags_with_value=("--out",),
+            flags_with_value=("--out", "--jobs"),
             flags_with_multi_value=("--langs",),
         ),
         "app_scanner": py_script(
@@ -258,6 +259,51 @@ def build_registry() -> Dict[str, ToolSpec]:
             allow_positionals=True,
             flags_with_value=("--root", "--lang", "--out", "--input", "--domain"),
         ),
+        "render_corpus": py_script(
+            "render_corpus",
+            "tools/render_corpus.py",
+            "Renders an NDJSON (.gz) frame corpus into sharded per-language NDJSON text with checkpoint/resume.",
+            title="Render Corpus",
+            category="Lexicon & Data",
+            group="Corpus Generation",
+            risk="moderate",
+            workflow_tags=("lexicon_work",),
+            timeout_sec=3600,
+            allow_args=True,
+            allowed_flags=(
+                "--input",
+                "--out",
+                "--langs",
+                "--workers",
+                "--batch-size",
+                "--max-inflight",
+                "--shard-size",
+                "--checkpoint-every",
+                "--fsync",
+                "--fresh",
+                "--limit",
+                "--max-error-rate",
+                "--progress-every",
+                "--json-out",
+                "--verbose",
+            ),
+            allow_positionals=False,
+            flags_with_value=(
+                "--input",
+                "--out",
+                "--workers",
+                "--batch-size",
+                "--max-inflight",
+                "--shard-size",
+                "--checkpoint-every",
+                "--limit",
+                "--max-error-rate",
+                "--progress-every",
+                "--json-out",
+            ),
+            flags_with_multi_value=("--langs",),
+            supports_json=True,
+        ),
         "build_lexicon_wikidata": py_script(
             "build_lexicon_wikidata",
             "utils/build_lexicon_from_wikidata.py",
@@ -221,6 +221,207 @@ def maintenance_registry() -> Dict[str, ToolSpec]:
             supports_verbose=True,
             supports_json=False,
         ),
+        "pipeline_benchmark": py_script(
+            "pipeline_benchmark",
+            "tools/health/pipeline_benchmark.py",
+            "Benchmarks each planner-first stage per construction x language x backend.",
+            title="Pipeline Benchmark",
+            category="QA & Validation",
+            group="Performance",
+            risk="moderate",
+            timeout_sec=600,
+            allow_args=True,
+            allowed_flags=(
+                "--constructions",
+                "--langs",
+                "--backends",
+                "--iterations",
+                "--alloc-iterations",
+                "--debug-modes",
+                "--verbose",
+            ),
+            allow_positionals=False,
+            flags_with_value=("--iterations", "--alloc-iterations", "--debug-modes"),
+            flags_with_multi_value=("--constructions", "--langs", "--backends"),
+            workflow_ids=("qa_validation", "all"),
+            long_description=(
+                "Times planning, construction selection, slot building, lexical resolution "
+                "and realization separately for every cell of the benchmark matrix, plus "
+                "response mapping/encoding. With --debug-modes both, each cell also runs in lean "
+                "(/generate?debug=false) mode and the per-request CPU saved is reported. "
+                "Backends that are unavailable on this machine (e.g. GF without pgf) are skipped. "
+                "Runs here are report-only; the baseline regression gate (--baseline) is for local CLI use."
+            ),
+            parameter_docs=(
+                {"flag": "--constructions", "description": "Construction ids to benchmark", "example": "--constructions copula_equative_classification"},
+                {"flag": "--langs", "description": "Languages to benchmark", "example": "--langs en fr"},
+                {"flag": "--backends", "description": "Realizer backends", "example": "--backends family safe_mode"},
+                {"flag": "--iterations", "description": "Timed iterations per cell", "example": "--iterations 200"},
+                {"flag": "--alloc-iterations", "description": "Allocation-tracing iterations per cell", "example": "--alloc-iterations 20"},
+                {"flag": "--debug-modes", "description": "Debug payloads on, off (lean) or both", "example": "--debug-modes both"},
+                {"flag": "--verbose", "description": "Keep runtime info logs enabled"},
+            ),
+            common_failure_modes=(
+                "A backend raised during timed iterations after passing warmup.",
+            ),
+            supports_verbose=True,
+            supports_json=False,
+        ),
+        "lexicon_repo_benchmark": py_script(
+            "lexicon_repo_benchmark",
+            "tools/health/lexicon_repo_benchmark.py",
+            "Benchmarks sequential lexicon saves for the journal and JSON repository backends.",
+            title="Lexicon Repo Benchmark",
+            category="QA & Validation",
+            group="Performance",
+            risk="safe",
+            timeout_sec=900,
+            allow_args=True,
+            allowed_flags=(
+                "--entries",
+                "--json-entries",
+                "--backends",
+                "--batch-size",
+                "--compact-every",
+                "--fsync",
+                "--qid-queries",
+                "--update-baseline",
+                "--threshold",
+                "--verbose",
+            ),
+            allow_positionals=False,
+            flags_with_value=(
+                "--entries",
+                "--json-entries",
+                "--batch-size",
+                "--compact-every",
+                "--qid-queries",
+                "--threshold",
+            ),
+            flags_with_multi_value=("--backends",),
+            workflow_ids=("qa_validation", "all"),
+            long_description=(
+                "Runs N sequential save_entry() calls against a temporary directory for each "
+                "LexiconRepo backend, then times QID lookups and the final journal compaction. "
+                "The JSON backend rewrites the whole shard per save, so it uses a smaller count."
+            ),
+            parameter_docs=(
+                {"flag": "--entries", "description": "Saves for the journal backend", "example": "--entries 50000"},
+                {"flag": "--json-entries", "description": "Saves for the JSON backend", "example": "--json-entries 2000"},
+                {"flag": "--backends", "description": "Backends to run", "example": "--backends journal"},
+                {"flag": "--batch-size", "description": "Use save_entries() in batches", "example": "--batch-size 500"},
+                {"flag": "--compact-every", "description": "Journal records between compactions", "example": "--compact-every 5000"},
+                {"flag": "--fsync", "description": "fsync every journal append"},
+                {"flag": "--qid-queries", "description": "QID lookups to time", "example": "--qid-queries 1000"},
+                {"flag": "--update-baseline", "description": "Persist journal saves/sec as the new baseline"},
+                {"flag": "--threshold", "description": "Allowed saves/sec drop vs baseline", "example": "--threshold 0.25"},
+                {"flag": "--verbose", "description": "Keep runtime info logs enabled"},
+            ),
+            common_failure_modes=(
+                "Baseline was recorded on different hardware or filesystem.",
+                "--fsync on slow disks dominates the measurement.",
+            ),
+            supports_verbose=True,
+            supports_json=False,
+        ),
+        "startup_latency": py_script(
+            "startup_latency",
+            "tools/health/startup_latency.py",
+            "Reports cold import/startup latency of the API and CLI entry points.",
+            title="Startup Latency Report",
+            category="QA & Validation",
+            group="Performance",
+            risk="safe",
+            timeout_sec=600,
+            allow_args=True,
+            allowed_flags=("--entry-points", "--runs", "--top", "--budget-scale"),
+            allow_positionals=False,
+            flags_with_value=("--runs", "--top", "--budget-scale"),
+            flags_with_multi_value=("--entry-points",),
+            workflow_ids=("qa_validation", "all"),
+            long_description=(
+                "Imports each entry point (app.adapters.api.main, nlg.api, app.shared.container, "
+                "app.core.domain) in fresh interpreters under `python -X importtime`, reports import "
+                "and wall time, and lists the heaviest modules. Fails when an entry point is over budget."
+            ),
+            parameter_docs=(
+                {"flag": "--entry-points", "description": "Modules to import", "example": "--entry-points nlg.api"},
+                {"flag": "--runs", "description": "Cold imports per entry point", "example": "--runs 5"},
+                {"flag": "--top", "description": "Heaviest modules to list", "example": "--top 10"},
+                {"flag": "--budget-scale", "description": "Multiply every budget", "example": "--budget-scale 2"},
+            ),
+            common_failure_modes=(
+                "A heavy adapter (boto3, redis, Gemini) is imported at module level again.",
+                "Cold filesystem cache on the first run inflates wall time.",
+            ),
+            supports_verbose=False,
+            supports_json=False,
+        ),
+        "discourse_benchmark": py_script(
+            "discourse_benchmark",
+            "tools/health/discourse_benchmark.py",
+            "Checks that discourse state (salience decay, topic choice) costs O(1) per sentence.",
+            title="Discourse State Benchmark",
+            category="QA & Validation",
+            group="Performance",
+            risk="safe",
+            timeout_sec=600,
+            allow_args=True,
+            allowed_flags=("--sizes", "--mentions", "--repeats", "--max-growth", "--eager"),
+            allow_positionals=False,
+            flags_with_value=("--mentions", "--repeats", "--max-growth"),
+            flags_with_multi_value=("--sizes",),
+            workflow_ids=("qa_validation", "all"),
+            long_description=(
+                "Runs DiscourseState over documents of N sentences and N entities for growing N and "
+                "reports microseconds per sentence. Fails when the per-sentence cost grows more than "
+                "--max-growth from the smallest to the largest size; --eager times the old "
+                "decay-every-entry strategy alongside."
+            ),
+            parameter_docs=(
+                {"flag": "--sizes", "description": "Sentences (= entities) per document", "example": "--sizes 1000 4000 16000"},
+                {"flag": "--mentions", "description": "Mentions per sentence", "example": "--mentions 3"},
+                {"flag": "--repeats", "description": "Best-of runs per size", "example": "--repeats 3"},
+                {"flag": "--max-growth", "description": "Allowed per-sentence cost ratio", "example": "--max-growth 3"},
+                {"flag": "--eager", "description": "Also time the eager strategy"},
+            ),
+            common_failure_modes=(
+                "A busy machine inflates one size more than the others; rerun with more --repeats.",
+            ),
+            supports_verbose=False,
+            supports_json=False,
+        ),
+        "normalization_benchmark": py_script(
+            "normalization_benchmark",
+            "tools/health/normalization_benchmark.py",
+            "Times memoized role/gender normalization and the flat BioFrame fast path.",
+            title="Frame Normalization Benchmark",
+            category="QA & Validation",
+            group="Performance",
+            risk="safe",
+            timeout_sec=300,
+            allow_args=True,
+            allowed_flags=("--iterations", "--frames", "--repeats", "--min-speedup"),
+            allow_positionals=False,
+            flags_with_value=("--iterations", "--frames", "--repeats", "--min-speedup"),
+            workflow_ids=("qa_validation", "all"),
+            long_description=(
+                "Reports nanoseconds per call for canonical_role, normalize_gender and "
+                "normalize_bio_frame. Role canonicalization and bio frames are compared with their "
+                "uncached / generic reference paths; fails when either speedup is below --min-speedup."
+            ),
+            parameter_docs=(
+                {"flag": "--iterations", "description": "Calls per role/gender measurement", "example": "--iterations 200000"},
+                {"flag": "--frames", "description": "Payloads per bio-frame measurement", "example": "--frames 20000"},
+                {"flag": "--repeats", "description": "Best-of runs per measurement", "example": "--repeats 5"},
+                {"flag": "--min-speedup", "description": "Required reference/fast ratio", "example": "--min-speedup 1.2"},
+            ),
+            common_failure_modes=(
+                "A busy machine skews one side of a comparison; rerun with more --repeats.",
+            ),
+            supports_verbose=False,
+            supports_json=False,
+        ),
         "visualize_ast": py_script(
             "visualize_ast",
             "tools/debug/visualize_ast.py",
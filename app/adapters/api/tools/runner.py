@@ -1,11 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
 import os
+import signal
 import subprocess
 import time
-from typing import Dict, Sequence, Tuple
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
-from .config import REPO_ROOT
+from .config import MAX_CONCURRENT_PER_TOOL, MAX_OUTPUT_CHARS, REPO_ROOT, iso_now
+
+# Exit codes for runs the runner itself ended.
+EXIT_TIMEOUT = 124
+EXIT_CANCELLED = 130
+EXIT_RUNNER_ERROR = 127
+
+_READ_CHUNK = 8192
+_KILL_GRACE_SEC = 5.0
+
+
+def _tool_env(env_updates: Dict[str, str]) -> Dict[str, str]:
+    env = os.environ.copy()
+    env["PYTHONUNBUFFERED"] = "1"
+    env["PYTHONPATH"] = str(REPO_ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+    env.update(env_updates)
+    return env
 
 
 def run_process_extended(
@@ -13,10 +34,8 @@ def run_process_extended(
     timeout_sec: int,
     env_updates: Dict[str, str],
 ) -> Tuple[int, str, str, int]:
-    env = os.environ.copy()
-    env["PYTHONUNBUFFERED"] = "1"
-    env["PYTHONPATH"] = str(REPO_ROOT) + os.pathsep + env.get("PYTHONPATH", "")
-    env.update(env_updates)
+    """Blocking runner (buffers all output). Kept for scripts; the API uses ToolProcess."""
+    env = _tool_env(env_updates)
 
     started = time.time()
     try:
@@ -44,3 +63,284 @@ def run_process_extended(
     except Exception as e:
         duration_ms = int((time.time() - started) * 1000)
         return 127, "", f"CRITICAL RUNNER ERROR: {str(e)}\n", duration_ms
+
+
+# -----------------------------------------------------------------------------
+# Async streaming runner
+# -----------------------------------------------------------------------------
+class OutputRing:
+    """
+    Keeps the last `limit_chars` characters of a stream.
+
+    Long builds print most of their diagnostics at the end, so the tail is
+    what is worth keeping; memory stays bounded however much the tool prints.
+    """
+
+    def __init__(self, limit_chars: int = MAX_OUTPUT_CHARS) -> None:
+        self.limit_chars = max(1, int(limit_chars))
+        self.total_chars = 0
+        self._chunks: Deque[str] = deque()
+        self._size = 0
+
+    @property
+    def truncated(self) -> bool:
+        return self.total_chars > self._size
+
+    def append(self, text: str) -> None:
+        if not text:
+            return
+        self.total_chars += len(text)
+        if len(text) >= self.limit_chars:
+            self._chunks.clear()
+            text = text[-self.limit_chars :]
+            self._size = 0
+        self._chunks.append(text)
+        self._size += len(text)
+        while self._size > self.limit_chars:
+            head = self._chunks[0]
+            excess = self._size - self.limit_chars
+            if len(head) <= excess:
+                self._chunks.popleft()
+                self._size -= len(head)
+            else:
+                self._chunks[0] = head[excess:]
+                self._size -= excess
+
+    def text(self) -> str:
+        body = "".join(self._chunks)
+        return f"[TRUNCATED] ...\n{body}" if self.truncated else body
+
+
+@dataclass
+class ToolRunResult:
+    exit_code: int
+    stdout: OutputRing
+    stderr: OutputRing
+    duration_ms: int
+    timed_out: bool = False
+    cancelled: bool = False
+
+
+@dataclass
+class ToolProcess:
+    """
+    One tool subprocess run with asyncio pipes.
+
+    Output is decoded incrementally into per-stream ring buffers. When
+    `stream=True`, chunks are also published to a bounded queue consumed by
+    `events()`; a slow consumer back-pressures the tool through its pipe
+    rather than growing memory. `cancel()` (or the timeout) terminates the
+    whole process group, then kills it after a grace period.
+    """
+
+    cmd: Sequence[str]
+    timeout_sec: int
+    env_updates: Dict[str, str]
+    tool_id: str = ""
+    trace_id: str = ""
+    limit_chars: int = MAX_OUTPUT_CHARS
+    stream: bool = False
+    started_at: str = field(default_factory=iso_now)
+
+    def __post_init__(self) -> None:
+        self.stdout = OutputRing(self.limit_chars)
+        self.stderr = OutputRing(self.limit_chars)
+        self.pid: Optional[int] = None
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._queue: Optional[asyncio.Queue] = asyncio.Queue(maxsize=256) if self.stream else None
+        self._cancel = asyncio.Event()
+        # Set once create_subprocess_exec returned (or failed), i.e. `pid` is final.
+        self._spawned = asyncio.Event()
+        self._detached = False
+        self._task: Optional[asyncio.Task] = None
+
+    # -- lifecycle ------------------------------------------------------------
+    def start(self) -> "ToolProcess":
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    def add_done_callback(self, callback: Callable[["asyncio.Task[ToolRunResult]"], None]) -> None:
+        assert self._task is not None, "start() first"
+        self._task.add_done_callback(callback)
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def detach(self) -> None:
+        """Stop publishing to `events()` (its consumer is gone); rings keep filling."""
+        self._detached = True
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
+    @property
+    def done(self) -> bool:
+        return self._task is not None and self._task.done()
+
+    async def spawned(self) -> Optional[int]:
+        """Wait until the subprocess exists; returns its pid (None if it could not start)."""
+        self.start()
+        await self._spawned.wait()
+        return self.pid
+
+    async def wait(self) -> ToolRunResult:
+        self.start()
+        assert self._task is not None
+        return await asyncio.shield(self._task)
+
+    async def events(self) -> AsyncIterator[Tuple[str, str]]:
+        """Yield ("stdout" | "stderr", text) chunks until the process ends."""
+        if self._queue is None:
+            raise RuntimeError("ToolProcess was created without stream=True")
+        self.start()
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            yield item
+
+    # -- internals ------------------------------------------------------------
+    async def _run(self) -> ToolRunResult:
+        started = time.monotonic()
+        timed_out = cancelled = False
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                *self.cmd,
+                cwd=str(REPO_ROOT),
+                env=_tool_env(self.env_updates),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                # Own process group so cancellation reaches grandchildren (gf, make, ...).
+                start_new_session=hasattr(os, "killpg"),
+            )
+            self.pid = self._proc.pid
+            self._spawned.set()
+            readers = [
+                asyncio.create_task(self._pump(self._proc.stdout, "stdout", self.stdout)),
+                asyncio.create_task(self._pump(self._proc.stderr, "stderr", self.stderr)),
+            ]
+
+            waiter = asyncio.create_task(self._proc.wait())
+            canceller = asyncio.create_task(self._cancel.wait())
+            done, _ = await asyncio.wait(
+                {waiter, canceller},
+                timeout=self.timeout_sec if self.timeout_sec and self.timeout_sec > 0 else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            canceller.cancel()
+            if waiter not in done:
+                if canceller in done:
+                    cancelled = True
+                else:
+                    timed_out = True
+                await self._terminate()
+            exit_code = await waiter
+            # Grandchildren may still hold the pipes open; do not wait on them forever.
+            _, pending = await asyncio.wait(readers, timeout=_KILL_GRACE_SEC)
+            for task in pending:
+                task.cancel()
+
+            if timed_out:
+                self.stderr.append(f"\nProcess timed out (limit: {self.timeout_sec}s).")
+                exit_code = EXIT_TIMEOUT
+            elif cancelled:
+                self.stderr.append("\nProcess cancelled.")
+                exit_code = EXIT_CANCELLED
+        except asyncio.CancelledError:
+            # The owning request went away: never leave the tool running.
+            await self._terminate()
+            raise
+        except Exception as e:
+            self.stderr.append(f"CRITICAL RUNNER ERROR: {str(e)}\n")
+            exit_code = EXIT_RUNNER_ERROR
+        finally:
+            self._spawned.set()
+            await self._publish(None)
+
+        return ToolRunResult(
+            exit_code=exit_code,
+            stdout=self.stdout,
+            stderr=self.stderr,
+            duration_ms=int((time.monotonic() - started) * 1000),
+            timed_out=timed_out,
+            cancelled=cancelled,
+        )
+
+    async def _pump(self, reader: Optional[asyncio.StreamReader], name: str, ring: OutputRing) -> None:
+        if reader is None:
+            return
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            data = await reader.read(_READ_CHUNK)
+            text = decoder.decode(data, final=not data)
+            if text:
+                ring.append(text)
+                await self._publish((name, text))
+            if not data:
+                return
+
+    async def _publish(self, item: Optional[Tuple[str, str]]) -> None:
+        if self._queue is None or self._detached:
+            return
+        await self._queue.put(item)
+
+    def _signal(self, sig: int) -> None:
+        proc = self._proc
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(proc.pid, sig)
+            else:  # pragma: no cover - Windows
+                proc.send_signal(sig)
+        except ProcessLookupError:
+            pass
+
+    async def _terminate(self) -> None:
+        proc = self._proc
+        if proc is None or proc.returncode is not None:
+            return
+        self._signal(signal.SIGTERM)
+        try:
+            await asyncio.wait_for(asyncio.shield(proc.wait()), timeout=_KILL_GRACE_SEC)
+        except asyncio.TimeoutError:
+            self._signal(getattr(signal, "SIGKILL", signal.SIGTERM))
+
+
+class ToolRunManager:
+    """
+    In-process registry of running tools.
+
+    Caps concurrent runs per tool id (a second `compile_pgf` while one is
+    linking only contends for the same files) and lets a run be cancelled
+    by trace id.
+    """
+
+    def __init__(self, default_limit: int = MAX_CONCURRENT_PER_TOOL) -> None:
+        self.default_limit = max(1, int(default_limit))
+        self._runs: Dict[str, ToolProcess] = {}
+
+    def running(self, tool_id: str) -> List[ToolProcess]:
+        return [p for p in self._runs.values() if p.tool_id == tool_id]
+
+    def admit(self, process: ToolProcess, limit: Optional[int] = None) -> bool:
+        """Start `process` unless its tool is at capacity. It is released when it exits."""
+        cap = max(1, int(limit or self.default_limit))
+        if len(self.running(process.tool_id)) >= cap:
+            return False
+        self._runs[process.trace_id] = process
+        process.start().add_done_callback(lambda _: self.release(process.trace_id))
+        return True
+
+    def release(self, trace_id: str) -> None:
+        self._runs.pop(trace_id, None)
+
+    def get(self, trace_id: str) -> Optional[ToolProcess]:
+        return self._runs.get(trace_id)
+
+    def all(self) -> List[ToolProcess]:
+        return list(self._runs.values())
+
+
+tool_runs = ToolRunManager()
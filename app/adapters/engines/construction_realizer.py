@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import inspect
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Mapping
 from collections.abc import Mapping as ABCMapping, Sequence
@@ -9,6 +10,8 @@ from collections.abc import Mapping as ABCMapping, Sequence
 import structlog
 
 from app.core.domain.exceptions import DomainError
+from app.shared.debug_payloads import debug_payloads_enabled
+from app.shared.timing import current_stage_timer
 
 try:
     from app.core.domain.exceptions import RealizationError  # type: ignore
@@ -52,6 +55,7 @@ _BACKEND_ALIASES: dict[str, str] = {
     "safe": "safe_mode",
 }
 _ATTEMPTABLE_STATUSES = {"full", "partial", "fallback_only"}
+_MAX_DISPATCH_TABLE_ENTRIES = 8192
 
 
 @dataclass(frozen=True, slots=True)
@@ -205,6 +209,12 @@ class ConstructionRealizer:
 
     The dispatcher itself does not reinterpret the construction. It only selects
     which backend is allowed to realize the already-chosen ConstructionPlan.
+
+    Per-backend support statuses are kept in a dispatch table keyed by
+    (construction_id, lang_code), so capability probes run once per pair rather
+    than on every request. Backends may expose a `capability_version` attribute
+    (bumped on grammar/profile reload); any change to those versions discards
+    the table.
     """
 
     def __init__(
@@ -235,6 +245,17 @@ class ConstructionRealizer:
 
         self.dispatch_order: tuple[str, ...] = tuple(normalized_order)
 
+        self._dispatch_table: dict[tuple[str, str], dict[str, str]] = {}
+        self._capability_stamp: tuple[Any, ...] = self._current_capability_stamp()
+        self._warm_pairs: tuple[tuple[str, ...], tuple[str, ...]] = ((), ())
+
+        # Backends that can reload in place (e.g. family profiles) tell the
+        # dispatcher, so the warmed table is rebuilt at reload time.
+        for realizer in self._realizers.values():
+            add_listener = getattr(realizer, "add_reload_listener", None)
+            if callable(add_listener):
+                add_listener(self.refresh_dispatch_table)
+
     @property
     def backend_name(self) -> str:
         return "dispatcher"
@@ -250,18 +271,7 @@ class ConstructionRealizer:
         seen_partial = False
         seen_fallback_only = False
 
-        for backend_name in self.dispatch_order:
-            realizer = self._realizers.get(backend_name)
-            if realizer is None:
-                continue
-
-            status = self._get_backend_support_status(
-                backend_name=backend_name,
-                realizer=realizer,
-                construction_id=construction_id,
-                lang_code=lang_code,
-            )
-
+        for status in self._support_statuses(construction_id, lang_code).values():
             if status == "full":
                 return "full"
             if status == "partial":
@@ -283,6 +293,7 @@ class ConstructionRealizer:
         forced_backend = self._resolve_forced_backend(plan)
         allow_fallback = self._resolve_allow_fallback(plan)
 
+        statuses = self._support_statuses(construction_id, lang_code)
         call_order = self._resolve_call_order(
             construction_id=construction_id,
             lang_code=lang_code,
@@ -296,69 +307,95 @@ class ConstructionRealizer:
                 f"'{construction_id}' and language '{lang_code}'."
             )
 
+        # Trace entries are only built when the request wants debug payloads.
+        debug = debug_payloads_enabled()
         backend_trace: list[dict[str, Any]] = []
         attempted_backends: list[str] = []
         failures: list[dict[str, str]] = []
 
+        # Per-attempt spans (including failed fallbacks) when a request-level
+        # StageTimer is active; a single ContextVar read otherwise.
+        timer = current_stage_timer()
+        attempt_started = 0
+
         for backend_name in call_order:
             realizer = self._realizers.get(backend_name)
             if realizer is None:
-                backend_trace.append(
-                    {
-                        "backend": backend_name,
-                        "event": "skipped",
-                        "reason": "not_configured",
-                    }
-                )
+                if debug:
+                    backend_trace.append(
+                        {
+                            "backend": backend_name,
+                            "event": "skipped",
+                            "reason": "not_configured",
+                        }
+                    )
                 continue
 
-            support_status = self._get_backend_support_status(
-                backend_name=backend_name,
-                realizer=realizer,
-                construction_id=construction_id,
-                lang_code=lang_code,
-            )
+            support_status = statuses.get(backend_name, "unsupported")
 
             if support_status not in _ATTEMPTABLE_STATUSES:
-                backend_trace.append(
-                    {
-                        "backend": backend_name,
-                        "event": "skipped",
-                        "reason": "unsupported",
-                        "capability_tier": support_status,
-                    }
-                )
+                if debug:
+                    backend_trace.append(
+                        {
+                            "backend": backend_name,
+                            "event": "skipped",
+                            "reason": "unsupported",
+                            "capability_tier": support_status,
+                        }
+                    )
                 continue
 
             attempted_backends.append(backend_name)
+            if timer is not None:
+                attempt_started = time.monotonic_ns()
 
             try:
                 raw_result = await _maybe_await(realizer.realize(plan))
             except DomainError as exc:
+                if timer is not None:
+                    timer.record(
+                        "realizer.backend",
+                        attempt_started,
+                        time.monotonic_ns(),
+                        outcome="failed",
+                        backend=backend_name,
+                        capability_tier=support_status,
+                    )
                 failures.append({"backend": backend_name, "error": str(exc)})
-                backend_trace.append(
-                    {
-                        "backend": backend_name,
-                        "event": "failed",
-                        "capability_tier": support_status,
-                        "error": str(exc),
-                    }
-                )
+                if debug:
+                    backend_trace.append(
+                        {
+                            "backend": backend_name,
+                            "event": "failed",
+                            "capability_tier": support_status,
+                            "error": str(exc),
+                        }
+                    )
 
                 if forced_backend is not None:
                     raise
 
                 continue
             except Exception as exc:
+                if timer is not None:
+                    timer.record(
+                        "realizer.backend",
+                        attempt_started,
+                        time.monotonic_ns(),
+                        outcome="failed",
+                        backend=backend_name,
+                        capability_tier=support_status,
+                    )
                 failures.append({"backend": backend_name, "error": str(exc)})
-                backend_trace.append(
-                    {
-                        "backend": backend_name,
-                        "event": "failed",
-                        "capability_tier": support_status,
-                        "error": str(exc),
-                    }
-                )
+                if debug:
+                    backend_trace.append(
+                        {
+                            "backend": backend_name,
+                            "event": "failed",
+                            "capability_tier": support_status,
+                            "error": str(exc),
+                        }
+                    )
 
                 if forced_backend is not None:
                     raise RealizationError(
@@ -368,13 +405,24 @@ class ConstructionRealizer:
 
                 continue
 
-            backend_trace.append(
-                {
-                    "backend": backend_name,
-                    "event": "selected",
-                    "capability_tier": support_status,
-                }
-            )
+            if timer is not None:
+                timer.record(
+                    "realizer.backend",
+                    attempt_started,
+                    time.monotonic_ns(),
+                    outcome="selected",
+                    backend=backend_name,
+                    capability_tier=support_status,
+                )
+
+            if debug:
+                backend_trace.append(
+                    {
+                        "backend": backend_name,
+                        "event": "selected",
+                        "capability_tier": support_status,
+                    }
+                )
 
             dispatch_fallback_used = (
                 len(attempted_backends) > 1
@@ -455,17 +503,13 @@ class ConstructionRealizer:
         forced_backend: str | None,
         allow_fallback: bool,
     ) -> tuple[str, ...]:
+        statuses = self._support_statuses(construction_id, lang_code)
+
         if forced_backend is not None:
-            realizer = self._realizers.get(forced_backend)
-            if realizer is None:
+            if self._realizers.get(forced_backend) is None:
                 raise RealizationError(f"Forced backend '{forced_backend}' is not configured")
 
-            status = self._get_backend_support_status(
-                backend_name=forced_backend,
-                realizer=realizer,
-                construction_id=construction_id,
-                lang_code=lang_code,
-            )
+            status = statuses.get(forced_backend, "unsupported")
             if status not in _ATTEMPTABLE_STATUSES:
                 raise RealizationError(
                     f"Forced backend '{forced_backend}' does not support construction "
@@ -475,25 +519,88 @@ class ConstructionRealizer:
 
         ordered: list[str] = []
 
-        for backend_name in self.dispatch_order:
+        # `statuses` preserves dispatch order and only holds configured backends.
+        for backend_name, status in statuses.items():
             if backend_name == "safe_mode" and not allow_fallback:
                 continue
+            if status in _ATTEMPTABLE_STATUSES:
+                ordered.append(backend_name)
+
+        return tuple(ordered)
 
+    # ------------------------------------------------------------------
+    # Dispatch table
+    # ------------------------------------------------------------------
+
+    def precompute_dispatch_table(
+        self,
+        construction_ids: Sequence[str],
+        lang_codes: Sequence[str],
+    ) -> int:
+        """
+        Warm the dispatch table for every (construction, language) pair.
+
+        Intended for startup so the first request per pair does not pay for
+        backend capability probes. The pairs are remembered and rebuilt by
+        `refresh_dispatch_table`. Returns the number of cached pairs.
+        """
+        self._warm_pairs = (
+            tuple(str(cid) for cid in construction_ids),
+            tuple(str(lang) for lang in lang_codes),
+        )
+        for construction_id in self._warm_pairs[0]:
+            for lang_code in self._warm_pairs[1]:
+                self._support_statuses(construction_id, lang_code)
+        return len(self._dispatch_table)
+
+    def invalidate_dispatch_table(self) -> None:
+        """Drop cached support statuses (e.g. after backends were swapped)."""
+        self._dispatch_table.clear()
+        self._capability_stamp = self._current_capability_stamp()
+
+    def refresh_dispatch_table(self) -> int:
+        """
+        Invalidate the table and re-warm the pairs last passed to
+        `precompute_dispatch_table`. Called on profile and grammar reload.
+        """
+        self.invalidate_dispatch_table()
+        count = self.precompute_dispatch_table(*self._warm_pairs)
+        logger.info("dispatch_table_refreshed", pairs=count)
+        return count
+
+    def _current_capability_stamp(self) -> tuple[Any, ...]:
+        return tuple(
+            getattr(self._realizers.get(name), "capability_version", None)
+            for name in _CANONICAL_BACKEND_ORDER
+        )
+
+    def _support_statuses(self, construction_id: str, lang_code: str) -> dict[str, str]:
+        stamp = self._current_capability_stamp()
+        if stamp != self._capability_stamp:
+            self._dispatch_table.clear()
+            self._capability_stamp = stamp
+
+        key = (construction_id, lang_code)
+        statuses = self._dispatch_table.get(key)
+        if statuses is not None:
+            return statuses
+
+        statuses = {}
+        for backend_name in self.dispatch_order:
             realizer = self._realizers.get(backend_name)
             if realizer is None:
                 continue
-
-            status = self._get_backend_support_status(
+            statuses[backend_name] = self._get_backend_support_status(
                 backend_name=backend_name,
                 realizer=realizer,
                 construction_id=construction_id,
                 lang_code=lang_code,
             )
 
-            if status in _ATTEMPTABLE_STATUSES:
-                ordered.append(backend_name)
-
-        return tuple(ordered)
+        if len(self._dispatch_table) >= _MAX_DISPATCH_TABLE_ENTRIES:
+            self._dispatch_table.clear()
+        self._dispatch_table[key] = statuses
+        return statuses
 
     def _get_backend_support_status(
         self,
@@ -557,9 +664,11 @@ class ConstructionRealizer:
             lang_code = plan_lang_code
         lang_code = str(lang_code).strip().lower()
 
-        debug_info = _as_plain_dict(_get_value(raw_result, "debug_info", {}))
+        debug = debug_payloads_enabled()
+        raw_debug_info = _get_value(raw_result, "debug_info", None) or {}
+        debug_info = _as_plain_dict(raw_debug_info) if debug else {}
         child_fallback = bool(
-            _get_value(raw_result, "fallback_used", debug_info.get("fallback_used", False))
+            _get_value(raw_result, "fallback_used", _get_value(raw_debug_info, "fallback_used", False))
         )
         fallback_used = bool(child_fallback or dispatch_fallback_used)
 
@@ -573,6 +682,19 @@ class ConstructionRealizer:
         except Exception:
             generation_time_ms = 0.0
 
+        if not debug:
+            # Lean mode: the result attributes carry backend / fallback_used.
+            return _build_result_object(
+                text=str(text).strip(),
+                lang_code=lang_code,
+                construction_id=construction_id,
+                renderer_backend=selected_backend,
+                fallback_used=fallback_used,
+                tokens=tokens,
+                debug_info=debug_info,
+                generation_time_ms=generation_time_ms,
+            )
+
         debug_info["construction_id"] = construction_id
         debug_info["lang_code"] = lang_code
         debug_info["renderer_backend"] = selected_backend
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import importlib
 import json
+import stat
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 
 import structlog
 
 from app.core.domain.exceptions import DomainError, LanguageNotFoundError
+from app.shared.debug_payloads import NULL_TRACE, debug_payloads_enabled
 
 if TYPE_CHECKING:
     from app.core.domain.models import SurfaceResult
@@ -180,15 +183,43 @@ def _deep_merge(base: Mapping[str, Any], overlay: Mapping[str, Any]) -> dict[str
     return out
 
 
+# Parsed profile / family config JSON by path, keyed on (mtime_ns, size) so
+# edits are picked up. Process-wide, so a preforking server can load the
+# configs once in the parent and share them with every worker.
+_JSON_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+_JSON_CACHE_LOCK = threading.Lock()
+
+
 def _load_json(path: Path) -> dict[str, Any]:
-    if not path.exists() or not path.is_file():
+    """
+    Load a JSON object, memoized per file version.
+
+    The returned dict is shared between callers and must not be mutated;
+    `_deep_merge` always builds a new mapping.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    if not stat.S_ISREG(st.st_mode):
         return {}
+
+    key = str(path)
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
     except Exception as exc:
         logger.warning("family_adapter_json_load_failed", path=str(path), error=str(exc))
         return {}
-    return data if isinstance(data, dict) else {}
+
+    data = data if isinstance(data, dict) else {}
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE[key] = (version, data)
+    return data
 
 
 def _normalize_gender(value: Any) -> str:
@@ -377,11 +408,29 @@ class FamilyConstructionAdapter:
             or self._repo_root / "app" / "core" / "config" / "profiles" / "profiles.json"
         )
         self._profiles = _load_json(self._profiles_path)
+        self._profiles_generation = 0
+        self._reload_listeners: list[Callable[[], Any]] = []
 
     @property
     def backend_name(self) -> str:
         return _BACKEND_NAME
 
+    @property
+    def capability_version(self) -> int:
+        """Changes whenever language profiles are reloaded."""
+        return self._profiles_generation
+
+    def add_reload_listener(self, callback: Callable[[], Any]) -> None:
+        """Register a callback run after every `reload_profiles`."""
+        self._reload_listeners.append(callback)
+
+    def reload_profiles(self) -> None:
+        """Re-read `profiles.json` (e.g. after a new language was onboarded)."""
+        self._profiles = _load_json(self._profiles_path)
+        self._profiles_generation += 1
+        for callback in self._reload_listeners:
+            callback()
+
     def supports(self, construction_id: str, lang_code: str) -> bool:
         normalized_cid = _clean_str(construction_id) or ""
         normalized_lang = (_clean_str(lang_code) or "").lower()
@@ -448,8 +497,9 @@ class FamilyConstructionAdapter:
 
         config = self._load_language_config(lang_code=lang_code, profile=profile)
 
-        trace: list[str] = ["validated construction", "validated slot_map"]
-        warnings: list[str] = []
+        debug = debug_payloads_enabled()
+        trace: list[str] = ["validated construction", "validated slot_map"] if debug else NULL_TRACE
+        warnings: list[str] = [] if debug else NULL_TRACE
 
         name, name_source = _extract_subject_name(slot_map)
         if not name:
@@ -553,6 +603,26 @@ class FamilyConstructionAdapter:
         tokens = _tokenize(text)
         trace.append("assembled family surface")
 
+        logger.info(
+            "family_realization_completed",
+            lang_code=lang_code,
+            construction_id=requested_construction_id,
+            base_construction_id=construction_id,
+            family=family_name,
+            fallback_used=lexical_fallback_used,
+        )
+
+        if not debug:
+            return _build_surface_result(
+                text=text,
+                lang_code=lang_code,
+                construction_id=requested_construction_id,
+                renderer_backend=self.backend_name,
+                fallback_used=lexical_fallback_used,
+                tokens=tokens,
+                debug_info={},
+            )
+
         debug_info: dict[str, Any] = {
             "construction_id": requested_construction_id,
             "renderer_backend": self.backend_name,
@@ -582,15 +652,6 @@ class FamilyConstructionAdapter:
         if lexical_fallback_used:
             debug_info["fallback_reason"] = "used slot content and/or default morphology because lexical bindings were absent or incomplete"
 
-        logger.info(
-            "family_realization_completed",
-            lang_code=lang_code,
-            construction_id=requested_construction_id,
-            base_construction_id=construction_id,
-            family=family_name,
-            fallback_used=lexical_fallback_used,
-        )
-
         return _build_surface_result(
             text=text,
             lang_code=lang_code,
@@ -664,8 +725,45 @@ class FamilyConstructionAdapter:
         return merged
 
 
+def preload_family_configs(
+    *,
+    engine_package: str = "app.adapters.engines.engines",
+    profiles_path: Path | None = None,
+    repo_root: Path | None = None,
+) -> dict[str, int]:
+    """
+    Import every family engine module and load every language's config.
+
+    Meant for server startup (see `app.adapters.api.server`): configs land in
+    the process-wide JSON cache, so later `realize()` calls do no file I/O.
+    Languages whose engine or config fails to load are skipped and counted.
+    """
+    adapter = FamilyConstructionAdapter(
+        engine_package=engine_package,
+        profiles_path=profiles_path,
+        repo_root=repo_root,
+    )
+    modules: set[str] = set()
+    languages = 0
+    failed = 0
+
+    for lang_code, profile in sorted(adapter._profiles.items()):
+        if not isinstance(profile, Mapping):
+            continue
+        try:
+            modules.add(adapter._load_engine_module(profile).__name__)
+            adapter._load_language_config(lang_code=lang_code, profile=profile)
+            languages += 1
+        except Exception as exc:
+            failed += 1
+            logger.warning("family_config_preload_failed", lang=lang_code, error=str(exc))
+
+    return {"languages": languages, "engine_modules": len(modules), "failed": failed}
+
+
 __all__ = [
     "FamilyConstructionAdapter",
+    "preload_family_configs",
     "UnsupportedConstructionError",
     "MissingRequiredRoleError",
     "FamilyRendererError",
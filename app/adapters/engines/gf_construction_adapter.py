@@ -174,6 +174,11 @@ class GFConstructionAdapter:
         self.engine = engine or GFGrammarEngine()
         self.allow_wrapper_passthrough = bool(allow_wrapper_passthrough)
 
+    @property
+    def capability_version(self) -> Any:
+        """Changes whenever the underlying grammar is (re)loaded."""
+        return getattr(self.engine, "grammar_generation", None)
+
     def supports(self, construction_id: str, lang_code: str) -> bool:
         _ = lang_code  # reserved for future language-aware capability tables
         cid = _normalize_construction_id(construction_id)
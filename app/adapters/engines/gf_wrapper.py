@@ -20,6 +20,7 @@ except ImportError:
 from app.core.domain.frame import BioFrame
 from app.core.domain.models import Frame, Sentence
 from app.shared.config import settings
+from app.shared.debug_payloads import NULL_TRACE, debug_payloads_enabled
 
 try:
     from app.core.domain.models import SurfaceResult as _ImportedSurfaceResult
@@ -194,6 +195,9 @@ class GFGrammarEngine:
         self.pgf_path: str = str(self._resolve_path(configured))
 
         self._grammar: Optional[Any] = None
+        # Bumped whenever the loaded grammar changes so capability caches
+        # (e.g. the ConstructionRealizer dispatch table) can invalidate.
+        self.grammar_generation: int = 0
 
         # Inventory (from rgl_inventory.json)
         self.inventory: Dict[str, Any] = {}
@@ -209,6 +213,10 @@ class GFGrammarEngine:
 
         self._async_load_lock: asyncio.Lock = asyncio.Lock()
         self._thread_load_lock: threading.Lock = threading.Lock()
+        # Serializes hot swaps only; requests never wait on it.
+        self._reload_lock: asyncio.Lock = asyncio.Lock()
+        # (mtime_ns, size) of the PGF file behind the current grammar.
+        self._loaded_stamp: Optional[tuple[int, int]] = None
 
         self._load_inventory()
         self._load_iso_config()
@@ -251,6 +259,21 @@ class GFGrammarEngine:
     @grammar.setter
     def grammar(self, value: Optional[Any]) -> None:
         self._grammar = value
+        # Not read from the PGF file, so the file stamp no longer describes it.
+        self._loaded_stamp = None
+        self.grammar_generation += 1
+
+    @property
+    def grammar_version(self) -> str:
+        """
+        Identity of the grammar currently in use (not of the file on disk).
+
+        The (mtime, size) of the PGF file it was read from, which matches
+        across processes; the process-local generation when there is none.
+        """
+        if self._loaded_stamp is not None:
+            return f"{self._loaded_stamp[0]}:{self._loaded_stamp[1]}"
+        return f"gen{self.grammar_generation}"
 
     # ------------------------------------------------------------------
     # Loading helpers
@@ -411,44 +434,71 @@ class GFGrammarEngine:
             if suffix:
                 self.iso2_to_wiki[iso2c] = suffix
 
+    def _pgf_file(self) -> Path:
+        path = Path(self.pgf_path)
+        if path.exists() and path.is_dir():
+            path = path / "semantik_architect.pgf"
+        return path
+
+    def _file_stamp(self) -> Optional[tuple[int, int]]:
+        try:
+            st = self._pgf_file().stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_pgf(self) -> tuple[Optional[Any], Optional[tuple[int, int]], Optional[str], Optional[str]]:
+        """
+        Read the PGF binary without touching engine state.
+
+        Returns (grammar, file_stamp, error_type, error). Safe to run in a
+        worker thread while requests keep using the current grammar.
+        """
+        if not pgf:
+            return (
+                None,
+                None,
+                "pgf_missing",
+                "Python module 'pgf' is not installed/available in this runtime.",
+            )
+
+        path = self._pgf_file()
+        stamp = self._file_stamp()
+        if stamp is None:
+            return None, None, "pgf_file_missing", f"PGF file not found at: {path}"
+
+        try:
+            logger.info("loading_pgf_binary", path=str(path))
+            return pgf.readPGF(str(path)), stamp, None, None
+        except Exception as exc:
+            return None, stamp, "pgf_read_failed", f"pgf.readPGF failed: {exc}"
+
     def _load_grammar_sync(self) -> None:
         with self._thread_load_lock:
             if self._grammar is not None:
                 return
 
-            self.last_load_error = None
-            self.last_load_error_type = None
-
-            if not pgf:
-                self._grammar = None
-                self.last_load_error_type = "pgf_missing"
-                self.last_load_error = "Python module 'pgf' is not installed/available in this runtime."
-                logger.error("pgf_module_missing")
-                return
-
-            path = Path(self.pgf_path)
-            if path.exists() and path.is_dir():
-                path = path / "semantik_architect.pgf"
+            grammar, stamp, error_type, error = self._read_pgf()
+            self.last_load_error_type = error_type
+            self.last_load_error = error
 
-            if not path.exists():
+            if grammar is None:
                 self._grammar = None
-                self.last_load_error_type = "pgf_file_missing"
-                self.last_load_error = f"PGF file not found at: {path}"
-                logger.error("pgf_file_missing", pgf_path=str(path))
+                if error_type == "pgf_missing":
+                    logger.error("pgf_module_missing")
+                elif error_type == "pgf_file_missing":
+                    logger.error("pgf_file_missing", pgf_path=str(self._pgf_file()))
+                else:
+                    logger.error("gf_load_failed", error=error, pgf_path=str(self._pgf_file()))
                 return
 
-            try:
-                logger.info("loading_pgf_binary", path=str(path))
-                self._grammar = pgf.readPGF(str(path))
-                logger.info(
-                    "pgf_binary_loaded_successfully",
-                    language_count=len(getattr(self._grammar, "languages", {}) or {}),
-                )
-            except Exception as exc:
-                self._grammar = None
-                self.last_load_error_type = "pgf_read_failed"
-                self.last_load_error = f"pgf.readPGF failed: {exc}"
-                logger.error("gf_load_failed", error=str(exc), pgf_path=str(path))
+            self._grammar = grammar
+            self._loaded_stamp = stamp
+            self.grammar_generation += 1
+            logger.info(
+                "pgf_binary_loaded_successfully",
+                language_count=len(getattr(grammar, "languages", {}) or {}),
+            )
 
     async def _ensure_grammar(self) -> None:
         if self._grammar is not None:
@@ -508,12 +558,17 @@ class GFGrammarEngine:
         )
         resolved_language = self._resolve_concrete_name(lang_code)
 
-        backend_trace: list[str] = [
-            "validated ConstructionPlan envelope",
-            f"selected backend={self.renderer_backend}",
-            f"effective_construction_id={effective_construction_id}",
-        ]
-        warnings: list[str] = []
+        debug = debug_payloads_enabled()
+        backend_trace: list[str] = (
+            [
+                "validated ConstructionPlan envelope",
+                f"selected backend={self.renderer_backend}",
+                f"effective_construction_id={effective_construction_id}",
+            ]
+            if debug
+            else NULL_TRACE
+        )
+        warnings: list[str] = [] if debug else NULL_TRACE
         fallback_used = False
         ast_str: Optional[str] = None
 
@@ -643,14 +698,11 @@ class GFGrammarEngine:
             return Sentence(
                 text=text,
                 lang_code=lang_code,
-                debug_info={
-                    "renderer_backend": self.renderer_backend,
-                    "runtime_path": "legacy_direct_frame",
-                    "compatibility_shim": True,
-                    "fallback_used": self._is_placeholder_text(text),
-                    "ast": ast_str,
-                    "resolved_language": self._resolve_concrete_name(lang_code),
-                },
+                debug_info=self._legacy_debug_info(
+                    lang_code=lang_code,
+                    ast_str=ast_str,
+                    fallback_used=self._is_placeholder_text(text),
+                ),
             )
 
         bio = self._coerce_to_bio_frame(frame)
@@ -666,22 +718,31 @@ class GFGrammarEngine:
         return Sentence(
             text=text,
             lang_code=lang_code,
-            debug_info={
-                "renderer_backend": self.renderer_backend,
-                "runtime_path": "legacy_direct_frame",
-                "compatibility_shim": True,
-                "fallback_used": fallback_used or self._is_placeholder_text(text),
-                "ast": ast_str,
-                "resolved_language": self._resolve_concrete_name(lang_code),
-            },
+            debug_info=self._legacy_debug_info(
+                lang_code=lang_code,
+                ast_str=ast_str,
+                fallback_used=fallback_used or self._is_placeholder_text(text),
+            ),
         )
 
+    def _legacy_debug_info(self, *, lang_code: str, ast_str: str, fallback_used: bool) -> dict[str, Any]:
+        if not debug_payloads_enabled():
+            return {"fallback_used": True} if fallback_used else {}
+        return {
+            "renderer_backend": self.renderer_backend,
+            "runtime_path": "legacy_direct_frame",
+            "compatibility_shim": True,
+            "fallback_used": fallback_used,
+            "ast": ast_str,
+            "resolved_language": self._resolve_concrete_name(lang_code),
+        }
+
     def parse(self, sentence: str, language: str):
         g = self.grammar
         if not g:
             return []
 
-        language_resolved = self._resolve_concrete_name(language)
+        language_resolved = self._resolve_concrete_name(language, grammar=g)
         if not language_resolved:
             return []
 
@@ -696,7 +757,7 @@ class GFGrammarEngine:
         if not g:
             return "<GF Runtime Not Loaded>"
 
-        language_resolved = self._resolve_concrete_name(language)
+        language_resolved = self._resolve_concrete_name(language, grammar=g)
         if not language_resolved:
             return f"<Language '{language}' not found>"
 
@@ -721,18 +782,61 @@ class GFGrammarEngine:
             return []
         return list(self._grammar.languages.keys())
 
-    async def reload(self) -> None:
-        self._load_inventory()
-        self._load_iso_config()
-        self._derive_wiki_from_inventory()
+    async def reload(self, *, force: bool = True) -> bool:
+        """
+        Hot-swap the grammar from disk without a not-loaded window.
 
-        async with self._async_load_lock:
-            with self._thread_load_lock:
-                self._grammar = None
-                self.last_load_error = None
-                self.last_load_error_type = None
+        The new PGF is read in a worker thread while requests keep using the
+        current one; once it is ready the reference is swapped in a single
+        assignment, so in-flight requests finish on the grammar they already
+        hold. If the read fails, the current grammar stays in place and the
+        error is recorded in `last_load_error`.
 
-        await self._ensure_grammar()
+        With `force=False` the read is skipped when the file's (mtime, size)
+        matches the loaded grammar. Returns True when a new grammar was
+        swapped in.
+        """
+        async with self._reload_lock:
+            if not force and self._grammar is not None and self._file_stamp() == self._loaded_stamp:
+                return False
+
+            grammar, stamp, error_type, error = await asyncio.to_thread(self._read_pgf)
+
+            if grammar is None:
+                self.last_load_error_type = error_type
+                self.last_load_error = error
+                logger.error(
+                    "gf_reload_failed",
+                    error_type=error_type,
+                    error=error,
+                    pgf_path=str(self.pgf_path),
+                    kept_previous=self._grammar is not None,
+                )
+                return False
+
+            # Everything below runs without yielding to the event loop, so
+            # coroutines see either the old grammar + maps or the new ones.
+            self._load_inventory()
+            self._load_iso_config()
+            self._derive_wiki_from_inventory()
+
+            self._grammar = grammar
+            self._loaded_stamp = stamp
+            self.last_load_error = None
+            self.last_load_error_type = None
+            self.grammar_generation += 1
+
+        logger.info(
+            "pgf_binary_swapped",
+            pgf_path=str(self.pgf_path),
+            grammar_generation=self.grammar_generation,
+            language_count=len(getattr(grammar, "languages", {}) or {}),
+        )
+        return True
+
+    async def reload_if_changed(self) -> bool:
+        """Reload only when the PGF file on disk differs from the loaded one."""
+        return await self.reload(force=False)
 
     async def health_check(self) -> bool:
         await self._ensure_grammar()
@@ -763,6 +867,20 @@ class GFGrammarEngine:
         warnings: List[str],
         metadata: Mapping[str, Any],
     ) -> Any:
+        tokens = _normalize_tokens(text)
+        if not debug_payloads_enabled():
+            # Lean mode: construction_id / backend / fallback_used travel as
+            # result attributes; no debug payload.
+            return _build_surface_result(
+                text=text,
+                lang_code=lang_code,
+                construction_id=construction_id,
+                renderer_backend=self.renderer_backend,
+                fallback_used=fallback_used,
+                tokens=tokens,
+                debug_info={},
+            )
+
         debug_info: dict[str, Any] = {
             "construction_id": construction_id,
             "renderer_backend": self.renderer_backend,
@@ -783,7 +901,6 @@ class GFGrammarEngine:
         if isinstance(metadata.get("wrapper_construction_id"), str):
             debug_info["wrapper_construction_id"] = metadata["wrapper_construction_id"]
 
-        tokens = _normalize_tokens(text)
         return _build_surface_result(
             text=text,
             lang_code=lang_code,
@@ -1075,8 +1192,8 @@ class GFGrammarEngine:
 
         return None
 
-    def _resolve_concrete_name(self, lang_code: str) -> Optional[str]:
-        g = self._grammar
+    def _resolve_concrete_name(self, lang_code: str, *, grammar: Any = None) -> Optional[str]:
+        g = grammar if grammar is not None else self._grammar
         if not g:
             return None
 
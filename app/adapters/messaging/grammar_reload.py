@@ -0,0 +1,77 @@
+# app/adapters/messaging/grammar_reload.py
+from collections.abc import Callable
+from typing import Any, Optional
+
+import structlog
+
+from app.core.domain.events import EventType, SystemEvent
+from app.core.ports.message_broker import IMessageBroker
+
+logger = structlog.get_logger()
+
+# The worker announces swaps explicitly; BUILD_COMPLETED is kept as a fallback
+# for workers that predate GRAMMAR_RELOADED.
+RELOAD_EVENTS = (EventType.GRAMMAR_RELOADED, EventType.BUILD_COMPLETED)
+
+
+class GrammarReloadListener:
+    """
+    Keeps an API process's grammar engine in step with the worker fleet.
+
+    Subscribes to reload notifications on the message broker and asks the
+    engine to hot-swap its PGF if the file on disk changed. The engine reads
+    the new binary off the event loop and swaps it atomically, so requests
+    keep being served from the previous grammar while the load runs.
+
+    Engines without `reload_if_changed` (e.g. the mock Python engine) are
+    left alone. `on_reload` runs after every successful swap (e.g. to rebuild
+    the construction dispatch table against the new grammar).
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        broker: IMessageBroker,
+        *,
+        on_reload: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self.engine = engine
+        self.broker = broker
+        self.on_reload = on_reload
+        self.reloads = 0
+        self.last_event_id: Optional[str] = None
+
+    async def start(self) -> bool:
+        if not callable(getattr(self.engine, "reload_if_changed", None)):
+            logger.info("grammar_reload_listener_skipped", engine=type(self.engine).__name__)
+            return False
+
+        for event_type in RELOAD_EVENTS:
+            await self.broker.subscribe(event_type, self.handle)
+        logger.info("grammar_reload_listener_started", events=[e.value for e in RELOAD_EVENTS])
+        return True
+
+    async def handle(self, event: SystemEvent) -> None:
+        self.last_event_id = event.id
+        try:
+            swapped = await self.engine.reload_if_changed()
+        except Exception as e:
+            # Never let a bad binary take the listener (or the process) down;
+            # the engine keeps serving its current grammar.
+            logger.error("grammar_reload_failed", event_id=event.id, type=event.type, error=str(e))
+            return
+
+        if swapped:
+            self.reloads += 1
+            if self.on_reload is not None:
+                try:
+                    self.on_reload()
+                except Exception as e:
+                    logger.error("grammar_reload_hook_failed", event_id=event.id, error=str(e))
+            logger.info(
+                "grammar_reloaded_from_event",
+                event_id=event.id,
+                type=event.type,
+                origin=(event.payload or {}).get("origin"),
+                grammar_generation=getattr(self.engine, "grammar_generation", None),
+            )
@@ -280,8 +280,7 @@ class NinaiAdapter:
     # --- Helper: Safe Fact Retrieval (Fix for Missing Method) ---
     def _get_lexicon_facts(self, lang: str, qid: Optional[str], prop: str) -> List[str]:
         """
-        Safely retrieves facts/claims from a lexicon entry.
-        Handles the case where lexicon.get_facts() doesn't exist yet.
+        Safely retrieves facts/claims for a QID from the shared lexicon store.
         """
         # [FIX] Local import to avoid circular dependency
         from app.shared.lexicon import lexicon
@@ -290,23 +289,7 @@ class NinaiAdapter:
             return []
 
         try:
-            entry = lexicon.get_entry(lang, qid)
-            if not entry:
-                return []
-
-            if isinstance(entry, dict):
-                # Facts may live under facts or features depending on runtime merge.
-                return entry.get("facts", {}).get(prop, []) or entry.get("features", {}).get(
-                    prop, []
-                )
-
-            if hasattr(entry, "facts") and isinstance(entry.facts, dict):
-                return entry.facts.get(prop, [])
-
-            if hasattr(entry, "features") and isinstance(entry.features, dict):
-                return entry.features.get(prop, [])
-
-            return []
+            return lexicon.get_facts(lang, qid, prop)
         except Exception as e:
             logger.warning(f"Failed to retrieve facts for {qid}: {e}")
             return []
@@ -8,9 +8,13 @@ It handles the translation between Domain Entities and the underlying storage me
 
 Components:
 - FileSystemLexiconRepository: Concrete implementation of ILexiconRepository using JSON/GF files.
+- JournalLexiconRepository: Same on-disk format, but saves append to a per-language
+  write-ahead journal that is periodically compacted into the JSON shard.
 """
 
 from .filesystem_repo import FileSystemLexiconRepository
+from .journal_lexicon_repo import JournalLexiconRepository
 __all__ = [
     "FileSystemLexiconRepository",
+    "JournalLexiconRepository",
 ]
\ No newline at end of file
@@ -117,6 +117,26 @@ class FileSystemLexiconRepository(LanguageRepo, LexiconRepo):
         await self._save_file(iso_code, data)
         logger.info("lexicon_entry_saved", lang=iso_code, lemma=key)
 
+    async def save_entries(self, iso_code: str, entries: List[LexiconEntry]) -> int:
+        """
+        Batched save: one read and one rewrite of the shard for the whole batch.
+        """
+        batch = list(entries)
+        if not batch:
+            return 0
+
+        data = await self._load_file(iso_code)
+        for entry in batch:
+            try:
+                val = entry.model_dump()
+            except AttributeError:
+                val = entry.dict()
+            data[entry.lemma if entry.lemma else entry.word] = val
+
+        await self._save_file(iso_code, data)
+        logger.info("lexicon_entries_saved", lang=iso_code, count=len(batch))
+        return len(batch)
+
     async def get_entries_by_concept(self, lang_code: str, qid: str) -> List[LexiconEntry]:
         """
         [FIXED] Now correctly checks 'qid' fields instead of the non-existent 'concepts' list.
@@ -0,0 +1,408 @@
+# app/adapters/persistence/journal_lexicon_repo.py
+"""
+Write-ahead journal backend for the LexiconRepo port.
+
+`FileSystemLexiconRepository` rewrites the whole `lexicon.json` shard on every
+`save_entry()` and rescans it for every QID query, which makes bulk onboarding
+O(n^2) in disk I/O. This repository keeps the same on-disk shard format but:
+
+- loads each language once (shard + journal replay) into memory,
+- appends every save as one NDJSON line to `lexicon.journal.ndjson`,
+- maintains a QID -> keys secondary index for `get_entries_by_concept()`,
+- compacts the journal back into `lexicon.json` every `compact_every`
+  appends (and on `compact()` / `close()`), atomically via rename.
+
+Crash safety: a compaction that dies after the rename but before the journal
+truncate simply replays already-applied puts (idempotent); a torn final
+journal line is truncated with a warning before appends resume.
+
+Multiple processes (e.g. prefork API workers) may share one lexicon: every
+load, append and compaction holds an exclusive `fcntl.flock` on a per-language
+`lexicon.journal.lock` and first catches up on records other processes have
+appended (or reloads if another process compacted). Reads check the journal
+size and shard identity and catch up the same way. Without `fcntl` (non-POSIX)
+the repository assumes a single writer process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:  # POSIX only; elsewhere the repository is single-writer.
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+import structlog
+
+from app.adapters.persistence.filesystem_repo import FileSystemLexiconRepository
+from app.core.domain.models import LexiconEntry
+
+logger = structlog.get_logger()
+
+JOURNAL_FILENAME = "lexicon.journal.ndjson"
+LOCK_FILENAME = "lexicon.journal.lock"
+
+# (inode, mtime_ns, size) of lexicon.json; changes whenever any process compacts.
+_ShardSig = Optional[Tuple[int, int, int]]
+
+
+def _file_sig(path: Path) -> _ShardSig:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _entry_qid(raw_entry: Any) -> Optional[str]:
+    if not isinstance(raw_entry, dict):
+        return None
+    qid = raw_entry.get("qid") or raw_entry.get("wikidata_qid")
+    if not qid:
+        features = raw_entry.get("features")
+        if isinstance(features, dict):
+            qid = features.get("qid")
+    return str(qid) if qid else None
+
+
+@dataclass
+class _LanguageJournal:
+    entries: Dict[str, Any]
+    qid_index: Dict[str, List[str]] = field(default_factory=dict)
+    handle: Optional[BinaryIO] = None
+    lock_handle: Optional[IO[str]] = None
+    pending: int = 0
+    # Journal bytes already applied, and the shard they were applied on top of.
+    offset: int = 0
+    shard_sig: _ShardSig = None
+
+    def apply(self, key: str, value: Any) -> None:
+        previous = self.entries.get(key)
+        if previous is not None:
+            old_qid = _entry_qid(previous)
+            if old_qid is not None:
+                keys = self.qid_index.get(old_qid)
+                if keys is not None and key in keys:
+                    keys.remove(key)
+                    if not keys:
+                        del self.qid_index[old_qid]
+
+        self.entries[key] = value
+        qid = _entry_qid(value)
+        if qid is not None:
+            self.qid_index.setdefault(qid, []).append(key)
+
+
+class JournalLexiconRepository(FileSystemLexiconRepository):
+    """
+    Journal-backed LexiconRepo; LanguageRepo behaviour is inherited unchanged.
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        *,
+        compact_every: int = 5000,
+        fsync: bool = False,
+    ):
+        super().__init__(base_path)
+        self.compact_every = max(1, int(compact_every))
+        self.fsync = bool(fsync)
+        self._journals: Dict[str, _LanguageJournal] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._load_locks: Dict[str, asyncio.Lock] = {}
+
+    # ------------------------------------------------------------------
+    # Paths / loading
+    # ------------------------------------------------------------------
+
+    def _get_journal_path(self, lang_code: str) -> Path:
+        return self.lexicon_base / lang_code / JOURNAL_FILENAME
+
+    def _lock_for(self, lang_code: str) -> asyncio.Lock:
+        lock = self._locks.get(lang_code)
+        if lock is None:
+            lock = self._locks[lang_code] = asyncio.Lock()
+        return lock
+
+    @contextmanager
+    def _file_lock(self, lang_code: str, journal: _LanguageJournal) -> Iterator[None]:
+        """Exclusive cross-process lock for one language (no-op without fcntl)."""
+        if fcntl is None:
+            yield
+            return
+        if journal.lock_handle is None:
+            lock_path = self.lexicon_base / lang_code / LOCK_FILENAME
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            journal.lock_handle = lock_path.open("a")
+        fd = journal.lock_handle.fileno()
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _reload_sync(self, lang_code: str, journal: _LanguageJournal) -> None:
+        """Rebuild `journal` from the shard plus a full journal replay. Caller holds the file lock."""
+        shard_path = self._get_file_path(lang_code)
+        journal.shard_sig = _file_sig(shard_path)
+        entries: Dict[str, Any] = {}
+        if journal.shard_sig is not None:
+            try:
+                content = shard_path.read_text(encoding="utf-8")
+                loaded = json.loads(content) if content else {}
+                if isinstance(loaded, dict):
+                    entries = loaded
+            except Exception as e:
+                logger.error("repo_read_failed", lang=lang_code, error=str(e))
+
+        # Build aside and swap, so concurrent readers never see a half-loaded map.
+        fresh = _LanguageJournal(entries={})
+        for key, value in entries.items():
+            fresh.apply(key, value)
+        journal.entries, journal.qid_index = fresh.entries, fresh.qid_index
+        journal.offset = 0
+        journal.pending = 0
+        self._catch_up_sync(lang_code, journal)
+
+    def _catch_up_sync(self, lang_code: str, journal: _LanguageJournal) -> int:
+        """
+        Apply journal records appended since `journal.offset` (by any process).
+
+        Reloads from scratch if another process compacted in the meantime.
+        Caller holds the file lock. Returns the number of records applied.
+        """
+        journal_path = self._get_journal_path(lang_code)
+        if journal.handle is not None and not journal.handle.closed:
+            # Compaction truncates in place, so our append handle tracks the live file.
+            size = os.fstat(journal.handle.fileno()).st_size
+        elif journal_path.exists():
+            size = journal_path.stat().st_size
+        else:
+            journal.offset = 0
+            return 0
+        if _file_sig(self._get_file_path(lang_code)) != journal.shard_sig or size < journal.offset:
+            before = journal.pending
+            self._reload_sync(lang_code, journal)
+            return journal.pending - before
+        if size == journal.offset:
+            return 0
+
+        self._truncate_torn_tail(lang_code, journal_path)
+        applied = 0
+        with journal_path.open("rb") as f:
+            f.seek(journal.offset)
+            for line in f:
+                journal.offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    journal.apply(str(record["k"]), record["v"])
+                    applied += 1
+                except Exception as e:
+                    logger.warning(
+                        "lexicon_journal_record_skipped",
+                        lang=lang_code,
+                        offset=journal.offset,
+                        error=str(e),
+                    )
+        journal.pending += applied
+        return applied
+
+    def _load_language_sync(self, lang_code: str) -> _LanguageJournal:
+        journal = _LanguageJournal(entries={})
+        journal_path = self._get_journal_path(lang_code)
+        journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._file_lock(lang_code, journal):
+            self._reload_sync(lang_code, journal)
+            journal.handle = journal_path.open("ab")
+
+        if journal.pending:
+            logger.info("lexicon_journal_replayed", lang=lang_code, records=journal.pending)
+        return journal
+
+    def _refresh_sync(self, lang_code: str, journal: _LanguageJournal) -> None:
+        with self._file_lock(lang_code, journal):
+            self._catch_up_sync(lang_code, journal)
+
+    def _is_stale(self, lang_code: str, journal: _LanguageJournal) -> bool:
+        """Cheap stat check: has another process appended or compacted since our last sync?"""
+        try:
+            size = self._get_journal_path(lang_code).stat().st_size
+        except FileNotFoundError:
+            size = 0
+        return size != journal.offset or _file_sig(self._get_file_path(lang_code)) != journal.shard_sig
+
+    @staticmethod
+    def _truncate_torn_tail(lang_code: str, journal_path: Path) -> None:
+        """Drop a partially written final record so later appends start on a fresh line."""
+        with journal_path.open("rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            f.seek(0)
+            data = f.read()
+            keep = data.rfind(b"\n") + 1
+            f.truncate(keep)
+        logger.warning(
+            "lexicon_journal_torn_tail_dropped",
+            lang=lang_code,
+            bytes=len(data) - keep,
+        )
+
+    async def _journal_for(self, lang_code: str, *, refresh: bool = True) -> _LanguageJournal:
+        journal = self._journals.get(lang_code)
+        if journal is not None:
+            # Writers catch up under the file lock anyway; only readers refresh here.
+            if refresh and fcntl is not None and self._is_stale(lang_code, journal):
+                async with self._lock_for(lang_code):
+                    await asyncio.to_thread(self._refresh_sync, lang_code, journal)
+            return journal
+
+        load_lock = self._load_locks.setdefault(lang_code, asyncio.Lock())
+        async with load_lock:
+            journal = self._journals.get(lang_code)
+            if journal is None:
+                journal = await asyncio.to_thread(self._load_language_sync, lang_code)
+                self._journals[lang_code] = journal
+        return journal
+
+    # ------------------------------------------------------------------
+    # Journal writes / compaction
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _entry_key_and_value(entry: LexiconEntry) -> tuple[str, Dict[str, Any]]:
+        try:
+            val = entry.model_dump()
+        except AttributeError:
+            val = entry.dict()
+        key = entry.lemma if entry.lemma else entry.word
+        return key, val
+
+    def _append_sync(self, lang_code: str, journal: _LanguageJournal, records: List[tuple[str, Any]]) -> int:
+        data = b"".join(
+            json.dumps({"k": key, "v": value}, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+            for key, value in records
+        )
+        with self._file_lock(lang_code, journal):
+            # Another process may have appended or compacted since our last sync.
+            self._catch_up_sync(lang_code, journal)
+            if journal.handle is None or journal.handle.closed:
+                journal.handle = self._get_journal_path(lang_code).open("ab")
+            journal.handle.write(data)
+            journal.handle.flush()
+            if self.fsync:
+                os.fsync(journal.handle.fileno())
+            journal.offset += len(data)
+
+            for key, value in records:
+                journal.apply(key, value)
+            journal.pending += len(records)
+            if journal.pending >= self.compact_every:
+                self._compact_locked(lang_code, journal)
+                logger.info("lexicon_journal_compacted", lang=lang_code, entries=len(journal.entries))
+        return len(records)
+
+    def _compact_locked(self, lang_code: str, journal: _LanguageJournal) -> None:
+        shard_path = self._get_file_path(lang_code)
+        shard_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = shard_path.with_suffix(shard_path.suffix + ".tmp")
+
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(journal.entries, f, indent=2, ensure_ascii=False)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, shard_path)
+        journal.shard_sig = _file_sig(shard_path)
+
+        # Snapshot is durable; the journal can now be truncated.
+        if journal.handle is not None:
+            journal.handle.close()
+        journal.handle = self._get_journal_path(lang_code).open("wb")
+        journal.offset = 0
+        journal.pending = 0
+
+    def _compact_sync(self, lang_code: str, journal: _LanguageJournal) -> None:
+        with self._file_lock(lang_code, journal):
+            # Fold in records other processes appended before snapshotting.
+            self._catch_up_sync(lang_code, journal)
+            if journal.pending:
+                self._compact_locked(lang_code, journal)
+
+    async def compact(self, lang_code: Optional[str] = None) -> None:
+        """Fold pending journal records into `lexicon.json` (one or all loaded languages)."""
+        langs = [lang_code] if lang_code is not None else list(self._journals)
+        for lang in langs:
+            async with self._lock_for(lang):
+                journal = self._journals.get(lang)
+                if journal is not None:
+                    await asyncio.to_thread(self._compact_sync, lang, journal)
+
+    async def close(self) -> None:
+        """Compact every loaded language and release journal file handles."""
+        await self.compact()
+        for journal in self._journals.values():
+            for handle in (journal.handle, journal.lock_handle):
+                if handle is not None:
+                    handle.close()
+            journal.handle = journal.lock_handle = None
+        self._journals.clear()
+
+    # ------------------------------------------------------------------
+    # LexiconRepo
+    # ------------------------------------------------------------------
+
+    async def get_entry(self, iso_code: str, word: str) -> Optional[LexiconEntry]:
+        journal = await self._journal_for(iso_code)
+        raw_entry = journal.entries.get(word)
+        if not raw_entry:
+            return None
+        return LexiconEntry(**raw_entry)
+
+    async def save_entry(self, iso_code: str, entry: LexiconEntry) -> None:
+        await self.save_entries(iso_code, [entry])
+
+    async def save_entries(self, iso_code: str, entries: Iterable[LexiconEntry]) -> int:
+        """
+        Persist a batch of entries with a single journal append.
+
+        Returns the number of entries written.
+        """
+        records = [self._entry_key_and_value(entry) for entry in entries]
+        if not records:
+            return 0
+
+        journal = await self._journal_for(iso_code, refresh=False)
+        async with self._lock_for(iso_code):
+            try:
+                written = await asyncio.to_thread(self._append_sync, iso_code, journal, records)
+            except Exception as e:
+                logger.error("repo_write_failed", lang=iso_code, error=str(e))
+                raise IOError(f"Could not save lexicon for {iso_code}")
+
+        logger.debug("lexicon_entries_journaled", lang=iso_code, count=written)
+        return written
+
+    async def get_entries_by_concept(self, lang_code: str, qid: str) -> List[LexiconEntry]:
+        journal = await self._journal_for(lang_code)
+        return [
+            LexiconEntry(**journal.entries[key])
+            for key in tuple(journal.qid_index.get(qid, ()))
+            if key in journal.entries
+        ]
+
+
+__all__ = ["JournalLexiconRepository", "JOURNAL_FILENAME", "LOCK_FILENAME"]
@@ -33,7 +33,15 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
-from .cache import clear_cache, cached_languages, get_or_build_index, preload_languages
+from .cache import (
+    cache_stats,
+    cached_languages,
+    clear_cache,
+    get_or_build_index,
+    memory_report,
+    preload_languages,
+    reset_cache_stats,
+)
 from .loader import available_languages, load_lexicon
 from .normalization import (
     build_normalized_index,
@@ -61,11 +69,8 @@ from .types import (
     TitleEntry,
 )
 
-# Batch 5 bridge / runtime exports
+# Batch 5 bridge exports
 from .aw_lexeme_bridge import lexeme_from_z_object, lexemes_from_z_list
-from . import lexical_resolution
-from . import entity_resolution
-from . import predicate_resolution
 
 
 # ---------------------------------------------------------------------------
@@ -165,6 +170,17 @@ def lookup_form(
     return None
 
 
+# ---------------------------------------------------------------------------
+# Batch 5 runtime namespaces
+# ---------------------------------------------------------------------------
+# Imported after the lookup wrappers above: entity_resolution binds
+# `lookup_lemma` / `lookup_qid` from this package at import time.
+
+from . import lexical_resolution  # noqa: E402
+from . import entity_resolution  # noqa: E402
+from . import predicate_resolution  # noqa: E402
+
+
 # ---------------------------------------------------------------------------
 # Backwards-compatible aliases
 # ---------------------------------------------------------------------------
@@ -188,6 +204,9 @@ __all__ = [
     "warmup_languages",
     "clear_cache",
     "cached_languages",
+    "memory_report",
+    "cache_stats",
+    "reset_cache_stats",
     # Normalization
     "normalize_for_lookup",
     "normalize_whitespace",
@@ -12,7 +12,7 @@ Goals
 - Provide a small, testable API to:
     - get/build a per-language LexiconIndex,
     - preload indexes for multiple languages,
-    - clear or inspect the cache.
+    - clear or inspect the cache (languages, memory, hit/miss stats).
 - Thread-safe for typical multi-threaded app servers.
 - Deterministic behavior and explicit error surfaces.
 
@@ -21,30 +21,79 @@ This module does not persist anything to disk.
 Implementation notes
 ====================
 - We cache by normalized language code (casefold + strip).
-- We use a lock to protect cache mutations (double-checked build).
+- Builds are single-flight per language: each language has its own build
+  lock, so a cold build of a large language never blocks lookups (or
+  builds) for other languages. `_CACHE_LOCK` only guards the short
+  bookkeeping sections (LRU order, stats), never a load.
+- The cache is an LRU bounded by `LexiconConfig.cache_max_langs` and
+  `LexiconConfig.cache_max_bytes` (both 0 = unlimited). Sizes come from
+  `approx_size_bytes`, measured once per build.
+- Stale-while-revalidate: at most every `cache_refresh_sec` a hit compares
+  the language's shard fingerprint (file names, mtimes, sizes) with the
+  one recorded at build time. On change, the stale index keeps serving
+  while a daemon thread rebuilds it and swaps it in.
 - We provide a `warmup_languages` alias for clarity in app startup code.
-- Compatibility: current loader returns a lexeme mapping; we construct
-  the index via LexiconIndex.from_lexemes().
+- The loader returns a rich `Lexicon`; the index wraps it without copying,
+  so each cached language is materialised exactly once per process. This
+  cache is the single store behind `app.shared.lexicon`, the Ninai adapter
+  and the lexical/entity/predicate resolvers.
 """
 
 from __future__ import annotations
 
+import logging
 import threading
-from typing import Dict, Iterable, List, Optional
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .loader import load_lexicon  # type: ignore[import-not-found]
-from .index import LexiconIndex  # type: ignore[import-not-found]
+from .config import get_config  # type: ignore[import-not-found]
+from .loader import load_lexicon, source_fingerprint  # type: ignore[import-not-found]
+from .index import LexiconIndex, approx_size_bytes  # type: ignore[import-not-found]
+
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Internal state
 # ---------------------------------------------------------------------------
 
-# Map: normalized language code → LexiconIndex
-_INDEX_CACHE: Dict[str, LexiconIndex] = {}
 
-# Lock for cache mutations / double-checked creation
+@dataclass(slots=True)
+class _CacheSlot:
+    index: LexiconIndex
+    size_bytes: int
+    # None for indexes injected via `set_index`; those are never refreshed.
+    fingerprint: Optional[Tuple[Tuple[str, int, int], ...]] = None
+    checked_at: float = 0.0
+    refreshing: bool = False
+
+
+@dataclass(slots=True)
+class _CacheStats:
+    hits: int = 0
+    misses: int = 0
+    builds: int = 0
+    build_failures: int = 0
+    build_time_ms: float = 0.0
+    evictions: int = 0
+    evicted_bytes: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+
+
+# Map: normalized language code → slot, in least- to most-recently-used order
+_INDEX_CACHE: "OrderedDict[str, _CacheSlot]" = OrderedDict()
+
+# Per-language build locks (single-flight builds / refreshes)
+_BUILD_LOCKS: Dict[str, threading.Lock] = {}
+
+# Lock for cache bookkeeping (membership, LRU order, stats, build-lock table)
 _CACHE_LOCK = threading.RLock()
 
+_STATS = _CacheStats()
+_LAST_BUILD_MS: Dict[str, float] = {}
+
 
 def _norm_lang(lang: str) -> str:
     if not isinstance(lang, str):
@@ -52,6 +101,119 @@ def _norm_lang(lang: str) -> str:
     return lang.strip().casefold()
 
 
+def _build_lock_for(nlang: str) -> threading.Lock:
+    lock = _BUILD_LOCKS.get(nlang)
+    if lock is None:
+        with _CACHE_LOCK:
+            lock = _BUILD_LOCKS.setdefault(nlang, threading.Lock())
+    return lock
+
+
+def _load_slot(nlang: str) -> _CacheSlot:
+    """Build a fresh slot. Must be called while holding the language's build lock."""
+    # Fingerprint first: a shard rewritten mid-load is picked up on the next check.
+    fingerprint = source_fingerprint(nlang)
+    started = time.perf_counter()
+    try:
+        index = LexiconIndex(load_lexicon(nlang))
+    except Exception:
+        with _CACHE_LOCK:
+            _STATS.build_failures += 1
+        raise
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    size = approx_size_bytes(index)
+
+    with _CACHE_LOCK:
+        _STATS.builds += 1
+        _STATS.build_time_ms += elapsed_ms
+        _LAST_BUILD_MS[nlang] = elapsed_ms
+
+    logger.debug("Built lexicon index for %r in %.1f ms (~%d bytes).", nlang, elapsed_ms, size)
+    return _CacheSlot(index=index, size_bytes=size, fingerprint=fingerprint, checked_at=time.monotonic())
+
+
+def _evict_locked(keep: str) -> None:
+    """Drop least-recently-used languages until within budget. Caller holds _CACHE_LOCK."""
+    cfg = get_config()
+    max_langs = cfg.resolved_cache_max_langs()
+    max_bytes = cfg.resolved_cache_max_bytes()
+    if not max_langs and not max_bytes:
+        return
+
+    total_bytes = sum(slot.size_bytes for slot in _INDEX_CACHE.values())
+    while len(_INDEX_CACHE) > 1:
+        over_langs = bool(max_langs) and len(_INDEX_CACHE) > max_langs
+        over_bytes = bool(max_bytes) and total_bytes > max_bytes
+        if not (over_langs or over_bytes):
+            break
+
+        victim = next(iter(_INDEX_CACHE))
+        if victim == keep:
+            # The newest entry alone exceeds the budget; keep serving it.
+            break
+        slot = _INDEX_CACHE.pop(victim)
+        total_bytes -= slot.size_bytes
+        _STATS.evictions += 1
+        _STATS.evicted_bytes += slot.size_bytes
+        logger.info("Evicted lexicon index for %r (~%d bytes).", victim, slot.size_bytes)
+
+
+def _install(nlang: str, slot: _CacheSlot) -> None:
+    with _CACHE_LOCK:
+        _INDEX_CACHE[nlang] = slot
+        _INDEX_CACHE.move_to_end(nlang)
+        _evict_locked(keep=nlang)
+
+
+def _refresh_worker(nlang: str, stale: _CacheSlot, fingerprint: Tuple[Any, ...]) -> None:
+    try:
+        with _build_lock_for(nlang):
+            if _INDEX_CACHE.get(nlang) is not stale:
+                return  # cleared or replaced while we were queued
+            fresh = _load_slot(nlang)
+            with _CACHE_LOCK:
+                if _INDEX_CACHE.get(nlang) is not stale:
+                    return
+                _INDEX_CACHE[nlang] = fresh  # keeps its LRU position
+                _STATS.refreshes += 1
+                _evict_locked(keep=nlang)
+        logger.info("Refreshed lexicon index for %r after on-disk change.", nlang)
+    except Exception as e:
+        with _CACHE_LOCK:
+            _STATS.refresh_failures += 1
+        # Do not retry until the shards change again; the stale index keeps serving.
+        stale.fingerprint = fingerprint
+        logger.warning("Background refresh of lexicon %r failed: %s (serving stale index).", nlang, e)
+    finally:
+        stale.refreshing = False
+
+
+def _maybe_refresh(nlang: str, slot: _CacheSlot, interval: int) -> None:
+    now = time.monotonic()
+    if slot.refreshing or now - slot.checked_at < interval:
+        return
+    slot.checked_at = now
+
+    try:
+        current = source_fingerprint(nlang)
+    except Exception:
+        return
+    if current == slot.fingerprint:
+        return
+
+    with _CACHE_LOCK:
+        if slot.refreshing:
+            return
+        slot.refreshing = True
+
+    threading.Thread(
+        target=_refresh_worker,
+        args=(nlang, slot, current),
+        name=f"lexicon-refresh-{nlang}",
+        daemon=True,
+    ).start()
+
+
 # ---------------------------------------------------------------------------
 # Core cache API
 # ---------------------------------------------------------------------------
@@ -65,7 +227,8 @@ def get_or_build_index(lang: str) -> LexiconIndex:
         lang: Language code (e.g. "en", "fr", "sw", "eng", "fra").
 
     Returns:
-        LexiconIndex for that language.
+        LexiconIndex for that language. If the language's shards changed on
+        disk, the previous index is returned while a refresh runs.
 
     Raises:
         ValueError: empty/invalid lang code.
@@ -76,29 +239,32 @@ def get_or_build_index(lang: str) -> LexiconIndex:
     if not nlang:
         raise ValueError("Language code must be a non-empty string.")
 
-    # Fast path (no lock) for already-cached entries.
-    existing = _INDEX_CACHE.get(nlang)
-    if existing is not None:
-        return existing
-
-    # Slow path: build under lock, double-checking.
-    with _CACHE_LOCK:
-        existing = _INDEX_CACHE.get(nlang)
-        if existing is not None:
-            return existing
-
-        lexemes = load_lexicon(nlang)
-
-        if not hasattr(LexiconIndex, "from_lexemes"):
-            raise TypeError(
-                "LexiconIndex does not expose from_lexemes(), but load_lexicon() "
-                "returns a lexeme mapping. Either add LexiconIndex.from_lexemes() "
-                "or migrate loader/index to a Lexicon-based construction path."
-            )
-
-        index = LexiconIndex.from_lexemes(lexemes)  # type: ignore[attr-defined]
-        _INDEX_CACHE[nlang] = index
-        return index
+    cfg = get_config()
+
+    # Fast path for already-cached entries.
+    slot = _INDEX_CACHE.get(nlang)
+    if slot is not None:
+        with _CACHE_LOCK:
+            _STATS.hits += 1
+            if nlang in _INDEX_CACHE:
+                _INDEX_CACHE.move_to_end(nlang)
+        if cfg.cache_refresh_sec and slot.fingerprint is not None:
+            _maybe_refresh(nlang, slot, cfg.cache_refresh_sec)
+        return slot.index
+
+    # Slow path: single-flight build for this language only.
+    with _build_lock_for(nlang):
+        slot = _INDEX_CACHE.get(nlang)
+        if slot is not None:
+            with _CACHE_LOCK:
+                _STATS.hits += 1
+            return slot.index
+
+        with _CACHE_LOCK:
+            _STATS.misses += 1
+        slot = _load_slot(nlang)
+        _install(nlang, slot)
+        return slot.index
 
 
 def set_index(lang: str, index: LexiconIndex) -> None:
@@ -112,8 +278,7 @@ def set_index(lang: str, index: LexiconIndex) -> None:
     if index is None:
         raise ValueError("Index must be non-null.")
 
-    with _CACHE_LOCK:
-        _INDEX_CACHE[nlang] = index
+    _install(nlang, _CacheSlot(index=index, size_bytes=approx_size_bytes(index)))
 
 
 def clear_cache(lang: Optional[str] = None) -> None:
@@ -138,6 +303,60 @@ def cached_languages() -> List[str]:
         return sorted(_INDEX_CACHE.keys())
 
 
+def memory_report() -> Dict[str, int]:
+    """
+    Return approximate retained bytes per cached language.
+
+    Sizes are measured once when each index is built (or injected), so this
+    is cheap enough to call from health endpoints.
+    """
+    with _CACHE_LOCK:
+        return {lang: slot.size_bytes for lang, slot in sorted(_INDEX_CACHE.items())}
+
+
+def cache_stats() -> Dict[str, Any]:
+    """
+    Return cache counters and current budget usage.
+
+    Keys:
+        hits / misses: lookups served from / not found in the cache.
+        builds / build_failures / build_time_ms: index loads (including
+            background refreshes) and their cumulative wall time.
+        last_build_ms: most recent build time per language.
+        evictions / evicted_bytes: LRU evictions and the bytes they released.
+        refreshes / refresh_failures: stale-while-revalidate swaps.
+        languages / cached_bytes / max_langs / max_bytes: current usage vs budget.
+    """
+    cfg = get_config()
+    with _CACHE_LOCK:
+        return {
+            "hits": _STATS.hits,
+            "misses": _STATS.misses,
+            "builds": _STATS.builds,
+            "build_failures": _STATS.build_failures,
+            "build_time_ms": round(_STATS.build_time_ms, 3),
+            "last_build_ms": {k: round(v, 3) for k, v in sorted(_LAST_BUILD_MS.items())},
+            "evictions": _STATS.evictions,
+            "evicted_bytes": _STATS.evicted_bytes,
+            "refreshes": _STATS.refreshes,
+            "refresh_failures": _STATS.refresh_failures,
+            "languages": len(_INDEX_CACHE),
+            "cached_bytes": sum(slot.size_bytes for slot in _INDEX_CACHE.values()),
+            "max_langs": cfg.resolved_cache_max_langs(),
+            "max_bytes": cfg.resolved_cache_max_bytes(),
+        }
+
+
+def reset_cache_stats() -> None:
+    """
+    Zero all cache counters (cached indexes are kept).
+    """
+    global _STATS
+    with _CACHE_LOCK:
+        _STATS = _CacheStats()
+        _LAST_BUILD_MS.clear()
+
+
 def preload_languages(langs: Iterable[str]) -> None:
     """
     Preload lexicon indexes for a list of languages.
@@ -161,6 +380,9 @@ __all__ = [
     "set_index",
     "clear_cache",
     "cached_languages",
+    "memory_report",
+    "cache_stats",
+    "reset_cache_stats",
     "preload_languages",
     "warmup_languages",
 ]
@@ -59,8 +59,19 @@ Cache controls:
 
 - AW_LEXICON_CACHE_MAX_LANGS
     Soft limit on number of cached language indices (0 = unlimited).
+    Least-recently-used languages are evicted beyond this limit.
     Default: 0
 
+- AW_LEXICON_CACHE_MAX_BYTES
+    Approximate memory budget for all cached indices, in bytes (0 = unlimited).
+    Default: 0
+
+- AW_LEXICON_CACHE_REFRESH_SEC
+    Minimum interval between on-disk change checks for a cached language.
+    When a shard file changes, the stale index keeps serving while a
+    replacement is built in the background. 0 disables change checks.
+    Default: 5
+
 Notes
 =====
 - This module does not enforce behavior; it exposes preferences.
@@ -169,6 +180,11 @@ class LexiconConfig:
 
         cache_max_langs:
             Soft limit on the number of cached language indices. 0 means unlimited.
+        cache_max_bytes:
+            Approximate memory budget for cached indices. 0 means unlimited.
+        cache_refresh_sec:
+            Minimum seconds between shard change checks per cached language.
+            0 disables background refresh.
     """
 
     lexicon_dir: str = "data/lexicon"
@@ -184,6 +200,8 @@ class LexiconConfig:
     log_level: str = ""
     cache_enabled: bool = True
     cache_max_langs: int = 0
+    cache_max_bytes: int = 0
+    cache_refresh_sec: int = 5
 
     @classmethod
     def from_env(cls) -> "LexiconConfig":
@@ -238,6 +256,18 @@ class LexiconConfig:
             min_value=0,
         )
 
+        cache_max_bytes = _parse_int(
+            os.getenv("AW_LEXICON_CACHE_MAX_BYTES", ""),
+            0,
+            min_value=0,
+        )
+
+        cache_refresh_sec = _parse_int(
+            os.getenv("AW_LEXICON_CACHE_REFRESH_SEC", ""),
+            5,
+            min_value=0,
+        )
+
         return cls(
             lexicon_dir=lex_dir,
             max_lemmas_per_language=max_lemmas,
@@ -249,6 +279,8 @@ class LexiconConfig:
             log_level=log_level,
             cache_enabled=cache_enabled,
             cache_max_langs=cache_max_langs,
+            cache_max_bytes=cache_max_bytes,
+            cache_refresh_sec=cache_refresh_sec,
         )
 
     def resolved_lexicon_dir(self, *, project_root: Optional[Path] = None) -> Path:
@@ -272,6 +304,12 @@ class LexiconConfig:
         """
         return max(0, int(self.cache_max_langs or 0))
 
+    def resolved_cache_max_bytes(self) -> int:
+        """
+        Return a safe cache_max_bytes (non-negative int).
+        """
+        return max(0, int(self.cache_max_bytes or 0))
+
 
 # Singleton configuration instance
 _CONFIG: Optional[LexiconConfig] = None
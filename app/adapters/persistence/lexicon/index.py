@@ -27,10 +27,17 @@ Design goals
 - Case-insensitive lookups, with optional robust normalization
   (underscores/spaces/dashes/punctuation) without mutating stored data.
 - Minimal surface area used by engines/routers.
+- One materialisation per language: when built from a Lexicon, every index
+  points at the Lexicon's own (slotted) entry objects, and recurring strings
+  (POS tags, language codes, form keys, ...) are interned process-wide.
+  The index is the canonical per-language store shared by the cache,
+  `app.shared.lexicon` and the lexical resolvers.
 """
 
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, Mapping, Optional, Tuple
 
@@ -48,10 +55,99 @@ except Exception:  # pragma: no cover
     normalize_for_lookup = None  # type: ignore[assignment]
 
 
+_QID_RE = re.compile(r"^Q\d+$", re.IGNORECASE)
+
+_INTERNED_ENTRY_ATTRS = (
+    "key",
+    "lemma",
+    "pos",
+    "language",
+    "sense",
+    "gender",
+    "default_number",
+    "default_formality",
+    "wikidata_qid",
+)
+
+
 def _casefold(s: str) -> str:
     return s.casefold()
 
 
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_entry(entry: Any) -> None:
+    """Intern the short, highly repetitive string fields of an entry in place."""
+    for attr in _INTERNED_ENTRY_ATTRS:
+        value = getattr(entry, attr, None)
+        if type(value) is str:
+            setattr(entry, attr, sys.intern(value))
+
+    forms = getattr(entry, "forms", None)
+    if isinstance(forms, dict) and forms:
+        entry.forms = {sys.intern(k): v for k, v in forms.items()}
+
+
+def _entry_surface(entry: Any) -> Optional[str]:
+    surface = getattr(entry, "lemma", None) or getattr(entry, "label", None) or getattr(entry, "key", None)
+    if not isinstance(surface, str) or not surface.strip():
+        return None
+    return surface
+
+
+def _entry_qid(entry: Any) -> Optional[str]:
+    qid = getattr(entry, "wikidata_qid", None)
+    if isinstance(qid, str) and qid.strip():
+        return qid
+    # Harvested shards key entries by QID without repeating it in the body.
+    key = getattr(entry, "key", None)
+    if isinstance(key, str) and _QID_RE.match(key):
+        return key
+    return None
+
+
+def approx_size_bytes(root: Any) -> int:
+    """
+    Approximate retained size of an object graph (shared objects counted once).
+
+    Walks dicts, sequences, sets and `__slots__` / `__dict__` objects. Interned
+    strings are counted too, so the figure is an upper bound for what evicting
+    the graph would free.
+    """
+    seen: set[int] = set()
+    total = 0
+    stack = [root]
+
+    while stack:
+        obj = stack.pop()
+        oid = id(obj)
+        if oid in seen:
+            continue
+        seen.add(oid)
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+            continue
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+            continue
+
+        for klass in type(obj).__mro__:
+            for slot in getattr(klass, "__slots__", ()):
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+        if hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+
+    return total
+
+
 def _norm_key(s: str) -> str:
     if not isinstance(s, str):
         return ""
@@ -74,8 +170,10 @@ class LexiconIndex:
     Notes:
       - When initialized with a Lexicon, this index preserves the original entry
         objects (ProfessionEntry, NationalityEntry, etc.) for lookup_* methods.
-      - Independently, we also build a "flat" view to support lookup_by_lemma,
-        lookup_by_qid, and lookup_form consistently.
+      - lookup_by_lemma / lookup_by_qid / lookup_form are served from two
+        parallel tuples (surface strings and entry records) rather than from a
+        second, flattened copy of the data. For a Lexicon the records *are*
+        the rich entries; for a flat mapping they are Lexemes built once.
     """
 
     lexemes: Any  # Lexicon | Dict[str, Dict[str, Any]]
@@ -84,15 +182,14 @@ class LexiconIndex:
         # Keep a reference to the rich Lexicon if provided.
         self._lexicon: Optional[Lexicon] = self.lexemes if isinstance(self.lexemes, Lexicon) else None
 
-        # Build the flat mapping used by lemma/qid/form APIs.
-        if isinstance(self.lexemes, dict):
-            self._flat: Dict[str, Dict[str, Any]] = self.lexemes
-        elif isinstance(self.lexemes, Lexicon):
-            self._flat = self._flatten_lexicon(self.lexemes)
-        else:
+        if not isinstance(self.lexemes, (dict, Lexicon)):
             raise TypeError("LexiconIndex expects a Lexicon or a dict mapping surface_form -> feature dict.")
 
-        # (lemma_norm, pos_norm or None) -> Lexeme
+        # Parallel, first-writer-wins record arrays: surface form -> entry.
+        self._surfaces: Tuple[str, ...] = ()
+        self._entries: Tuple[Any, ...] = ()
+
+        # (lemma_norm, pos_norm or None) -> entry
         self._lemma_index: Dict[Tuple[str, Optional[str]], Lexeme] = {}
         # lemma_norm -> Lexeme (first writer wins) to support pos=None queries
         self._lemma_anypos_index: Dict[str, Lexeme] = {}
@@ -107,7 +204,11 @@ class LexiconIndex:
         self._any_index: Dict[str, BaseLexicalEntry] = {}
 
         # Build indices
-        self._build_flat_indices()
+        if self._lexicon is not None:
+            self._load_records_from_lexicon(self._lexicon)
+        else:
+            self._load_records_from_flat(self.lexemes)
+        self._build_record_indices()
         if self._lexicon is not None:
             self._build_rich_indices(self._lexicon)
 
@@ -115,14 +216,15 @@ class LexiconIndex:
     # Construction helpers
     # ------------------------------------------------------------------
 
-    def _flatten_lexicon(self, lex: Lexicon) -> Dict[str, Dict[str, Any]]:
+    def _load_records_from_lexicon(self, lex: Lexicon) -> None:
         """
-        Convert a rich Lexicon object into the flattened mapping expected by
-        the lemma/qid/form APIs.
+        Register the Lexicon's own entries as records (no copies).
 
-        First writer wins on duplicate lemma keys.
+        First writer wins on duplicate surface forms.
         """
-        flat: Dict[str, Dict[str, Any]] = {}
+        surfaces: list[str] = []
+        entries: list[Any] = []
+        seen: set[str] = set()
 
         for table in (
             lex.professions,
@@ -132,34 +234,32 @@ class LexiconIndex:
             lex.general_entries,
         ):
             for entry in table.values():
-                surface = entry.lemma or entry.key
-                if not isinstance(surface, str) or not surface.strip():
+                _intern_entry(entry)
+                surface = _entry_surface(entry)
+                if surface is None or surface in seen:
                     continue
-                if surface in flat:
-                    continue
-                flat[surface] = entry.to_dict()
+                seen.add(surface)
+                surfaces.append(surface)
+                entries.append(entry)
 
-        return flat
+        self._surfaces = tuple(surfaces)
+        self._entries = tuple(entries)
 
-    def _build_flat_indices(self) -> None:
+    def _load_records_from_flat(self, flat: Mapping[str, Any]) -> None:
         """
-        Build lemma/qid indices from the flattened mapping.
+        Build one Lexeme record per surface form of a flattened mapping.
         """
-        for surface, feats in self._flat.items():
+        surfaces: list[str] = []
+        entries: list[Any] = []
+
+        for surface, feats in flat.items():
             if not isinstance(surface, str) or not surface.strip():
                 continue
             if not isinstance(feats, Mapping):
                 continue
 
             surface_raw = surface
-            surface_norm = _norm_key(surface_raw)
-
-            # keep first-writer-wins canonicalization
-            if surface_norm and surface_norm not in self._surface_canon:
-                self._surface_canon[surface_norm] = surface_raw
-
             pos_raw = feats.get("pos")
-            pos_norm = _casefold(pos_raw) if isinstance(pos_raw, str) and pos_raw.strip() else None
 
             lex = Lexeme(
                 key=str(feats.get("key") or surface_raw),
@@ -175,6 +275,26 @@ class LexiconIndex:
                 forms=dict(feats.get("forms")) if isinstance(feats.get("forms"), Mapping) else {},
                 extra=dict(feats),
             )
+            _intern_entry(lex)
+            surfaces.append(sys.intern(surface_raw))
+            entries.append(lex)
+
+        self._surfaces = tuple(surfaces)
+        self._entries = tuple(entries)
+
+    def _build_record_indices(self) -> None:
+        """
+        Build lemma/qid indices over the record arrays.
+        """
+        for surface_raw, lex in zip(self._surfaces, self._entries):
+            surface_norm = sys.intern(_norm_key(surface_raw))
+
+            # keep first-writer-wins canonicalization
+            if surface_norm and surface_norm not in self._surface_canon:
+                self._surface_canon[surface_norm] = surface_raw
+
+            pos_raw = getattr(lex, "pos", None)
+            pos_norm = _intern(_casefold(pos_raw)) if isinstance(pos_raw, str) and pos_raw.strip() else None
 
             key_any = (surface_norm, None)
             key_pos = (surface_norm, pos_norm)
@@ -190,8 +310,8 @@ class LexiconIndex:
                     if key_any not in self._lemma_index:
                         self._lemma_index[key_any] = lex
 
-            qid = lex.wikidata_qid
-            if isinstance(qid, str) and qid.strip():
+            qid = _entry_qid(lex)
+            if qid is not None:
                 qid_norm = _norm_key(qid)
                 if qid_norm and qid_norm not in self._qid_index:
                     self._qid_index[qid_norm] = lex
@@ -231,7 +351,9 @@ class LexiconIndex:
         # titles / honours / general entries should be discoverable via lookup_any
         for table in (lex.titles, lex.honours, lex.general_entries):
             for entry in table.values():
-                self._add_alias(self._any_index, entry.lemma, entry)
+                # HonourEntry carries `label` / `short_label` instead of `lemma`.
+                self._add_alias(self._any_index, _entry_surface(entry), entry)
+                self._add_alias(self._any_index, getattr(entry, "short_label", None), entry)
                 self._add_alias(self._any_index, entry.key, entry)
 
     # ------------------------------------------------------------------
@@ -338,35 +460,33 @@ class LexiconIndex:
             if gender and gender in lex.forms and isinstance(lex.forms[gender], str):
                 return Form(surface=lex.forms[gender], features={"gender": gender})
 
-        # 3) search flattened mapping for matching surface with same qid (if known)
-        qid = lex.wikidata_qid
+        # 3) search records for matching surface with same qid (if known)
+        qid = getattr(lex, "wikidata_qid", None)
+        qid_norm = _norm_key(qid) if isinstance(qid, str) and qid.strip() else None
         pos_norm = _casefold(pos) if isinstance(pos, str) and pos.strip() else None
 
         best_surface: Optional[str] = None
 
-        for surface, feats in self._flat.items():
-            if not isinstance(surface, str) or not isinstance(feats, Mapping):
-                continue
-
-            cand_qid = feats.get("qid") or feats.get("wikidata_qid")
-            if qid and isinstance(cand_qid, str) and cand_qid.strip():
-                if _norm_key(cand_qid) != _norm_key(qid):
+        for surface, cand in zip(self._surfaces, self._entries):
+            cand_qid = getattr(cand, "wikidata_qid", None)
+            if qid_norm and isinstance(cand_qid, str) and cand_qid.strip():
+                if _norm_key(cand_qid) != qid_norm:
                     continue
-            elif qid:
+            elif qid_norm:
                 continue
 
             if pos_norm is not None:
-                cand_pos = feats.get("pos")
+                cand_pos = getattr(cand, "pos", None)
                 cand_pos_norm = _casefold(cand_pos) if isinstance(cand_pos, str) and cand_pos.strip() else None
                 if cand_pos_norm != pos_norm:
                     continue
 
             if gender is not None:
-                cand_gender = feats.get("gender")
+                cand_gender = getattr(cand, "gender", None)
                 if cand_gender is None or str(cand_gender) != gender:
                     continue
             if number is not None:
-                cand_number = feats.get("number") or feats.get("default_number")
+                cand_number = getattr(cand, "default_number", None)
                 if cand_number is None or str(cand_number) != number:
                     continue
 
@@ -386,5 +506,16 @@ class LexiconIndex:
             features={k: v for k, v in (("gender", gender), ("number", number)) if v is not None},
         )
 
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def approx_size_bytes(self) -> int:
+        """Approximate retained bytes of this index and the data it owns."""
+        return approx_size_bytes(self)
+
 
-__all__ = ["LexiconIndex"]
+__all__ = ["LexiconIndex", "approx_size_bytes"]
@@ -14,7 +14,7 @@ from app.core.domain.constructions.slot_models import (
 )
 from app.core.ports.lexical_resolver_port import ResolutionResult
 
-from .index import get_index
+from .cache import get_or_build_index as get_index
 from .normalization import normalize_for_lookup
 
 if TYPE_CHECKING:
@@ -202,14 +202,21 @@ def _entry_qid(entry: Any) -> Optional[str]:
     extra = _entry_extra(entry)
     return (
         _clean_str(_entry_attr(entry, "qid"))
+        or _clean_str(_entry_attr(entry, "wikidata_qid"))
         or _clean_str(extra.get("qid"))
+        or _clean_str(extra.get("wikidata_qid"))
         or _clean_str(extra.get("wikidata_id"))
         or _clean_str(extra.get("entity_id"))
     )
 
 
 def _entry_lexeme_id(entry: Any) -> Optional[str]:
-    return _clean_str(_entry_attr(entry, "id"))
+    extra = _entry_extra(entry)
+    return (
+        _clean_str(_entry_attr(entry, "id"))
+        or _clean_str(_entry_attr(entry, "lexeme_id"))
+        or _clean_str(extra.get("lexeme_id"))
+    )
 
 
 def _entry_label(entry: Any) -> Optional[str]:
@@ -777,7 +784,6 @@ class LexicalResolver:
                         lexeme_id = _entry_lexeme_id(entry)
                 ref = LexemeRef(
                     lemma=lemma or "unknown",
-                    lang_code=lang_code,
                     pos=pos,
                     source="stable_id",
                     confidence=1.0,
@@ -810,7 +816,6 @@ class LexicalResolver:
                     alias_used = lemma if normalize_for_lookup(lemma) != normalize_for_lookup(entry_lemma) else None
                     ref = LexemeRef(
                         lemma=entry_lemma,
-                        lang_code=lang_code,
                         pos=_clean_str(_entry_attr(entry, "pos")) or pos,
                         source="language_lexicon" if alias_used is None else "lexicon_alias",
                         confidence=0.9 if alias_used is None else 0.75,
@@ -839,7 +844,6 @@ class LexicalResolver:
 
                 ref = LexemeRef(
                     lemma=lemma,
-                    lang_code=lang_code,
                     pos=pos,
                     source="raw_string",
                     confidence=0.25,
@@ -883,7 +887,6 @@ class LexicalResolver:
             if entry is not None:
                 ref = LexemeRef(
                     lemma=_entry_label(entry) or raw,
-                    lang_code=lang_code,
                     pos=_clean_str(_entry_attr(entry, "pos")),
                     source="stable_id",
                     confidence=1.0,
@@ -920,7 +923,6 @@ class LexicalResolver:
             alias_used = raw if normalize_for_lookup(raw) != normalize_for_lookup(entry_lemma) else None
             ref = LexemeRef(
                 lemma=entry_lemma,
-                lang_code=lang_code,
                 pos=_clean_str(_entry_attr(entry, "pos")),
                 source="language_lexicon" if alias_used is None else "lexicon_alias",
                 confidence=0.9 if alias_used is None else 0.75,
@@ -956,7 +958,6 @@ class LexicalResolver:
 
         ref = LexemeRef(
             lemma=raw,
-            lang_code=lang_code,
             pos=pos_hint,
             source="raw_string",
             confidence=0.25,
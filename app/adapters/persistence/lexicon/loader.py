@@ -792,6 +792,35 @@ def load_lexicon_flat(lang_code: str) -> Dict[str, Dict[str, Any]]:
     return out
 
 
+def source_fingerprint(lang_code: str) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Return a cheap change marker for the files `load_lexicon(lang_code)` reads.
+
+    The marker is a sorted tuple of (filename, mtime_ns, size); it changes
+    whenever a shard is added, removed or rewritten. Only `stat()` calls are
+    made, so callers can poll it without parsing JSON.
+    """
+    lang = (lang_code or "").strip()
+    if not lang:
+        return ()
+
+    lang_dir = _language_dir(lang)
+    if lang_dir.is_dir():
+        paths = sorted(lang_dir.glob("*.json"))
+    else:
+        legacy_file = _lexicon_base_dir() / f"{lang}_lexicon.json"
+        paths = [legacy_file] if legacy_file.is_file() else []
+
+    marker: List[Tuple[str, int, int]] = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        marker.append((path.name, st.st_mtime_ns, st.st_size))
+    return tuple(marker)
+
+
 def available_languages() -> List[str]:
     """Return a sorted list of language codes for which a lexicon directory exists."""
     lex_dir = _lexicon_base_dir()
@@ -815,4 +844,5 @@ __all__ = [
     "load_lexicon",
     "load_lexicon_flat",
     "available_languages",
+    "source_fingerprint",
 ]
\ No newline at end of file
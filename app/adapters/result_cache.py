@@ -0,0 +1,243 @@
+# app/adapters/result_cache.py
+"""
+End-to-end generation result caches (IGenerationResultCache adapters).
+
+Both backends share the same key scheme:
+
+    blake2b(lang_code | canonical frame JSON | PGF stamp | lexicon stamp | config stamp)
+
+- canonical frame JSON: `model_dump(mode="json")` (or the raw mapping) with
+  sorted keys, prefixed by the frame class name.
+- PGF stamp: the engine's `grammar_version`, i.e. the grammar actually
+  loaded, so a hot swap changes every key at the moment it lands (not when
+  the file on disk changes). Caches built without an engine fall back to
+  the mtime/size of settings.PGF_PATH.
+- lexicon stamp: `lexicon.loader.source_fingerprint(lang_code)`.
+- config stamp: GENERATION_CACHE_NAMESPACE plus the settings that select the
+  runtime. Bump the namespace on deploys that change generation code.
+
+Lexicon stamps cost a few `stat()` calls, so they are memoised for
+`stamp_ttl_sec` (default 1 s) per language. The PGF stamp is read on every
+call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+from app.core.domain.models import Sentence
+from app.core.ports.result_cache import IGenerationResultCache
+from app.shared.config import settings
+
+logger = structlog.get_logger()
+
+try:
+    from app.adapters.persistence.lexicon.loader import source_fingerprint
+except ImportError:  # pragma: no cover
+    source_fingerprint = None
+
+
+def _canonical_frame(frame: Any) -> str:
+    if hasattr(frame, "model_dump"):
+        data = frame.model_dump(mode="json")
+    elif isinstance(frame, dict):
+        data = frame
+    else:
+        data = getattr(frame, "__dict__", repr(frame))
+    body = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return f"{type(frame).__name__}:{body}"
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+
+class VersionedResultCache(IGenerationResultCache):
+    """
+    Key derivation shared by the concrete result caches; subclasses provide
+    `get` / `set` (the class itself cannot be instantiated).
+    """
+
+    def __init__(self, *, ttl_sec: int = 3600, stamp_ttl_sec: float = 1.0, engine: Any = None) -> None:
+        self.engine = engine
+        self.ttl_sec = max(0, int(ttl_sec))
+        self.stamp_ttl_sec = max(0.0, float(stamp_ttl_sec))
+        self._config_stamp = _digest(
+            str(settings.GENERATION_CACHE_NAMESPACE),
+            str(settings.USE_MOCK_GRAMMAR),
+            str(settings.PGF_PATH),
+            str(settings.FILESYSTEM_REPO_PATH),
+        )
+        self._stamps: Dict[str, Tuple[float, str]] = {}
+
+    # ------------------------------------------------------------------
+    # Version stamps
+    # ------------------------------------------------------------------
+
+    def _pgf_stamp(self) -> str:
+        if self.engine is not None:
+            version = getattr(self.engine, "grammar_version", None)
+            return f"pgf:{version}" if version is not None else "pgf:none"
+        try:
+            st = os.stat(settings.PGF_PATH or "")
+        except OSError:
+            return "pgf:none"
+        return f"pgf:{st.st_mtime_ns}:{st.st_size}"
+
+    @staticmethod
+    def _lexicon_stamp(lang_code: str) -> str:
+        if source_fingerprint is None:
+            return "lex:none"
+        try:
+            return "lex:" + _digest(repr(source_fingerprint(lang_code)))
+        except Exception:
+            return "lex:none"
+
+    def version_stamp(self, lang_code: str) -> str:
+        """PGF + lexicon + config stamp for a language (lexicon part memoised briefly)."""
+        now = time.monotonic()
+        cached = self._stamps.get(lang_code)
+        if cached is not None and cached[0] > now:
+            lexicon = cached[1]
+        else:
+            lexicon = self._lexicon_stamp(lang_code)
+            self._stamps[lang_code] = (now + self.stamp_ttl_sec, lexicon)
+        return f"{self._pgf_stamp()}|{lexicon}|{self._config_stamp}"
+
+    def make_key(self, lang_code: str, frame: Any) -> Optional[str]:
+        lang = (lang_code or "").strip()
+        if not lang or frame is None:
+            return None
+        try:
+            return _digest(lang, _canonical_frame(frame), self.version_stamp(lang))
+        except Exception as e:
+            logger.debug("generation_cache_key_failed", lang=lang, error=str(e))
+            return None
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Sentence]:
+        """Return a cached Sentence, or None on miss."""
+
+    @abstractmethod
+    async def set(self, key: str, sentence: Sentence) -> None:
+        """Store a successfully generated Sentence."""
+
+
+class InMemoryResultCache(VersionedResultCache):
+    """
+    Per-process LRU result cache with TTL.
+
+    Runs on the event loop only, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 10000,
+        ttl_sec: int = 3600,
+        stamp_ttl_sec: float = 1.0,
+        engine: Any = None,
+    ) -> None:
+        super().__init__(ttl_sec=ttl_sec, stamp_ttl_sec=stamp_ttl_sec, engine=engine)
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, Tuple[float, Sentence]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Sentence]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, sentence = item
+        if self.ttl_sec and expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return sentence.model_copy(deep=True)
+
+    async def set(self, key: str, sentence: Sentence) -> None:
+        expires_at = time.monotonic() + self.ttl_sec if self.ttl_sec else float("inf")
+        self._entries[key] = (expires_at, sentence.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._stamps.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisResultCache(VersionedResultCache):
+    """
+    Redis-backed result cache shared by every API process.
+
+    Values are Sentence JSON under `<prefix><key>` with the configured TTL.
+    Connection or decode errors are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        *,
+        redis_url: str = settings.REDIS_URL,
+        ttl_sec: int = 3600,
+        prefix: str = "ska:gen:",
+        stamp_ttl_sec: float = 1.0,
+        client: Any = None,
+        engine: Any = None,
+    ) -> None:
+        super().__init__(ttl_sec=ttl_sec, stamp_ttl_sec=stamp_ttl_sec, engine=engine)
+        self.redis_url = redis_url
+        self.prefix = prefix
+        self._client = client
+
+    def _redis(self) -> Any:
+        if self._client is None:
+            from redis.asyncio import from_url
+
+            self._client = from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    async def get(self, key: str) -> Optional[Sentence]:
+        try:
+            data = await self._redis().get(self.prefix + key)
+        except Exception as e:
+            logger.warning("generation_cache_get_failed", error=str(e))
+            return None
+        if not data:
+            return None
+        try:
+            return Sentence.model_validate_json(data)
+        except Exception as e:
+            logger.warning("generation_cache_decode_failed", error=str(e))
+            return None
+
+    async def set(self, key: str, sentence: Sentence) -> None:
+        try:
+            await self._redis().set(
+                self.prefix + key,
+                sentence.model_dump_json(),
+                ex=self.ttl_sec or None,
+            )
+        except Exception as e:
+            logger.warning("generation_cache_set_failed", error=str(e))
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+__all__ = ["VersionedResultCache", "InMemoryResultCache", "RedisResultCache"]
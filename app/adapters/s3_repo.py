@@ -1,35 +1,37 @@
 # app/adapters/s3_repo.py
-import asyncio
 import json
-import boto3
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 from botocore.exceptions import ClientError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 # [FIX] Import from the consolidated ports package
 from app.core.ports import LanguageRepo, LexiconRepo
 from app.core.domain.models import LexiconEntry
-from app.shared.config import settings
+from app.adapters.s3_store import S3ObjectStore
 from app.shared.telemetry import get_tracer
 
 tracer = get_tracer(__name__)
 
+MATRIX_KEY = "data/indices/everything_matrix.json"
+GRAMMAR_PREFIX = "grammars/"
+
 class S3LanguageRepo(LanguageRepo, LexiconRepo):
     """
     Production Persistence Adapter backed by AWS S3.
     - Acts as LanguageRepo (Metadata & Grammars)
     - Acts as LexiconRepo (Vocabulary - currently stubs/limited)
+
+    All object I/O goes through S3ObjectStore: pooled client, local
+    content-addressed cache revalidated with ETags, ranged/multipart
+    transfers for large PGFs.
     """
 
-    def __init__(self):
-        # Initialize Boto3 Client
-        self.s3_client = boto3.client(
-            "s3",
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
-        self.bucket = settings.AWS_BUCKET_NAME
+    def __init__(self, store: Optional[S3ObjectStore] = None):
+        self.store = store or S3ObjectStore.from_settings()
+        self.s3_client = self.store.client
+        self.bucket = self.store.bucket
+        # (content sha256, parsed languages): skip re-parsing an unchanged matrix.
+        self._matrix: Tuple[str, List[Dict[str, Any]]] = ("", [])
 
     # =========================================================
     # PART 1: LanguageRepo Implementation (Zone A)
@@ -38,10 +40,13 @@ class S3LanguageRepo(LanguageRepo, LexiconRepo):
     async def list_languages(self) -> List[Dict[str, Any]]:
         """
         Fetches 'data/indices/everything_matrix.json' from S3.
+        A 304 on revalidation reuses the cached copy (and its parsed form).
         """
-        key = "data/indices/everything_matrix.json"
         try:
-            content_bytes = await asyncio.to_thread(self._download_sync, key)
+            path = await self.store.get_path(MATRIX_KEY)
+            if path.name == self._matrix[0]:
+                return list(self._matrix[1])
+            content_bytes = await self.store.run(path.read_bytes)
             data = json.loads(content_bytes.decode('utf-8'))
             
             languages = []
@@ -52,7 +57,9 @@ class S3LanguageRepo(LanguageRepo, LexiconRepo):
                     "name": meta.get("name", iso_code.upper()),
                     "z_id": meta.get("z_id", None)
                 })
-            return sorted(languages, key=lambda x: x["name"])
+            languages = sorted(languages, key=lambda x: x["name"])
+            self._matrix = (path.name, languages)
+            return list(languages)
         except (ClientError, FileNotFoundError):
             # Fallback if matrix missing
             return []
@@ -60,13 +67,13 @@ class S3LanguageRepo(LanguageRepo, LexiconRepo):
     async def save_grammar(self, language_code: str, content: str) -> None:
         """Saves the GF source file (.gf) to S3."""
         key = f"sources/{language_code}/Wiki{language_code}.gf"
-        await asyncio.to_thread(self._upload_sync, key, content.encode('utf-8'))
+        await self.store.put(key, content.encode('utf-8'), content_type="text/plain; charset=utf-8")
 
     async def get_grammar(self, language_code: str) -> Optional[str]:
         """Retrieves the GF source file."""
         key = f"sources/{language_code}/Wiki{language_code}.gf"
         try:
-            data = await asyncio.to_thread(self._download_sync, key)
+            data = await self.store.get(key)
             return data.decode('utf-8')
         except (ClientError, FileNotFoundError):
             return None
@@ -96,43 +103,24 @@ class S3LanguageRepo(LanguageRepo, LexiconRepo):
     async def health_check(self) -> bool:
         """Checks connection by listing 1 object."""
         try:
-            await asyncio.to_thread(self.s3_client.list_objects_v2, Bucket=self.bucket, MaxKeys=1)
+            await self.store.run(self.s3_client.list_objects_v2, Bucket=self.bucket, MaxKeys=1)
             return True
         except Exception:
             return False
 
     async def save_pgf(self, language_code: str, binary_content: bytes) -> None:
-        """Legacy/Extra: Uploads compiled PGF binary."""
-        key = f"grammars/{language_code}.pgf"
-        await asyncio.to_thread(self._upload_sync, key, binary_content)
-
-    # --- Synchronous Helpers (executed in thread pool) ---
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ClientError)
-    )
-    def _upload_sync(self, key: str, data: bytes):
-        """Sync boto3 upload with retries."""
-        self.s3_client.put_object(
-            Bucket=self.bucket,
-            Key=key,
-            Body=data,
-            # ContentType="application/octet-stream"
-        )
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ClientError)
-    )
-    def _download_sync(self, key: str) -> bytes:
-        """Sync boto3 download with retries."""
+        """Legacy/Extra: Uploads compiled PGF binary (multipart when large)."""
+        key = f"{GRAMMAR_PREFIX}{language_code}.pgf"
+        await self.store.put(key, binary_content, content_type="application/octet-stream")
+
+    async def get_pgf_path(self, language_code: str) -> Optional[Path]:
+        """Local path of the language's compiled PGF (downloaded/revalidated on demand)."""
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
-            return response["Body"].read()
-        except ClientError as e:
-            if e.response['Error']['Code'] in ("404", "NoSuchKey"):
-                raise FileNotFoundError(f"Key {key} not found.")
-            raise e
\ No newline at end of file
+            return await self.store.get_path(f"{GRAMMAR_PREFIX}{language_code}.pgf")
+        except (ClientError, FileNotFoundError):
+            return None
+
+    async def prefetch_grammars(self) -> int:
+        """Warm the local cache with every per-language PGF in the bucket."""
+        keys = [key for key in await self.store.list_keys(GRAMMAR_PREFIX) if key.endswith(".pgf")]
+        return await self.store.prefetch(keys)
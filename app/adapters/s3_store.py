@@ -0,0 +1,398 @@
+# app/adapters/s3_store.py
+"""
+Pooled S3 object store with a local, content-addressed read-through cache.
+
+- One boto3 client (thread-safe, connection pool sized to `max_concurrency`)
+  driven from a dedicated thread pool, so S3 I/O neither blocks the event
+  loop nor competes with other `asyncio.to_thread` work.
+- Reads start with one ranged GET of `part_size` bytes. Small objects are
+  complete after that round trip; larger ones fetch the remaining ranges in
+  parallel, pinned to the first response's ETag (If-Match) so an overwrite
+  mid-download fails instead of producing a torn file.
+- Uploads above `multipart_threshold` go up as parallel multipart parts.
+- Every object lands in `<cache_dir>/blobs/<sha256>`, and `index.json` maps
+  key -> (etag, sha256, size). Reads revalidate with If-None-Match; a 304
+  is served from disk without transferring the body.
+
+`S3_ENDPOINT_URL` points the client at MinIO / `moto_server` for local runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+import structlog
+from botocore.exceptions import ClientError
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+from app.shared.config import settings
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+MB = 1024 * 1024
+# S3 rejects multipart parts below 5 MiB (except the last one).
+MIN_PART_SIZE = 5 * MB
+
+_NOT_MODIFIED = frozenset({"304", "NotModified"})
+_NOT_FOUND = frozenset({"404", "NoSuchKey", "NotFound"})
+_PRECONDITION_FAILED = frozenset({"412", "PreconditionFailed"})
+
+
+def _error_code(exc: ClientError) -> str:
+    return str(exc.response.get("Error", {}).get("Code", ""))
+
+
+def _is_transient(exc: BaseException) -> bool:
+    # Conditional-request outcomes and missing keys are answers, not failures.
+    if not isinstance(exc, ClientError):
+        return False
+    code = _error_code(exc)
+    return code not in _NOT_MODIFIED | _NOT_FOUND | _PRECONDITION_FAILED and code != "InvalidRange"
+
+
+_s3_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    retry=retry_if_exception(_is_transient),
+    reraise=True,
+)
+
+
+def _total_size(content_range: Optional[str], body_len: int) -> int:
+    """Object size from a `bytes 0-99/1234` Content-Range (whole body if absent)."""
+    if content_range and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1].strip()
+        if total.isdigit():
+            return int(total)
+    return body_len
+
+
+@dataclass(frozen=True)
+class CachedObject:
+    etag: str
+    sha256: str
+    size: int
+
+
+class ContentCache:
+    """
+    Immutable blobs named by their SHA-256 plus a key -> CachedObject index.
+
+    Identical content under several keys is stored once. Blobs are written to
+    a temp file and renamed into place, so readers never see a partial file.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.blobs = self.root / "blobs"
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / "index.json"
+        self._lock = threading.Lock()
+        self._index: Dict[str, CachedObject] = self._load_index()
+
+    def _load_index(self) -> Dict[str, CachedObject]:
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        index: Dict[str, CachedObject] = {}
+        for key, value in (raw or {}).items():
+            try:
+                entry = CachedObject(**value)
+            except TypeError:
+                continue
+            if self.blob_path(entry.sha256).exists():
+                index[key] = entry
+        return index
+
+    def _save_index_locked(self) -> None:
+        tmp = self.index_path.with_suffix(".json.tmp")
+        payload = {key: asdict(entry) for key, entry in self._index.items()}
+        tmp.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blobs / sha256[:2] / sha256
+
+    def lookup(self, key: str) -> Optional[CachedObject]:
+        with self._lock:
+            entry = self._index.get(key)
+        if entry is not None and not self.blob_path(entry.sha256).exists():
+            self.forget(key)
+            return None
+        return entry
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            if self._index.pop(key, None) is not None:
+                self._save_index_locked()
+
+    def new_temp(self) -> Path:
+        fd, name = tempfile.mkstemp(dir=self.blobs, suffix=".part")
+        os.close(fd)
+        return Path(name)
+
+    def commit(self, key: str, etag: str, tmp: Path) -> CachedObject:
+        """Move a fully written temp file into the cache under its content hash."""
+        digest = hashlib.sha256()
+        with open(tmp, "rb") as f:
+            for chunk in iter(partial(f.read, MB), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+
+        dest = self.blob_path(sha256)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists():
+            tmp.unlink(missing_ok=True)
+        else:
+            os.replace(tmp, dest)
+
+        entry = CachedObject(etag=etag, sha256=sha256, size=dest.stat().st_size)
+        with self._lock:
+            self._index[key] = entry
+            self._save_index_locked()
+        return entry
+
+    def put_bytes(self, key: str, etag: str, data: bytes) -> CachedObject:
+        tmp = self.new_temp()
+        try:
+            tmp.write_bytes(data)
+            return self.commit(key, etag, tmp)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+
+class S3ObjectStore:
+    """Async facade over one bucket; see the module docstring."""
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        *,
+        cache_dir: Path,
+        max_concurrency: int = 16,
+        multipart_threshold: int = 16 * MB,
+        part_size: int = 8 * MB,
+    ) -> None:
+        self.client = client
+        self.bucket = bucket
+        self.cache = ContentCache(Path(cache_dir))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.multipart_threshold = int(multipart_threshold)
+        self.part_size = max(1, int(part_size))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="s3")
+        self._key_locks: Dict[str, asyncio.Lock] = {}
+
+    @classmethod
+    def from_settings(cls) -> "S3ObjectStore":
+        import boto3
+        from botocore.config import Config
+
+        client = boto3.client(
+            "s3",
+            region_name=settings.AWS_REGION,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            endpoint_url=settings.S3_ENDPOINT_URL or None,
+            config=Config(max_pool_connections=settings.S3_MAX_CONCURRENCY),
+        )
+        return cls(
+            client,
+            settings.AWS_BUCKET_NAME,
+            cache_dir=Path(settings.S3_CACHE_DIR),
+            max_concurrency=settings.S3_MAX_CONCURRENCY,
+            multipart_threshold=settings.S3_MULTIPART_THRESHOLD_MB * MB,
+            # Parts below the S3 minimum would be rejected at CompleteMultipartUpload.
+            part_size=max(MIN_PART_SIZE, settings.S3_PART_SIZE_MB * MB),
+        )
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call on the store's S3 thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def _key_lock(self, key: str) -> asyncio.Lock:
+        return self._key_locks.setdefault(key, asyncio.Lock())
+
+    # --- Reads ---
+
+    async def get(self, key: str) -> bytes:
+        path = await self.get_path(key)
+        return await self.run(path.read_bytes)
+
+    async def get_path(self, key: str) -> Path:
+        """
+        Local path of the current object. Revalidates with If-None-Match; if
+        S3 cannot be reached, a previously cached copy is served instead.
+        Raises FileNotFoundError if the key does not exist.
+        """
+        async with self._key_lock(key):
+            cached = self.cache.lookup(key)
+            try:
+                entry = await self._fetch(key, cached)
+            except ClientError as e:
+                if _error_code(e) in _NOT_FOUND:
+                    self.cache.forget(key)
+                    raise FileNotFoundError(f"Key {key} not found.") from e
+                if cached is None:
+                    raise
+                logger.warning("s3_revalidate_failed_serving_cached", key=key, error=str(e))
+                entry = cached
+            return self.cache.blob_path(entry.sha256)
+
+    async def _fetch(self, key: str, cached: Optional[CachedObject]) -> CachedObject:
+        try:
+            etag, first, total = await self.run(
+                self._get_range, key, 0, self.part_size - 1, if_none_match=cached.etag if cached else None
+            )
+        except ClientError as e:
+            code = _error_code(e)
+            if code in _NOT_MODIFIED and cached is not None:
+                return cached
+            if code != "InvalidRange":
+                raise
+            # Empty object: any Range is unsatisfiable.
+            etag, first, total = await self.run(self._get_range, key)
+
+        if total <= len(first):
+            return await self.run(self.cache.put_bytes, key, etag, first)
+
+        tmp = self.cache.new_temp()
+        try:
+            with open(tmp, "r+b") as f:
+                f.truncate(total)
+                f.write(first)
+            starts = range(len(first), total, self.part_size)
+            await asyncio.gather(
+                *(self.run(self._copy_range, tmp, key, start, min(start + self.part_size, total) - 1, etag) for start in starts)
+            )
+            entry = await self.run(self.cache.commit, key, etag, tmp)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        logger.info("s3_ranged_download", key=key, size=total, parts=len(starts) + 1)
+        return entry
+
+    @_s3_retry
+    def _get_range(
+        self,
+        key: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        *,
+        if_none_match: Optional[str] = None,
+        if_match: Optional[str] = None,
+    ) -> Tuple[str, bytes, int]:
+        kwargs: Dict[str, Any] = {"Bucket": self.bucket, "Key": key}
+        if start is not None:
+            kwargs["Range"] = f"bytes={start}-{end}"
+        if if_none_match:
+            kwargs["IfNoneMatch"] = if_none_match
+        if if_match:
+            kwargs["IfMatch"] = if_match
+        response = self.client.get_object(**kwargs)
+        body = response["Body"].read()
+        return response["ETag"], body, _total_size(response.get("ContentRange"), len(body))
+
+    def _copy_range(self, path: Path, key: str, start: int, end: int, etag: str) -> None:
+        _, body, _ = self._get_range(key, start, end, if_match=etag)
+        with open(path, "r+b") as f:
+            f.seek(start)
+            f.write(body)
+
+    async def list_keys(self, prefix: str) -> List[str]:
+        return await self.run(self._list_keys, prefix)
+
+    @_s3_retry
+    def _list_keys(self, prefix: str) -> List[str]:
+        keys: List[str] = []
+        kwargs: Dict[str, Any] = {"Bucket": self.bucket, "Prefix": prefix}
+        while True:
+            response = self.client.list_objects_v2(**kwargs)
+            keys.extend(item["Key"] for item in response.get("Contents", []))
+            if not response.get("IsTruncated"):
+                return keys
+            kwargs["ContinuationToken"] = response["NextContinuationToken"]
+
+    async def prefetch(self, keys: Iterable[str]) -> int:
+        """Download (or revalidate) `keys` concurrently; returns how many are cached."""
+        keys = list(keys)
+        results = await asyncio.gather(*(self.get_path(key) for key in keys), return_exceptions=True)
+        for key, result in zip(keys, results):
+            if isinstance(result, BaseException):
+                logger.warning("s3_prefetch_failed", key=key, error=str(result))
+        return sum(1 for result in results if not isinstance(result, BaseException))
+
+    # --- Writes ---
+
+    async def put(self, key: str, data: bytes, *, content_type: Optional[str] = None) -> CachedObject:
+        """Upload `data` (multipart above the threshold) and write it through to the cache."""
+        async with self._key_lock(key):
+            if len(data) > self.multipart_threshold:
+                etag = await self._multipart_upload(key, data, content_type)
+            else:
+                etag = await self.run(self._put_object, key, data, content_type)
+            return await self.run(self.cache.put_bytes, key, etag, data)
+
+    @_s3_retry
+    def _put_object(self, key: str, data: bytes, content_type: Optional[str]) -> str:
+        kwargs: Dict[str, Any] = {"Bucket": self.bucket, "Key": key, "Body": data}
+        if content_type:
+            kwargs["ContentType"] = content_type
+        return self.client.put_object(**kwargs)["ETag"]
+
+    async def _multipart_upload(self, key: str, data: bytes, content_type: Optional[str]) -> str:
+        kwargs: Dict[str, Any] = {"Bucket": self.bucket, "Key": key}
+        if content_type:
+            kwargs["ContentType"] = content_type
+        upload_id = (await self.run(_s3_retry(self.client.create_multipart_upload), **kwargs))["UploadId"]
+
+        try:
+            offsets = range(0, len(data), self.part_size)
+            etags = await asyncio.gather(
+                *(
+                    self.run(self._upload_part, key, upload_id, number, data[offset : offset + self.part_size])
+                    for number, offset in enumerate(offsets, start=1)
+                )
+            )
+            parts = [{"ETag": etag, "PartNumber": number} for number, etag in enumerate(etags, start=1)]
+            response = await self.run(
+                _s3_retry(self.client.complete_multipart_upload),
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            try:
+                await self.run(self.client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id)
+            except Exception as e:
+                logger.warning("s3_multipart_abort_failed", key=key, upload_id=upload_id, error=str(e))
+            raise
+
+        logger.info("s3_multipart_upload", key=key, size=len(data), parts=len(parts))
+        return response["ETag"]
+
+    @_s3_retry
+    def _upload_part(self, key: str, upload_id: str, number: int, chunk: bytes) -> str:
+        response = self.client.upload_part(
+            Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=chunk
+        )
+        return response["ETag"]
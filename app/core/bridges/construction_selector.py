@@ -126,6 +126,59 @@ RELATIVE_OBJECT_ATTACHMENT_VALUES = frozenset(
     {"relative_object", "object_gap", "relative_clause_object_gap"}
 )
 
+# Every top-level key whose *presence* (non-empty value) base-construction
+# inference inspects. Together with frame type, participant role names, voice
+# and aggregate multiplicity these form the structural signature that
+# `_infer_base_construction` depends on, so its result can be memoised.
+_STRUCTURAL_VALUE_KEYS = frozenset(
+    {
+        # relation shape
+        "location",
+        "place",
+        "site",
+        "located_in",
+        "position_in_space",
+        "owner",
+        "possessor",
+        "possessed",
+        "owned_entity",
+        "holder",
+        "adjective",
+        "adjective_lemma",
+        "property_adjective",
+        "evaluation_adjective",
+        "predicate",
+        "class_label",
+        "profession",
+        "office",
+        "role",
+        "title",
+        "nationality",
+        "category",
+        "relation",
+        "subject",
+        # event valency
+        "object",
+        "patient",
+        "theme",
+        "target",
+        "recipient",
+        "beneficiary",
+        # event-likeness / eventive follow-ups
+        "main_event",
+        "event",
+        "events",
+        "timeline",
+        "milestones",
+        "participants",
+        "event_type",
+    }
+)
+_VOICE_KEYS = ("voice", "preferred_voice", "discourse_voice")
+_AGGREGATE_SEQUENCE_KEYS = ("items", "clauses", "events")
+
+_MAX_SELECTION_CACHE_ENTRIES = 4096
+
 
 # ---------------------------------------------------------------------------
 # Dataclasses
@@ -231,6 +284,16 @@ class ConstructionSelector:
         self._registry = registry or DEFAULT_CONSTRUCTION_REGISTRY
         self._strict_registry = strict_registry
 
+        # structural signature -> (frame_family, base_id, reason, fallback_reason)
+        self._base_cache: dict[tuple[Any, ...], tuple[str, str, str, str | None]] = {}
+        # (construction_id, base_id) pairs that already passed registry validation
+        self._validated: set[tuple[str, str | None]] = set()
+
+    def clear_cache(self) -> None:
+        """Drop memoised selections (e.g. after the construction registry changes)."""
+        self._base_cache.clear()
+        self._validated.clear()
+
     def select(
         self,
         frame: Mapping[str, Any] | Any,
@@ -271,7 +334,9 @@ class ConstructionSelector:
     ) -> ConstructionSelection:
         frame = context.frame
         frame_type = self._frame_type(frame)
-        frame_family = self._frame_family(frame_type)
+        signature = self._structural_signature(frame, frame_type, context.is_first_sentence)
+        cached_base = self._base_cache.get(signature) if signature is not None else None
+        frame_family = cached_base[0] if cached_base is not None else self._frame_family(frame_type)
         merged_generation = self._merge_maps(
             context.generation_options,
             self._mapping_or_none(self._read_value(frame, "generation_options")),
@@ -327,12 +392,24 @@ class ConstructionSelector:
             base_construction_id = self._normalize_construction_id(forced_base)
             selection_metadata["selection_reason"] = "forced_construction_id"
         else:
-            base_construction_id, inferred_reason, fallback_reason = self._infer_base_construction(
-                frame=frame,
-                frame_type=frame_type,
-                frame_family=frame_family,
-                is_first_sentence=context.is_first_sentence,
-            )
+            if cached_base is not None:
+                _, base_construction_id, inferred_reason, fallback_reason = cached_base
+            else:
+                base_construction_id, inferred_reason, fallback_reason = self._infer_base_construction(
+                    frame=frame,
+                    frame_type=frame_type,
+                    frame_family=frame_family,
+                    is_first_sentence=context.is_first_sentence,
+                )
+                if signature is not None:
+                    if len(self._base_cache) >= _MAX_SELECTION_CACHE_ENTRIES:
+                        self._base_cache.clear()
+                    self._base_cache[signature] = (
+                        frame_family,
+                        base_construction_id,
+                        inferred_reason,
+                        fallback_reason,
+                    )
             selection_metadata["selection_reason"] = inferred_reason
             if fallback_reason:
                 selection_metadata["fallback_used"] = True
@@ -710,6 +787,14 @@ class ConstructionSelector:
         construction_id = selection.construction_id
         base_id = selection.base_construction_id
 
+        validated_key = (construction_id, base_id)
+        if validated_key in self._validated:
+            return
+
+        self._validate_selection_uncached(construction_id, base_id)
+        self._validated.add(validated_key)
+
+    def _validate_selection_uncached(self, construction_id: str, base_id: str | None) -> None:
         # Best-effort validation when the registry is not populated yet.
         if len(self._registry) == 0:
             self._validate_against_known_ids(construction_id, base_id)
@@ -773,6 +858,43 @@ class ConstructionSelector:
     # Frame inspection helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _structural_signature(
+        frame: Mapping[str, Any] | Any,
+        frame_type: str,
+        is_first_sentence: bool | None,
+    ) -> tuple[Any, ...] | None:
+        """
+        Hashable summary of everything base-construction inference reads.
+
+        Only plain mappings are signed; attribute-style frames fall through to
+        uncached inference because their readable keys cannot be enumerated.
+        """
+        if not isinstance(frame, Mapping):
+            return None
+
+        present: list[str] = []
+        for key, value in frame.items():
+            if key in _STRUCTURAL_VALUE_KEYS and ConstructionSelector._is_meaningful(value):
+                present.append(key)
+
+        passive = any(
+            isinstance(frame.get(key), str)
+            and ConstructionSelector._normalize_tag(frame.get(key)) == "passive"
+            for key in _VOICE_KEYS
+        )
+        multi = tuple(
+            isinstance(frame.get(key), (list, tuple)) and len(frame.get(key)) > 1
+            for key in _AGGREGATE_SEQUENCE_KEYS
+        )
+        roles = (
+            frozenset(ConstructionSelector._participant_role_names(frame))
+            if "participants" in present or "main_event" in present
+            else frozenset()
+        )
+
+        return (frame_type, is_first_sentence, frozenset(present), roles, passive, multi)
+
     @staticmethod
     def _frame_type(frame: Mapping[str, Any] | Any) -> str:
         value = ConstructionSelector._first_non_empty_string(
@@ -964,16 +1086,20 @@ class ConstructionSelector:
     @staticmethod
     def _has_any_value_static(frame: Mapping[str, Any] | Any, *keys: str) -> bool:
         for key in keys:
-            value = ConstructionSelector._read_value(frame, key)
-            if value is None:
-                continue
-            if isinstance(value, str) and not value.strip():
-                continue
-            if isinstance(value, (list, tuple, set, dict)) and len(value) == 0:
-                continue
-            return True
+            if ConstructionSelector._is_meaningful(ConstructionSelector._read_value(frame, key)):
+                return True
         return False
 
+    @staticmethod
+    def _is_meaningful(value: Any) -> bool:
+        if value is None:
+            return False
+        if isinstance(value, str) and not value.strip():
+            return False
+        if isinstance(value, (list, tuple, set, dict)) and len(value) == 0:
+            return False
+        return True
+
 
 # ---------------------------------------------------------------------------
 # Convenience function
@@ -15,6 +15,7 @@ class EventType(str, Enum):
     BUILD_STARTED = "language.build.started"
     BUILD_COMPLETED = "language.build.completed"
     BUILD_FAILED = "language.build.failed"
+    GRAMMAR_RELOADED = "grammar.reloaded"
     
     # Data Events
     LEXICON_UPDATED = "lexicon.updated"
@@ -49,8 +50,15 @@ class BuildRequestedPayload(BaseModel):
     lang_code: str
     strategy: str = "fast"  # 'fast' (Pidgin) or 'full' (Grammar)
     requester_id: Optional[str] = None
+    priority: str = "interactive"  # 'interactive' or 'bulk' (onboarding); see BuildScheduler
 
 class BuildFailedPayload(BaseModel):
     lang_code: str
     error_code: str
-    details: str
\ No newline at end of file
+    details: str
+
+class GrammarReloadedPayload(BaseModel):
+    pgf_path: str
+    mtime_ns: int
+    size: int
+    origin: str = "watcher"  # 'watcher' or the job that rebuilt the PGF
\ No newline at end of file
@@ -480,6 +480,23 @@ class Sentence(SurfaceResult):
     pass
 
 
+class Document(BaseModel):
+    """
+    Multi-sentence generation result.
+
+    `sentences` follow the discourse plan order; `text` joins them with single
+    spaces.
+    """
+
+    text: str
+    lang_code: str
+    sentences: list[Sentence] = Field(default_factory=list)
+    debug_info: Dict[str, Any] = Field(default_factory=dict)
+    generation_time_ms: float = 0.0
+
+    model_config = ConfigDict(extra="ignore")
+
+
 class LexiconEntry(BaseModel):
     """Represents a single lexical entry."""
 
@@ -566,6 +583,7 @@ __all__ = [
     # Result models
     "SurfaceResult",
     "Sentence",
+    "Document",
     # Language / lexicon
     "LanguageStatus",
     "GrammarType",
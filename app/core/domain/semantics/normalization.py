@@ -15,8 +15,9 @@ This module focuses on:
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Union
 
 # [FIX] Use relative imports for sibling modules to resolve ModuleNotFoundError
 from .types import (
@@ -103,10 +104,36 @@ _WD_FEMALE = {"Q6581072"}
 _WD_NONBINARY = {"Q48270", "Q1097630"}
 
 
+_GENDER_TOKENS: Dict[str, str] = {
+    **{t: "male" for t in _WD_MALE},
+    **{t: "female" for t in _WD_FEMALE},
+    **{t: "nonbinary" for t in _WD_NONBINARY},
+    **dict.fromkeys(("m", "male", "man", "masculine"), "male"),
+    **dict.fromkeys(("f", "female", "woman", "feminine"), "female"),
+    **dict.fromkeys(("nonbinary", "non-binary", "nb", "enby"), "nonbinary"),
+    **dict.fromkeys(("unknown", "unspecified", "na", "n/a", "none", ""), "unknown"),
+}
+
+# Memo of raw gender string -> normalized gender. Bounded like the role memo
+# in `semantics.roles`: dropped wholesale when full.
+_GENDER_MEMO_MAX = 1024
+_GENDER_MEMO: Dict[str, str] = {}
+
+
 def normalize_gender(raw: Any) -> str:
     if raw is None:
         return "unknown"
 
+    if type(raw) is str:
+        try:
+            return _GENDER_MEMO[raw]
+        except KeyError:
+            gender = _GENDER_TOKENS.get(raw.strip().lower(), "other")
+            if len(_GENDER_MEMO) >= _GENDER_MEMO_MAX:
+                _GENDER_MEMO.clear()
+            _GENDER_MEMO[raw] = gender
+            return gender
+
     unwrapped = _unwrap_zobject(raw)
 
     if isinstance(unwrapped, Mapping):
@@ -114,21 +141,7 @@ def normalize_gender(raw: Any) -> str:
         if isinstance(qid, str):
             return normalize_gender(qid)
 
-    token = _lower_ascii(unwrapped)
-
-    if not token:
-        return "unknown"
-
-    if token in _WD_MALE: return "male"
-    if token in _WD_FEMALE: return "female"
-    if token in _WD_NONBINARY: return "nonbinary"
-
-    if token in {"m", "male", "man", "masculine"}: return "male"
-    if token in {"f", "female", "woman", "feminine"}: return "female"
-    if token in {"nonbinary", "non-binary", "nb", "enby"}: return "nonbinary"
-    if token in {"unknown", "unspecified", "na", "n/a", "none"}: return "unknown"
-
-    return "other"
+    return _GENDER_TOKENS.get(_lower_ascii(unwrapped), "other")
 
 
 # ---------------------------------------------------------------------------
@@ -173,6 +186,19 @@ def normalize_info_structure(raw: Optional[Mapping[str, Any]]) -> InfoStructure:
 # ---------------------------------------------------------------------------
 
 
+# Alias keys per BioSemantics field, in precedence order (first truthy wins).
+_BIO_FIELD_ALIASES: Dict[str, tuple] = {
+    "name": ("name", "label", "K1"),
+    "gender": ("gender", "sex", "K2"),
+    "profession": ("profession", "occupation", "prof_lemma", "K3"),
+    "nationality": ("nationality", "citizenship", "nat_lemma", "K4"),
+    "language": ("language", "lang", "K5"),
+}
+_BIO_KEYS = frozenset(k for aliases in _BIO_FIELD_ALIASES.values() for k in aliases)
+# The language is not part of a BioFrame, so the fast path skips it.
+_FLAT_BIO_ALIASES = tuple(_BIO_FIELD_ALIASES[f] for f in ("name", "gender", "profession", "nationality"))
+
+
 def normalize_bio_semantics(
     raw: Union[Mapping[str, Any], Sequence[Any]],
     *,
@@ -188,7 +214,7 @@ def normalize_bio_semantics(
 
         extra: Dict[str, Any] = {}
         for k, v in raw.items():
-            if k not in {"name", "label", "gender", "sex", "profession", "occupation", "prof_lemma", "nationality", "citizenship", "nat_lemma", "language", "lang", "K1", "K2", "K3", "K4", "K5"}:
+            if k not in _BIO_KEYS:
                 extra[k] = v
 
         return BioSemantics(name, gender, prof_lemma, nat_lemma, lang_code, extra)
@@ -225,27 +251,61 @@ def normalize_bio_with_info(
 # BRIDGE FUNCTIONS (Fixes AttributeError)
 # ---------------------------------------------------------------------------
 
+def _flat_bio_fields(payload: Mapping[str, Any]) -> Optional[tuple]:
+    """
+    Fast path for flat bio payloads (the alias values that decide a field
+    are plain strings or None). Returns (name, gender, profession,
+    nationality, extra), or None when a value would need Z-object unwrapping
+    or coercion, in which case the caller takes the generic path.
+    """
+    get = payload.get
+    picked = []
+    for aliases in _FLAT_BIO_ALIASES:
+        value = ""
+        for key in aliases:
+            v = get(key)
+            if v is None:
+                continue
+            if type(v) is not str:
+                return None
+            if v:
+                value = v
+                break
+        picked.append(value)
+
+    name, gender, profession, nationality = picked
+    extra = {k: v for k, v in payload.items() if k not in _BIO_KEYS}
+    return name.strip(), normalize_gender(gender), profession.strip(), nationality.strip(), extra
+
+
 def normalize_bio_frame(payload: Mapping[str, Any], frame_type: str) -> BioFrame:
     """
     Construct a BioFrame from a raw dictionary payload.
     Used by aw_bridge for 'bio' and related types.
+
+    Flat payloads (the common case) are read in one pass; anything else goes
+    through `normalize_bio_semantics`.
     """
-    sem = normalize_bio_semantics(payload)
-    
+    fields = _flat_bio_fields(payload) if type(payload) is dict or isinstance(payload, Mapping) else None
+    if fields is None:
+        sem = normalize_bio_semantics(payload)
+        fields = (sem.name, sem.gender, sem.profession_lemma, sem.nationality_lemma, sem.extra)
+    name, gender, profession, nationality, extra = fields
+
     # Construct the core Entity
     main_entity = Entity(
-        name=sem.name,
-        gender=sem.gender,
-        lemmas=[sem.profession_lemma] if sem.profession_lemma else [],
-        extra=sem.extra
+        name=name,
+        gender=gender,
+        lemmas=[profession] if profession else [],
+        extra=extra
     )
 
     return BioFrame(
         main_entity=main_entity,
         frame_type="bio",
-        primary_profession_lemmas=[sem.profession_lemma] if sem.profession_lemma else [],
-        nationality_lemmas=[sem.nationality_lemma] if sem.nationality_lemma else [],
-        extra=sem.extra
+        primary_profession_lemmas=[profession] if profession else [],
+        nationality_lemmas=[nationality] if nationality else [],
+        extra=extra
     )
 
 
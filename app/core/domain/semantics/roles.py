@@ -39,6 +39,7 @@ user-facing or external labels should be normalized via this module.
 
 from __future__ import annotations
 
+import sys
 from typing import Any, Dict, Iterable, Mapping
 
 
@@ -254,19 +255,15 @@ _ROLE_ALIASES: Dict[str, str] = {
 # ---------------------------------------------------------------------------
 
 
-def canonical_role(label: str) -> str:
-    """
-    Map an arbitrary label (case-insensitive) to a canonical role code.
+# Memo of label -> canonical code. Frames reuse a small vocabulary of role
+# labels, so the strip/upper/lower work is done once per distinct label.
+# The table is bounded: it is dropped wholesale when full, which keeps
+# lookups branch-free and is harmless because entries are cheap to rebuild.
+_ROLE_MEMO_MAX = 4096
+_ROLE_MEMO: Dict[str, str] = {}
 
-    Examples:
-        canonical_role("subject")    -> "SUBJ"
-        canonical_role("Agent")      -> "AGENT"
-        canonical_role("time")       -> "TIME"
 
-    If the label is not known, it falls back to UPPERCASE version of the input.
-    This makes it safe to pass through user-defined labels while still
-    benefiting from canonicalization where possible.
-    """
+def _resolve_role(label: str) -> str:
     if not label:
         raise ValueError("Role label must be a non-empty string.")
 
@@ -284,8 +281,37 @@ def canonical_role(label: str) -> str:
     if lower in _ROLE_ALIASES:
         return _ROLE_ALIASES[lower]
 
-    # Fallback: just return the uppercased label
-    return upper
+    # Fallback: just return the uppercased label (interned, so repeated
+    # user-defined labels share one string object)
+    return sys.intern(upper)
+
+
+def canonical_role(label: str) -> str:
+    """
+    Map an arbitrary label (case-insensitive) to a canonical role code.
+
+    Examples:
+        canonical_role("subject")    -> "SUBJ"
+        canonical_role("Agent")      -> "AGENT"
+        canonical_role("time")       -> "TIME"
+
+    If the label is not known, it falls back to UPPERCASE version of the input.
+    This makes it safe to pass through user-defined labels while still
+    benefiting from canonicalization where possible.
+
+    Results are memoized per distinct label (see `_ROLE_MEMO`).
+    """
+    try:
+        return _ROLE_MEMO[label]
+    except (KeyError, TypeError):
+        pass
+
+    role = _resolve_role(label)
+    if type(label) is str:
+        if len(_ROLE_MEMO) >= _ROLE_MEMO_MAX:
+            _ROLE_MEMO.clear()
+        _ROLE_MEMO[label] = role
+    return role
 
 
 def normalize_roles(
@@ -321,14 +347,13 @@ def normalize_roles(
                 "TIME": time_span,
             }
     """
+    # `merge` does not change behavior (last occurrence wins either way);
+    # the flag documents intent.
+    memo = _ROLE_MEMO
     normalized: Dict[str, Any] = {}
     for raw_label, value in roles.items():
-        canonical = canonical_role(raw_label)
-        if merge:
-            normalized[canonical] = value
-        else:
-            # Behavior is the same (last wins), but the flag documents intent.
-            normalized[canonical] = value
+        canonical = memo.get(raw_label) if type(raw_label) is str else None
+        normalized[canonical or canonical_role(raw_label)] = value
     return normalized
 
 
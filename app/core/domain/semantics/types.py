@@ -18,8 +18,9 @@ Design goals:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, Mapping, Optional, Protocol, TypeAlias, runtime_checkable
+from typing import Any, Dict, Optional, Protocol, TypeAlias, runtime_checkable
 
 
 # ---------------------------------------------------------------------------
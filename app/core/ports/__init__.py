@@ -99,6 +99,10 @@ class LexiconRepo(Protocol):
     async def save_entry(self, lang: str, entry: Dict[str, Any]) -> None:
         ...
 
+    async def save_entries(self, lang: str, entries: List[Dict[str, Any]]) -> int:
+        """Persists a batch of entries; returns the number written."""
+        ...
+
     async def health_check(self) -> bool:
         ...
 
@@ -0,0 +1,32 @@
+# app/core/ports/result_cache.py
+from __future__ import annotations
+
+from typing import Any, Optional, Protocol
+
+from app.core.domain.models import Sentence
+
+
+class IGenerationResultCache(Protocol):
+    """
+    Port for caching end-to-end generation results.
+
+    Notes:
+    - Keys are opaque strings owned by the adapter. They must change whenever
+      anything that can alter the output changes (frame content, language,
+      grammar binary, lexicon data, runtime configuration), so a key can
+      double as an HTTP ETag.
+    - Implementations must treat backend failures as misses; the cache must
+      never fail a generation request.
+    """
+
+    def make_key(self, lang_code: str, frame: Any) -> Optional[str]:
+        """Return the cache key for (lang_code, frame), or None if uncacheable."""
+        ...
+
+    async def get(self, key: str) -> Optional[Sentence]:
+        """Return a cached Sentence, or None on miss."""
+        ...
+
+    async def set(self, key: str, sentence: Sentence) -> None:
+        """Store a successfully generated Sentence."""
+        ...
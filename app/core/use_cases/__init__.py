@@ -24,12 +24,15 @@ Use cases in this package may:
 Notes
 -----
 - `GenerateText` is the high-level orchestration entry point.
+- `GenerateDocument` plans a frame set once and realizes its sentences
+  concurrently through `GenerateText`.
 - `PlanText` isolates sentence/construction planning.
 - `RealizeText` isolates rendering of a canonical construction plan.
 - Language build/onboarding workflows remain separate operational use cases.
 """
 
 from .generate_text import GenerateText
+from .generate_document import GenerateDocument
 from .plan_text import PlanText
 from .realize_text import RealizeText
 from .build_language import BuildLanguage
@@ -37,6 +40,7 @@ from .onboard_language_saga import OnboardLanguageSaga
 
 __all__ = [
     "GenerateText",
+    "GenerateDocument",
     "PlanText",
     "RealizeText",
     "BuildLanguage",
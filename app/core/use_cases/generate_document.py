@@ -0,0 +1,342 @@
+# app/core/use_cases/generate_document.py
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, Optional
+
+import structlog
+
+from app.core.domain.exceptions import DomainError, InvalidFrameError
+from app.core.domain.models import Document, Frame, Sentence
+from app.core.use_cases.generate_text import GenerateText
+from app.shared.config import settings
+from app.shared.observability import get_tracer
+
+try:
+    # Top-level discourse package; shipped alongside `app` but kept optional so
+    # isolated deployments without it fail per request, not at import time.
+    from discourse.planner import plan_generic
+    from discourse.referring_expression import EntityFeatureCache, ReferringExpressionPolicy
+except ImportError:  # pragma: no cover - defensive import fallback
+    plan_generic = None  # type: ignore[assignment]
+    EntityFeatureCache = None  # type: ignore[assignment,misc]
+    ReferringExpressionPolicy = None  # type: ignore[assignment,misc]
+
+
+logger = structlog.get_logger()
+tracer = get_tracer(__name__)
+
+_BIOISH_FRAME_TYPES = {
+    "bio",
+    "biography",
+    "entity.person",
+    "entity_person",
+    "person",
+    "entity.person.v1",
+    "entity.person.v2",
+}
+
+# (surface label, GF pronoun function) by gender, shared with the session-based
+# pronominalization in the generation router.
+_PRONOUNS_BY_GENDER: dict[str, tuple[str, str]] = {
+    "f": ("She", "she_Pron"),
+    "fem": ("She", "she_Pron"),
+    "female": ("She", "she_Pron"),
+    "m": ("He", "he_Pron"),
+    "masc": ("He", "he_Pron"),
+    "male": ("He", "he_Pron"),
+    "n": ("It", "it_Pron"),
+    "neuter": ("It", "it_Pron"),
+}
+
+
+def pronoun_for_gender(gender: Any) -> tuple[str, str]:
+    """Return (label, gf_arg) for a gender value; unknown genders map to 'It'."""
+    return _PRONOUNS_BY_GENDER.get(str(gender or "").strip().lower(), ("It", "it_Pron"))
+
+
+class GenerateDocument:
+    """
+    Public application use case for multi-sentence (document) generation.
+
+    Pipeline:
+        frames -> discourse plan (once) -> referring expressions (once)
+               -> per-sentence GenerateText, run concurrently -> Document
+
+    Notes:
+    - Planning uses `discourse.planner.plan_generic`, so biography-like frame
+      sets get biography ordering and everything else keeps input order.
+    - Referring-expression choices are made sequentially over the plan with
+      the language's compiled `ReferringExpressionPolicy` (same decisions as
+      `discourse.referring_expression.select_np_spec`) and one entity
+      feature cache per document, before any realization, so realization
+      of different sentences is independent.
+    - Every frame subject counts as a mention; pronoun / short-name choices
+      are applied only to copies of bio-like frames, the same
+      way X-Session-ID discourse rewrites them for `/generate` (name + GF
+      `UsePron` hint). Caller frames are never mutated.
+    - Sentences are realized concurrently (bounded by `max_concurrency`) and
+      returned in plan order. The first failure cancels the remaining
+      sentences and fails the document.
+    """
+
+    def __init__(
+        self,
+        sentence_generator: GenerateText,
+        *,
+        max_frames: int | None = None,
+        max_concurrency: int | None = None,
+        lang_profile_provider: Callable[[str], Mapping[str, Any]] | None = None,
+    ) -> None:
+        self.sentence_generator = sentence_generator
+        self.max_frames = int(max_frames if max_frames is not None else settings.DOCUMENT_MAX_FRAMES)
+        self.max_concurrency = max(
+            1,
+            int(max_concurrency if max_concurrency is not None else settings.DOCUMENT_REALIZE_CONCURRENCY),
+        )
+        self.lang_profile_provider = lang_profile_provider
+
+    async def execute(
+        self,
+        lang_code: str,
+        frames: Sequence[Frame],
+        *,
+        domain: str = "auto",
+    ) -> Document:
+        """
+        Generate a Document from a set of frames about one article.
+
+        Args:
+            lang_code:
+                Target language code.
+            frames:
+                Domain frames, in input order.
+            domain:
+                Planner domain: "auto", "bio", or any generic domain label.
+
+        Raises:
+            InvalidFrameError:
+                When the frame set is empty, too large, or a frame is invalid.
+            DomainError:
+                When planning or any sentence realization fails.
+        """
+        started = time.perf_counter()
+        frame_list = list(frames or ())
+
+        if not frame_list:
+            raise InvalidFrameError("Document generation requires at least one frame.")
+        if self.max_frames > 0 and len(frame_list) > self.max_frames:
+            raise InvalidFrameError(
+                f"Document has {len(frame_list)} frames; the limit is {self.max_frames}."
+            )
+        if plan_generic is None or ReferringExpressionPolicy is None or EntityFeatureCache is None:
+            raise DomainError("Discourse planner is not available in this deployment.")
+
+        with tracer.start_as_current_span("use_case.generate_document") as span:
+            span.set_attribute("app.lang_code", lang_code or "")
+            span.set_attribute("app.frame_count", len(frame_list))
+
+            plan_started = time.perf_counter()
+            try:
+                planned = plan_generic(frame_list, lang_code=lang_code, domain=domain or "auto")
+            except Exception as exc:
+                raise DomainError(f"Document planning failed: {exc}") from exc
+
+            source_index = {id(frame): index for index, frame in enumerate(frame_list)}
+            lang_profile = self._lang_profile(lang_code)
+            np_specs = self._select_referring_expressions(planned, lang_profile)
+            sentence_frames = [
+                self._apply_np_spec(getattr(item, "frame", None), spec)
+                for item, spec in zip(planned, np_specs)
+            ]
+            plan_ms = (time.perf_counter() - plan_started) * 1000.0
+
+            realize_started = time.perf_counter()
+            sentences = await self._realize_all(lang_code, sentence_frames)
+            realize_ms = (time.perf_counter() - realize_started) * 1000.0
+
+            for index, (item, spec, sentence) in enumerate(zip(planned, np_specs, sentences)):
+                debug_info = dict(sentence.debug_info or {})
+                debug_info["document"] = {
+                    "order_index": index,
+                    "source_index": source_index.get(id(getattr(item, "frame", None))),
+                    "planned_construction_id": item.construction_id,
+                    "topic_entity_id": item.topic_entity_id,
+                    "referring_expression": (spec or {}).get("realization_type"),
+                }
+                sentences[index] = sentence.model_copy(update={"debug_info": debug_info})
+
+            resolved_domain = (
+                str((planned[0].metadata or {}).get("planner_domain") or domain) if planned else domain
+            )
+            span.set_attribute("app.sentence_count", len(sentences))
+
+            document = Document(
+                text=" ".join(s.text for s in sentences if s.text),
+                lang_code=lang_code,
+                sentences=sentences,
+                debug_info={
+                    "planner": "discourse.planner.plan_generic",
+                    "planner_domain": resolved_domain,
+                    "sentence_count": len(sentences),
+                    "realize_concurrency": min(self.max_concurrency, len(sentences)),
+                    "plan_ms": round(plan_ms, 3),
+                    "realize_ms": round(realize_ms, 3),
+                },
+                generation_time_ms=(time.perf_counter() - started) * 1000.0,
+            )
+
+        logger.info(
+            "document_generation_success",
+            lang=lang_code,
+            sentences=len(sentences),
+            planner_domain=resolved_domain,
+            plan_ms=round(plan_ms, 3),
+            realize_ms=round(realize_ms, 3),
+        )
+        return document
+
+    # ------------------------------------------------------------------
+    # Referring expressions
+    # ------------------------------------------------------------------
+
+    def _lang_profile(self, lang_code: str) -> Mapping[str, Any]:
+        if self.lang_profile_provider is None:
+            return {}
+        try:
+            return self.lang_profile_provider(lang_code) or {}
+        except Exception as exc:
+            logger.warning("document_lang_profile_failed", lang=lang_code, error=str(exc))
+            return {}
+
+    def _select_referring_expressions(
+        self,
+        planned: Sequence[Any],
+        lang_profile: Mapping[str, Any],
+    ) -> list[Optional[dict[str, Any]]]:
+        """
+        Decide the subject NP of every planned sentence, in plan order.
+
+        An entity is "first mention" until it has been the subject of an
+        earlier sentence, and any other subject seen since its last mention
+        counts as a competing referent (which blocks pronouns).
+        """
+        specs: list[Optional[dict[str, Any]]] = []
+        subjects: list[Optional[str]] = []
+        last_mention: dict[str, int] = {}
+        topic_key = self._topic_key(planned)
+        policy = ReferringExpressionPolicy.from_profile(dict(lang_profile))
+        feature_cache = EntityFeatureCache()
+
+        for index, item in enumerate(planned):
+            entity = self._subject_entity(getattr(item, "frame", None))
+            key = self._entity_key(entity) if entity is not None else None
+            subjects.append(key)
+
+            if entity is None or key is None:
+                specs.append(None)
+                continue
+
+            previous = last_mention.get(key)
+            competing = (
+                len({s for s in subjects[previous + 1 : index] if s and s != key})
+                if previous is not None
+                else 0
+            )
+            discourse_info = {
+                "is_first_mention": previous is None,
+                "is_topic": key == topic_key,
+                "competing_referents": competing,
+            }
+            specs.append(policy.select(entity, discourse_info, cache=feature_cache))
+            last_mention[key] = index
+
+        return specs
+
+    def _topic_key(self, planned: Sequence[Any]) -> Optional[str]:
+        for item in planned:
+            if item.topic_entity_id:
+                return str(item.topic_entity_id)
+        for item in planned:
+            entity = self._subject_entity(getattr(item, "frame", None))
+            if entity is not None:
+                return self._entity_key(entity)
+        return None
+
+    def _subject_entity(self, frame: Any) -> Optional[dict[str, Any]]:
+        if frame is None:
+            return None
+
+        subject = getattr(frame, "subject", None)
+        if hasattr(subject, "model_dump"):
+            entity = subject.model_dump()
+        elif isinstance(subject, Mapping):
+            entity = dict(subject)
+        else:
+            return None
+
+        if not str(entity.get("name") or "").strip():
+            return None
+        if self._is_bioish(frame):
+            entity.setdefault("entity_type", "person")
+        return entity
+
+    @staticmethod
+    def _entity_key(entity: Mapping[str, Any]) -> Optional[str]:
+        for field in ("qid", "id", "name"):
+            value = entity.get(field)
+            if isinstance(value, str) and value.strip():
+                return value.strip()
+        return None
+
+    @staticmethod
+    def _is_bioish(frame: Any) -> bool:
+        frame_type = str(getattr(frame, "frame_type", "") or "").strip().lower()
+        return frame_type in _BIOISH_FRAME_TYPES
+
+    def _apply_np_spec(self, frame: Any, spec: Optional[Mapping[str, Any]]) -> Any:
+        """Return the frame to realize, rewritten for a pronoun / short name decision."""
+        if frame is None:
+            raise InvalidFrameError("Planned sentence is missing its source frame.")
+        if not spec or spec.get("realization_type") not in {"pronoun", "short_name"}:
+            return frame
+        # Only bio frames have a subject-name slot the engines honour.
+        if not self._is_bioish(frame) or not hasattr(frame, "model_copy"):
+            return frame
+
+        rewritten = frame.model_copy(deep=True)
+        if rewritten.meta is None:
+            rewritten.meta = {}
+
+        if spec["realization_type"] == "pronoun":
+            gender = (spec.get("features") or {}).get("gender") or getattr(rewritten, "gender", None)
+            label, gf_arg = pronoun_for_gender(gender)
+            rewritten.name = label
+            rewritten.meta["gf_function"] = "UsePron"
+            rewritten.meta["gf_arg"] = gf_arg
+        elif spec.get("lemma"):
+            rewritten.name = str(spec["lemma"])
+
+        return rewritten
+
+    # ------------------------------------------------------------------
+    # Realization
+    # ------------------------------------------------------------------
+
+    async def _realize_all(self, lang_code: str, frames: Sequence[Any]) -> list[Sentence]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def realize(frame: Any) -> Sentence:
+            async with semaphore:
+                return await self.sentence_generator.execute(lang_code, frame)
+
+        tasks = [asyncio.ensure_future(realize(frame)) for frame in frames]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
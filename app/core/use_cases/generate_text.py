@@ -11,7 +11,18 @@ from app.core.domain.exceptions import DomainError, InvalidFrameError
 from app.core.domain.models import Frame, Sentence
 from app.core.ports.grammar_engine import IGrammarEngine
 from app.core.ports.llm_port import ILanguageModel
+from app.core.ports.result_cache import IGenerationResultCache
+from app.shared.config import settings
+from app.shared.debug_payloads import debug_payloads_enabled
 from app.shared.observability import get_tracer
+from app.shared.telemetry import record_stage_timings
+from app.shared.timing import (
+    StageTimer,
+    activate_stage_timer,
+    current_stage_timer,
+    deactivate_stage_timer,
+    stage_span,
+)
 
 logger = structlog.get_logger()
 tracer = get_tracer(__name__)
@@ -34,6 +45,15 @@ class GenerateText:
       during migration and is always recorded in debug_info when used.
     - This class intentionally remains tolerant of evolving planner/realizer
       contracts so it can bridge the migration safely.
+    - When stage timing is enabled, planner / lexical resolver / realizer (and
+      each realizer backend attempt) are timed and attached to
+      debug_info["stage_timings"], then exported as stage histograms.
+    - With a result cache injected, successful non-fallback results are
+      cached by `result_cache.make_key(lang_code, frame)`; hits skip the
+      runtime and are marked with debug_info["result_cache"] = "hit".
+    - With debug payloads disabled (`app.shared.debug_payloads`), debug_info
+      carries only `fallback_used` and results are not written to the cache,
+      so later debug requests still get the full payload on a hit.
     """
 
     def __init__(
@@ -45,6 +65,8 @@ class GenerateText:
         lexical_resolver: Any | None = None,
         realizer: Any | None = None,
         allow_legacy_engine_fallback: bool = True,
+        stage_timing: bool | None = None,
+        result_cache: IGenerationResultCache | None = None,
     ) -> None:
         # Legacy compatibility dependency
         self.engine = engine
@@ -60,7 +82,37 @@ class GenerateText:
         # Migration control
         self.allow_legacy_engine_fallback = allow_legacy_engine_fallback
 
-    async def execute(self, lang_code: str, frame: Frame) -> Sentence:
+        # Per-request stage timing (None -> settings.STAGE_TIMING_ENABLED)
+        self.stage_timing_enabled = (
+            bool(settings.STAGE_TIMING_ENABLED) if stage_timing is None else bool(stage_timing)
+        )
+
+        # Optional end-to-end result cache
+        self.result_cache = result_cache
+
+    def result_cache_key(self, lang_code: str, frame: Frame) -> str | None:
+        """
+        Return the result-cache key for this request, or None when caching is off.
+
+        The key changes with every input that can alter the output, so API
+        adapters may expose it as an ETag.
+        """
+        if self.result_cache is None:
+            return None
+        try:
+            return self.result_cache.make_key(lang_code, frame)
+        except Exception as exc:
+            logger.warning("result_cache_key_failed", lang=lang_code, error=str(exc))
+            return None
+
+    async def execute(
+        self,
+        lang_code: str,
+        frame: Frame,
+        *,
+        use_cache: bool = True,
+        cache_key: str | None = None,
+    ) -> Sentence:
         """
         Generate a single Sentence from a semantic Frame.
 
@@ -69,6 +121,12 @@ class GenerateText:
                 Target language code.
             frame:
                 Semantic/domain frame.
+            use_cache:
+                False when the output depends on state outside the frame
+                (e.g. discourse session context); bypasses the result cache.
+            cache_key:
+                Precomputed `result_cache_key(lang_code, frame)`, for callers
+                that already derived an ETag from it.
 
         Returns:
             Sentence:
@@ -82,117 +140,169 @@ class GenerateText:
         """
         started = time.perf_counter()
 
-        with tracer.start_as_current_span("use_case.generate_text") as span:
-            frame_type = str(getattr(frame, "frame_type", "unknown") or "unknown")
+        if use_cache and cache_key is None:
+            cache_key = self.result_cache_key(lang_code, frame)
+        if not use_cache:
+            cache_key = None
+
+        timer = StageTimer() if self.stage_timing_enabled else None
+        timer_token = activate_stage_timer(timer) if timer is not None else None
+
+        try:
+            with tracer.start_as_current_span("use_case.generate_text") as span:
+                try:
+                    return await self._execute(
+                        lang_code,
+                        frame,
+                        span=span,
+                        started=started,
+                        cache_key=cache_key,
+                    )
+                finally:
+                    if timer is not None:
+                        # Exported inside the use-case span so OTel stage spans nest under it.
+                        record_stage_timings(timer, lang_code=lang_code or "")
+        finally:
+            if timer_token is not None:
+                deactivate_stage_timer(timer_token)
+
+    async def _execute(
+        self,
+        lang_code: str,
+        frame: Frame,
+        *,
+        span: Any,
+        started: float,
+        cache_key: str | None = None,
+    ) -> Sentence:
+        frame_type = str(getattr(frame, "frame_type", "unknown") or "unknown")
+
+        span.set_attribute("app.lang_code", lang_code or "")
+        span.set_attribute("app.frame_type", frame_type)
+
+        if cache_key is not None:
+            cached = await self._get_cached(cache_key, started=started)
+            span.set_attribute("app.result_cache", "hit" if cached is not None else "miss")
+            if cached is not None:
+                logger.debug("generation_cache_hit", lang=lang_code, frame_type=frame_type)
+                return cached
+
+        logger.info(
+            "generation_started",
+            lang=lang_code,
+            frame_type=frame_type,
+            planner_runtime_configured=self._planner_runtime_available(),
+            legacy_engine_configured=self.engine is not None,
+        )
 
-            span.set_attribute("app.lang_code", lang_code or "")
-            span.set_attribute("app.frame_type", frame_type)
+        try:
+            self._validate_lang_code(lang_code)
+            self._validate_frame(frame)
 
-            logger.info(
-                "generation_started",
-                lang=lang_code,
-                frame_type=frame_type,
-                planner_runtime_configured=self._planner_runtime_available(),
-                legacy_engine_configured=self.engine is not None,
-            )
+            sentence: Sentence
+            runtime_path: str
 
-            try:
-                self._validate_lang_code(lang_code)
-                self._validate_frame(frame)
-
-                sentence: Sentence
-                runtime_path: str
-
-                if self._planner_runtime_available():
-                    try:
-                        sentence = await self._generate_via_planner_runtime(
-                            lang_code=lang_code,
-                            frame=frame,
-                        )
-                        runtime_path = "planner_first"
-                    except InvalidFrameError:
+            if self._planner_runtime_available():
+                try:
+                    sentence = await self._generate_via_planner_runtime(
+                        lang_code=lang_code,
+                        frame=frame,
+                    )
+                    runtime_path = "planner_first"
+                except InvalidFrameError:
+                    raise
+                except Exception as planner_exc:
+                    if not self._can_fallback_to_legacy_engine():
                         raise
-                    except Exception as planner_exc:
-                        if not self._can_fallback_to_legacy_engine():
-                            raise
-
-                        logger.warning(
-                            "planner_runtime_failed_falling_back",
-                            lang=lang_code,
-                            frame_type=frame_type,
-                            error=str(planner_exc),
-                            planner=self._component_name(self.planner),
-                            lexical_resolver=self._component_name(self.lexical_resolver),
-                            realizer=self._component_name(self.realizer),
-                        )
-
-                        sentence = await self._generate_via_legacy_engine(
-                            lang_code=lang_code,
-                            frame=frame,
-                            fallback_reason=str(planner_exc),
-                        )
-                        runtime_path = "legacy_engine_fallback"
-                else:
-                    if self.engine is None:
-                        raise DomainError(
-                            "GenerateText is not configured with either "
-                            "a planner-first runtime or a legacy grammar engine."
-                        )
+
+                    logger.warning(
+                        "planner_runtime_failed_falling_back",
+                        lang=lang_code,
+                        frame_type=frame_type,
+                        error=str(planner_exc),
+                        planner=self._component_name(self.planner),
+                        lexical_resolver=self._component_name(self.lexical_resolver),
+                        realizer=self._component_name(self.realizer),
+                    )
 
                     sentence = await self._generate_via_legacy_engine(
                         lang_code=lang_code,
                         frame=frame,
-                        fallback_reason=None,
+                        fallback_reason=str(planner_exc),
+                    )
+                    runtime_path = "legacy_engine_fallback"
+            else:
+                if self.engine is None:
+                    raise DomainError(
+                        "GenerateText is not configured with either "
+                        "a planner-first runtime or a legacy grammar engine."
                     )
-                    runtime_path = "legacy_engine"
 
-                sentence = self._finalize_sentence(
-                    sentence=sentence,
+                sentence = await self._generate_via_legacy_engine(
                     lang_code=lang_code,
-                    elapsed_ms=(time.perf_counter() - started) * 1000.0,
-                    runtime_path=runtime_path,
+                    frame=frame,
+                    fallback_reason=None,
                 )
+                runtime_path = "legacy_engine"
 
-                span.set_attribute("app.runtime_path", runtime_path)
-                span.set_attribute("app.generated_length", len(sentence.text))
-                span.set_attribute(
-                    "app.fallback_used",
-                    bool((sentence.debug_info or {}).get("fallback_used", False)),
-                )
+            sentence = self._finalize_sentence(
+                sentence=sentence,
+                lang_code=lang_code,
+                elapsed_ms=(time.perf_counter() - started) * 1000.0,
+                runtime_path=runtime_path,
+            )
 
-                construction_id = (sentence.debug_info or {}).get("construction_id")
-                renderer_backend = (sentence.debug_info or {}).get("renderer_backend")
-
-                if construction_id:
-                    span.set_attribute("app.construction_id", str(construction_id))
-                if renderer_backend:
-                    span.set_attribute("app.renderer_backend", str(renderer_backend))
-
-                logger.info(
-                    "generation_success",
-                    lang=sentence.lang_code,
-                    runtime_path=runtime_path,
-                    text_preview=sentence.text[:80],
-                    construction_id=construction_id,
-                    renderer_backend=renderer_backend,
-                    fallback_used=bool(
-                        (sentence.debug_info or {}).get("fallback_used", False)
-                    ),
-                )
+            span.set_attribute("app.runtime_path", runtime_path)
+            span.set_attribute("app.generated_length", len(sentence.text))
+            span.set_attribute(
+                "app.fallback_used",
+                bool((sentence.debug_info or {}).get("fallback_used", False)),
+            )
 
-                return sentence
-
-            except DomainError:
-                raise
-            except Exception as exc:
-                logger.error(
-                    "generation_failed",
-                    lang=lang_code,
-                    frame_type=frame_type,
-                    error=str(exc),
-                    exc_info=True,
-                )
-                raise DomainError(f"Unexpected generation failure: {str(exc)}") from exc
+            construction_id = (sentence.debug_info or {}).get("construction_id")
+            renderer_backend = (sentence.debug_info or {}).get("renderer_backend")
+
+            if construction_id:
+                span.set_attribute("app.construction_id", str(construction_id))
+            if renderer_backend:
+                span.set_attribute("app.renderer_backend", str(renderer_backend))
+
+            logger.info(
+                "generation_success",
+                lang=sentence.lang_code,
+                runtime_path=runtime_path,
+                text_preview=sentence.text[:80],
+                construction_id=construction_id,
+                renderer_backend=renderer_backend,
+                fallback_used=bool(
+                    (sentence.debug_info or {}).get("fallback_used", False)
+                ),
+            )
+
+            # Degraded fallback output is not cached; the next request retries the planner.
+            # Nor is output whose key went stale mid-request (e.g. a grammar hot swap).
+            if (
+                cache_key is not None
+                and runtime_path != "legacy_engine_fallback"
+                and not (sentence.debug_info or {}).get("fallback_used")
+                and debug_payloads_enabled()
+                and self.result_cache_key(lang_code, frame) == cache_key
+            ):
+                await self._store_cached(cache_key, sentence)
+
+            return sentence
+
+        except DomainError:
+            raise
+        except Exception as exc:
+            logger.error(
+                "generation_failed",
+                lang=lang_code,
+                frame_type=frame_type,
+                error=str(exc),
+                exc_info=True,
+            )
+            raise DomainError(f"Unexpected generation failure: {str(exc)}") from exc
 
     async def _generate_via_planner_runtime(self, *, lang_code: str, frame: Frame) -> Sentence:
         """
@@ -204,29 +314,35 @@ class GenerateText:
         - lexical resolver is optional,
         - realizer is authoritative for the final surface result.
         """
-        planned = await self._call_planner(lang_code=lang_code, frame=frame)
+        with stage_span("planner"):
+            planned = await self._call_planner(lang_code=lang_code, frame=frame)
         runtime_payload = planned
 
         if self.lexical_resolver is not None:
-            runtime_payload = await self._call_lexical_resolver(
+            with stage_span("lexical_resolver"):
+                runtime_payload = await self._call_lexical_resolver(
+                    payload=runtime_payload,
+                    lang_code=lang_code,
+                    frame=frame,
+                )
+
+        with stage_span("realizer"):
+            realized = await self._call_realizer(
                 payload=runtime_payload,
                 lang_code=lang_code,
                 frame=frame,
             )
 
-        realized = await self._call_realizer(
-            payload=runtime_payload,
-            lang_code=lang_code,
-            frame=frame,
-        )
-
-        debug_info = {
-            "runtime_path": "planner_first",
-            "fallback_used": False,
-            "planner": self._component_name(self.planner),
-            "lexical_resolver": self._component_name(self.lexical_resolver),
-            "realizer": self._component_name(self.realizer),
-        }
+        if debug_payloads_enabled():
+            debug_info = {
+                "runtime_path": "planner_first",
+                "fallback_used": False,
+                "planner": self._component_name(self.planner),
+                "lexical_resolver": self._component_name(self.lexical_resolver),
+                "realizer": self._component_name(self.realizer),
+            }
+        else:
+            debug_info = {}
 
         return self._coerce_to_sentence(
             value=realized,
@@ -250,15 +366,19 @@ class GenerateText:
         if self.engine is None:
             raise DomainError("Legacy grammar engine fallback is not configured.")
 
-        result = await self.engine.generate(lang_code, frame)
+        with stage_span("legacy_engine"):
+            result = await self.engine.generate(lang_code, frame)
 
-        debug_info = {
-            "runtime_path": "legacy_engine_fallback" if fallback_reason else "legacy_engine",
-            "fallback_used": bool(fallback_reason),
-            "fallback_reason": fallback_reason,
-            "legacy_engine": self._component_name(self.engine),
-            "planner_runtime_configured": self._planner_runtime_available(),
-        }
+        if debug_payloads_enabled():
+            debug_info = {
+                "runtime_path": "legacy_engine_fallback" if fallback_reason else "legacy_engine",
+                "fallback_used": bool(fallback_reason),
+                "fallback_reason": fallback_reason,
+                "legacy_engine": self._component_name(self.engine),
+                "planner_runtime_configured": self._planner_runtime_available(),
+            }
+        else:
+            debug_info = {"fallback_used": True} if fallback_reason else {}
 
         return self._coerce_to_sentence(
             value=result,
@@ -421,13 +541,18 @@ class GenerateText:
 
         # SurfaceResult-like objects often expose useful runtime metadata as attributes.
         extra_debug: dict[str, Any] = dict(default_debug_info)
-        for key in (
-            "construction_id",
-            "renderer_backend",
-            "fallback_used",
-            "tokens",
-            "selected_backend",
-        ):
+        keys: tuple[str, ...] = (
+            (
+                "construction_id",
+                "renderer_backend",
+                "fallback_used",
+                "tokens",
+                "selected_backend",
+            )
+            if debug_payloads_enabled()
+            else ("fallback_used",)
+        )
+        for key in keys:
             attr = getattr(value, key, None)
             if attr is not None:
                 extra_debug.setdefault(key, attr)
@@ -454,9 +579,14 @@ class GenerateText:
         """
         text = str(sentence.text or "").strip()
         debug_info = dict(sentence.debug_info or {})
-        debug_info.setdefault("runtime_path", runtime_path)
         debug_info.setdefault("fallback_used", False)
 
+        if debug_payloads_enabled():
+            debug_info.setdefault("runtime_path", runtime_path)
+            timer = current_stage_timer()
+            if timer is not None:
+                debug_info["stage_timings"] = timer.as_debug()
+
         generation_time_ms = float(sentence.generation_time_ms or 0.0)
         if generation_time_ms <= 0.0:
             generation_time_ms = elapsed_ms
@@ -468,6 +598,33 @@ class GenerateText:
             generation_time_ms=generation_time_ms,
         )
 
+    async def _get_cached(self, cache_key: str, *, started: float) -> Sentence | None:
+        assert self.result_cache is not None
+        try:
+            cached = await self.result_cache.get(cache_key)
+        except Exception as exc:
+            logger.warning("result_cache_get_failed", error=str(exc))
+            return None
+        if cached is None:
+            return None
+
+        debug_info = dict(cached.debug_info or {})
+        debug_info.pop("stage_timings", None)
+        debug_info["result_cache"] = "hit"
+        return cached.model_copy(
+            update={
+                "debug_info": debug_info,
+                "generation_time_ms": (time.perf_counter() - started) * 1000.0,
+            }
+        )
+
+    async def _store_cached(self, cache_key: str, sentence: Sentence) -> None:
+        assert self.result_cache is not None
+        try:
+            await self.result_cache.set(cache_key, sentence)
+        except Exception as exc:
+            logger.warning("result_cache_set_failed", error=str(exc))
+
     def _validate_lang_code(self, lang_code: str) -> None:
         if not isinstance(lang_code, str) or not lang_code.strip():
             raise DomainError("lang_code must be a non-empty string.")
@@ -526,6 +683,12 @@ class GenerateText:
         current: Any,
         defaults: dict[str, Any],
     ) -> dict[str, Any]:
+        if not debug_payloads_enabled():
+            fallback_used = bool(defaults.get("fallback_used")) or (
+                isinstance(current, dict) and bool(current.get("fallback_used"))
+            )
+            return {"fallback_used": True} if fallback_used else {}
+
         merged = dict(defaults)
 
         if isinstance(current, dict):
@@ -88,7 +88,8 @@ class OnboardLanguageSaga:
             # We immediately request a 'Fast' build to generate the scaffolding
             build_payload = BuildRequestedPayload(
                 lang_code=code,
-                strategy="fast"
+                strategy="fast",
+                priority="bulk",
             )
             
             event = SystemEvent(
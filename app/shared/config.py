@@ -27,6 +27,17 @@ class StorageBackend(str, Enum):
     S3 = "s3"
 
 
+class LexiconStore(str, Enum):
+    JSON = "json"
+    JOURNAL = "journal"
+
+
+class GenerationCacheBackend(str, Enum):
+    NONE = "none"
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
 class Settings(BaseSettings):
     """
     Central Configuration Registry.
@@ -78,21 +89,92 @@ class Settings(BaseSettings):
     API_SECRET: Optional[str] = None
     API_KEY: Optional[str] = None  # Back-compat alias
 
+    # --- Preforking Server (app.adapters.api.server) ---
+    # Workers forked after the grammar, lexicons and family configs are loaded
+    # once in the parent. API_PRELOAD_LANGUAGES: comma-separated, "*" = all.
+    API_WORKERS: int = 2
+    API_PRELOAD_LANGUAGES: str = "*"
+    API_MEMORY_REPORT_SEC: float = 60.0
+
     # --- Logging & Observability ---
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
     OTEL_SERVICE_NAME: str = "architect-backend"
     OTEL_EXPORTER_OTLP_ENDPOINT: Optional[str] = None
+    # Per-request stage timings (debug_info["stage_timings"] + stage histograms).
+    STAGE_TIMING_ENABLED: bool = True
 
     # --- Messaging & State (Redis) ---
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_QUEUE_NAME: str = "architect_tasks"
     SESSION_TTL_SEC: int = 600
 
+    # --- Generation Result Cache ---
+    # Caches /generate results keyed by canonical frame + language + PGF/lexicon/config
+    # stamps. Requests whose output depends on X-Session-ID discourse state bypass it.
+    GENERATION_CACHE_BACKEND: GenerationCacheBackend = GenerationCacheBackend.NONE
+    GENERATION_CACHE_TTL_SEC: int = 3600
+    GENERATION_CACHE_MAX_ENTRIES: int = 10000
+    # Bump to invalidate every cached result (e.g. on deploys changing generation code).
+    GENERATION_CACHE_NAMESPACE: str = "v1"
+
+    # Default for /generate?debug=. False builds no debug_info/backend_trace and
+    # returns only text + lang_code (clients can still opt in per request).
+    GENERATION_DEBUG_DEFAULT: bool = True
+
+    # --- Document Generation ---
+    # /generate/{lang}/document: frames accepted per request and sentences realized at once.
+    DOCUMENT_MAX_FRAMES: int = 64
+    DOCUMENT_REALIZE_CONCURRENCY: int = 8
+
+    # --- Admission Control (generation routes) ---
+    # Route-wide limit adapts (AIMD) between MIN and MAX around the latency
+    # target; per-language limit is fixed. Excess requests wait in a bounded
+    # queue and get 503 + Retry-After once their deadline cannot be met.
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_ADAPTIVE: bool = True
+    ADMISSION_MAX_CONCURRENCY: int = 64
+    ADMISSION_INITIAL_CONCURRENCY: int = 16
+    ADMISSION_MIN_CONCURRENCY: int = 2
+    ADMISSION_PER_LANGUAGE_CONCURRENCY: int = 8
+    ADMISSION_MAX_QUEUE: int = 128
+    ADMISSION_TARGET_LATENCY_SEC: float = 0.5
+    # Queue-wait bound when the request carries neither X-Request-Deadline nor
+    # X-Request-Timeout; such requests get no time limit on generation itself.
+    ADMISSION_DEFAULT_TIMEOUT_SEC: float = 10.0
+
+    # --- Language Catalogue (GET /languages) ---
+    # Rebuilt on matrix-file change or build/lexicon events; repos with no
+    # local matrix file (S3) also rebuild after TTL (0 = events only).
+    LANGUAGES_CATALOG_TTL_SEC: float = 300.0
+    LANGUAGES_CACHE_MAX_AGE_SEC: int = 60
+
+    # --- Readiness Probe (/health/ready) ---
+    # Checks run concurrently, each bounded by CHECK_TIMEOUT; the report is
+    # cached for CACHE_TTL so probe storms cost one round of checks.
+    # REQUIRE_WARM turns "degraded" (grammar/lexicon not loaded) into a 503.
+    READINESS_CACHE_TTL_SEC: float = 2.0
+    READINESS_CHECK_TIMEOUT_SEC: float = 1.0
+    READINESS_REQUIRE_WARM: bool = False
+
     # --- External Services ---
     WIKIDATA_SPARQL_URL: str = "https://query.wikidata.org/sparql"
     WIKIDATA_TIMEOUT: int = 30
 
+    # --- Circuit Breakers (app.shared.resilience) ---
+    # Trip on failure rate (or slow-call rate) over the last WINDOW_SIZE calls
+    # no older than WINDOW_SEC, once MIN_CALLS are in the window. After
+    # RECOVERY_TIMEOUT_SEC, up to HALF_OPEN_MAX_CALLS probes test recovery.
+    # SLOW_CALL_SEC=0 disables slow-call tracking.
+    CIRCUIT_BREAKER_WINDOW_SIZE: int = 20
+    CIRCUIT_BREAKER_WINDOW_SEC: float = 60.0
+    CIRCUIT_BREAKER_MIN_CALLS: int = 5
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5
+    CIRCUIT_BREAKER_SLOW_CALL_SEC: float = 0.0
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = 0.8
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT_SEC: float = 30.0
+    CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS: int = 2
+
     # --- AI & DevOps ---
     GEMINI_API_KEY: str = ""
     GOOGLE_API_KEY: Optional[str] = None  # Deprecated alias for Gemini
@@ -108,15 +190,47 @@ class Settings(BaseSettings):
     # FILESYSTEM CONFIG
     FILESYSTEM_REPO_PATH: str = str(_PROJECT_ROOT)
 
+    # Lexicon write path: "json" rewrites lexicon.json on every save;
+    # "journal" appends to a write-ahead journal compacted every N records
+    # (safe across API_WORKERS processes via a per-language flock; POSIX only).
+    LEXICON_STORE: LexiconStore = LexiconStore.JSON
+    LEXICON_JOURNAL_COMPACT_EVERY: int = 5000
+    LEXICON_JOURNAL_FSYNC: bool = False
+
     # S3 Config
     AWS_ACCESS_KEY_ID: Optional[str] = None
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
     AWS_REGION: str = "us-east-1"
     AWS_BUCKET_NAME: str = "abstract-wiki-grammars"
+    # Custom endpoint (MinIO, moto_server) for local runs; empty = AWS.
+    S3_ENDPOINT_URL: Optional[str] = None
+    # Local read-through cache (content-addressed, revalidated via ETag).
+    S3_CACHE_DIR: str = str(_PROJECT_ROOT / "data" / "cache" / "s3")
+    # Connection pool size = parallel requests (ranged parts, multipart parts, prefetch).
+    S3_MAX_CONCURRENCY: int = 16
+    S3_MULTIPART_THRESHOLD_MB: int = 16
+    S3_PART_SIZE_MB: int = 8
+    # Download every grammars/*.pgf into the local cache in the background at startup.
+    S3_PREFETCH_GRAMMARS: bool = True
 
     # --- Worker Configuration ---
     WORKER_CONCURRENCY: int = 2
 
+    # --- Build Scheduler (worker) ---
+    # Build requests are coalesced per language for BUILD_DEBOUNCE_SEC after the
+    # first one, then due languages (interactive before bulk onboarding) are
+    # compiled together in one orchestrator run, one run at a time fleet-wide.
+    BUILD_SCHEDULER_ENABLED: bool = True
+    BUILD_DEBOUNCE_SEC: float = 5.0
+    BUILD_MAX_BATCH_LANGS: int = 16
+    BUILD_SCHEDULER_POLL_SEC: float = 1.0
+    # Safety net if a worker dies mid-build; must exceed the longest build.
+    BUILD_LOCK_TTL_SEC: int = 3600
+    # Failed (or abandoned) builds are requeued after BUILD_RETRY_DELAY_SEC,
+    # doubling per attempt, until a request has been tried BUILD_MAX_ATTEMPTS times.
+    BUILD_MAX_ATTEMPTS: int = 3
+    BUILD_RETRY_DELAY_SEC: float = 30.0
+
     # --- Feature Flags ---
     USE_MOCK_GRAMMAR: bool = False
 
@@ -134,6 +248,11 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("AW_PGF_PATH"),
         description="Deprecated alias for PGF_PATH. Prefer PGF_PATH.",
     )
+    # Hot swap: API processes reload the PGF when the worker broadcasts
+    # grammar.reloaded / language.build.completed; the worker's file watcher
+    # waits this long after the last change before re-reading the binary.
+    GRAMMAR_HOT_RELOAD: bool = True
+    GRAMMAR_RELOAD_DEBOUNCE_SEC: float = 0.5
 
     # --- Dynamic Path Resolution ---
     @property
@@ -1,30 +1,53 @@
 # app/shared/container.py
+import importlib
+from typing import Any, Callable
+
 from dependency_injector import containers, providers
 
 from app.shared.config import settings
 
-# --- Adapters ---
-from app.adapters.llm_adapter import GeminiAdapter
-from app.adapters.messaging.redis_broker import RedisMessageBroker
-from app.adapters.persistence.filesystem_repo import FileSystemLexiconRepository
-from app.adapters.task_queue import ArqTaskQueue
-from app.adapters.engines.gf_wrapper import GFGrammarEngine
-from app.adapters.engines.python_engine_wrapper import PythonGrammarEngine
-
-try:
-    from app.adapters.s3_repo import S3LanguageRepo
-except ImportError:
-    S3LanguageRepo = None
-
-
-# --- Use Cases ---
+# Adapters are imported on first provider resolution, not here: this module is
+# imported by every CLI tool and script that touches `app.*` (nlg.api, the
+# health/benchmark tools), and most of them never build a Redis client, an
+# S3 session or a Gemini client. Use cases are pure core code and stay eager.
 from app.core.use_cases.generate_text import GenerateText
+from app.core.use_cases.generate_document import GenerateDocument
 from app.core.use_cases.build_language import BuildLanguage
 from app.core.use_cases.onboard_language_saga import OnboardLanguageSaga
 
 
+def _lazy(path: str) -> Callable[..., Any]:
+    """
+    Provider target for ``"package.module:Class"`` that imports the module on
+    first call. Overrides (tests, BYOK adapters) never trigger the import.
+    """
+    module_name, _, attr = path.partition(":")
+    target: Any = None
+
+    def _create(*args: Any, **kwargs: Any) -> Any:
+        nonlocal target
+        if target is None:
+            target = getattr(importlib.import_module(module_name), attr)
+        return target(*args, **kwargs)
+
+    _create.__name__ = _create.__qualname__ = attr
+    _create.__doc__ = f"Lazily imported {path}"
+    return _create
+
+
+def _s3_repo_available() -> bool:
+    # Only imported (boto3 included) when the S3 backend is actually selected.
+    try:
+        importlib.import_module("app.adapters.s3_repo")
+    except ImportError:
+        return False
+    return True
+
+
 _STORAGE_BACKEND = (settings.STORAGE_BACKEND or "").strip().lower()
-_USE_S3_REPO = _STORAGE_BACKEND == "s3" and S3LanguageRepo is not None
+_USE_S3_REPO = _STORAGE_BACKEND == "s3" and _s3_repo_available()
+_USE_LEXICON_JOURNAL = (settings.LEXICON_STORE or "").strip().lower() == "journal"
+_GENERATION_CACHE_BACKEND = (settings.GENERATION_CACHE_BACKEND or "").strip().lower()
 
 
 class Container(containers.DeclarativeContainer):
@@ -46,26 +69,36 @@ class Container(containers.DeclarativeContainer):
             "app.adapters.api.routers.languages",
             "app.adapters.api.routers.health",
             "app.adapters.api.dependencies",
-        ]
+        ],
+        # Wiring imports the routers (and FastAPI); the API wires explicitly
+        # in create_app(), so non-API importers do not pay for it.
+        auto_wire=False,
     )
 
     # Optional: expose settings to providers/tests
     config = providers.Object(settings)
 
     # --- Infrastructure ---
-    message_broker = providers.Singleton(RedisMessageBroker)
+    message_broker = providers.Singleton(_lazy("app.adapters.messaging.redis_broker:RedisMessageBroker"))
 
     task_queue = providers.Singleton(
-        ArqTaskQueue,
+        _lazy("app.adapters.task_queue:ArqTaskQueue"),
         redis_dsn=settings.REDIS_URL,
         queue_name=settings.REDIS_QUEUE_NAME,
     )
 
     if _USE_S3_REPO:
-        language_repo = providers.Singleton(S3LanguageRepo)
+        language_repo = providers.Singleton(_lazy("app.adapters.s3_repo:S3LanguageRepo"))
+    elif _USE_LEXICON_JOURNAL:
+        language_repo = providers.Singleton(
+            _lazy("app.adapters.persistence.journal_lexicon_repo:JournalLexiconRepository"),
+            base_path=settings.FILESYSTEM_REPO_PATH,
+            compact_every=settings.LEXICON_JOURNAL_COMPACT_EVERY,
+            fsync=settings.LEXICON_JOURNAL_FSYNC,
+        )
     else:
         language_repo = providers.Singleton(
-            FileSystemLexiconRepository,
+            _lazy("app.adapters.persistence.filesystem_repo:FileSystemLexiconRepository"),
             base_path=settings.FILESYSTEM_REPO_PATH,
         )
 
@@ -73,15 +106,58 @@ class Container(containers.DeclarativeContainer):
     lexicon_repository = language_repo
 
     if settings.USE_MOCK_GRAMMAR:
-        grammar_engine = providers.Singleton(PythonGrammarEngine)
+        grammar_engine = providers.Singleton(_lazy("app.adapters.engines.python_engine_wrapper:PythonGrammarEngine"))
     else:
         # Let GFGrammarEngine resolve settings.PGF_PATH by itself.
-        grammar_engine = providers.Singleton(GFGrammarEngine)
+        grammar_engine = providers.Singleton(_lazy("app.adapters.engines.gf_wrapper:GFGrammarEngine"))
+
+    # Construction dispatcher (GF -> family -> safe_mode). Its dispatch table is
+    # warmed at API startup and rebuilt on profile / grammar reload.
+    family_realizer = providers.Singleton(
+        _lazy("app.adapters.engines.family_construction_adapter:FamilyConstructionAdapter")
+    )
+    if settings.USE_MOCK_GRAMMAR:
+        # The mock Python engine is a safe_mode-class backend.
+        construction_realizer = providers.Singleton(
+            _lazy("app.adapters.engines.construction_realizer:ConstructionRealizer"),
+            family_realizer=family_realizer,
+            safe_mode_realizer=grammar_engine,
+        )
+    else:
+        construction_realizer = providers.Singleton(
+            _lazy("app.adapters.engines.construction_realizer:ConstructionRealizer"),
+            gf_realizer=providers.Singleton(
+                _lazy("app.adapters.engines.gf_construction_adapter:GFConstructionAdapter"),
+                engine=grammar_engine,
+            ),
+            family_realizer=family_realizer,
+            safe_mode_realizer=providers.Singleton(
+                _lazy("app.adapters.engines.safe_mode_construction_adapter:SafeModeConstructionAdapter")
+            ),
+        )
 
     # Request-scoped adapter factory.
     # Usage from dependencies.py:
     #   llm = container.llm_adapter(user_api_key=user_key)
-    llm_adapter = providers.Factory(GeminiAdapter)
+    llm_adapter = providers.Factory(_lazy("app.adapters.llm_adapter:GeminiAdapter"))
+
+    # Optional end-to-end generation result cache (GENERATION_CACHE_BACKEND).
+    if _GENERATION_CACHE_BACKEND == "memory":
+        generation_result_cache = providers.Singleton(
+            _lazy("app.adapters.result_cache:InMemoryResultCache"),
+            max_entries=settings.GENERATION_CACHE_MAX_ENTRIES,
+            ttl_sec=settings.GENERATION_CACHE_TTL_SEC,
+            engine=grammar_engine,
+        )
+    elif _GENERATION_CACHE_BACKEND == "redis":
+        generation_result_cache = providers.Singleton(
+            _lazy("app.adapters.result_cache:RedisResultCache"),
+            redis_url=settings.REDIS_URL,
+            ttl_sec=settings.GENERATION_CACHE_TTL_SEC,
+            engine=grammar_engine,
+        )
+    else:
+        generation_result_cache = providers.Object(None)
 
     # --- Use Cases ---
     # Keep this override-friendly: request-specific LLM instances can be supplied
@@ -89,6 +165,14 @@ class Container(containers.DeclarativeContainer):
     generate_text_use_case = providers.Factory(
         GenerateText,
         engine=grammar_engine,
+        result_cache=generation_result_cache,
+    )
+
+    generate_document_use_case = providers.Factory(
+        GenerateDocument,
+        sentence_generator=generate_text_use_case,
+        max_frames=settings.DOCUMENT_MAX_FRAMES,
+        max_concurrency=settings.DOCUMENT_REALIZE_CONCURRENCY,
     )
 
     build_language_use_case = providers.Factory(
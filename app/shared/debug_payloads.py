@@ -0,0 +1,73 @@
+# app/shared/debug_payloads.py
+"""
+Request-scoped switch for debug payload construction.
+
+Realizers and the generation use case build `debug_info` / `backend_trace`
+structures on every request. Callers that only need `text` (e.g. `/generate`
+with `debug=false`) turn this off for the duration of the request; the flag
+travels through a ContextVar, like the active `StageTimer` in
+`app.shared.timing`, so nested components can check it without a new
+parameter on every call signature.
+
+When disabled, components keep only what generation itself depends on
+(`fallback_used`, which gates result caching) and never allocate traces.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Iterable, Iterator
+
+_debug_payloads: ContextVar[bool] = ContextVar("architect_debug_payloads", default=True)
+
+
+class _DiscardTrace(list):
+    """A list that drops appends; stands in for a trace when debug is off."""
+
+    __slots__ = ()
+
+    def append(self, item: Any) -> None:
+        return None
+
+    def extend(self, items: Iterable[Any]) -> None:
+        return None
+
+    def __iadd__(self, other: Iterable[Any]) -> "_DiscardTrace":
+        return self
+
+
+# Shared, always empty.
+NULL_TRACE: list[Any] = _DiscardTrace()
+
+
+def debug_payloads_enabled() -> bool:
+    """True unless the current request asked for a lean (debug=false) response."""
+    return _debug_payloads.get()
+
+
+def set_debug_payloads(enabled: bool) -> Token[bool]:
+    return _debug_payloads.set(bool(enabled))
+
+
+def reset_debug_payloads(token: Token[bool]) -> None:
+    _debug_payloads.reset(token)
+
+
+@contextmanager
+def debug_payloads(enabled: bool) -> Iterator[None]:
+    """Enable or disable debug payload construction within the block."""
+    token = set_debug_payloads(enabled)
+    try:
+        yield
+    finally:
+        reset_debug_payloads(token)
+
+
+__all__ = [
+    "NULL_TRACE",
+    "debug_payloads",
+    "debug_payloads_enabled",
+    "reset_debug_payloads",
+    "set_debug_payloads",
+]
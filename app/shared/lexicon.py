@@ -48,17 +48,18 @@ class LexiconRuntime:
     """
     Compatibility facade over the authoritative lexicon adapter package.
 
-    Preferred behavior:
+    Behavior:
     - normalize language codes consistently,
     - delegate lookups to `app.adapters.persistence.lexicon`,
     - convert rich adapter entries into stable legacy `LexiconEntry` objects.
 
-    Fallback behavior:
-    - if the adapter package is unavailable or incomplete during migration,
-      fall back to the older shard-based JSON loading path.
-
     Notes
     -----
+    This class holds no lexical data of its own: every lookup is served from
+    the per-language index cache in `app.adapters.persistence.lexicon.cache`,
+    so a language is materialised once per process regardless of how many
+    facades read it.
+
     This class is intentionally retained because current callers still import
     `LexiconRuntime` / `lexicon` directly. New lexical-resolution logic should
     live behind the shared lexical-resolution contract rather than here.
@@ -66,10 +67,6 @@ class LexiconRuntime:
 
     _instance: "LexiconRuntime | None" = None
 
-    # Legacy fallback storage
-    _legacy_data: Dict[str, Dict[str, LexiconEntry]] = {}
-    _legacy_loaded_langs: set[str] = set()
-
     # Shared normalization map
     _iso_map: Dict[str, str] = {}
 
@@ -245,6 +242,41 @@ class LexiconRuntime:
             )
             return None
 
+    def _adapter_lookup_key(self, lang_code: str, key: str) -> Any:
+        """
+        Look up by entry key or any alias (e.g. the QID a harvested shard is
+        keyed by) through the shared index.
+        """
+        idx = self._get_adapter_index(lang_code)
+        lookup_any = getattr(idx, "lookup_any", None)
+        if not callable(lookup_any):
+            return None
+        try:
+            return lookup_any(key)
+        except Exception as exc:
+            logger.debug("lexicon_adapter_key_lookup_failed", key=key, error=str(exc))
+            return None
+
+    def _find_raw(self, key: str, lang_code: str) -> Any:
+        """
+        Resolve `key` to the shared store's entry object.
+
+        Resolution strategy:
+        1. QID lookup for QIDs,
+        2. lemma lookup,
+        3. entry key / alias lookup.
+        """
+        if _QID_RE.match(key):
+            hit = self._adapter_lookup_qid(lang_code, key)
+            if hit is not None:
+                return hit
+
+        hit = self._adapter_lookup_lemma(lang_code, key)
+        if hit is not None:
+            return hit
+
+        return self._adapter_lookup_key(lang_code, key)
+
     @staticmethod
     def _mapping_copy(value: Any) -> Dict[str, Any]:
         return dict(value) if isinstance(value, Mapping) else {}
@@ -294,6 +326,10 @@ class LexiconRuntime:
         )
         if qid is not None:
             qid = str(qid).strip() or None
+        if qid is None:
+            key = getattr(raw, "key", None)
+            if isinstance(key, str) and _QID_RE.match(key.strip()):
+                qid = key.strip()
 
         gf_fun = (
             getattr(raw, "gf_fun", None)
@@ -312,6 +348,13 @@ class LexiconRuntime:
         features.update(raw_features)
         features.update(extra)
 
+        # Harvested shards nest Wikidata claims under "facts"; legacy callers
+        # read them as top-level features (e.g. features["P106"]).
+        facts = extra.get("facts")
+        if isinstance(facts, Mapping):
+            for prop, value in facts.items():
+                features.setdefault(str(prop), value)
+
         for attr_name in (
             "sense",
             "human",
@@ -340,107 +383,6 @@ class LexiconRuntime:
             features=features,
         )
 
-    # ------------------------------------------------------------------ #
-    # Legacy raw-shard fallback path
-    # ------------------------------------------------------------------ #
-
-    def _legacy_load_language(self, lang_code: str) -> None:
-        iso2 = self.normalize_code(lang_code)
-        if not iso2 or iso2 in self._legacy_loaded_langs:
-            return
-
-        base_path = self._candidate_repo_roots()[0]
-        shard_names = [
-            "wide.json",
-            "core.json",
-            "people.json",
-            "science.json",
-            "geography.json",
-        ]
-
-        self._legacy_data.setdefault(iso2, {})
-        loaded_shards: List[str] = []
-
-        for shard_name in shard_names:
-            shard_path = base_path / "data" / "lexicon" / iso2 / shard_name
-            if not shard_path.exists():
-                continue
-
-            try:
-                with shard_path.open("r", encoding="utf-8") as f:
-                    raw_data = json.load(f)
-
-                if not isinstance(raw_data, Mapping):
-                    continue
-
-                for _, value in raw_data.items():
-                    entry_data = value[0] if isinstance(value, list) and value else value
-                    if not isinstance(entry_data, Mapping):
-                        continue
-
-                    features = dict(entry_data.get("features", {}) or {})
-                    facts = entry_data.get("facts")
-                    if isinstance(facts, Mapping):
-                        features.update(dict(facts))
-
-                    entry = LexiconEntry(
-                        lemma=str(entry_data.get("lemma", "unknown")),
-                        pos=str(entry_data.get("pos", "noun")),
-                        gf_fun=str(entry_data.get("gf_fun", "")),
-                        qid=(
-                            str(entry_data.get("qid") or entry_data.get("wnid")).strip()
-                            if (entry_data.get("qid") or entry_data.get("wnid"))
-                            else None
-                        ),
-                        source=str(entry_data.get("source", shard_name)),
-                        features=features,
-                    )
-
-                    if entry.qid:
-                        self._legacy_data[iso2][entry.qid] = entry
-                    self._legacy_data[iso2][entry.lemma.lower()] = entry
-
-                loaded_shards.append(shard_name)
-
-            except json.JSONDecodeError:
-                logger.error(
-                    "lexicon_json_corrupt",
-                    lang=iso2,
-                    path=str(shard_path),
-                )
-            except Exception as exc:
-                logger.error(
-                    "lexicon_load_failed",
-                    lang=iso2,
-                    shard=shard_name,
-                    error=str(exc),
-                )
-
-        self._legacy_loaded_langs.add(iso2)
-
-        if loaded_shards:
-            logger.info(
-                "lexicon_loaded_success",
-                lang=iso2,
-                total_entries=len(self._legacy_data[iso2]),
-                shards=loaded_shards,
-            )
-        else:
-            logger.warning("lexicon_no_shards_found", lang=iso2)
-
-    def _legacy_lookup(self, key: str, lang_code: str) -> Optional[LexiconEntry]:
-        if not key:
-            return None
-
-        iso2 = self.normalize_code(lang_code)
-        self._legacy_load_language(iso2)
-
-        lang_db = self._legacy_data.get(iso2)
-        if not lang_db:
-            return None
-
-        return lang_db.get(key) or lang_db.get(key.lower())
-
     # ------------------------------------------------------------------ #
     # Public API
     # ------------------------------------------------------------------ #
@@ -449,72 +391,43 @@ class LexiconRuntime:
         return self._get_adapter_index("en") is not None or bool(self._adapter_available_languages())
 
     def available_languages(self) -> List[str]:
-        langs = self._adapter_available_languages()
-        if langs:
-            return sorted(set(langs))
-        return sorted(self._legacy_loaded_langs)
+        return sorted(set(self._adapter_available_languages()))
 
     def load_language(self, lang_code: str) -> None:
         """
-        Warm whichever backend is currently authoritative/available.
-
-        Adapter-first:
-            build the per-language index via `app.adapters.persistence.lexicon`.
-
-        Fallback:
-            load the legacy raw shards.
+        Warm the shared per-language index via `app.adapters.persistence.lexicon`.
         """
         iso2 = self.normalize_code(lang_code)
 
         idx = self._get_adapter_index(iso2)
         if idx is not None:
             logger.debug("lexicon_adapter_warmed", lang=iso2)
-            return
-
-        self._legacy_load_language(iso2)
+        else:
+            logger.warning("lexicon_no_shards_found", lang=iso2)
 
     def lookup(self, key: str, lang_code: str) -> Optional[LexiconEntry]:
         """
-        Universal compatibility lookup.
-
-        Resolution strategy:
-        1. adapter QID lookup for QIDs,
-        2. adapter lemma lookup,
-        3. legacy raw-shard fallback.
+        Universal compatibility lookup (QID, then lemma, then entry key).
         """
         if not key:
             return None
 
-        iso2 = self.normalize_code(lang_code)
         raw_key = str(key).strip()
         if not raw_key:
             return None
 
-        adapter_hit: Any = None
-        if _QID_RE.match(raw_key):
-            adapter_hit = self._adapter_lookup_qid(iso2, raw_key)
-            if adapter_hit is not None:
-                return self._coerce_to_legacy_entry(
-                    adapter_hit,
-                    default_source="adapter.lookup_qid",
-                )
-
-        adapter_hit = self._adapter_lookup_lemma(iso2, raw_key)
-        if adapter_hit is not None:
-            return self._coerce_to_legacy_entry(
-                adapter_hit,
-                default_source="adapter.lookup_lemma",
-            )
-
-        return self._legacy_lookup(raw_key, iso2)
+        return self._coerce_to_legacy_entry(
+            self._find_raw(raw_key, self.normalize_code(lang_code)),
+            default_source="adapter.lookup",
+        )
 
     def lookup_qid(self, lang_code: str, qid: str) -> Optional[LexiconEntry]:
         if not qid:
             return None
         hit = self._adapter_lookup_qid(lang_code, qid)
-        if hit is not None:
-            return self._coerce_to_legacy_entry(hit, default_source="adapter.lookup_qid")
-        return self._legacy_lookup(qid, lang_code)
+        if hit is None:
+            hit = self._adapter_lookup_key(lang_code, qid)
+        return self._coerce_to_legacy_entry(hit, default_source="adapter.lookup_qid")
 
     def lookup_lemma(
         self,
@@ -526,12 +439,9 @@ class LexiconRuntime:
         if not lemma:
             return None
         hit = self._adapter_lookup_lemma(lang_code, lemma, pos=pos)
-        if hit is not None:
-            return self._coerce_to_legacy_entry(
-                hit,
-                default_source="adapter.lookup_lemma",
-            )
-        return self._legacy_lookup(lemma, lang_code)
+        if hit is None:
+            hit = self._adapter_lookup_key(lang_code, lemma)
+        return self._coerce_to_legacy_entry(hit, default_source="adapter.lookup_lemma")
 
     def get_entry(self, lang_code: str, qid: str) -> Optional[LexiconEntry]:
         """
@@ -543,13 +453,28 @@ class LexiconRuntime:
         """
         Return semantic facts from the compatibility entry shape.
 
-        This preserves the old `features[property_id]` lookup behavior.
+        This preserves the old `features[property_id]` lookup behavior, but
+        reads the shared store's entry directly instead of materialising a
+        `LexiconEntry` copy.
         """
-        entry = self.get_entry(lang_code, qid)
-        if not entry or not entry.features:
+        if not qid:
+            return []
+
+        raw = self._find_raw(str(qid).strip(), self.normalize_code(lang_code))
+        if raw is None:
             return []
 
-        value = entry.features.get(property_id, [])
+        if isinstance(raw, LexiconEntry):
+            value = raw.features.get(property_id, [])
+        else:
+            extra = getattr(raw, "extra", None)
+            if not isinstance(extra, Mapping):
+                return []
+            facts = extra.get("facts")
+            value = facts.get(property_id) if isinstance(facts, Mapping) else None
+            if value is None:
+                value = extra.get(property_id, [])
+
         if value is None:
             return []
         if isinstance(value, list):
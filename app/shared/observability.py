@@ -1,12 +1,15 @@
 # app\shared\observability.py
-from fastapi import FastAPI
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from app.shared.config import settings
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+
 def setup_observability(app: FastAPI):
     """
     Configures OpenTelemetry for the application.
@@ -15,6 +18,11 @@ def setup_observability(app: FastAPI):
     2. Configures an Exporter (Console for Dev, can be swapped for OTLP/Jaeger).
     3. Auto-instruments the FastAPI application to trace all HTTP requests.
     """
+    # Imported here: use cases import this module for `get_tracer` only, and
+    # should not pay for the SDK + FastAPI instrumentation at import time.
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
     
     # 1. Define Resource (Service Name identity)
     resource = Resource.create(attributes={
@@ -1,10 +1,12 @@
 # app/shared/resilience.py
 import time
 import asyncio
+import threading
 import structlog
+from collections import deque
 from enum import Enum
 from functools import wraps
-from typing import Callable, Any, Dict, Coroutine
+from typing import Callable, Any, Deque, Dict, Coroutine, Optional, Tuple
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -13,6 +15,7 @@ from tenacity import (
     before_sleep_log
 )
 from app.shared.config import settings
+from app.shared.telemetry import record_circuit_transition
 
 logger = structlog.get_logger()
 
@@ -38,97 +41,233 @@ class CircuitState(str, Enum):
 
 class CircuitBreaker:
     """
-    Implements the Circuit Breaker pattern.
+    Implements the Circuit Breaker pattern over a sliding window.
     
     Prevents the system from repeatedly trying to execute an operation 
     that is likely to fail, allowing the external service time to recover.
+
+    - CLOSED: outcomes of the last `window_size` calls (and no older than
+      `window_sec`) are kept. Once at least `minimum_calls` are in the window,
+      the breaker trips if the failure rate reaches `failure_rate_threshold`,
+      or the share of calls slower than `slow_call_sec` reaches
+      `slow_call_rate_threshold`.
+    - OPEN: calls fail fast with CircuitBreakerOpenError for `recovery_timeout`.
+    - HALF_OPEN: at most `half_open_max_calls` probes run at a time; everyone
+      else still fails fast. That many successful probes close the circuit,
+      any failed probe re-opens it.
+
+    State is guarded by a lock that is never held across an await, so one
+    breaker can be shared by coroutines and threads alike.
     """
-    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: int = 30):
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        *,
+        window_size: int = 20,
+        window_sec: float = 60.0,
+        failure_rate_threshold: float = 0.5,
+        slow_call_sec: Optional[float] = None,
+        slow_call_rate_threshold: float = 1.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.name = name
-        self.failure_threshold = failure_threshold
+        # Calls needed in the window before rates are evaluated.
+        self.minimum_calls = max(1, int(failure_threshold))
         self.recovery_timeout = recovery_timeout
-        
-        self.state = CircuitState.CLOSED
-        self.failure_count = 0
-        self.last_failure_time = 0.0
+        self.window_size = max(self.minimum_calls, int(window_size))
+        self.window_sec = window_sec
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_sec = slow_call_sec if slow_call_sec and slow_call_sec > 0 else None
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.half_open_max_calls = max(1, int(half_open_max_calls))
+        self.clock = clock
 
-    def call(self, func: Callable, *args, **kwargs) -> Any:
-        """Executes the function (Synchronously) if the circuit is CLOSED or HALF-OPEN."""
-        self._check_state()
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        # (finished_at, failed, slow)
+        self._window: Deque[Tuple[float, bool, bool]] = deque(maxlen=self.window_size)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    # Back-compat alias for the old cumulative counter's threshold.
+    @property
+    def failure_threshold(self) -> int:
+        return self.minimum_calls
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
 
+    @state.setter
+    def state(self, value: Any) -> None:
+        """Force a state (operational override, tests)."""
+        with self._lock:
+            self._transition_to(CircuitState(value))
+
+    @property
+    def failure_count(self) -> int:
+        with self._lock:
+            return sum(1 for _, failed, _ in self._window if failed)
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Executes the function (Synchronously) if the circuit allows it."""
+        probe = self._acquire()
+        started = self.clock()
         try:
             result = func(*args, **kwargs)
-            self._handle_success()
-            return result
-        except Exception as e:
-            self._handle_failure()
-            raise e
+        except Exception:
+            self._record(probe, failed=True, duration=self.clock() - started)
+            raise
+        except BaseException:
+            self._abandon(probe)
+            raise
+        self._record(probe, failed=False, duration=self.clock() - started)
+        return result
 
     async def a_call(self, func: Callable[..., Coroutine[Any, Any, Any]], *args, **kwargs) -> Any:
         """
-        Executes an async function (Coroutine) if the circuit is CLOSED or HALF-OPEN.
+        Executes an async function (Coroutine) if the circuit allows it.
         This is the non-blocking equivalent of call().
         """
-        self._check_state()
-
+        probe = self._acquire()
+        started = self.clock()
         try:
-            # Await the coroutine
             result = await func(*args, **kwargs)
-            self._handle_success()
-            return result
-        except Exception as e:
-            self._handle_failure()
-            raise e
-
-    def _check_state(self):
-        """Internal logic to check if the circuit allows execution."""
-        if self.state == CircuitState.OPEN:
-            # Check if enough time has passed to try again (Half-Open)
-            if time.time() - self.last_failure_time > self.recovery_timeout:
+        except Exception:
+            self._record(probe, failed=True, duration=self.clock() - started)
+            raise
+        except BaseException:
+            # Cancelled: says nothing about the service; free the probe slot.
+            self._abandon(probe)
+            raise
+        self._record(probe, failed=False, duration=self.clock() - started)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._prune(self.clock())
+            calls = len(self._window)
+            return {
+                "name": self.name,
+                "state": self._state.value,
+                "calls": calls,
+                "failure_rate": self._rate(1),
+                "slow_call_rate": self._rate(2),
+                "probes_in_flight": self._probes_in_flight,
+            }
+
+    # -- internals (call with self._lock held unless noted) --------------
+
+    def _acquire(self) -> bool:
+        """Admit a call or raise CircuitBreakerOpenError. Returns True for a half-open probe."""
+        with self._lock:
+            now = self.clock()
+            if self._state == CircuitState.OPEN:
+                remaining = self.recovery_timeout - (now - self._opened_at)
+                if remaining > 0:
+                    raise CircuitBreakerOpenError(self.name, round(remaining, 3))
                 self._transition_to(CircuitState.HALF_OPEN)
-            else:
-                # Fail fast
-                raise CircuitBreakerOpenError(self.name, self.recovery_timeout)
-
-    def _handle_success(self):
-        """Called when a request succeeds. Closes the circuit if it was recovering."""
-        if self.state == CircuitState.HALF_OPEN:
-            self._reset()
-
-    def _handle_failure(self):
-        """Called when a request fails. Increments counter or trips the breaker."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.state == CircuitState.HALF_OPEN:
-            # If we fail immediately after trying to recover, go back to OPEN
-            self._transition_to(CircuitState.OPEN)
-        elif self.failure_count >= self.failure_threshold:
-            self._transition_to(CircuitState.OPEN)
+            if self._state == CircuitState.HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_max_calls:
+                    raise CircuitBreakerOpenError(self.name, 0)
+                self._probes_in_flight += 1
+                return True
+            return False
 
-    def _transition_to(self, new_state: CircuitState):
-        self.state = new_state
-        logger.warning("circuit_breaker_state_change", 
-                       service=self.name, 
-                       state=new_state, 
-                       failures=self.failure_count)
+    def _record(self, probe: bool, *, failed: bool, duration: float) -> None:
+        with self._lock:
+            now = self.clock()
+            slow = self.slow_call_sec is not None and duration >= self.slow_call_sec
+            if probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if self._state != CircuitState.HALF_OPEN:
+                    return  # forced elsewhere meanwhile
+                if failed or slow:
+                    self._transition_to(CircuitState.OPEN)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._transition_to(CircuitState.CLOSED)
+                return
+
+            if self._state != CircuitState.CLOSED:
+                return  # a call admitted before the circuit opened
+            self._window.append((now, failed, slow))
+            self._prune(now)
+            if len(self._window) < self.minimum_calls:
+                return
+            if self._rate(1) >= self.failure_rate_threshold or (
+                self.slow_call_sec is not None and self._rate(2) >= self.slow_call_rate_threshold
+            ):
+                self._transition_to(CircuitState.OPEN)
+
+    def _abandon(self, probe: bool) -> None:
+        if probe:
+            with self._lock:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
 
-    def _reset(self):
-        self.failure_count = 0
-        self.state = CircuitState.CLOSED
-        logger.info("circuit_breaker_recovered", service=self.name)
+    def _prune(self, now: float) -> None:
+        if self.window_sec and self.window_sec > 0:
+            horizon = now - self.window_sec
+            while self._window and self._window[0][0] < horizon:
+                self._window.popleft()
+
+    def _rate(self, index: int) -> float:
+        if not self._window:
+            return 0.0
+        return sum(1 for entry in self._window if entry[index]) / len(self._window)
+
+    def _transition_to(self, new_state: CircuitState):
+        old_state = self._state
+        failures = sum(1 for _, failed, _ in self._window if failed)
+        self._state = new_state
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if new_state == CircuitState.OPEN:
+            self._opened_at = self.clock()
+        elif new_state == CircuitState.CLOSED:
+            self._window.clear()
+        if old_state == new_state:
+            return
+        record_circuit_transition(self.name, old_state.value, new_state.value)
+        if new_state == CircuitState.CLOSED:
+            logger.info("circuit_breaker_recovered", service=self.name)
+        else:
+            logger.warning("circuit_breaker_state_change", 
+                           service=self.name, 
+                           state=new_state, 
+                           failures=failures)
 
 # Registry to hold singleton instances of breakers
 _breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
 
-def get_circuit_breaker(service_name: str) -> CircuitBreaker:
-    if service_name not in _breakers:
-        _breakers[service_name] = CircuitBreaker(
-            name=service_name,
-            failure_threshold=5,
-            recovery_timeout=settings.WIKIDATA_TIMEOUT
-        )
-    return _breakers[service_name]
+def get_circuit_breaker(service_name: str, **overrides: Any) -> CircuitBreaker:
+    """
+    Shared breaker for `service_name`. Defaults come from the CIRCUIT_BREAKER_*
+    settings; `overrides` (CircuitBreaker keyword arguments) apply on first
+    creation only.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(service_name)
+        if breaker is None:
+            options: Dict[str, Any] = {
+                "failure_threshold": settings.CIRCUIT_BREAKER_MIN_CALLS,
+                "recovery_timeout": settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT_SEC,
+                "window_size": settings.CIRCUIT_BREAKER_WINDOW_SIZE,
+                "window_sec": settings.CIRCUIT_BREAKER_WINDOW_SEC,
+                "failure_rate_threshold": settings.CIRCUIT_BREAKER_FAILURE_RATE,
+                "slow_call_sec": settings.CIRCUIT_BREAKER_SLOW_CALL_SEC,
+                "slow_call_rate_threshold": settings.CIRCUIT_BREAKER_SLOW_CALL_RATE,
+                "half_open_max_calls": settings.CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS,
+            }
+            options.update(overrides)
+            breaker = _breakers[service_name] = CircuitBreaker(name=service_name, **options)
+        return breaker
 
 # --- 3. Retry Policies (Tenacity) ---
 
@@ -1,17 +1,23 @@
 # app\shared\telemetry.py
 # app/shared/telemetry.py
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-from opentelemetry import trace
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry import metrics, trace
 
+# The SDK, the OTLP exporter and the FastAPI instrumentation are imported
+# inside setup_telemetry / instrument_fastapi: the recorders below are used
+# from core code and CLI tools that should not pay for them at import time.
 from app.shared.config import settings
 
+if TYPE_CHECKING:
+    from app.shared.timing import StageTimer
+
+try:
+    from prometheus_client import Histogram as _PromHistogram
+except ImportError:
+    _PromHistogram = None
+
 logger = logging.getLogger(__name__)
 
 def setup_telemetry(app_name: str = settings.OTEL_SERVICE_NAME):
@@ -25,6 +31,11 @@ def setup_telemetry(app_name: str = settings.OTEL_SERVICE_NAME):
 
     logger.info(f"Initializing Telemetry for service: {app_name}")
 
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
     # 1. Define Resource (Service Identity)
     resource = Resource.create(attributes={
         "service.name": app_name,
@@ -52,10 +63,239 @@ def instrument_fastapi(app):
     Auto-instruments the FastAPI application to trace incoming HTTP requests.
     """
     if settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
         FastAPIInstrumentor.instrument_app(app)
 
 def get_tracer(name: str):
     """
     Utility to get a tracer for manual instrumentation in specific modules.
     """
-    return trace.get_tracer(name)
\ No newline at end of file
+    return trace.get_tracer(name)
+
+
+# --- Generation stage timings ---
+
+_STAGE_BUCKETS_SEC = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_stage_tracer = trace.get_tracer("app.generation.stages")
+_stage_histogram = metrics.get_meter("app.generation").create_histogram(
+    "architect.generation.stage.duration",
+    unit="ms",
+    description="Duration of generation pipeline stages and realizer backend attempts.",
+)
+
+if _PromHistogram is not None:
+    _prom_stage_histogram = _PromHistogram(
+        "architect_generation_stage_duration_seconds",
+        "Duration of generation pipeline stages and realizer backend attempts.",
+        ("stage", "backend", "outcome"),
+        buckets=_STAGE_BUCKETS_SEC,
+    )
+else:
+    _prom_stage_histogram = None
+
+
+def record_stage_timings(timer: "StageTimer", *, lang_code: str = "") -> None:
+    """
+    Export the spans collected by a StageTimer.
+
+    - OTel histogram `architect.generation.stage.duration` (no-op without a MeterProvider)
+    - Prometheus histogram `architect_generation_stage_duration_seconds` when
+      prometheus_client is installed
+    - OTel child spans of the current span, back-dated to the recorded times
+      (only when the current span is recording)
+    """
+    if not timer.spans:
+        return
+
+    export_spans = trace.get_current_span().is_recording()
+
+    for span in timer.spans:
+        backend = str(span.attributes.get("backend") or "")
+        labels = {"stage": span.name, "backend": backend, "outcome": span.outcome}
+
+        _stage_histogram.record(span.duration_ms, attributes={**labels, "lang_code": lang_code})
+        if _prom_stage_histogram is not None:
+            _prom_stage_histogram.labels(**labels).observe(span.duration_ms / 1000.0)
+
+        if export_spans:
+            otel_span = _stage_tracer.start_span(
+                f"generation.{span.name}",
+                start_time=timer.to_wall_ns(span.start_ns),
+                attributes={f"app.{k}": str(v) for k, v in labels.items() if v},
+            )
+            otel_span.end(end_time=timer.to_wall_ns(span.end_ns))
+
+
+# --- Build scheduler ---
+
+_BUILD_BUCKETS_SEC = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0)
+
+_build_meter = metrics.get_meter("app.build")
+_build_latency_histogram = _build_meter.create_histogram(
+    "architect.build.latency",
+    unit="s",
+    description="Build request latency: queue wait, build run and end-to-end.",
+)
+# Synchronous gauges arrived in opentelemetry-api 1.23.
+_create_gauge = getattr(_build_meter, "create_gauge", None)
+_build_queue_gauge = (
+    _create_gauge("architect.build.queue_depth", description="Pending (coalesced) build requests per priority.")
+    if _create_gauge is not None
+    else None
+)
+
+if _PromHistogram is not None:
+    from prometheus_client import Gauge as _PromGauge
+
+    _prom_build_latency = _PromHistogram(
+        "architect_build_latency_seconds",
+        "Build request latency: queue wait, build run and end-to-end.",
+        ("phase", "priority", "outcome"),
+        buckets=_BUILD_BUCKETS_SEC,
+    )
+    _prom_build_queue = _PromGauge(
+        "architect_build_queue_depth",
+        "Pending (coalesced) build requests per priority.",
+        ("priority",),
+    )
+else:
+    _prom_build_latency = None
+    _prom_build_queue = None
+
+
+def record_build_queue_depth(depth: Dict[str, int]) -> None:
+    for priority, value in depth.items():
+        if _build_queue_gauge is not None:
+            _build_queue_gauge.set(value, attributes={"priority": priority})
+        if _prom_build_queue is not None:
+            _prom_build_queue.labels(priority=priority).set(value)
+
+
+def record_build_latency(phase: str, seconds: float, *, priority: str, outcome: str = "ok") -> None:
+    """`phase` is one of: queue (request -> claim), build (claim -> done), total."""
+    labels = {"phase": phase, "priority": priority, "outcome": outcome}
+    _build_latency_histogram.record(max(0.0, seconds), attributes=labels)
+    if _prom_build_latency is not None:
+        _prom_build_latency.labels(**labels).observe(max(0.0, seconds))
+
+
+# --- Admission control ---
+
+_QUEUE_BUCKETS_SEC = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_admission_meter = metrics.get_meter("app.admission")
+_admission_counter = _admission_meter.create_counter(
+    "architect.admission.requests",
+    description="Generation requests admitted or shed by admission control.",
+)
+_admission_queue_histogram = _admission_meter.create_histogram(
+    "architect.admission.queue_time",
+    unit="s",
+    description="Time admitted requests waited for a concurrency slot.",
+)
+_create_admission_gauge = getattr(_admission_meter, "create_gauge", None)
+_admission_gauges = (
+    {
+        name: _create_admission_gauge(f"architect.admission.{name}", description=desc)
+        for name, desc in (
+            ("limit", "Current (adaptive) concurrency limit per route."),
+            ("inflight", "Requests holding a concurrency slot per route."),
+            ("queued", "Requests waiting for a concurrency slot per route."),
+        )
+    }
+    if _create_admission_gauge is not None
+    else {}
+)
+
+if _PromHistogram is not None:
+    from prometheus_client import Counter as _PromCounter
+
+    _prom_admission_requests = _PromCounter(
+        "architect_admission_requests_total",
+        "Generation requests admitted or shed by admission control.",
+        ("route", "outcome", "reason"),
+    )
+    _prom_admission_queue = _PromHistogram(
+        "architect_admission_queue_seconds",
+        "Time admitted requests waited for a concurrency slot.",
+        ("route",),
+        buckets=_QUEUE_BUCKETS_SEC,
+    )
+    _prom_admission_state = _PromGauge(
+        "architect_admission_state",
+        "Admission control state per route (limit, inflight, queued).",
+        ("route", "field"),
+    )
+else:
+    _prom_admission_requests = None
+    _prom_admission_queue = None
+    _prom_admission_state = None
+
+
+def record_admission(route: str, outcome: str, *, reason: str = "", queue_sec: Optional[float] = None) -> None:
+    """`outcome` is `admitted` or `shed` (with `reason`: queue_full, deadline, deadline_expired)."""
+    labels = {"route": route, "outcome": outcome, "reason": reason}
+    _admission_counter.add(1, attributes=labels)
+    if _prom_admission_requests is not None:
+        _prom_admission_requests.labels(**labels).inc()
+    if queue_sec is not None:
+        _admission_queue_histogram.record(max(0.0, queue_sec), attributes={"route": route})
+        if _prom_admission_queue is not None:
+            _prom_admission_queue.labels(route=route).observe(max(0.0, queue_sec))
+
+
+def record_admission_limit(route: str, *, limit: int, inflight: int, queued: int) -> None:
+    for name, value in (("limit", limit), ("inflight", inflight), ("queued", queued)):
+        gauge = _admission_gauges.get(name)
+        if gauge is not None:
+            gauge.set(value, attributes={"route": route})
+        if _prom_admission_state is not None:
+            _prom_admission_state.labels(route=route, field=name).set(value)
+
+
+# --- Circuit breakers ---
+
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+_circuit_meter = metrics.get_meter("app.resilience")
+_circuit_transitions = _circuit_meter.create_counter(
+    "architect.circuit_breaker.transitions",
+    description="Circuit breaker state transitions.",
+)
+_create_circuit_gauge = getattr(_circuit_meter, "create_gauge", None)
+_circuit_state_gauge = (
+    _create_circuit_gauge(
+        "architect.circuit_breaker.state",
+        description="Circuit breaker state (0 closed, 1 half-open, 2 open).",
+    )
+    if _create_circuit_gauge is not None
+    else None
+)
+
+if _PromHistogram is not None:
+    _prom_circuit_transitions = _PromCounter(
+        "architect_circuit_breaker_transitions_total",
+        "Circuit breaker state transitions.",
+        ("service", "from_state", "to_state"),
+    )
+    _prom_circuit_state = _PromGauge(
+        "architect_circuit_breaker_state",
+        "Circuit breaker state (0 closed, 1 half-open, 2 open).",
+        ("service",),
+    )
+else:
+    _prom_circuit_transitions = None
+    _prom_circuit_state = None
+
+
+def record_circuit_transition(service: str, from_state: str, to_state: str) -> None:
+    _circuit_transitions.add(1, attributes={"service": service, "from_state": from_state, "to_state": to_state})
+    value = _CIRCUIT_STATE_VALUES.get(to_state, -1)
+    if _circuit_state_gauge is not None:
+        _circuit_state_gauge.set(value, attributes={"service": service})
+    if _prom_circuit_transitions is not None:
+        _prom_circuit_transitions.labels(service=service, from_state=from_state, to_state=to_state).inc()
+    if _prom_circuit_state is not None:
+        _prom_circuit_state.labels(service=service).set(value)
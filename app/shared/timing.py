@@ -0,0 +1,144 @@
+# app/shared/timing.py
+"""
+Lightweight per-request stage timing.
+
+A `StageTimer` collects monotonic-clock spans for one generation request
+(planner, lexical resolver, realizer, and every realizer backend attempt,
+including failed fallbacks). The active timer travels through a ContextVar so
+deeply nested components (e.g. `ConstructionRealizer`) can record spans
+without threading a parameter through every call signature.
+
+When no timer is active, `stage_span()` returns a shared no-op context manager
+and `current_stage_timer()` returns None, so instrumented code paths cost one
+ContextVar lookup.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, ContextManager, Iterator, Optional
+
+_NOOP_SPAN: ContextManager[None] = nullcontext()
+
+_current_timer: ContextVar[Optional["StageTimer"]] = ContextVar(
+    "architect_stage_timer",
+    default=None,
+)
+
+
+@dataclass(slots=True)
+class StageSpan:
+    """One timed stage or backend attempt."""
+
+    name: str
+    start_ns: int
+    end_ns: int
+    outcome: str = "ok"
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000.0
+
+    def to_dict(self, origin_ns: int) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "stage": self.name,
+            "offset_ms": round((self.start_ns - origin_ns) / 1_000_000.0, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            "outcome": self.outcome,
+        }
+        if self.attributes:
+            payload.update(self.attributes)
+        return payload
+
+
+class StageTimer:
+    """
+    Per-request span recorder.
+
+    Spans use `time.monotonic_ns()`; a wall-clock anchor taken at construction
+    lets exporters convert them into absolute timestamps (e.g. OTel spans).
+    """
+
+    __slots__ = ("spans", "origin_ns", "wall_origin_ns")
+
+    def __init__(self) -> None:
+        self.spans: list[StageSpan] = []
+        self.origin_ns = time.monotonic_ns()
+        self.wall_origin_ns = time.time_ns()
+
+    def record(
+        self,
+        name: str,
+        start_ns: int,
+        end_ns: int,
+        *,
+        outcome: str = "ok",
+        **attributes: Any,
+    ) -> StageSpan:
+        span = StageSpan(
+            name=name,
+            start_ns=start_ns,
+            end_ns=end_ns,
+            outcome=outcome,
+            attributes=attributes,
+        )
+        self.spans.append(span)
+        return span
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[None]:
+        start = time.monotonic_ns()
+        outcome = "ok"
+        try:
+            yield
+        except BaseException:
+            outcome = "error"
+            raise
+        finally:
+            self.record(
+                name,
+                start,
+                time.monotonic_ns(),
+                outcome=outcome,
+                **attributes,
+            )
+
+    def to_wall_ns(self, monotonic_ns: int) -> int:
+        return self.wall_origin_ns + (monotonic_ns - self.origin_ns)
+
+    def as_debug(self) -> list[dict[str, Any]]:
+        return [span.to_dict(self.origin_ns) for span in self.spans]
+
+
+def current_stage_timer() -> Optional[StageTimer]:
+    return _current_timer.get()
+
+
+def activate_stage_timer(timer: Optional[StageTimer]) -> Token:
+    return _current_timer.set(timer)
+
+
+def deactivate_stage_timer(token: Token) -> None:
+    _current_timer.reset(token)
+
+
+def stage_span(name: str, **attributes: Any) -> ContextManager[None]:
+    """Time `name` on the active timer, or do nothing if timing is disabled."""
+    timer = _current_timer.get()
+    if timer is None:
+        return _NOOP_SPAN
+    return timer.span(name, **attributes)
+
+
+__all__ = [
+    "StageSpan",
+    "StageTimer",
+    "activate_stage_timer",
+    "current_stage_timer",
+    "deactivate_stage_timer",
+    "stage_span",
+]
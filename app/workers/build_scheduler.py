@@ -0,0 +1,442 @@
+# app/workers/build_scheduler.py
+"""
+Redis-backed scheduler for grammar builds.
+
+Every build request (BUILD_REQUESTED events and `build_language` jobs) is
+submitted here instead of triggering its own index + PGF rebuild:
+
+- Coalescing: one pending entry per language. The first request opens a
+  debounce window (`debounce_sec`); later requests inside it merge into the
+  same entry (strategy upgraded to a clean build if any asked for one,
+  requester/event ids accumulated).
+- Priority: `interactive` entries are claimed before `bulk` (onboarding)
+  ones; an interactive request for a language pending as bulk promotes it.
+- Batching: `claim_batch` pops every due language of the highest ready
+  priority whose strategy maps to the same orchestrator run, up to
+  `max_batch` languages, so they compile in one multi-language build.
+- Single flight: `acquire_lock` / `release_lock` keep one build running
+  across the worker fleet; requests arriving meanwhile wait for the next
+  batch instead of racing the PGF link step.
+- At-least-once: claiming moves each request to the in-flight hash in the
+  same transaction. `complete` drops it after a successful build; `requeue`
+  merges it back into pending (with backoff, up to `max_attempts`) after a
+  failed one, and `requeue_inflight` does the same for entries left behind
+  by a worker that died mid-build (call it while holding the fleet lock).
+
+Layout (all under `namespace`):
+
+    <ns>:pending:<priority>   ZSET  lang -> due_at (epoch seconds)
+    <ns>:req:<lang>           STR   merged request JSON
+    <ns>:inflight             HASH  lang -> claimed request JSON
+    <ns>:lock                 STR   owner token, PX = lock TTL
+
+Works against redis.asyncio, ARQ's pool and fakeredis (bytes or str replies).
+"""
+
+from __future__ import annotations
+
+import json
+import secrets
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import structlog
+
+try:
+    from redis.exceptions import WatchError
+except ImportError:  # pragma: no cover - redis is a hard dependency of the worker
+    WatchError = Exception  # type: ignore[misc,assignment]
+
+logger = structlog.get_logger()
+
+
+class BuildPriority(str, Enum):
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+# Claim order.
+PRIORITY_ORDER: Tuple[BuildPriority, ...] = (BuildPriority.INTERACTIVE, BuildPriority.BULK)
+
+_CLEAN_STRATEGIES = {"full", "clean"}
+_MAX_IDS = 50
+
+
+def normalize_priority(value: Any) -> BuildPriority:
+    try:
+        return BuildPriority(str(value or "").strip().lower())
+    except ValueError:
+        return BuildPriority.INTERACTIVE
+
+
+def merge_strategy(current: str, incoming: str) -> str:
+    """A clean (`full`) request wins; otherwise the latest strategy applies."""
+    cur = (current or "").strip().lower()
+    new = (incoming or "").strip().lower()
+    if cur in _CLEAN_STRATEGIES and new not in _CLEAN_STRATEGIES:
+        return current
+    return incoming or current
+
+
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, (bytes, bytearray)) else str(value)
+
+
+@dataclass
+class BuildBatch:
+    """Languages claimed together for one orchestrator run."""
+
+    langs: List[str]
+    strategy: str
+    priority: BuildPriority
+    requests: List[Dict[str, Any]] = field(default_factory=list)
+    claimed_at: float = 0.0
+
+    def requested_at(self, lang: str) -> Optional[float]:
+        for req in self.requests:
+            if req.get("lang_code") == lang:
+                return req.get("requested_at")
+        return None
+
+
+class BuildScheduler:
+    def __init__(
+        self,
+        redis: Any,
+        *,
+        debounce_sec: float = 5.0,
+        max_batch: int = 16,
+        lock_ttl_sec: int = 3600,
+        max_attempts: int = 3,
+        retry_delay_sec: float = 30.0,
+        namespace: str = "ska:build",
+        strategy_key: Optional[Callable[[str], Any]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.redis = redis
+        self.debounce_sec = max(0.0, float(debounce_sec))
+        self.max_batch = max(1, int(max_batch))
+        self.lock_ttl_ms = max(1, int(lock_ttl_sec)) * 1000
+        self.max_attempts = max(1, int(max_attempts))
+        # Doubles with every failed attempt of the same request.
+        self.retry_delay_sec = max(0.0, float(retry_delay_sec))
+        self.namespace = namespace
+        # Maps a strategy to what the orchestrator actually runs; languages
+        # are only batched when this matches.
+        self.strategy_key = strategy_key or (lambda s: (s or "").strip().lower())
+        self.clock = clock
+        self._lock_token: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+    def _pending_key(self, priority: BuildPriority) -> str:
+        return f"{self.namespace}:pending:{priority.value}"
+
+    def _request_key(self, lang: str) -> str:
+        return f"{self.namespace}:req:{lang}"
+
+    @property
+    def _inflight_key(self) -> str:
+        return f"{self.namespace}:inflight"
+
+    @property
+    def _lock_key(self) -> str:
+        return f"{self.namespace}:lock"
+
+    # ------------------------------------------------------------------
+    # Submit
+    # ------------------------------------------------------------------
+    async def submit(self, request: Mapping[str, Any]) -> bool:
+        """
+        Record a build request. Returns True if it opened a new pending entry,
+        False if it was coalesced into one already waiting.
+        """
+        lang = str(request.get("lang_code") or "").strip()
+        if not lang:
+            raise ValueError("build request is missing lang_code")
+        priority = normalize_priority(request.get("priority"))
+        strategy = str(request.get("strategy") or "fast")
+        req_key = self._request_key(lang)
+
+        while True:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(req_key)
+                    raw = await pipe.get(req_key)
+                    now = self.clock()
+                    existing = json.loads(_text(raw)) if raw else None
+
+                    if existing is None:
+                        merged: Dict[str, Any] = {
+                            "lang_code": lang,
+                            "strategy": strategy,
+                            "priority": priority.value,
+                            "requested_at": now,
+                            "count": 1,
+                            "event_ids": [],
+                            "requester_ids": [],
+                            "trace_ids": [],
+                        }
+                        previous_priority = None
+                    else:
+                        merged = existing
+                        previous_priority = normalize_priority(existing.get("priority"))
+                        merged["strategy"] = merge_strategy(str(existing.get("strategy") or ""), strategy)
+                        merged["count"] = int(existing.get("count") or 0) + 1
+                        if priority is BuildPriority.INTERACTIVE:
+                            merged["priority"] = priority.value
+
+                    for src, dst in (
+                        ("event_id", "event_ids"),
+                        ("correlation_id", "event_ids"),
+                        ("requester_id", "requester_ids"),
+                        ("trace_id", "trace_ids"),
+                    ):
+                        value = request.get(src)
+                        if value and value not in merged[dst]:
+                            merged[dst] = (merged[dst] + [value])[-_MAX_IDS:]
+
+                    final_priority = normalize_priority(merged["priority"])
+                    pipe.multi()
+                    pipe.set(req_key, json.dumps(merged, separators=(",", ":")))
+                    if previous_priority is not None and previous_priority is not final_priority:
+                        # Promotion: the window restarts on the faster lane.
+                        pipe.zrem(self._pending_key(previous_priority), lang)
+                        pipe.zadd(self._pending_key(final_priority), {lang: now + self.debounce_sec})
+                    else:
+                        # NX keeps the first due time, so a stream of edits
+                        # cannot postpone the build indefinitely.
+                        pipe.zadd(self._pending_key(final_priority), {lang: now + self.debounce_sec}, nx=True)
+                    await pipe.execute()
+                    break
+                except WatchError:
+                    continue  # claimed or merged concurrently; re-read
+
+        coalesced = existing is not None
+        logger.info(
+            "build_request_scheduled",
+            lang=lang,
+            priority=merged["priority"],
+            strategy=merged["strategy"],
+            coalesced=coalesced,
+            pending_requests=merged["count"],
+        )
+        return not coalesced
+
+    # ------------------------------------------------------------------
+    # Claim
+    # ------------------------------------------------------------------
+    async def claim_batch(self) -> Optional[BuildBatch]:
+        """
+        Pop the next batch of due languages, highest priority first.
+
+        Only languages whose strategy runs the same orchestrator build as the
+        first due one are taken; the rest stay pending for a later batch.
+        """
+        now = self.clock()
+        for priority in PRIORITY_ORDER:
+            pending_key = self._pending_key(priority)
+            due = await self.redis.zrangebyscore(pending_key, "-inf", now)
+            if not due:
+                continue
+
+            batch: Optional[BuildBatch] = None
+            for raw_lang in due:
+                if batch is not None and len(batch.langs) >= self.max_batch:
+                    break
+                lang = _text(raw_lang)
+                req = await self._peek_request(lang)
+                strategy = str(req.get("strategy") or "fast")
+                if batch is not None and self.strategy_key(strategy) != self.strategy_key(batch.strategy):
+                    continue
+
+                claimed = await self._claim(pending_key, lang)
+                if claimed is None:
+                    continue  # another process claimed it first
+                claimed.setdefault("lang_code", lang)
+                claimed.setdefault("strategy", strategy)
+
+                if batch is None:
+                    batch = BuildBatch(
+                        langs=[],
+                        strategy=str(claimed["strategy"]),
+                        priority=priority,
+                        claimed_at=now,
+                    )
+                batch.langs.append(lang)
+                batch.requests.append(claimed)
+
+            if batch is not None:
+                logger.info(
+                    "build_batch_claimed",
+                    langs=batch.langs,
+                    priority=priority.value,
+                    strategy=batch.strategy,
+                    coalesced_requests=sum(int(r.get("count") or 1) for r in batch.requests),
+                )
+                return batch
+        return None
+
+    async def _peek_request(self, lang: str) -> Dict[str, Any]:
+        raw = await self.redis.get(self._request_key(lang))
+        return json.loads(_text(raw)) if raw else {}
+
+    async def _claim(self, pending_key: str, lang: str) -> Optional[Dict[str, Any]]:
+        req_key = self._request_key(lang)
+        while True:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(req_key, pending_key)
+                    if await pipe.zscore(pending_key, lang) is None:
+                        return None  # another process claimed it first
+                    raw = await pipe.get(req_key)
+                    request = json.loads(_text(raw)) if raw else {}
+                    request.setdefault("lang_code", lang)
+                    pipe.multi()
+                    pipe.zrem(pending_key, lang)
+                    pipe.delete(req_key)
+                    pipe.hset(self._inflight_key, lang, json.dumps(request, separators=(",", ":")))
+                    await pipe.execute()
+                    return request
+                except WatchError:
+                    continue  # merged or claimed concurrently; re-read
+
+    # ------------------------------------------------------------------
+    # Completion / retry
+    # ------------------------------------------------------------------
+    async def complete(self, batch: BuildBatch) -> None:
+        """Drop the batch's in-flight requests after a successful build."""
+        if batch.langs:
+            await self.redis.hdel(self._inflight_key, *batch.langs)
+
+    async def requeue(self, batch: BuildBatch) -> List[str]:
+        """
+        Return the batch's in-flight requests to pending after a failed build.
+
+        Returns the languages scheduled for another attempt; requests that
+        have used up `max_attempts` are dropped with an error log.
+        """
+        retried: List[str] = []
+        for lang in batch.langs:
+            if await self._requeue_lang(lang):
+                retried.append(lang)
+        return retried
+
+    async def requeue_inflight(self) -> List[str]:
+        """
+        Requeue every in-flight request. Only safe while holding the fleet
+        lock: with no build running, whatever is still in flight was claimed
+        by a worker that died (or was cancelled) before completing it.
+        """
+        langs = [_text(lang) for lang in await self.redis.hkeys(self._inflight_key)]
+        retried = [lang for lang in langs if await self._requeue_lang(lang)]
+        if langs:
+            logger.warning("build_inflight_recovered", langs=langs, requeued=retried)
+        return retried
+
+    async def _requeue_lang(self, lang: str) -> bool:
+        req_key = self._request_key(lang)
+        while True:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(req_key, self._inflight_key)
+                    raw_claimed = await pipe.hget(self._inflight_key, lang)
+                    if raw_claimed is None:
+                        return False  # already completed or requeued
+                    claimed = json.loads(_text(raw_claimed))
+                    attempts = int(claimed.get("attempts") or 0) + 1
+                    if attempts >= self.max_attempts:
+                        pipe.multi()
+                        pipe.hdel(self._inflight_key, lang)
+                        await pipe.execute()
+                        logger.error("build_request_dropped", lang=lang, attempts=attempts)
+                        return False
+
+                    raw = await pipe.get(req_key)
+                    merged = self._merge_back(claimed, json.loads(_text(raw)) if raw else None)
+                    merged["attempts"] = attempts
+                    priority = normalize_priority(merged.get("priority"))
+                    due = self.clock() + self.retry_delay_sec * (2 ** (attempts - 1))
+
+                    pipe.multi()
+                    pipe.set(req_key, json.dumps(merged, separators=(",", ":")))
+                    for other in PRIORITY_ORDER:
+                        if other is not priority:
+                            pipe.zrem(self._pending_key(other), lang)
+                    # LT adds the entry, or keeps a newer request's earlier due time.
+                    pipe.zadd(self._pending_key(priority), {lang: due}, lt=True)
+                    pipe.hdel(self._inflight_key, lang)
+                    await pipe.execute()
+                    break
+                except WatchError:
+                    continue
+
+        logger.warning("build_request_requeued", lang=lang, attempts=attempts, due_in_sec=round(due - self.clock(), 3))
+        return True
+
+    @staticmethod
+    def _merge_back(claimed: Dict[str, Any], pending: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fold a failed in-flight request into whatever was submitted since."""
+        if pending is None:
+            return dict(claimed)
+        merged = dict(pending)
+        merged["strategy"] = merge_strategy(str(claimed.get("strategy") or ""), str(pending.get("strategy") or ""))
+        if BuildPriority.INTERACTIVE.value in (claimed.get("priority"), pending.get("priority")):
+            merged["priority"] = BuildPriority.INTERACTIVE.value
+        times = [float(t) for t in (claimed.get("requested_at"), pending.get("requested_at")) if t is not None]
+        if times:
+            merged["requested_at"] = min(times)
+        merged["count"] = int(claimed.get("count") or 1) + int(pending.get("count") or 1)
+        for ids in ("event_ids", "requester_ids", "trace_ids"):
+            combined = list(claimed.get(ids) or [])
+            combined += [v for v in pending.get(ids) or [] if v not in combined]
+            merged[ids] = combined[-_MAX_IDS:]
+        return merged
+
+    # ------------------------------------------------------------------
+    # Fleet-wide single flight
+    # ------------------------------------------------------------------
+    async def acquire_lock(self) -> bool:
+        token = secrets.token_hex(8)
+        ok = await self.redis.set(self._lock_key, token, px=self.lock_ttl_ms, nx=True)
+        if ok:
+            self._lock_token = token
+        return bool(ok)
+
+    async def release_lock(self) -> None:
+        token, self._lock_token = self._lock_token, None
+        if token is None:
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(self._lock_key)
+                current = await pipe.get(self._lock_key)
+                if current is None or _text(current) != token:
+                    return  # expired and taken over; not ours to delete
+                pipe.multi()
+                pipe.delete(self._lock_key)
+                await pipe.execute()
+            except WatchError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    async def queue_depth(self) -> Dict[str, int]:
+        depth: Dict[str, int] = {}
+        for priority in PRIORITY_ORDER:
+            depth[priority.value] = int(await self.redis.zcard(self._pending_key(priority)))
+        return depth
+
+
+__all__ = [
+    "BuildBatch",
+    "BuildPriority",
+    "BuildScheduler",
+    "PRIORITY_ORDER",
+    "merge_strategy",
+    "normalize_priority",
+]
@@ -4,6 +4,7 @@ import json
 import os
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional, Callable, Coroutine
@@ -27,15 +28,22 @@ except Exception:
     pgf = None
 
 from app.shared.config import settings
-from app.shared.telemetry import setup_telemetry, get_tracer
+from app.shared.telemetry import (
+    get_tracer,
+    record_build_latency,
+    record_build_queue_depth,
+    setup_telemetry,
+)
 from app.shared.lexicon import lexicon
 
 from app.adapters.messaging.redis_broker import RedisMessageBroker
+from app.workers.build_scheduler import BuildBatch, BuildScheduler
 from app.core.domain.events import (
     SystemEvent,
     EventType,
     BuildRequestedPayload,
     BuildFailedPayload,
+    GrammarReloadedPayload,
 )
 
 logger = structlog.get_logger()
@@ -162,61 +170,107 @@ class GrammarRuntime:
     """
     Holds a loaded PGF in memory (if pgf runtime is installed).
     Also supports "zombie language" detection based on the Everything Matrix verdict.
+
+    Reloads are double-buffered: the new binary is read off the event loop and
+    swapped in only once it is ready, so a failed or slow read never leaves the
+    worker without a grammar.
     """
 
     _pgf: Optional[Any] = None
     _last_mtime: float = 0.0
+    _stamp: Optional[tuple[int, int]] = None
 
-    def load(self, pgf_path: str) -> None:
-        pgf_path = _normalize_pgf_path(pgf_path)
+    @staticmethod
+    def _file_stamp(pgf_path: str) -> Optional[tuple[int, int]]:
+        try:
+            st = os.stat(pgf_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read(self, pgf_path: str) -> tuple[Optional[Any], Optional[tuple[int, int]]]:
+        """Read and check a PGF without touching the loaded one (thread-safe)."""
         logger.info("runtime_loading_pgf", path=pgf_path)
 
         if not pgf:
             logger.warning("runtime_pgf_lib_missing", note="python 'pgf' module not installed")
-            return
+            return None, None
 
-        if not os.path.exists(pgf_path):
+        stamp = self._file_stamp(pgf_path)
+        if stamp is None:
             logger.warning("runtime_pgf_missing", path=pgf_path)
-            return
+            return None, None
 
         try:
-            self._last_mtime = os.path.getmtime(pgf_path)
             raw_pgf = pgf.readPGF(pgf_path)
-
-            # Detect (but do not delete) zombie languages using Everything Matrix
-            matrix_path = Path(settings.FILESYSTEM_REPO_PATH) / "data" / "indices" / "everything_matrix.json"
-            if matrix_path.exists():
-                try:
-                    matrix = json.loads(matrix_path.read_text(encoding="utf-8"))
-                    languages = matrix.get("languages", {}) or {}
-                    for lang_name in list(getattr(raw_pgf, "languages", {}).keys()):
-                        iso_guess = (lang_name[-3:] if isinstance(lang_name, str) else "").lower()
-                        verdict = (languages.get(iso_guess, {}) or {}).get("verdict", {}) or {}
-                        runnable = verdict.get("runnable", True)
-                        if not runnable:
-                            logger.warning(
-                                "runtime_zombie_language_detected",
-                                lang=lang_name,
-                                iso=iso_guess,
-                                reason="matrix.verdict.runnable=False",
-                            )
-                except Exception as e:
-                    logger.error("runtime_matrix_filter_failed", error=str(e))
-            else:
-                logger.warning("runtime_matrix_missing", path=str(matrix_path))
-
-            self._pgf = raw_pgf
-            logger.info("runtime_pgf_loaded_success", active_languages=list(self._pgf.languages.keys()))
         except Exception as e:
             logger.error("runtime_pgf_load_failed", error=str(e))
+            return None, None
+
+        # Detect (but do not delete) zombie languages using Everything Matrix
+        matrix_path = Path(settings.FILESYSTEM_REPO_PATH) / "data" / "indices" / "everything_matrix.json"
+        if matrix_path.exists():
+            try:
+                matrix = json.loads(matrix_path.read_text(encoding="utf-8"))
+                languages = matrix.get("languages", {}) or {}
+                for lang_name in list(getattr(raw_pgf, "languages", {}).keys()):
+                    iso_guess = (lang_name[-3:] if isinstance(lang_name, str) else "").lower()
+                    verdict = (languages.get(iso_guess, {}) or {}).get("verdict", {}) or {}
+                    runnable = verdict.get("runnable", True)
+                    if not runnable:
+                        logger.warning(
+                            "runtime_zombie_language_detected",
+                            lang=lang_name,
+                            iso=iso_guess,
+                            reason="matrix.verdict.runnable=False",
+                        )
+            except Exception as e:
+                logger.error("runtime_matrix_filter_failed", error=str(e))
+        else:
+            logger.warning("runtime_matrix_missing", path=str(matrix_path))
+
+        return raw_pgf, stamp
+
+    def _swap(self, raw_pgf: Any, stamp: tuple[int, int]) -> None:
+        self._pgf = raw_pgf
+        self._stamp = stamp
+        self._last_mtime = stamp[0] / 1e9
+        logger.info("runtime_pgf_loaded_success", active_languages=list(raw_pgf.languages.keys()))
+
+    def load(self, pgf_path: str) -> bool:
+        """Synchronous load (tooling / tests). Prefer `reload()` inside the worker loop."""
+        pgf_path = _normalize_pgf_path(pgf_path)
+        raw_pgf, stamp = self._read(pgf_path)
+        if raw_pgf is None or stamp is None:
+            return False
+        self._swap(raw_pgf, stamp)
+        return True
 
     def get(self) -> Optional[Any]:
         return self._pgf
 
-    async def reload(self) -> None:
-        pgf_path = _effective_pgf_path()
+    def stamp(self) -> Optional[tuple[int, int]]:
+        return self._stamp
+
+    async def reload(self, pgf_path: Optional[str] = None, *, force: bool = True) -> bool:
+        """
+        Read the PGF in a worker thread and swap it in once ready.
+
+        With force=False the read is skipped when (mtime_ns, size) matches the
+        loaded binary. Returns True when a new grammar was swapped in.
+        """
+        pgf_path = _normalize_pgf_path(pgf_path or _effective_pgf_path())
+        if not force and self._pgf is not None and self._file_stamp(pgf_path) == self._stamp:
+            return False
+
         logger.info("runtime_reloading_triggered", path=pgf_path)
-        self.load(pgf_path)
+        raw_pgf, stamp = await asyncio.to_thread(self._read, pgf_path)
+        if raw_pgf is None or stamp is None:
+            logger.warning("runtime_reload_kept_previous", path=pgf_path, loaded=self._pgf is not None)
+            return False
+
+        self._swap(raw_pgf, stamp)
+        return True
 
 
 runtime = GrammarRuntime()
@@ -296,29 +350,50 @@ async def _run_orchestrator(repo_root: Path, *, langs: list[str], strategy: str,
         raise RuntimeError(f"Build orchestrator failed: {e}") from e
 
 
+async def _reload_and_announce(ctx: Dict[str, Any], *, origin: str, force: bool = False) -> bool:
+    """
+    Hot-swap the worker runtime and broadcast GRAMMAR_RELOADED so every API
+    process re-reads the same binary. Only announces an actual swap.
+    """
+    pgf_path = _effective_pgf_path()
+    if not await runtime.reload(pgf_path, force=force):
+        return False
+
+    broker: Optional[RedisMessageBroker] = ctx.get("event_broker")
+    stamp = runtime.stamp()
+    if broker and stamp:
+        payload = GrammarReloadedPayload(pgf_path=pgf_path, mtime_ns=stamp[0], size=stamp[1], origin=origin)
+        try:
+            await broker.publish(SystemEvent(type=EventType.GRAMMAR_RELOADED, payload=payload.model_dump()))
+        except Exception as e:
+            logger.error("grammar_reload_announce_failed", error=str(e), origin=origin)
+    return True
+
+
 # -----------------------------
-# ARQ Jobs
+# Builds
 # -----------------------------
-async def build_language(ctx: Dict[str, Any], request: Dict[str, Any]) -> str:
+async def _build_languages(
+    ctx: Dict[str, Any],
+    langs: list[str],
+    *,
+    strategy: str,
+    requester_ids: Optional[Dict[str, Optional[str]]] = None,
+) -> str:
     """
-    Canonical job triggered by the Event Bus bridge.
-
-    Pipeline:
-      1) Index knowledge layer: tools/everything_matrix/build_index.py
-      2) Compile/link grammar layer (in-process): builder.orchestrator.build_pgf
-      3) Reload in-memory runtime if available
-      4) Emit BUILD_COMPLETED / BUILD_FAILED
+    Index + compile + reload for one or more languages in a single
+    orchestrator run. Emits BUILD_STARTED / BUILD_COMPLETED / BUILD_FAILED
+    per language so subscribers see the same events as single-language builds.
     """
     broker: Optional[RedisMessageBroker] = ctx.get("event_broker")
-
-    payload = BuildRequestedPayload(**request)
-    lang_code = payload.lang_code
-    requested_strategy = (payload.strategy or "auto").strip()
+    requester_ids = requester_ids or {}
+    requested_strategy = (strategy or "auto").strip()
 
     orch_strategy, clean = _map_build_strategy(requested_strategy)
 
     with tracer.start_as_current_span("worker_build_language") as span:
-        span.set_attribute("language.code", lang_code)
+        span.set_attribute("language.code", ",".join(langs))
+        span.set_attribute("build.language_count", len(langs))
         span.set_attribute("build.strategy.requested", requested_strategy)
         span.set_attribute("build.strategy.orchestrator", orch_strategy)
         span.set_attribute("build.clean", bool(clean))
@@ -326,71 +401,180 @@ async def build_language(ctx: Dict[str, Any], request: Dict[str, Any]) -> str:
         try:
             logger.info(
                 "build_job_started",
-                lang=lang_code,
+                langs=langs,
                 strategy=requested_strategy,
                 orch_strategy=orch_strategy,
                 clean=clean,
             )
 
             if broker:
-                await broker.publish(
-                    SystemEvent(
-                        type=EventType.BUILD_STARTED,
-                        payload={
-                            "lang_code": lang_code,
-                            "strategy": requested_strategy,
-                            "requester_id": payload.requester_id,
-                        },
+                for lang_code in langs:
+                    await broker.publish(
+                        SystemEvent(
+                            type=EventType.BUILD_STARTED,
+                            payload={
+                                "lang_code": lang_code,
+                                "strategy": requested_strategy,
+                                "requester_id": requester_ids.get(lang_code),
+                            },
+                        )
                     )
-                )
 
             repo_root = Path(settings.FILESYSTEM_REPO_PATH)
 
             # Step 1: Index (scoped)
-            await _run_indexer(repo_root, langs=[lang_code])
+            await _run_indexer(repo_root, langs=list(langs))
 
             # Step 2: Build Orchestrator (scoped, in-process)
-            await _run_orchestrator(repo_root, langs=[lang_code], strategy=orch_strategy, clean=clean)
+            await _run_orchestrator(repo_root, langs=list(langs), strategy=orch_strategy, clean=clean)
 
             # Validate artifact
             pgf_path = _effective_pgf_path()
             if not os.path.exists(pgf_path):
                 raise RuntimeError(f"Build completed but PGF artifact missing at: {pgf_path}")
 
-            # Hot reload (best-effort)
-            await runtime.reload()
+            # Hot reload (best-effort) + fleet broadcast
+            await _reload_and_announce(ctx, origin="build_language")
 
-            logger.info("build_job_completed", lang=lang_code, pgf_path=pgf_path)
+            logger.info("build_job_completed", langs=langs, pgf_path=pgf_path)
 
             if broker:
-                await broker.publish(
-                    SystemEvent(
-                        type=EventType.BUILD_COMPLETED,
-                        payload={"lang_code": lang_code, "strategy": requested_strategy, "pgf_path": pgf_path},
+                for lang_code in langs:
+                    await broker.publish(
+                        SystemEvent(
+                            type=EventType.BUILD_COMPLETED,
+                            payload={"lang_code": lang_code, "strategy": requested_strategy, "pgf_path": pgf_path},
+                        )
                     )
-                )
 
-            return f"Built {lang_code} successfully."
+            return f"Built {', '.join(langs)} successfully."
 
         except Exception as e:
-            logger.error("build_job_failed", lang=lang_code, error=str(e))
+            logger.error("build_job_failed", langs=langs, error=str(e))
             span.record_exception(e)
 
             if broker:
-                fail = BuildFailedPayload(
-                    lang_code=lang_code,
-                    error_code="WORKER_BUILD_FAILED",
-                    details=str(e),
-                )
-                await broker.publish(
-                    SystemEvent(
-                        type=EventType.BUILD_FAILED,
-                        payload=fail.model_dump(),
+                for lang_code in langs:
+                    fail = BuildFailedPayload(
+                        lang_code=lang_code,
+                        error_code="WORKER_BUILD_FAILED",
+                        details=str(e),
+                    )
+                    await broker.publish(
+                        SystemEvent(
+                            type=EventType.BUILD_FAILED,
+                            payload=fail.model_dump(),
+                        )
                     )
-                )
             raise
 
 
+async def _run_build_batch(ctx: Dict[str, Any], batch: BuildBatch) -> bool:
+    """Build one claimed batch; returns False if the build failed."""
+    priority = batch.priority.value
+    for req in batch.requests:
+        requested_at = req.get("requested_at")
+        if requested_at is not None:
+            record_build_latency("queue", batch.claimed_at - float(requested_at), priority=priority)
+
+    started = time.time()
+    outcome = "ok"
+    try:
+        await _build_languages(
+            ctx,
+            batch.langs,
+            strategy=batch.strategy,
+            requester_ids={
+                str(r.get("lang_code")): (r.get("requester_ids") or [None])[-1] for r in batch.requests
+            },
+        )
+    except Exception:
+        # BUILD_FAILED is already published per language; keep the loop alive.
+        outcome = "error"
+    finally:
+        finished = time.time()
+        record_build_latency("build", finished - started, priority=priority, outcome=outcome)
+        for req in batch.requests:
+            requested_at = req.get("requested_at")
+            if requested_at is not None:
+                record_build_latency("total", finished - float(requested_at), priority=priority, outcome=outcome)
+    return outcome == "ok"
+
+
+async def dispatch_build_batch(ctx: Dict[str, Any]) -> Optional[BuildBatch]:
+    """
+    One scheduler step: if no build is running fleet-wide, claim the next due
+    batch and build it. Returns the batch that ran, if any.
+
+    Claimed requests stay in flight until the build succeeds; a failed build
+    requeues them, and requests a dead worker left in flight are requeued
+    by the next step that holds the fleet lock.
+    """
+    scheduler: BuildScheduler = ctx["build_scheduler"]
+    record_build_queue_depth(await scheduler.queue_depth())
+
+    if not await scheduler.acquire_lock():
+        return None
+    try:
+        await scheduler.requeue_inflight()
+        batch = await scheduler.claim_batch()
+        if batch is not None:
+            if await _run_build_batch(ctx, batch):
+                await scheduler.complete(batch)
+            else:
+                await scheduler.requeue(batch)
+        return batch
+    finally:
+        await scheduler.release_lock()
+
+
+async def run_build_scheduler(ctx: Dict[str, Any]) -> None:
+    poll = max(0.05, float(settings.BUILD_SCHEDULER_POLL_SEC))
+    logger.info("build_scheduler_started", debounce_sec=settings.BUILD_DEBOUNCE_SEC, poll_sec=poll)
+    while True:
+        batch: Optional[BuildBatch] = None
+        try:
+            batch = await dispatch_build_batch(ctx)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("build_scheduler_error", error=str(e))
+        if batch is None:
+            await asyncio.sleep(poll)
+
+
+# -----------------------------
+# ARQ Jobs
+# -----------------------------
+async def build_language(ctx: Dict[str, Any], request: Dict[str, Any]) -> str:
+    """
+    Canonical job triggered by the Event Bus bridge and BuildLanguage.
+
+    With the build scheduler enabled the request is coalesced with other
+    pending requests for the language and built by `run_build_scheduler`;
+    otherwise it builds immediately.
+
+    Pipeline:
+      1) Index knowledge layer: tools/everything_matrix/build_index.py
+      2) Compile/link grammar layer (in-process): builder.orchestrator.build_pgf
+      3) Reload in-memory runtime if available
+      4) Emit BUILD_COMPLETED / BUILD_FAILED
+    """
+    payload = BuildRequestedPayload(**request)
+
+    scheduler: Optional[BuildScheduler] = ctx.get("build_scheduler")
+    if scheduler is not None:
+        await scheduler.submit({**request, **payload.model_dump()})
+        return f"Scheduled build for {payload.lang_code}."
+
+    return await _build_languages(
+        ctx,
+        [payload.lang_code],
+        strategy=payload.strategy,
+        requester_ids={payload.lang_code: payload.requester_id},
+    )
+
+
 # Back-compat job: compile a single language (kept for older callers)
 async def compile_grammar(ctx: Dict[str, Any], language_code: str) -> str:
     repo_root = Path(settings.FILESYSTEM_REPO_PATH)
@@ -403,20 +587,24 @@ async def compile_grammar(ctx: Dict[str, Any], language_code: str) -> str:
     if not os.path.exists(pgf_path):
         raise RuntimeError(f"Build completed but PGF artifact missing at: {pgf_path}")
 
-    await runtime.reload()
+    await _reload_and_announce(ctx, origin="compile_grammar")
     return f"Compiled {language_code} successfully."
 
 
 # -----------------------------
 # Background tasks
 # -----------------------------
-async def watch_grammar_file(_: Dict[str, Any]) -> None:
+async def watch_grammar_file(ctx: Dict[str, Any]) -> None:
     """
-    Watches settings.PGF_PATH and reloads runtime when it changes.
+    Watches settings.PGF_PATH and hot-swaps the runtime when it changes.
     Uses watchfiles when available, otherwise polling.
+
+    Bursts of change events (the builder writes the PGF in several steps) are
+    debounced into one reload, and the read itself runs off the event loop.
     """
     pgf_path = _effective_pgf_path()
     pgf_dir = os.path.dirname(pgf_path)
+    debounce = max(0.0, float(settings.GRAMMAR_RELOAD_DEBOUNCE_SEC))
 
     if not os.path.exists(pgf_dir):
         logger.warning("watcher_dir_missing", path=pgf_dir)
@@ -426,23 +614,33 @@ async def watch_grammar_file(_: Dict[str, Any]) -> None:
 
     if awatch:
         try:
-            async for changes in awatch(pgf_dir):
-                for change_type, file_path in changes:
-                    if os.path.abspath(file_path) == os.path.abspath(pgf_path):
-                        logger.info("watcher_detected_change", file=file_path, type=change_type)
-                        await asyncio.sleep(0.1)
-                        runtime.load(pgf_path)
+            async for changes in awatch(pgf_dir, debounce=int(debounce * 1000), step=50):
+                hits = [
+                    (change_type, file_path)
+                    for change_type, file_path in changes
+                    if os.path.abspath(file_path) == os.path.abspath(pgf_path)
+                ]
+                if not hits:
+                    continue
+                logger.info("watcher_detected_change", file=pgf_path, events=len(hits))
+                await _reload_and_announce(ctx, origin="watcher")
         except asyncio.CancelledError:
             logger.info("watcher_stopped")
         except Exception as e:
             logger.error("watcher_crashed", error=str(e))
     else:
+        attempted: Optional[tuple[int, int]] = None
         try:
             while True:
-                current_mtime = os.path.getmtime(pgf_path) if os.path.exists(pgf_path) else 0.0
-                if current_mtime > runtime._last_mtime:
-                    logger.info("watcher_polling_change", old=runtime._last_mtime, new=current_mtime)
-                    runtime.load(pgf_path)
+                stamp = runtime._file_stamp(pgf_path)
+                if stamp is not None and stamp not in {runtime.stamp(), attempted}:
+                    # Wait for the file to settle before reading it.
+                    await asyncio.sleep(debounce)
+                    if runtime._file_stamp(pgf_path) == stamp:
+                        logger.info("watcher_polling_change", old=runtime.stamp(), new=stamp)
+                        attempted = stamp
+                        await _reload_and_announce(ctx, origin="watcher")
+                        continue
                 await asyncio.sleep(5)
         except asyncio.CancelledError:
             logger.info("watcher_stopped")
@@ -486,11 +684,17 @@ async def _bridge_handler_factory(ctx: Dict[str, Any]) -> Callable[[SystemEvent]
         request = {
             "lang_code": payload.lang_code,
             "strategy": payload.strategy,
+            "priority": payload.priority,
             "requester_id": payload.requester_id,
             "event_id": event.id,
             "trace_id": event.trace_id,
         }
 
+        scheduler: Optional[BuildScheduler] = ctx.get("build_scheduler")
+        if scheduler is not None:
+            await scheduler.submit(request)
+            return
+
         redis = ctx.get("redis")
         if not redis:
             logger.error("bridge_no_arq_redis", note="ctx['redis'] missing; cannot enqueue")
@@ -527,13 +731,25 @@ async def startup(ctx: Dict[str, Any]) -> None:
     await broker.connect()
     ctx["event_broker"] = broker
 
-    runtime.load(_effective_pgf_path())
+    await runtime.reload(_effective_pgf_path())
 
     try:
         lexicon.load_language("eng")
     except Exception as e:
         logger.warning("lexicon_warm_failed", error=str(e))
 
+    if settings.BUILD_SCHEDULER_ENABLED and ctx.get("redis") is not None:
+        ctx["build_scheduler"] = BuildScheduler(
+            ctx["redis"],
+            debounce_sec=settings.BUILD_DEBOUNCE_SEC,
+            max_batch=settings.BUILD_MAX_BATCH_LANGS,
+            lock_ttl_sec=settings.BUILD_LOCK_TTL_SEC,
+            max_attempts=settings.BUILD_MAX_ATTEMPTS,
+            retry_delay_sec=settings.BUILD_RETRY_DELAY_SEC,
+            strategy_key=_map_build_strategy,
+        )
+        ctx["scheduler_task"] = asyncio.create_task(run_build_scheduler(ctx))
+
     ctx["bridge_task"] = asyncio.create_task(_run_bridge(ctx))
     ctx["watcher_task"] = asyncio.create_task(watch_grammar_file(ctx))
 
@@ -541,7 +757,7 @@ async def startup(ctx: Dict[str, Any]) -> None:
 async def shutdown(ctx: Dict[str, Any]) -> None:
     logger.info("worker_shutdown")
 
-    for task_name in ("bridge_task", "watcher_task"):
+    for task_name in ("bridge_task", "watcher_task", "scheduler_task"):
         task = ctx.get(task_name)
         if task:
             task.cancel()
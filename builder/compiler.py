@@ -1,14 +1,17 @@
 # builder\compiler.py
 import os
 import json
+import hashlib
 import subprocess
 import glob
+import concurrent.futures
 from . import config
 
 # --- Configuration ---
 LOG_DIR = 'build_logs'
 # This report is critical for the AI Surgeon to know what to fix
 FAILURE_REPORT = os.path.join("data", "reports", "build_failures.json")
+STATE_VERSION = 1
 
 def get_sandboxed_env():
     """
@@ -23,12 +26,13 @@ def get_sandboxed_env():
 def setup_paths():
     """
     Constructs the exact include path string for GF.
-    Dynamically includes the Core RGL base, generated sources, 
+    Dynamically includes the Core RGL base, generated sources,
     and ALL language family subdirectories.
+    The order is stable so the string can be part of the build hashes.
     """
     abs_rgl_base = os.path.abspath(config.RGL_BASE)
     generated_src = os.path.abspath(os.path.join("generated", "src"))
-    
+
     # 1. Start with base paths
     include_paths = {
         ".",
@@ -45,80 +49,202 @@ def setup_paths():
     else:
         print(f"⚠️ Warning: RGL base path '{abs_rgl_base}' not found.")
 
-    return ":".join(include_paths)
+    return ":".join(sorted(include_paths))
+
+# -----------------------------------------------------------------------------
+# Incremental state
+# -----------------------------------------------------------------------------
+
+def _digest(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+def _read_bytes(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return b""
+
+def _file_signature(path):
+    """(path, mtime_ns, size) of an input file; cheap to recompute every build."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return f"{path}:missing"
+    return f"{path}:{st.st_mtime_ns}:{st.st_size}"
+
+def _load_inventory():
+    try:
+        with open(config.RGL_INVENTORY_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    languages = data.get("languages", {}) if isinstance(data, dict) else {}
+    return languages if isinstance(languages, dict) else {}
 
-def run():
+def _input_signature(lang_code, inventory):
+    """Signatures of the RGL modules a language's blueprint was built from."""
+    modules = (inventory.get(lang_code) or {}).get("modules") or {}
+    return [_file_signature(modules[name]) for name in sorted(modules)]
+
+def _write_json_atomic(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+def load_state():
+    try:
+        with open(config.BUILD_STATE_FILE, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        state = {}
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        state = {"version": STATE_VERSION}
+    state.setdefault("languages", {})
+    return state
+
+def save_state(state):
+    _write_json_atomic(config.BUILD_STATE_FILE, state)
+
+# -----------------------------------------------------------------------------
+# Compilation
+# -----------------------------------------------------------------------------
+
+def _gf(args, path_arg, env):
+    return subprocess.run(
+        ["gf", "-make", "-path", path_arg, *args],
+        cwd=config.GF_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+
+def _compile_concrete(filename, path_arg, env):
+    # We compile one by one to isolate failures
+    proc = _gf([filename], path_arg, env)
+    return proc.returncode, proc.stderr.decode("utf-8", errors="replace").strip()
+
+def _object_exists(filename):
+    return os.path.exists(os.path.join(config.GF_DIR, filename[:-3] + ".gfo"))
+
+def _record_failure(lang_code, filename, err_msg, failed_languages):
+    # Formatted summary for console
+    summary = "\n   ".join(err_msg.splitlines()[-2:])
+    print(f"❌ {lang_code:<10} [FAILED] -> {summary}")
+
+    # Record for AI Surgeon - Uses FULL error message
+    failed_languages[lang_code] = {
+        "file": filename,
+        "reason": err_msg # Give full error context to AI
+    }
+
+    # Archive full log
+    with open(os.path.join(LOG_DIR, f"error_{lang_code}.txt"), "w", encoding="utf-8") as log:
+        log.write(err_msg)
+
+def run(jobs=None, force=False):
+    """
+    Compiles the abstract, then every concrete whose inputs changed (in
+    parallel, up to `jobs` gf processes), then relinks if anything changed.
+
+    A concrete's key hashes its source, the abstract, the include path and
+    the RGL modules listed for it in the inventory. Only successful compiles
+    are recorded, so an unchanged key skips a language that built before,
+    while failed languages (gf errors or runner failures alike) are retried
+    on every run. `force` ignores the state.
+    """
     print(f"🚀 Starting Wiki PGF Compilation (Sandboxed)...")
-    
+
     if not os.path.exists(config.GF_DIR):
         print(f"❌ Error: Directory '{config.GF_DIR}' not found.")
         return False
 
     path_arg = setup_paths()
     if not path_arg: return False
-    
+
     # Prepare Environment
     sandbox_env = get_sandboxed_env()
     os.makedirs(LOG_DIR, exist_ok=True)
     os.makedirs(os.path.dirname(FAILURE_REPORT), exist_ok=True)
-    
+    state = {"version": STATE_VERSION, "languages": {}} if force else load_state()
+    inventory = _load_inventory()
+
     # Identify Candidates
     all_files = glob.glob(os.path.join(config.GF_DIR, "Wiki*.gf"))
     concrete_files = sorted([os.path.basename(f) for f in all_files if "Wiki.gf" not in f])
-    
+
     successful_files = []
     failed_languages = {} # Stores data for the AI Surgeon
-    
+
     print(f"--- Phase 1: Individual Verification ({len(concrete_files)} languages) ---")
 
     # 1. Compile Abstract (Critical)
-    try:
-        subprocess.run(
-            ["gf", "-make", "-path", path_arg, "Wiki.gf"], 
-            cwd=config.GF_DIR, env=sandbox_env, check=True, 
-            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
-        )
+    abstract_key = _digest(_read_bytes(os.path.join(config.GF_DIR, "Wiki.gf")), path_arg)
+    if state.get("abstract") == abstract_key and _object_exists("Wiki.gf"):
+        print("✔ SemantikArchitect.gf unchanged.")
+    else:
+        proc = _gf(["Wiki.gf"], path_arg, sandbox_env)
+        if proc.returncode != 0:
+            print("❌ CRITICAL: SemantikArchitect.gf failed.")
+            print(proc.stderr.decode("utf-8"))
+            return False
         print("✔ SemantikArchitect.gf compiled successfully.")
-    except subprocess.CalledProcessError as e:
-        print("❌ CRITICAL: SemantikArchitect.gf failed.")
-        print(e.stderr.decode("utf-8"))
-        return False
+        state["abstract"] = abstract_key
 
-    # 2. Compile Concretes (Robust Loop)
+    # 2. Compile Concretes (changed ones only, in parallel)
+    previous = state["languages"]
+    languages = {}
+    pending = {}
     for filename in concrete_files:
         lang_code = filename.replace("Wiki", "").replace(".gf", "")
-        
-        try:
-            # We compile one by one to isolate failures
-            subprocess.run(
-                ["gf", "-make", "-path", path_arg, filename],
-                cwd=config.GF_DIR, env=sandbox_env, check=True, 
-                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
-            )
-            print(f"✔ {lang_code:<10} [OK]")
+        key = _digest(
+            abstract_key,
+            _read_bytes(os.path.join(config.GF_DIR, filename)),
+            *_input_signature(lang_code, inventory),
+        )
+        entry = previous.get(filename)
+        if entry and entry.get("ok") and entry.get("key") == key and _object_exists(filename):
+            languages[filename] = entry
             successful_files.append(filename)
-            
-        except subprocess.CalledProcessError as e:
-            err_msg = e.stderr.decode("utf-8", errors="replace").strip()
-            
-            # Formatted summary for console
-            summary = "\n   ".join(err_msg.splitlines()[-2:])
-            print(f"❌ {lang_code:<10} [FAILED] -> {summary}")
-            
-            # Record for AI Surgeon - Uses FULL error message
-            failed_languages[lang_code] = {
-                "file": filename,
-                "reason": err_msg # Give full error context to AI
-            }
-            
-            # Archive full log
-            with open(os.path.join(LOG_DIR, f"error_{lang_code}.txt"), "w", encoding="utf-8") as log:
-                log.write(err_msg)
-
-    # 3. Generate Failure Report
+        else:
+            pending[filename] = (lang_code, key)
+    state["languages"] = languages
+
+    print(f"   {len(concrete_files) - len(pending)} unchanged, {len(pending)} to compile ({jobs or config.COMPILE_JOBS} jobs)")
+
+    # 3. Failure Report, rewritten as results arrive
     # This is the "Medical Chart" the Surgeon will read
-    with open(FAILURE_REPORT, "w", encoding="utf-8") as f:
-        json.dump(failed_languages, f, indent=2)
+    _write_json_atomic(FAILURE_REPORT, failed_languages)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, jobs or config.COMPILE_JOBS)) as pool:
+        futures = {
+            pool.submit(_compile_concrete, filename, path_arg, sandbox_env): filename
+            for filename in pending
+        }
+        for future in concurrent.futures.as_completed(futures):
+            filename = futures[future]
+            lang_code, key = pending[filename]
+            try:
+                returncode, err_msg = future.result()
+            except OSError as e:
+                returncode, err_msg = -1, str(e)
+
+            if returncode == 0:
+                print(f"✔ {lang_code:<10} [OK]")
+                successful_files.append(filename)
+                languages[filename] = {"key": key, "ok": True}
+            else:
+                err_msg = err_msg or f"Unknown Error (Exit Code {returncode})"
+                # Not recorded in the state: the language is retried next run.
+                _record_failure(lang_code, filename, err_msg, failed_languages)
+                _write_json_atomic(FAILURE_REPORT, failed_languages)
+            save_state(state)
+
+    _write_json_atomic(FAILURE_REPORT, dict(sorted(failed_languages.items())))
     print(f"📝 Failure report saved to {FAILURE_REPORT}")
 
     print("-" * 60)
@@ -126,18 +252,31 @@ def run():
 
     # 4. Final Link
     if not successful_files:
+        save_state(state)
         print("\n❌ No languages compiled successfully. Exiting.")
         return False
 
+    successful_files.sort()
+    link_key = _digest(abstract_key, *(f"{f}:{languages[f]['key']}" for f in successful_files))
+    pgf_path = os.path.join(config.GF_DIR, 'Wiki.pgf')
+    if state.get("link") == link_key and os.path.exists(pgf_path):
+        save_state(state)
+        print(f"\n✅ UP TO DATE: {pgf_path}")
+        return True
+
     print(f"\n--- Phase 2: Linking Final PGF ---")
     final_cmd = ["gf", "-make", "-path", path_arg, "Wiki.gf"] + successful_files
-    
+
     try:
         subprocess.run(
             final_cmd, cwd=config.GF_DIR, env=sandbox_env, check=True
         )
-        print(f"\n✅ SUCCESS: {os.path.join(config.GF_DIR, 'Wiki.pgf')} created.")
+        state["link"] = link_key
+        save_state(state)
+        print(f"\n✅ SUCCESS: {pgf_path} created.")
         return True
     except subprocess.CalledProcessError:
+        state.pop("link", None)
+        save_state(state)
         print("\n❌ FAILURE during final linking.")
-        return False
\ No newline at end of file
+        return False
@@ -20,6 +20,14 @@ RGL_PATHS_FILE = "rgl_paths.json"
 # This file defines the rules (Gold, Silver, Bronze, Iron)
 STRATEGIES_FILE = os.path.join("builder", "strategies.json")
 
+# --- Incremental Builds ---
+# Input hashes and outcomes of the last compile, per language.
+# Unchanged languages are neither re-forged nor recompiled.
+BUILD_STATE_FILE = os.path.join("data", "cache", "builder_state.json")
+
+# Concurrent `gf` processes during compilation (BUILDER_JOBS overrides).
+COMPILE_JOBS = int(os.environ.get("BUILDER_JOBS", "0")) or min(32, os.cpu_count() or 4)
+
 # --- RGL Families (Shared Resources) ---
 # These folders contain shared definitions (like Romance.gf) that languages inherit from.
 FAMILY_FOLDERS = [
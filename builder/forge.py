@@ -12,6 +12,22 @@ def load_plan():
     with open(plan_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
+def write_if_changed(path, content):
+    """
+    Writes `content` to `path` unless the file already holds exactly that.
+    Untouched files keep their mtime, so the compiler sees them as unchanged.
+    Returns True if the file was written.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
 def generate_abstract():
     """Generates the Abstract Grammar (Wiki.gf)."""
     # This remains static as it defines the API surface for all languages
@@ -29,14 +45,13 @@ def generate_abstract():
     if not os.path.exists(config.GF_DIR): os.makedirs(config.GF_DIR)
     
     path = os.path.join(config.GF_DIR, "Wiki.gf")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"   📄 Minted Abstract: {path}")
+    if write_if_changed(path, content):
+        print(f"   📄 Minted Abstract: {path}")
 
-def execute_blueprint(rgl_code, blueprint):
+def render_blueprint(rgl_code, blueprint):
     """
-    Writes a concrete grammar file based strictly on the provided blueprint.
-    No decision making happens here; only file I/O and formatting.
+    Renders the concrete grammar for a blueprint.
+    No decision making happens here; only formatting.
     """
     filename = f"Wiki{rgl_code}.gf"
     
@@ -68,11 +83,15 @@ def execute_blueprint(rgl_code, blueprint):
     apple_N   = {rules.get('apple_N', 'cn')} ;
 }}
 """
-    
-    path = os.path.join(config.GF_DIR, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    return True
+    return content
+
+def execute_blueprint(rgl_code, blueprint):
+    """
+    Writes a concrete grammar file based strictly on the provided blueprint.
+    Returns True if the file changed.
+    """
+    path = os.path.join(config.GF_DIR, f"Wiki{rgl_code}.gf")
+    return write_if_changed(path, render_blueprint(rgl_code, blueprint))
 
 def run():
     print("🏭 Factory Started: Executing Build Plan...")
@@ -83,22 +102,23 @@ def run():
         print("❌ Error: No build plan found. Run Strategist first.")
         return
 
-    # 2. Clean Workspace (The Site Prep)
+    # 2. Site Prep: drop concretes that are no longer in the plan
     if not os.path.exists(config.GF_DIR): os.makedirs(config.GF_DIR)
+    expected = {f"Wiki{rgl_code}.gf" for rgl_code in plan} | {"Wiki.gf"}
     for f in glob.glob(os.path.join(config.GF_DIR, "Wiki*.gf")):
-        try: os.remove(f)
-        except: pass
+        if os.path.basename(f) not in expected:
+            try: os.remove(f)
+            except: pass
 
     # 3. Mint Abstract (The Foundation)
     generate_abstract()
 
     # 4. Execute Blueprints (The Construction)
-    count = 0
-    for rgl_code, blueprint in plan.items():
-        execute_blueprint(rgl_code, blueprint)
-        count += 1
+    # Only blueprints whose rendered grammar differs are rewritten.
+    changed = [rgl_code for rgl_code, blueprint in plan.items() if execute_blueprint(rgl_code, blueprint)]
 
-    print(f"   ✨ Built {count} Grammars from Plan.")
+    print(f"   ✨ Built {len(plan)} Grammars from Plan ({len(changed)} changed).")
+    return changed
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -0,0 +1,39 @@
+# builder\pipeline.py
+"""
+Incremental build pipeline: Strategist -> Forge -> Compiler.
+
+Each stage only does work for languages whose inputs changed:
+- the Strategist recomputes the plan (cheap, pure),
+- the Forge rewrites only concretes whose rendered grammar differs,
+- the Compiler recompiles only concretes whose source or RGL inputs
+  changed, across a bounded pool of gf processes, and relinks only if
+  the set of compiled languages changed.
+
+Usage (from the project root):
+    python -m builder.pipeline
+    python -m builder.pipeline --jobs 8
+    python -m builder.pipeline --force --fail-on-regression
+"""
+import argparse
+import sys
+
+from . import compiler, config, forge, strategist
+
+def run(jobs=None, force=False, fail_on_regression=False):
+    if not strategist.generate_plan(fail_on_regression=fail_on_regression):
+        return False
+    if forge.run() is None:
+        return False
+    return compiler.run(jobs=jobs, force=force)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plan, forge and compile the Wiki grammars incrementally.")
+    parser.add_argument("--jobs", type=int, default=config.COMPILE_JOBS, help="Concurrent gf processes")
+    parser.add_argument("--force", action="store_true", help="Ignore the build state and recompile everything")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Abort when a language's strategy degrades")
+    args = parser.parse_args(argv)
+    ok = run(jobs=args.jobs, force=args.force, fail_on_regression=args.fail_on_regression)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -56,6 +56,7 @@ from app.core.domain.planning.planned_sentence import PlannedSentence
 BIO_FRAME_ORDER: tuple[str, ...] = (
     "definition",
     "biographical-definition",
+    "bio",
     "birth",
     "education",
     "career",
@@ -66,14 +67,16 @@ BIO_FRAME_ORDER: tuple[str, ...] = (
     "other",
 )
 
+# "bio" is the API wire BioFrame type, which carries the definition sentence.
 BIO_DEFINITION_TYPES: frozenset[str] = frozenset(
-    {"definition", "biographical-definition"}
+    {"definition", "biographical-definition", "bio"}
 )
 
 DEFAULT_CONSTRUCTION_BY_FRAME_TYPE: dict[str, str] = {
     # Copular / identity-ish
     "definition": "copula_equative_simple",
     "biographical-definition": "copula_equative_simple",
+    "bio": "copula_equative_simple",
     "position": "copula_equative_simple",
     "classification": "copula_equative_classification",
     "class-membership": "copula_equative_classification",
@@ -336,7 +339,7 @@ def _guess_focus_role(
 
 
 def _looks_like_biography(frames: Sequence[Any]) -> bool:
-    bioish = {"definition", "biographical-definition", "birth", "death", "career"}
+    bioish = {"definition", "biographical-definition", "bio", "birth", "death", "career"}
     return any(_frame_type(frame) in bioish for frame in frames)
 
 
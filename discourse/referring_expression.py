@@ -115,6 +115,7 @@ select_np_spec(...) returns a dict like:
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 
@@ -684,8 +685,232 @@ def select_np_spec(
     }
 
 
+# ---------------------------------------------------------------------------
+# Compiled policy (documents)
+# ---------------------------------------------------------------------------
+#
+# `select_np_spec` re-reads the profile and re-probes the entity on every
+# call. For documents, compile the profile once per language and extract
+# each entity's features once per document; decisions are identical.
+
+
+@dataclass(frozen=True, slots=True)
+class EntityFeatures:
+    """Everything the policy reads from an entity, extracted once."""
+
+    referent_id: Optional[str]
+    name: Optional[str]
+    short_name: Optional[str]
+    entity_type: Optional[str]
+    human: bool
+    description_head: str
+    base_features: Dict[str, Any]
+
+    @classmethod
+    def extract(cls, entity: Any) -> "EntityFeatures":
+        return cls(
+            referent_id=_entity_id(entity),
+            name=_entity_name(entity),
+            short_name=_entity_short_name(entity),
+            entity_type=_entity_type(entity),
+            human=_entity_is_human(entity),
+            description_head=_description_head(entity),
+            base_features=_build_base_features(entity),
+        )
+
+    def metadata(self, decision: str, reason: str) -> Dict[str, Any]:
+        meta: Dict[str, Any] = {
+            "decision": decision,
+            "reason": reason,
+            "entity_type": self.entity_type,
+        }
+        if self.short_name:
+            meta["short_name_available"] = True
+        return meta
+
+
+class EntityFeatureCache:
+    """
+    Per-document cache of EntityFeatures.
+
+    Keyed by entity id (so fresh payload copies of the same referent share
+    one extraction); entities without an id are keyed by object identity.
+    Create one per document: entities are assumed not to change within it.
+    """
+
+    def __init__(self) -> None:
+        self._by_id: Dict[str, EntityFeatures] = {}
+        self._by_object: Dict[int, tuple[Any, EntityFeatures]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id) + len(self._by_object)
+
+    def get(self, entity: Any) -> EntityFeatures:
+        referent_id = _entity_id(entity)
+        if referent_id is not None:
+            features = self._by_id.get(referent_id)
+            if features is None:
+                features = self._by_id[referent_id] = EntityFeatures.extract(entity)
+            return features
+
+        cached = self._by_object.get(id(entity))
+        if cached is not None and cached[0] is entity:
+            return cached[1]
+        features = EntityFeatures.extract(entity)
+        # Hold the entity so its id() cannot be reused while cached.
+        self._by_object[id(entity)] = (entity, features)
+        return features
+
+
+@dataclass(frozen=True, slots=True)
+class ReferringExpressionPolicy:
+    """The `referring_expression` section of a language profile, resolved once."""
+
+    allow_pronouns: bool = True
+    pronouns_for_humans_only: bool = True
+    allow_pronouns_on_first_mention: bool = False
+    use_pronoun_for_topic_after_first_mention: bool = True
+    use_pronoun_for_focus_after_first_mention: bool = True
+    allow_unmarked_pronouns_after_first_mention: bool = True
+    use_short_name_after_first_mention: bool = True
+    allow_short_name_when_topic: bool = True
+
+    @classmethod
+    def from_profile(cls, lang_profile: Dict[str, Any]) -> "ReferringExpressionPolicy":
+        cfg = _get_ref_cfg(lang_profile)
+        return cls(**{name: _flag(cfg, name, default) for name, default in _POLICY_DEFAULTS.items()})
+
+    def should_use_pronoun(self, features: EntityFeatures, info: Mapping[str, Any]) -> bool:
+        """`should_use_pronoun` for a normalized discourse_info."""
+        if not self.allow_pronouns:
+            return False
+        if _safe_bool(info["avoid_pronoun"], False) or _safe_bool(info["pronoun_ambiguous"], False):
+            return False
+        if _safe_int(info["competing_referents"], 0) > 0:
+            return False
+        if _safe_int(info["recent_same_gender_human_mentions"], 0) > 0:
+            return False
+
+        if _safe_bool(info["force_pronoun"], False):
+            return features.human or not self.pronouns_for_humans_only
+
+        if _safe_bool(info["is_first_mention"], True) and not self.allow_pronouns_on_first_mention:
+            return False
+        if self.pronouns_for_humans_only and not features.human:
+            return False
+        if _safe_bool(info["is_topic"], False) and self.use_pronoun_for_topic_after_first_mention:
+            return True
+        if _safe_bool(info["is_focus"], False) and self.use_pronoun_for_focus_after_first_mention:
+            return True
+        return self.allow_unmarked_pronouns_after_first_mention
+
+    def should_use_short_name(self, features: EntityFeatures, info: Mapping[str, Any]) -> bool:
+        """`should_use_short_name` for a normalized discourse_info."""
+        if _safe_bool(info["is_first_mention"], True):
+            return False
+        short_name = features.short_name
+        if not short_name:
+            return False
+        if features.name and short_name.strip() == features.name.strip():
+            return False
+        if not self.use_short_name_after_first_mention:
+            return False
+        if _safe_bool(info["is_topic"], False):
+            return self.allow_short_name_when_topic
+        return True
+
+    def select(
+        self,
+        entity: Any,
+        discourse_info: Optional[Dict[str, Any]],
+        *,
+        allow_description_fallback: bool = True,
+        cache: Optional[EntityFeatureCache] = None,
+    ) -> Dict[str, Any]:
+        """Same result as `select_np_spec(entity, discourse_info, profile, ...)`."""
+        features = cache.get(entity) if cache is not None else EntityFeatures.extract(entity)
+        info = _normalize_discourse_info(discourse_info)
+
+        if _safe_bool(info["force_description"], False):
+            return _compiled_description(features, "forced_description")
+        if _safe_bool(info["force_name"], False):
+            return _compiled_name(features, "forced_name")
+
+        if self.should_use_pronoun(features, info):
+            if _safe_bool(info["force_pronoun"], False):
+                reason = "forced_pronoun"
+            elif _safe_bool(info["is_topic"], False):
+                reason = "topic_after_first_mention"
+            elif _safe_bool(info["is_focus"], False):
+                reason = "focus_after_first_mention"
+            else:
+                reason = "repeated_mention_pronoun"
+            feats = dict(features.base_features)
+            feats["pronoun_type"] = "personal"
+            return _compiled_spec(features, REALIZATION_PRONOUN, None, feats, reason)
+
+        if _safe_bool(info["force_short_name"], False):
+            return _compiled_short_name(features, "forced_short_name")
+        if self.should_use_short_name(features, info):
+            return _compiled_short_name(features, "short_name_after_first_mention")
+        if features.name:
+            return _compiled_name(features, "default_named_entity")
+        if allow_description_fallback:
+            return _compiled_description(features, "description_fallback")
+        return _compiled_spec(
+            features, REALIZATION_DESCRIPTION, "entity", dict(features.base_features), "opaque_last_resort"
+        )
+
+
+_POLICY_DEFAULTS: Dict[str, bool] = {
+    name: field.default for name, field in ReferringExpressionPolicy.__dataclass_fields__.items()
+}
+
+
+def _compiled_spec(
+    features: EntityFeatures,
+    decision: str,
+    lemma: Optional[str],
+    feats: Dict[str, Any],
+    reason: str,
+) -> Dict[str, Any]:
+    return {
+        "realization_type": decision,
+        "lemma": lemma,
+        "features": feats,
+        "referent_id": features.referent_id,
+        "metadata": features.metadata(decision, reason),
+    }
+
+
+def _compiled_name(features: EntityFeatures, reason: str) -> Dict[str, Any]:
+    if not features.name:
+        return _compiled_description(features, "missing_name_fallback")
+    feats = dict(features.base_features)
+    feats["named_entity"] = True
+    return _compiled_spec(features, REALIZATION_NAME, features.name, feats, reason)
+
+
+def _compiled_short_name(features: EntityFeatures, reason: str) -> Dict[str, Any]:
+    if not features.short_name:
+        return _compiled_name(features, "missing_short_name_fallback")
+    feats = dict(features.base_features)
+    feats["named_entity"] = True
+    feats["short_form"] = True
+    return _compiled_spec(features, REALIZATION_SHORT_NAME, features.short_name, feats, reason)
+
+
+def _compiled_description(features: EntityFeatures, reason: str) -> Dict[str, Any]:
+    return _compiled_spec(
+        features, REALIZATION_DESCRIPTION, features.description_head, dict(features.base_features), reason
+    )
+
+
 __all__ = [
     "select_np_spec",
     "should_use_pronoun",
     "should_use_short_name",
+    "ReferringExpressionPolicy",
+    "EntityFeatures",
+    "EntityFeatureCache",
 ]
\ No newline at end of file
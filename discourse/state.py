@@ -14,13 +14,30 @@ This module keeps track of:
 
 It is intentionally simple: enough to support pronoun choice and
 topic selection across a short multi-sentence description (e.g. a
-Wikipedia lead section).
+Wikipedia lead section), but it stays linear on long documents too
+(list articles with hundreds of entities):
+
+- Salience decays lazily. The state keeps the cumulative log of all
+  decay factors applied so far; each entry stores its salience as of
+  the moment it was last touched plus that log ("stamp"). The current
+  salience is `base * exp(log_decay - stamp)`, so `advance_sentence()`
+  is O(1) instead of touching every entry.
+- Decay multiplies every entry by the same factor, so the relative
+  order of entries never changes between mentions. A max-heap keyed on
+  the time-invariant `base / exp(stamp)` (in log space) therefore gives
+  the most salient entry in O(1) amortised; stale heap items are
+  dropped lazily and the heap is rebuilt when it outgrows the entries.
+- `to_dict()` / `from_dict()` (and `dumps()` / `loads()`) produce a
+  compact, materialised form for Redis-backed sessions.
 """
 
 from __future__ import annotations
 
+import heapq
+import json
+import math
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from app.core.domain.semantics.types import Entity
 
@@ -43,7 +60,10 @@ class DiscourseEntry:
             (usually entity.id or a derived fallback).
         salience:
             A simple score used for topic/pronoun selection.
-            Higher is more salient.
+            Higher is more salient. Derived lazily from base_salience
+            and decay_stamp (see module docstring); assignable.
+        base_salience:
+            Salience as of the moment decay_stamp was taken.
         last_sentence_index:
             Index of the last sentence where this entity was mentioned.
         times_mentioned:
@@ -53,15 +73,51 @@ class DiscourseEntry:
             e.g. {"subject", "object", "topic"}.
         extra:
             Free-form metadata for advanced algorithms.
+        decay_stamp:
+            The owning state's cumulative log-decay when base_salience
+            was last set.
     """
 
     entity: Entity
     key: str
-    salience: float = 0.0
+    base_salience: float = 0.0
     last_sentence_index: int = -1
     times_mentioned: int = 0
     roles: set[str] = field(default_factory=set)
     extra: Dict[str, Any] = field(default_factory=dict)
+    decay_stamp: float = 0.0
+    _state: Optional["DiscourseState"] = field(default=None, repr=False, compare=False)
+    _order: int = field(default=0, repr=False, compare=False)
+    _version: int = field(default=0, repr=False, compare=False)
+
+    @property
+    def salience(self) -> float:
+        if self._state is None or self.base_salience == 0.0:
+            return self.base_salience
+        return self.base_salience * math.exp(self._state._log_decay - self.decay_stamp)
+
+    @salience.setter
+    def salience(self, value: float) -> None:
+        if self._state is None:
+            self.base_salience = float(value)
+        else:
+            self._state._set_salience(self, float(value))
+
+
+def _rank(entry: DiscourseEntry) -> Tuple[int, float]:
+    """
+    Time-invariant ordering key for an entry (larger = more salient).
+
+    Compares `base / exp(stamp)` without computing it (it overflows after
+    a few thousand decays): positives by log-magnitude, then zero, then
+    negatives (decay shrinks them towards zero, order preserved).
+    """
+    base = entry.base_salience
+    if base > 0.0:
+        return (2, math.log(base) - entry.decay_stamp)
+    if base == 0.0:
+        return (1, 0.0)
+    return (0, -(math.log(-base) - entry.decay_stamp))
 
 
 # ---------------------------------------------------------------------------
@@ -96,6 +152,13 @@ class DiscourseState:
         # Key of current topic entity (if any)
         self._current_topic_key: Optional[str] = None
 
+        # Sum of log(decay) over all advance_sentence() calls.
+        self._log_decay: float = 0.0
+
+        # Max-heap (via negated rank) of (-class, -value, order, version, key);
+        # items whose version no longer matches their entry are stale.
+        self._heap: List[Tuple[int, float, int, int, str]] = []
+
     # ------------------------------------------------------------------
     # Internal key management
     # ------------------------------------------------------------------
@@ -152,13 +215,15 @@ class DiscourseState:
             entry = DiscourseEntry(
                 entity=entity,
                 key=key,
-                salience=float(initial_salience),
                 last_sentence_index=self.sentence_index,
                 times_mentioned=0,
+                _state=self,
+                _order=len(self._entries),
             )
             if roles:
                 entry.roles.update(roles)
             self._entries[key] = entry
+            self._set_salience(entry, float(initial_salience))
 
             if as_topic:
                 self._current_topic_key = key
@@ -198,7 +263,7 @@ class DiscourseState:
 
         entry.times_mentioned += 1
         entry.last_sentence_index = self.sentence_index
-        entry.salience += float(salience_boost)
+        self._set_salience(entry, entry.salience + float(salience_boost))
 
         if role:
             entry.roles.add(role)
@@ -212,6 +277,9 @@ class DiscourseState:
         """
         Move to the next sentence and apply a simple salience decay.
 
+        O(1): the decay is folded into the state's cumulative log-decay
+        and applied to each entry when its salience is read.
+
         Args:
             decay:
                 Multiplicative decay factor applied to all entries'
@@ -219,8 +287,53 @@ class DiscourseState:
         """
         self.sentence_index += 1
 
+        decay = float(decay)
+        if decay == 1.0:
+            return
+        if decay > 0.0:
+            self._log_decay += math.log(decay)
+            return
+
+        # Non-positive decay cannot be expressed in log space; materialise.
         for entry in self._entries.values():
-            entry.salience *= float(decay)
+            self._set_salience(entry, entry.salience * decay)
+
+    # ------------------------------------------------------------------
+    # Salience index
+    # ------------------------------------------------------------------
+
+    def _set_salience(self, entry: DiscourseEntry, value: float) -> None:
+        entry.base_salience = value
+        entry.decay_stamp = self._log_decay
+        entry._version += 1
+        rank_class, rank_value = _rank(entry)
+        heapq.heappush(self._heap, (-rank_class, -rank_value, entry._order, entry._version, entry.key))
+
+        # Each update leaves one stale item behind; rebuild before the heap
+        # grows unboundedly relative to the live entries.
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        self._heap = []
+        for entry in self._entries.values():
+            rank_class, rank_value = _rank(entry)
+            self._heap.append((-rank_class, -rank_value, entry._order, entry._version, entry.key))
+        heapq.heapify(self._heap)
+
+    def most_salient(self) -> Optional[DiscourseEntry]:
+        """
+        Return the entry with the highest current salience (earliest
+        registered on ties), or None if no entity is tracked.
+        """
+        heap = self._heap
+        while heap:
+            _, _, _, version, key = heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry._version == version:
+                return entry
+            heapq.heappop(heap)
+        return None
 
     # ------------------------------------------------------------------
     # Topic / salience queries
@@ -255,11 +368,10 @@ class DiscourseState:
         if topic is not None:
             return topic
 
-        if not self._entries:
-            return None
-
         # Pick highest-salience entry
-        entry = max(self._entries.values(), key=lambda e: e.salience)
+        entry = self.most_salient()
+        if entry is None:
+            return None
         self._current_topic_key = entry.key
         return entry.entity
 
@@ -287,5 +399,64 @@ class DiscourseState:
         """
         return dict(self._entries)
 
+    # ------------------------------------------------------------------
+    # Serialisation (Redis-backed sessions)
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Compact, JSON-safe snapshot. Saliences are materialised, so the
+        restored state starts from a zero log-decay.
+
+        Entries are positional lists:
+            [key, entity, salience, last_sentence_index, times_mentioned, roles, extra]
+        with empty roles/extra omitted from the tail.
+        """
+        entries: List[List[Any]] = []
+        for entry in self._entries.values():
+            row: List[Any] = [
+                entry.key,
+                {k: v for k, v in entry.entity.to_dict().items() if v not in (None, "", [], {}, False, "unknown")},
+                round(entry.salience, 9),
+                entry.last_sentence_index,
+                entry.times_mentioned,
+                sorted(entry.roles),
+                entry.extra,
+            ]
+            while row[-1] in ([], {}) and len(row) > 5:
+                row.pop()
+            entries.append(row)
+        return {"v": 1, "i": self.sentence_index, "t": self._current_topic_key, "e": entries}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "DiscourseState":
+        state = cls()
+        state.sentence_index = int(data.get("i", 0))
+        for row in data.get("e") or []:
+            key, entity_data, salience, last_index, times = row[:5]
+            entry = DiscourseEntry(
+                entity=Entity.from_dict(entity_data),
+                key=str(key),
+                last_sentence_index=int(last_index),
+                times_mentioned=int(times),
+                roles=set(row[5]) if len(row) > 5 else set(),
+                extra=dict(row[6]) if len(row) > 6 else {},
+                _state=state,
+                _order=len(state._entries),
+            )
+            state._entries[entry.key] = entry
+            entry.base_salience = float(salience)
+        state._rebuild_index()
+        topic = data.get("t")
+        state._current_topic_key = topic if topic in state._entries else None
+        return state
+
+    def dumps(self) -> str:
+        return json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False)
+
+    @classmethod
+    def loads(cls, payload: str | bytes) -> "DiscourseState":
+        return cls.from_dict(json.loads(payload))
+
 
 __all__ = ["DiscourseState", "DiscourseEntry"]
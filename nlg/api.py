@@ -11,7 +11,6 @@ from typing import Any, Dict, List, Optional, Protocol, Sequence, cast
 from app.core.domain.models import Frame as WireFrame
 from app.core.domain.models import Sentence
 from app.core.ports.grammar_engine import IGrammarEngine
-from app.shared.container import container
 
 
 # Optional semantic-frame types (kept for compatibility with older call sites).
@@ -102,6 +101,10 @@ class Engine(Protocol):
 
 def _get_grammar_engine() -> IGrammarEngine:
     # DI container provides the configured grammar engine implementation.
+    # Imported on first use: dependency_injector is a large import for callers
+    # that only need the data models.
+    from app.shared.container import container
+
     return cast(IGrammarEngine, container.grammar_engine())
 
 
@@ -0,0 +1,144 @@
+# tests/adapters/test_admission_control.py
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.adapters.api.admission import (
+    AdmissionControlMiddleware,
+    AdmissionController,
+    AdmissionRejected,
+    AIMDLimit,
+    FixedLimit,
+    Limiter,
+    request_deadline,
+)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_aimd_limit_grows_slowly_and_backs_off_once_per_window() -> None:
+    clock = Clock()
+    limit = AIMDLimit(4, min_limit=2, max_limit=8, target_latency_sec=0.5, backoff=0.5, clock=clock)
+
+    for _ in range(5):
+        limit.on_sample(0.1)
+    assert limit.value == 5  # ~+1 per round of `limit` fast requests
+
+    limit.on_sample(2.0)
+    limit.on_sample(2.0)  # same congestion window: ignored
+    assert limit.value == 2
+    clock.now += 1.0
+    limit.on_sample(0.1, ok=False)
+    assert limit.value == 2  # floor
+
+
+async def test_limiter_queues_fifo_and_rejects_when_queue_is_full() -> None:
+    limiter = Limiter("t", FixedLimit(1), max_queue=1)
+    assert await limiter.acquire(None) == 0.0
+
+    waiting = asyncio.create_task(limiter.acquire(None))
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+
+    with pytest.raises(AdmissionRejected) as excinfo:
+        await limiter.acquire(None)
+    assert excinfo.value.reason == "queue_full"
+
+    limiter.release(0.05)
+    assert await asyncio.wait_for(waiting, 1) >= 0.0
+    assert limiter.inflight == 1 and limiter.queued == 0
+
+
+async def test_limiter_sheds_up_front_when_expected_wait_exceeds_deadline() -> None:
+    limiter = Limiter("t", FixedLimit(1), max_queue=10)
+    await limiter.acquire(None)
+    limiter.release(2.0)  # observed latency pushes the wait estimate up
+    await limiter.acquire(None)
+
+    with pytest.raises(AdmissionRejected) as excinfo:
+        await limiter.acquire(time.monotonic() + 0.01)
+
+    assert excinfo.value.reason == "deadline"
+    assert excinfo.value.retry_after_sec > 0
+    assert limiter.queued == 0
+
+
+async def test_queued_request_is_dropped_when_its_deadline_passes() -> None:
+    limiter = Limiter("t", FixedLimit(1), max_queue=10)
+    limiter._latency_ewma = 0.0  # estimate says "no wait", reality disagrees
+    await limiter.acquire(None)
+
+    with pytest.raises(AdmissionRejected) as excinfo:
+        await limiter.acquire(time.monotonic() + 0.05)
+
+    assert excinfo.value.reason == "deadline_expired"
+    assert limiter.queued == 0
+    limiter.release()
+    assert limiter.inflight == 0
+
+
+def test_request_deadline_headers() -> None:
+    def scope(*headers):
+        return {"headers": [(k.encode(), v.encode()) for k, v in headers]}
+
+    assert request_deadline(scope(("X-Request-Timeout", "2.5")), 10, now=1000.0) == 1002.5
+    assert request_deadline(scope(("X-Request-Deadline", "1234.5")), 10, now=1000.0) == 1234.5
+    assert request_deadline(scope(("X-Request-Deadline", "1234500")), 10, now=1000.0) == 1234500.0
+    assert request_deadline(scope(("X-Request-Deadline", "1700000000000")), 10, now=1000.0) == 1700000000.0
+    assert request_deadline(scope(("X-Request-Timeout", "soon")), 10, now=1000.0) == 1010.0
+    assert request_deadline(scope(), 0, now=1000.0) is None
+
+
+def test_classify_generation_routes() -> None:
+    classify = AdmissionController.classify
+    assert classify("POST", "/api/v1/generate") == ("generate", None)
+    assert classify("POST", "/api/v1/generate/EN") == ("generate", "en")
+    assert classify("POST", "/api/v1/generate/fr/document") == ("document", "fr")
+    assert classify("GET", "/api/v1/generate/en") is None
+    assert classify("POST", "/api/v1/tools/run") is None
+
+
+async def test_middleware_sheds_with_retry_after_and_propagates_deadline() -> None:
+    release = asyncio.Event()
+    seen_deadlines = []
+
+    async def app(scope, receive, send):
+        seen_deadlines.append(scope.get("state", {}).get("deadline"))
+        if scope["path"].endswith("/slow"):
+            await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    controller = AdmissionController(route_limit=8, language_limit=1, max_queue=0, adaptive=False)
+    wrapped = AdmissionControlMiddleware(app, controller)
+    transport = httpx.ASGITransport(app=wrapped)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.post("/api/v1/generate/slow", headers={"X-Request-Timeout": "5"}))
+        while controller.routes["generate"].inflight == 0:
+            await asyncio.sleep(0.01)
+
+        shed = await client.post("/api/v1/generate/slow")
+        other_lang = await client.post("/api/v1/generate/fr")
+        untouched = await client.get("/api/v1/generate/fr")
+
+        release.set()
+        assert (await first).status_code == 200
+
+    assert shed.status_code == 503
+    assert int(shed.headers["Retry-After"]) >= 1
+    assert shed.json()["reason"] == "queue_full"
+    assert other_lang.status_code == 200
+    assert untouched.status_code == 200
+    assert seen_deadlines[0] == pytest.approx(time.time() + 5, abs=2)
+    # No header: the default only bounds queueing, generation gets no deadline.
+    assert seen_deadlines[1] is None
+    assert controller.routes["generate"].inflight == 0
@@ -0,0 +1,150 @@
+# tests/adapters/test_grammar_hot_swap.py
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.adapters.engines import gf_wrapper
+from app.adapters.engines.gf_wrapper import GFGrammarEngine
+from app.adapters.messaging.grammar_reload import GrammarReloadListener
+from app.core.domain.events import EventType, SystemEvent
+
+
+class FakeConcrete:
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+
+    def linearize(self, expr: Any) -> str:
+        return f"{self.tag}:{expr}"
+
+
+class FakePGF:
+    """Stands in for the `pgf` module; readPGF returns the file's content as a tag."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+        self.gate: threading.Event | None = None
+        self.fail = False
+
+    def readPGF(self, path: str) -> Any:
+        self.reads += 1
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        if self.fail:
+            raise RuntimeError("truncated PGF")
+        tag = open(path, encoding="utf-8").read()
+        return SimpleNamespace(languages={"WikiEng": FakeConcrete(tag)})
+
+    @staticmethod
+    def readExpr(expr: str) -> str:
+        return expr
+
+
+def _rewrite(path, content: str) -> None:
+    stat = path.stat()
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def fake_pgf(monkeypatch) -> FakePGF:
+    fake = FakePGF()
+    monkeypatch.setattr(gf_wrapper, "pgf", fake)
+    return fake
+
+
+@pytest.fixture
+async def engine(tmp_path, fake_pgf) -> GFGrammarEngine:
+    path = tmp_path / "semantik_architect.pgf"
+    path.write_text("v1", encoding="utf-8")
+    engine = GFGrammarEngine(lib_path=str(path))
+    await engine.health_check()
+    return engine
+
+
+async def test_requests_use_old_grammar_until_new_one_is_swapped_in(engine, fake_pgf) -> None:
+    generation = engine.grammar_generation
+    fake_pgf.gate = threading.Event()
+    _rewrite(engine._pgf_file(), "v2")
+
+    reload_task = asyncio.create_task(engine.reload())
+    await asyncio.sleep(0.05)
+
+    # The read is parked in a worker thread; the loop still serves v1.
+    assert not reload_task.done()
+    assert engine.linearize("Expr", "WikiEng") == "v1:Expr"
+
+    fake_pgf.gate.set()
+    assert await reload_task is True
+    assert engine.linearize("Expr", "WikiEng") == "v2:Expr"
+    assert engine.grammar_generation == generation + 1
+
+
+async def test_failed_reload_keeps_serving_previous_grammar(engine, fake_pgf) -> None:
+    fake_pgf.fail = True
+    _rewrite(engine._pgf_file(), "broken")
+
+    assert await engine.reload() is False
+    assert engine.linearize("Expr", "WikiEng") == "v1:Expr"
+    assert engine.last_load_error_type == "pgf_read_failed"
+    assert await engine.health_check() is True
+
+
+async def test_reload_if_changed_skips_unchanged_file(engine, fake_pgf) -> None:
+    reads = fake_pgf.reads
+    assert await engine.reload_if_changed() is False
+    assert fake_pgf.reads == reads
+
+    _rewrite(engine._pgf_file(), "v2")
+    assert await engine.reload_if_changed() is True
+    assert fake_pgf.reads == reads + 1
+
+
+class FakeBroker:
+    def __init__(self) -> None:
+        self.handlers: dict[str, list[Any]] = {}
+
+    async def subscribe(self, event_type: EventType, handler: Any) -> None:
+        self.handlers.setdefault(event_type.value, []).append(handler)
+
+    async def deliver(self, event: SystemEvent) -> None:
+        for handler in self.handlers.get(event.type, []):
+            await handler(event)
+
+
+async def test_listener_reloads_engine_on_broadcast(engine, fake_pgf) -> None:
+    broker = FakeBroker()
+    refreshed: list[int] = []
+    listener = GrammarReloadListener(engine, broker, on_reload=lambda: refreshed.append(1))
+    assert await listener.start() is True
+    assert set(broker.handlers) == {"grammar.reloaded", "language.build.completed"}
+
+    _rewrite(engine._pgf_file(), "v2")
+    event = SystemEvent(
+        type=EventType.GRAMMAR_RELOADED,
+        payload={"pgf_path": engine.pgf_path, "mtime_ns": 0, "size": 2, "origin": "watcher"},
+    )
+    await broker.deliver(event)
+    # A second notification for the same file is a no-op.
+    await broker.deliver(SystemEvent(type=EventType.BUILD_COMPLETED, payload={"lang_code": "en"}))
+
+    assert listener.reloads == 1
+    assert refreshed == [1]
+    assert engine.linearize("Expr", "WikiEng") == "v2:Expr"
+
+    fake_pgf.fail = True
+    _rewrite(engine._pgf_file(), "broken")
+    await broker.deliver(event)
+    assert engine.linearize("Expr", "WikiEng") == "v2:Expr"
+    assert refreshed == [1]
+
+
+async def test_listener_ignores_engines_without_hot_reload() -> None:
+    broker = FakeBroker()
+    assert await GrammarReloadListener(object(), broker).start() is False
+    assert broker.handlers == {}
@@ -0,0 +1,101 @@
+# tests/adapters/test_journal_lexicon_repo.py
+import json
+
+import pytest
+
+from app.adapters.persistence.journal_lexicon_repo import (
+    JOURNAL_FILENAME,
+    JournalLexiconRepository,
+)
+from app.core.domain.models import LexiconEntry
+
+
+def _entry(lemma: str, qid: str | None = None) -> LexiconEntry:
+    features = {"qid": qid} if qid else {}
+    return LexiconEntry(lemma=lemma, pos="NOUN", features=features)
+
+
+@pytest.mark.asyncio
+class TestJournalLexiconRepository:
+
+    async def test_saves_are_journaled_and_readable_without_rewriting_shard(self, tmp_path):
+        repo = JournalLexiconRepository(str(tmp_path), compact_every=100)
+
+        await repo.save_entry("en", _entry("physicist", "Q169470"))
+        await repo.save_entry("en", _entry("chemist", "Q593644"))
+
+        shard = tmp_path / "data" / "lexicon" / "en" / "lexicon.json"
+        journal = tmp_path / "data" / "lexicon" / "en" / JOURNAL_FILENAME
+        assert not shard.exists()
+        assert len(journal.read_text(encoding="utf-8").splitlines()) == 2
+
+        hit = await repo.get_entry("en", "physicist")
+        assert hit is not None and hit.features["qid"] == "Q169470"
+        await repo.close()
+
+    async def test_qid_index_tracks_overwrites(self, tmp_path):
+        repo = JournalLexiconRepository(str(tmp_path))
+
+        await repo.save_entries("en", [_entry("physicist", "Q1"), _entry("scientist", "Q1")])
+        assert sorted(e.lemma for e in await repo.get_entries_by_concept("en", "Q1")) == [
+            "physicist",
+            "scientist",
+        ]
+
+        await repo.save_entry("en", _entry("scientist", "Q2"))
+        assert [e.lemma for e in await repo.get_entries_by_concept("en", "Q1")] == ["physicist"]
+        assert [e.lemma for e in await repo.get_entries_by_concept("en", "Q2")] == ["scientist"]
+        await repo.close()
+
+    async def test_compaction_writes_shard_and_truncates_journal(self, tmp_path):
+        repo = JournalLexiconRepository(str(tmp_path), compact_every=3)
+
+        await repo.save_entries("fr", [_entry(f"mot{i}") for i in range(3)])
+
+        lang_dir = tmp_path / "data" / "lexicon" / "fr"
+        shard = json.loads((lang_dir / "lexicon.json").read_text(encoding="utf-8"))
+        assert sorted(shard) == ["mot0", "mot1", "mot2"]
+        assert (lang_dir / JOURNAL_FILENAME).read_text(encoding="utf-8") == ""
+        await repo.close()
+
+    async def test_reopen_replays_journal_and_skips_torn_tail(self, tmp_path):
+        repo = JournalLexiconRepository(str(tmp_path), compact_every=1000)
+        await repo.save_entry("de", _entry("Physiker", "Q169470"))
+        # Simulate a crash: drop handles without compacting, leave a torn line.
+        for journal in repo._journals.values():
+            journal.handle.close()
+        journal_path = tmp_path / "data" / "lexicon" / "de" / JOURNAL_FILENAME
+        with journal_path.open("a", encoding="utf-8") as f:
+            f.write('{"k": "Chemi')
+
+        reopened = JournalLexiconRepository(str(tmp_path))
+        hit = await reopened.get_entry("de", "Physiker")
+        assert hit is not None
+        assert [e.lemma for e in await reopened.get_entries_by_concept("de", "Q169470")] == ["Physiker"]
+        await reopened.close()
+
+    async def test_repositories_sharing_a_lexicon_see_each_others_writes(self, tmp_path):
+        # Two instances stand in for two prefork workers; each flock is taken
+        # on its own open file description, so they exclude each other.
+        a = JournalLexiconRepository(str(tmp_path), compact_every=3)
+        b = JournalLexiconRepository(str(tmp_path), compact_every=3)
+
+        await a.save_entry("en", _entry("physicist", "Q1"))
+        assert (await b.get_entry("en", "physicist")) is not None
+
+        # b catches up on a's record first, so its compaction keeps it.
+        await b.save_entries("en", [_entry("chemist", "Q2"), _entry("scientist", "Q1")])
+        lang_dir = tmp_path / "data" / "lexicon" / "en"
+        shard = json.loads((lang_dir / "lexicon.json").read_text(encoding="utf-8"))
+        assert sorted(shard) == ["chemist", "physicist", "scientist"]
+
+        # a notices the compaction and keeps appending on top of it.
+        assert sorted(e.lemma for e in await a.get_entries_by_concept("en", "Q1")) == ["physicist", "scientist"]
+        await a.save_entry("en", _entry("biologist", "Q3"))
+        assert (await b.get_entry("en", "biologist")) is not None
+
+        await a.close()
+        await b.close()
+        reopened = JournalLexiconRepository(str(tmp_path))
+        assert {"biologist", "chemist", "physicist", "scientist"} <= set((await reopened._journal_for("en")).entries)
+        await reopened.close()
@@ -0,0 +1,114 @@
+# tests/adapters/test_language_catalog.py
+import json
+import os
+from unittest.mock import AsyncMock
+
+from app.adapters.api.routers.languages import LanguageCatalog
+from app.core.domain.events import EventType, SystemEvent
+
+API_PREFIX = "/api/v1"
+
+
+class MatrixRepo:
+    """Reads the matrix on every call, like the filesystem repo."""
+
+    def __init__(self, matrix_path) -> None:
+        self.matrix_path = matrix_path
+        self.calls = 0
+
+    async def list_languages(self):
+        self.calls += 1
+        data = json.loads(self.matrix_path.read_text(encoding="utf-8"))
+        return [{"code": code, "name": meta["name"]} for code, meta in data.items()]
+
+
+def _write_matrix(path, languages, mtime_ns) -> None:
+    path.write_text(json.dumps(languages), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_languages_served_from_catalog_with_etag_and_304(client, mock_repo):
+    mock_repo.list_languages = AsyncMock(
+        return_value=[
+            {"code": "fr", "name": "French"},
+            {"code": "WikiEng", "name": "English"},
+            {"code": "en", "name": "English (duplicate)"},
+            {"code": "??", "name": "Unknown"},
+        ]
+    )
+    client.app.state.language_catalog.invalidate()
+
+    first = client.get(f"{API_PREFIX}/languages/")
+    assert first.status_code == 200
+    assert [lang["code"] for lang in first.json()] == ["en", "fr"]
+    assert first.json()[0]["name"] == "English"
+    assert "max-age" in first.headers["Cache-Control"]
+    etag = first.headers["ETag"]
+
+    for _ in range(5):
+        assert client.get(f"{API_PREFIX}/languages/").json() == first.json()
+    not_modified = client.get(f"{API_PREFIX}/languages/", headers={"If-None-Match": etag})
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+    assert mock_repo.list_languages.await_count == 1  # one rebuild; later requests never reach the repo
+
+
+async def test_catalog_rebuilds_only_when_the_matrix_file_changes(tmp_path):
+    matrix = tmp_path / "everything_matrix.json"
+    _write_matrix(matrix, {"en": {"name": "English"}}, 1_000_000_000)
+    repo = MatrixRepo(matrix)
+    catalog = LanguageCatalog()
+
+    for _ in range(10):
+        await catalog.get(repo)
+    etag = catalog.etag
+    assert repo.calls == 1
+
+    _write_matrix(matrix, {"en": {"name": "English"}, "de": {"name": "German"}}, 2_000_000_000)
+    await catalog.get(repo)
+
+    assert repo.calls == 2
+    assert [lang.code for lang in catalog.languages] == ["de", "en"]
+    assert catalog.etag != etag
+
+
+async def test_broker_event_and_ttl_invalidate_catalog_without_a_matrix_file():
+    class Clock:
+        now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    repo = AsyncMock()
+    repo.list_languages = AsyncMock(return_value=["en"])
+    del repo.matrix_path
+    clock = Clock()
+    catalog = LanguageCatalog(ttl_sec=60, clock=clock)
+
+    await catalog.get(repo)
+    await catalog.get(repo)
+    assert repo.list_languages.await_count == 1
+
+    await catalog.handle_event(SystemEvent(type=EventType.BUILD_COMPLETED, payload={}))
+    await catalog.get(repo)
+    assert repo.list_languages.await_count == 2
+
+    clock.now += 61
+    await catalog.get(repo)
+    assert repo.list_languages.await_count == 3
+
+
+async def test_failed_rebuild_keeps_serving_the_previous_catalog():
+    repo = AsyncMock()
+    repo.list_languages = AsyncMock(return_value=["fr"])
+    del repo.matrix_path
+    catalog = LanguageCatalog()
+    await catalog.get(repo)
+    body = catalog.body
+
+    repo.list_languages = AsyncMock(side_effect=OSError("matrix unreadable"))
+    catalog.invalidate()
+    await catalog.get(repo)
+
+    assert catalog.body == body
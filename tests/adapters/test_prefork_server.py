@@ -0,0 +1,62 @@
+# tests/adapters/test_prefork_server.py
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+from app.adapters.api.server import parse_smaps, read_memory_usage
+from app.adapters.engines import family_construction_adapter as family
+
+SMAPS_ROLLUP = """\
+55d0c0a00000-7ffd5b7fe000 ---p 00000000 00:00 0                          [rollup]
+Rss:               75264 kB
+Pss:               37700 kB
+Shared_Clean:      50000 kB
+Shared_Dirty:       6000 kB
+Private_Clean:       264 kB
+Private_Dirty:     19000 kB
+Swap:                  0 kB
+"""
+
+
+def test_smaps_rollup_is_split_into_unique_and_shared() -> None:
+    usage = parse_smaps(SMAPS_ROLLUP, pid=42)
+
+    assert usage.pid == 42
+    assert usage.rss == 75264 * 1024
+    assert usage.pss == 37700 * 1024
+    assert usage.shared == 56000 * 1024
+    assert usage.unique == 19264 * 1024
+    assert usage.as_mb()["unique"] == pytest.approx(18.8, abs=0.05)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc is Linux-only")
+def test_own_process_memory_is_readable() -> None:
+    usage = read_memory_usage(os.getpid())
+
+    assert usage is not None
+    assert usage.rss > 0
+    assert usage.unique + usage.shared == pytest.approx(usage.rss, rel=0.05)
+
+
+def test_family_config_json_is_parsed_once_per_file_version(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "grammar_matrix.json"
+    path.write_text(json.dumps({"copula": {"lemma": "be"}}), encoding="utf-8")
+
+    reads: list[str] = []
+    real_loads = json.loads
+    monkeypatch.setattr(family.json, "loads", lambda text: reads.append(text) or real_loads(text))
+
+    first = family._load_json(path)
+    assert family._load_json(path) is first
+    assert len(reads) == 1
+
+    stat = path.stat()
+    path.write_text(json.dumps({"copula": {"lemma": "is"}}), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert family._load_json(path) == {"copula": {"lemma": "is"}}
+    assert len(reads) == 2
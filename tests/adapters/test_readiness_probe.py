@@ -0,0 +1,113 @@
+# tests/adapters/test_readiness_probe.py
+import asyncio
+import time
+
+from app.adapters.api.routers.health import ReadinessProbe
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _checks(**overrides):
+    async def up() -> bool:
+        return True
+
+    async def warm() -> str:
+        return "warm"
+
+    checks = {"broker": up, "storage": up, "engine": up, "grammar": warm, "lexicon": warm}
+    checks.update(overrides)
+    return checks
+
+
+async def test_checks_run_concurrently_and_report_per_component_latency() -> None:
+    async def slow() -> bool:
+        await asyncio.sleep(0.2)
+        return True
+
+    probe = ReadinessProbe(timeout_sec=1.0)
+    started = time.perf_counter()
+    report = await probe.report(_checks(broker=slow, storage=slow, engine=slow))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5  # ~max of the checks, not their sum
+    assert report["status"] == "ready"
+    assert report["broker"] == report["storage"] == report["engine"] == "up"
+    assert report["latency_ms"]["broker"] >= 150
+    assert report["latency_ms"]["grammar"] < 150
+    assert probe.is_ready(report)
+
+
+async def test_hung_check_times_out_and_is_reused_by_the_next_refresh() -> None:
+    calls = []
+    release = asyncio.Event()
+
+    async def hung() -> bool:
+        calls.append(1)
+        await release.wait()
+        return True
+
+    clock = Clock()
+    probe = ReadinessProbe(ttl_sec=1.0, timeout_sec=0.05, clock=clock)
+
+    report = await probe.report(_checks(storage=hung))
+    assert report["storage"] == "timeout"
+    assert report["status"] == "not_ready"
+    assert not probe.is_ready(report)
+
+    clock.now += 2
+    await probe.report(_checks(storage=hung))
+    assert len(calls) == 1  # still in flight: awaited again, not restarted
+
+    release.set()
+    await asyncio.sleep(0)
+    clock.now += 2
+    assert (await probe.report(_checks(storage=hung)))["storage"] == "up"
+
+
+async def test_concurrent_probes_share_one_round_of_checks_until_ttl_expires() -> None:
+    calls = []
+
+    async def counted() -> bool:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return True
+
+    clock = Clock()
+    probe = ReadinessProbe(ttl_sec=2.0, clock=clock)
+
+    reports = await asyncio.gather(*(probe.report(_checks(broker=counted)) for _ in range(20)))
+
+    assert len(calls) == 1
+    assert sum(1 for r in reports if not r["cached"]) == 1
+    clock.now += 1
+    assert (await probe.report(_checks(broker=counted)))["cached"] is True
+    clock.now += 2
+    assert (await probe.report(_checks(broker=counted)))["cached"] is False
+    assert len(calls) == 2
+
+
+async def test_cold_grammar_or_lexicon_is_degraded_and_failures_are_down() -> None:
+    async def cold() -> str:
+        return "cold"
+
+    async def broken() -> bool:
+        raise ConnectionError("redis gone")
+
+    lenient = ReadinessProbe()
+    strict = ReadinessProbe(require_warm=True)
+
+    degraded = await lenient.report(_checks(lexicon=cold))
+    assert degraded["status"] == "degraded"
+    assert degraded["lexicon"] == "cold"
+    assert lenient.is_ready(degraded)
+    assert not strict.is_ready(degraded)
+
+    down = await strict.report(_checks(broker=broken))
+    assert down["broker"] == "down"
+    assert down["status"] == "not_ready"
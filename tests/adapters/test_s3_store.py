@@ -0,0 +1,220 @@
+# tests/adapters/test_s3_store.py
+import hashlib
+import io
+import json
+import threading
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.adapters.s3_repo import S3LanguageRepo
+from app.adapters.s3_store import S3ObjectStore
+
+BUCKET = "grammars"
+
+
+def _error(code: str, operation: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
+
+
+class FakeS3:
+    """In-memory stand-in for the subset of the boto3 S3 client the store uses."""
+
+    def __init__(self) -> None:
+        self.objects = {}
+        self.uploads = {}
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _record(self, name, **kwargs):
+        with self._lock:
+            self.calls.append((name, kwargs))
+
+    def count(self, name):
+        return sum(1 for call, _ in self.calls if call == name)
+
+    def put(self, key, data):
+        self.objects[key] = (data, '"' + hashlib.md5(data).hexdigest() + '"')
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self._record("put_object", Key=Key)
+        self.put(Key, bytes(Body))
+        return {"ETag": self.objects[Key][1]}
+
+    def get_object(self, Bucket, Key, Range=None, IfNoneMatch=None, IfMatch=None):
+        self._record("get_object", Key=Key, Range=Range)
+        if Key not in self.objects:
+            raise _error("NoSuchKey", "GetObject")
+        data, etag = self.objects[Key]
+        if IfNoneMatch == etag:
+            raise _error("304", "GetObject")
+        if IfMatch is not None and IfMatch != etag:
+            raise _error("PreconditionFailed", "GetObject")
+        response = {"ETag": etag}
+        if Range:
+            start, end = (int(x) for x in Range.removeprefix("bytes=").split("-"))
+            if start >= len(data):
+                raise _error("InvalidRange", "GetObject")
+            end = min(end, len(data) - 1)
+            response["ContentRange"] = f"bytes {start}-{end}/{len(data)}"
+            data = data[start : end + 1]
+        response["Body"] = io.BytesIO(data)
+        return response
+
+    def list_objects_v2(self, Bucket, Prefix="", MaxKeys=1000, ContinuationToken=None):
+        keys = sorted(k for k in self.objects if k.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start : start + 2]
+        response = {"Contents": [{"Key": k} for k in page], "IsTruncated": start + 2 < len(keys)}
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + 2)
+        return response
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        self._record("create_multipart_upload", Key=Key)
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self._record("upload_part", Key=Key, PartNumber=PartNumber)
+        self.uploads[UploadId][PartNumber] = bytes(Body)
+        return {"ETag": f'"part-{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        numbers = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        self.objects[Key] = (b"".join(parts[n] for n in numbers), f'"multi-{len(numbers)}"')
+        return {"ETag": self.objects[Key][1]}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self._record("abort_multipart_upload", Key=Key)
+        self.uploads.pop(UploadId, None)
+
+
+@pytest.fixture
+def fake_s3():
+    return FakeS3()
+
+
+@pytest.fixture
+def store(fake_s3, tmp_path):
+    store = S3ObjectStore(fake_s3, BUCKET, cache_dir=tmp_path / "cache", max_concurrency=4, multipart_threshold=64, part_size=16)
+    yield store
+    store.close()
+
+
+async def test_small_object_is_fetched_once_then_revalidated_with_304(store, fake_s3):
+    fake_s3.put("sources/en/WikiEn.gf", b"concrete WikiEn")
+
+    assert await store.get("sources/en/WikiEn.gf") == b"concrete WikiEn"
+    assert await store.get("sources/en/WikiEn.gf") == b"concrete WikiEn"
+
+    assert fake_s3.count("get_object") == 2  # one full read, one 304
+    fake_s3.put("sources/en/WikiEn.gf", b"concrete WikiEn v2")
+    assert await store.get("sources/en/WikiEn.gf") == b"concrete WikiEn v2"
+
+
+async def test_large_object_is_downloaded_as_parallel_ranges(store, fake_s3):
+    data = bytes(range(256)) * 2
+    fake_s3.put("grammars/en.pgf", data)
+
+    path = await store.get_path("grammars/en.pgf")
+
+    assert path.read_bytes() == data
+    assert path.name == hashlib.sha256(data).hexdigest()
+    assert fake_s3.count("get_object") == 512 // 16
+
+
+async def test_cache_is_content_addressed_and_survives_restart(store, fake_s3, tmp_path):
+    fake_s3.put("grammars/en.pgf", b"same bytes")
+    fake_s3.put("grammars/en-GB.pgf", b"same bytes")
+    first = await store.get_path("grammars/en.pgf")
+    second = await store.get_path("grammars/en-GB.pgf")
+    assert first == second
+
+    reopened = S3ObjectStore(fake_s3, BUCKET, cache_dir=tmp_path / "cache")
+    calls = len(fake_s3.calls)
+    assert await reopened.get("grammars/en.pgf") == b"same bytes"
+    assert fake_s3.calls[calls][1]["Range"] == "bytes=0-8388607"  # revalidation only: answered with a 304
+    reopened.close()
+
+
+async def test_unreachable_s3_serves_cached_copy_and_fails_for_uncached_keys(store, fake_s3, monkeypatch):
+    fake_s3.put("grammars/fr.pgf", b"pgf")
+    await store.get("grammars/fr.pgf")
+
+    def unavailable(**kwargs):
+        raise _error("ServiceUnavailable", "GetObject")
+
+    fake_s3.get_object = unavailable
+    monkeypatch.setattr(S3ObjectStore._get_range.retry, "sleep", lambda _: None)
+    assert await store.get("grammars/fr.pgf") == b"pgf"
+
+    with pytest.raises(ClientError):
+        await store.get("grammars/de.pgf")
+
+
+async def test_large_upload_is_multipart_and_written_through(store, fake_s3):
+    data = b"x" * 100
+
+    await store.put("grammars/de.pgf", data)
+
+    assert fake_s3.count("upload_part") == 7
+    assert fake_s3.count("put_object") == 0
+    assert fake_s3.objects["grammars/de.pgf"][0] == data
+    assert await store.get("grammars/de.pgf") == data
+    assert fake_s3.count("get_object") == 1  # 304: the upload already populated the cache
+
+
+async def test_failed_multipart_upload_is_aborted(store, fake_s3, monkeypatch):
+    def broken_part(**kwargs):
+        raise _error("AccessDenied", "UploadPart")
+
+    fake_s3.upload_part = broken_part
+    monkeypatch.setattr(S3ObjectStore._upload_part.retry, "sleep", lambda _: None)
+
+    with pytest.raises(ClientError):
+        await store.put("grammars/de.pgf", b"x" * 100)
+
+    assert fake_s3.count("abort_multipart_upload") == 1
+    assert fake_s3.uploads == {}
+
+
+async def test_repo_prefetches_grammars_and_reuses_parsed_matrix(store, fake_s3):
+    for lang in ("de", "en", "fr"):
+        fake_s3.put(f"grammars/{lang}.pgf", f"pgf-{lang}".encode())
+    fake_s3.put("grammars/README.txt", b"not a grammar")
+    matrix = {"languages": {"en": {"meta": {"iso": "en", "name": "English"}}}}
+    fake_s3.put("data/indices/everything_matrix.json", json.dumps(matrix).encode())
+    repo = S3LanguageRepo(store=store)
+
+    assert await repo.prefetch_grammars() == 3
+    assert (await repo.get_pgf_path("fr")).read_bytes() == b"pgf-fr"
+    assert await repo.get_pgf_path("xx") is None
+
+    first = await repo.list_languages()
+    repo_parsed = repo._matrix
+    assert await repo.list_languages() == first == [{"code": "en", "name": "English", "z_id": None}]
+    assert repo._matrix is repo_parsed
+
+
+def test_repo_against_moto(tmp_path):
+    moto = pytest.importorskip("moto")
+    boto3 = pytest.importorskip("boto3")
+    import asyncio
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        store = S3ObjectStore(client, BUCKET, cache_dir=tmp_path, multipart_threshold=5 * 1024 * 1024, part_size=5 * 1024 * 1024)
+        repo = S3LanguageRepo(store=store)
+        data = b"p" * (11 * 1024 * 1024)
+
+        async def scenario():
+            await repo.save_pgf("en", data)
+            store.cache.forget("grammars/en.pgf")
+            return (await repo.get_pgf_path("en")).read_bytes()
+
+        assert asyncio.run(scenario()) == data
+        store.close()
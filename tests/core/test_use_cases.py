@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.adapters.engines.construction_realizer import ConstructionRealizer
 from app.core.domain.events import EventType
 from app.core.domain.exceptions import DomainError, InvalidFrameError
 from app.core.domain.models import Frame, Sentence
@@ -300,6 +301,62 @@ class TestGenerateText:
         assert first.debug_info["runtime_path"] == "planner_first"
         assert second.debug_info["runtime_path"] == "planner_first"
 
+    async def test_execute_records_stage_timings_including_failed_backend_attempts(self):
+        frame = _sample_frame()
+
+        planner = MagicMock()
+        planner.plan = AsyncMock(
+            return_value={
+                "construction_id": "copula_equative_classification",
+                "lang_code": "eng",
+                "slot_map": {"subject": "Alan Turing"},
+            }
+        )
+
+        failing_gf = MagicMock()
+        failing_gf.get_support_status = MagicMock(return_value="full")
+        failing_gf.realize = AsyncMock(side_effect=DomainError("gf exploded"))
+
+        safe_mode = MagicMock()
+        safe_mode.get_support_status = MagicMock(return_value="fallback_only")
+        safe_mode.realize = AsyncMock(
+            return_value={"text": "Alan Turing is a mathematician.", "debug_info": {}}
+        )
+
+        use_case = GenerateText(
+            planner=planner,
+            realizer=ConstructionRealizer(gf_realizer=failing_gf, safe_mode_realizer=safe_mode),
+            stage_timing=True,
+        )
+
+        result = await use_case.execute("eng", frame)
+
+        timings = result.debug_info["stage_timings"]
+        assert [t["stage"] for t in timings if not t["stage"].startswith("realizer.")] == [
+            "planner",
+            "realizer",
+        ]
+        attempts = [t for t in timings if t["stage"] == "realizer.backend"]
+        assert [(a["backend"], a["outcome"]) for a in attempts] == [
+            ("gf", "failed"),
+            ("safe_mode", "selected"),
+        ]
+        assert all(t["duration_ms"] >= 0.0 for t in timings)
+
+    async def test_execute_omits_stage_timings_when_disabled(self):
+        frame = _sample_frame()
+
+        planner = MagicMock()
+        planner.plan = AsyncMock(return_value={"construction_id": "x", "lang_code": "eng"})
+        realizer = MagicMock()
+        realizer.realize = AsyncMock(return_value="Alan Turing is a mathematician.")
+
+        use_case = GenerateText(planner=planner, realizer=realizer, stage_timing=False)
+
+        result = await use_case.execute("eng", frame)
+
+        assert "stage_timings" not in result.debug_info
+
 
 @pytest.mark.asyncio
 class TestBuildLanguage:
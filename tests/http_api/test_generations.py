@@ -1,6 +1,7 @@
 # tests/http_api/test_generations.py
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import pytest
@@ -24,9 +25,12 @@ class FakeGenerateTextUseCase:
 
     def __init__(self) -> None:
         self.calls: list[tuple[str, Any]] = []
+        self.delay_sec = 0.0
 
     async def execute(self, lang_code: str, frame: Any) -> Sentence:
         self.calls.append((lang_code, frame))
+        if self.delay_sec:
+            await asyncio.sleep(self.delay_sec)
         subject_name = self._extract_subject_name(frame)
 
         text = f"Fake generated text for {subject_name} in {lang_code}"
@@ -245,4 +249,147 @@ def test_generate_path_route_invalid_payload_returns_422(client: TestClient) ->
 
     assert response.status_code == 422
     detail = response.json()["detail"]
-    assert "frame_type" in detail.lower() or "invalid" in detail.lower()
\ No newline at end of file
+    assert "frame_type" in detail.lower() or "invalid" in detail.lower()
+
+class _CountingEngine:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, lang_code: str, frame: Any) -> Sentence:
+        self.calls += 1
+        return Sentence(text=f"Generated #{self.calls}", lang_code=lang_code)
+
+
+@pytest.fixture()
+def cached_client(monkeypatch: pytest.MonkeyPatch):
+    from app.adapters.api.routers import generation as generation_router
+    from app.adapters.result_cache import InMemoryResultCache
+    from app.core.use_cases.generate_text import GenerateText
+
+    async def _no_discourse(session_id: str, frame: Any) -> None:
+        return None
+
+    monkeypatch.setattr(generation_router, "_apply_discourse_context", _no_discourse)
+
+    engine = _CountingEngine()
+    use_case = GenerateText(engine=engine, result_cache=InMemoryResultCache(), stage_timing=False)
+
+    app = create_app()
+    app.dependency_overrides[get_generate_text_use_case] = lambda: use_case
+    app.dependency_overrides[verify_api_key] = lambda: "test-api-key"
+
+    with TestClient(app) as c:
+        yield c, engine
+
+    app.dependency_overrides.clear()
+
+
+def test_generate_path_route_serves_etag_and_304_from_result_cache(cached_client) -> None:
+    client, engine = cached_client
+
+    first = client.post(f"{API_PREFIX}/generate/en", json=_valid_bio_payload())
+    assert first.status_code == 200, first.text
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    second = client.post(f"{API_PREFIX}/generate/en", json=_valid_bio_payload())
+    assert second.headers["ETag"] == etag
+    assert second.json()["text"] == "Generated #1"
+    assert second.json()["debug_info"]["result_cache"] == "hit"
+
+    not_modified = client.post(
+        f"{API_PREFIX}/generate/en",
+        json=_valid_bio_payload(),
+        headers={"If-None-Match": etag},
+    )
+    assert not_modified.status_code == 304
+    assert engine.calls == 1
+
+
+def test_generate_path_route_lean_mode_returns_text_only(cached_client) -> None:
+    client, engine = cached_client
+
+    response = client.post(f"{API_PREFIX}/generate/en?debug=false", json=_valid_bio_payload())
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"text": "Generated #1", "lang_code": "en"}
+    lean_etag = response.headers["ETag"]
+    assert lean_etag.startswith('W/"') and lean_etag.endswith(';lean"')
+
+    full = client.post(f"{API_PREFIX}/generate/en", json=_valid_bio_payload())
+    assert full.json()["debug_info"]["runtime_path"] == "legacy_engine"
+    assert full.headers["ETag"] == lean_etag.replace(";lean", "")
+
+    # A validator only revalidates the representation it was issued for.
+    assert client.post(
+        f"{API_PREFIX}/generate/en?debug=false", json=_valid_bio_payload(), headers={"If-None-Match": lean_etag}
+    ).status_code == 304
+    assert client.post(
+        f"{API_PREFIX}/generate/en", json=_valid_bio_payload(), headers={"If-None-Match": lean_etag}
+    ).status_code == 200
+
+
+def test_generate_path_route_skips_result_cache_for_discourse_sessions(cached_client) -> None:
+    client, engine = cached_client
+    headers = {"X-Session-ID": "session-1"}
+
+    first = client.post(f"{API_PREFIX}/generate/en", json=_valid_bio_payload(), headers=headers)
+    second = client.post(f"{API_PREFIX}/generate/en", json=_valid_bio_payload(), headers=headers)
+
+    assert "ETag" not in first.headers
+    assert second.json()["text"] == "Generated #2"
+    assert engine.calls == 2
+
+
+def test_generate_document_route_plans_and_returns_sentences_in_order(
+    client: TestClient,
+    fake_use_case: FakeGenerateTextUseCase,
+) -> None:
+    turing = {"frame_type": "bio", "subject": {"name": "Alan Turing", "gender": "m", "qid": "Q7251"}}
+    response = client.post(
+        f"{API_PREFIX}/generate/en/document",
+        json={"frames": [_valid_bio_payload(), turing, _valid_bio_payload()], "domain": "generic"},
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [s["text"] for s in body["sentences"]] == [
+        "Fake generated text for Ada Lovelace in en",
+        "Fake generated text for Alan Turing in en",
+        "Fake generated text for Ada Lovelace in en",
+    ]
+    assert body["text"] == " ".join(s["text"] for s in body["sentences"])
+    assert body["debug_info"]["sentence_count"] == 3
+    assert len(fake_use_case.calls) == 3
+
+
+def test_generate_document_route_rejects_empty_and_mismatched_payloads(client: TestClient) -> None:
+    empty = client.post(f"{API_PREFIX}/generate/en/document", json={"frames": []})
+    assert empty.status_code == 422
+
+    mismatch = client.post(
+        f"{API_PREFIX}/generate/en/document",
+        json={"frames": [{**_valid_bio_payload(), "lang": "fr"}]},
+    )
+    assert mismatch.status_code == 422
+    assert "mismatch" in mismatch.json()["detail"].lower()
+
+
+def test_generate_returns_504_when_generation_outlives_the_request_deadline(
+    client: TestClient,
+    fake_use_case: FakeGenerateTextUseCase,
+) -> None:
+    fake_use_case.delay_sec = 2.0
+
+    response = client.post(
+        f"{API_PREFIX}/generate/en",
+        json=_valid_bio_payload(),
+        headers={"X-Request-Timeout": "0.1"},
+    )
+
+    assert response.status_code == 504
+    assert "deadline" in response.json()["detail"]
+
+    fake_use_case.delay_sec = 0.0
+    ok = client.post(f"{API_PREFIX}/generate/en", json=_valid_bio_payload(), headers={"X-Request-Timeout": "5"})
+    assert ok.status_code == 200
@@ -0,0 +1,168 @@
+# tests/http_api/test_tools_run.py
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.api.dependencies import verify_api_key
+from app.adapters.api.main import create_app
+from app.adapters.api.routers import tools as tools_router
+from app.adapters.api.tools.models import ToolSpec
+from app.adapters.api.tools.runner import (
+    EXIT_CANCELLED,
+    OutputRing,
+    ToolProcess,
+    ToolRunManager,
+    tool_runs,
+)
+
+API_PREFIX = "/api/v1"
+
+SCRIPT = (
+    "import sys\n"
+    "for i in range(3):\n"
+    "    print('line %d' % i, flush=True)\n"
+    "print('oops', file=sys.stderr)\n"
+)
+
+
+def _spec(tool_id: str, code: str, *, timeout_sec: int = 30) -> ToolSpec:
+    # rel_target only has to exist under the repo root; the command ignores it.
+    # cmd parts go through str.format, so the code must not contain braces.
+    return ToolSpec(
+        tool_id=tool_id,
+        description="test tool",
+        rel_target="requirements.txt",
+        cmd=(sys.executable, "-u", "-c", code),
+        timeout_sec=timeout_sec,
+    )
+
+
+@pytest.fixture(scope="module")
+def client():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(tools_router.TOOL_REGISTRY, "echo_tool", _spec("echo_tool", SCRIPT))
+        mp.setitem(tools_router.TOOL_REGISTRY, "sleep_tool", _spec("sleep_tool", "import time; time.sleep(30)"))
+
+        app = create_app()
+        app.dependency_overrides[verify_api_key] = lambda: "test-api-key"
+        with TestClient(app) as c:
+            yield c
+        app.dependency_overrides.clear()
+
+
+def _parse_sse(body: str) -> list[tuple[str, str]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        name, data = "", []
+        for line in block.split("\n"):
+            if line.startswith("event: "):
+                name = line[len("event: ") :]
+            elif line.startswith("data: "):
+                data.append(line[len("data: ") :])
+        events.append((name, "\n".join(data)))
+    return events
+
+
+def test_output_ring_keeps_bounded_tail() -> None:
+    ring = OutputRing(limit_chars=10)
+    for chunk in ("abcdef", "ghijkl", "mn"):
+        ring.append(chunk)
+
+    assert ring.total_chars == 14
+    assert ring.truncated
+    assert ring.text().endswith("efghijklmn")
+
+
+def test_run_returns_envelope_from_async_runner(client: TestClient) -> None:
+    resp = client.post(f"{API_PREFIX}/tools/run", json={"tool_id": "echo_tool"})
+
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["success"] is True
+    assert body["stdout"] == "line 0\nline 1\nline 2\n"
+    assert body["stderr"] == "oops\n"
+    assert body["stdout_chars"] == len(body["stdout"])
+    assert tool_runs.all() == []
+
+
+def test_run_stream_emits_sse_chunks_then_envelope(client: TestClient) -> None:
+    with client.stream("POST", f"{API_PREFIX}/tools/run/stream", json={"tool_id": "echo_tool"}) as resp:
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        trace_id = resp.headers["X-Tool-Trace-Id"]
+        events = _parse_sse("".join(resp.iter_text()))
+
+    names = [name for name, _ in events]
+    assert names[0] == "start" and names[-1] == "end"
+    # `start` is only sent once the subprocess exists, so it carries a real pid.
+    assert isinstance(json.loads(events[0][1])["pid"], int)
+    assert "".join(data for name, data in events if name == "stdout") == "line 0\nline 1\nline 2\n"
+    assert "oops" in "".join(data for name, data in events if name == "stderr")
+
+    end = json.loads(events[-1][1])
+    assert end["trace_id"] == trace_id
+    assert end["exit_code"] == 0
+
+
+def test_run_is_rejected_while_the_tool_is_at_capacity(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    busy = ToolProcess(cmd=["true"], timeout_sec=1, env_updates={}, tool_id="sleep_tool", trace_id="busy-1")
+    monkeypatch.setitem(tool_runs._runs, busy.trace_id, busy)
+
+    resp = client.post(f"{API_PREFIX}/tools/run", json={"tool_id": "sleep_tool"})
+
+    assert resp.status_code == 429
+    assert [r["trace_id"] for r in client.get(f"{API_PREFIX}/tools/runs").json()] == ["busy-1"]
+    assert client.post(f"{API_PREFIX}/tools/runs/unknown/cancel").status_code == 404
+
+
+async def test_manager_caps_runs_per_tool_and_cancel_stops_the_process() -> None:
+    manager = ToolRunManager(default_limit=1)
+
+    def _sleeper(trace_id: str) -> ToolProcess:
+        code = "import time; print('up', flush=True); time.sleep(30)"
+        return ToolProcess(
+            cmd=[sys.executable, "-u", "-c", code],
+            timeout_sec=60,
+            env_updates={},
+            tool_id="sleep_tool",
+            trace_id=trace_id,
+            stream=True,
+        )
+
+    first = _sleeper("a")
+    assert manager.admit(first) is True
+    assert manager.admit(_sleeper("b")) is False
+
+    events = first.events()
+    name, text = await asyncio.wait_for(events.__anext__(), timeout=10)
+    assert name == "stdout" and text.startswith("up")
+
+    started = time.monotonic()
+    manager.get("a").cancel()
+    result = await asyncio.wait_for(first.wait(), timeout=10)
+    await asyncio.sleep(0)  # let the done callback release the slot
+
+    assert result.cancelled and result.exit_code == EXIT_CANCELLED
+    assert time.monotonic() - started < 10
+    assert manager.all() == []
+
+
+async def test_tool_process_timeout_terminates_process() -> None:
+    process = ToolProcess(
+        cmd=[sys.executable, "-c", "import time; time.sleep(30)"],
+        timeout_sec=1,
+        env_updates={},
+        tool_id="t",
+        trace_id="t1",
+    )
+    result = await asyncio.wait_for(process.wait(), timeout=10)
+
+    assert result.timed_out
+    assert result.exit_code == 124
+    assert "timed out" in result.stderr.text()
@@ -0,0 +1,174 @@
+# tests/integration/test_build_scheduler.py
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.workers import worker
+from app.workers.build_scheduler import BuildPriority, BuildScheduler
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def scheduler(clock: Clock) -> BuildScheduler:
+    # ARQ's pool returns bytes, like the default fakeredis client.
+    return BuildScheduler(
+        fakeredis.FakeAsyncRedis(),
+        debounce_sec=5.0,
+        strategy_key=worker._map_build_strategy,
+        clock=clock,
+    )
+
+
+async def test_requests_for_one_language_coalesce_within_debounce_window(scheduler, clock) -> None:
+    assert await scheduler.submit({"lang_code": "de", "strategy": "fast", "event_id": "e1"}) is True
+    clock.now += 2
+    assert await scheduler.submit({"lang_code": "de", "strategy": "full", "event_id": "e2"}) is False
+    assert await scheduler.submit({"lang_code": "de", "strategy": "fast", "event_id": "e3"}) is False
+
+    assert await scheduler.queue_depth() == {"interactive": 1, "bulk": 0}
+    # Later requests do not push the due time back.
+    clock.now += 2.9
+    assert await scheduler.claim_batch() is None
+    clock.now += 0.2
+
+    batch = await scheduler.claim_batch()
+    assert batch is not None
+    assert batch.langs == ["de"]
+    assert batch.strategy == "full"  # a clean request is never downgraded
+    assert batch.requests[0]["count"] == 3
+    assert batch.requests[0]["event_ids"] == ["e1", "e2", "e3"]
+    assert await scheduler.queue_depth() == {"interactive": 0, "bulk": 0}
+
+
+async def test_due_languages_are_batched_by_orchestrator_strategy(scheduler, clock) -> None:
+    for lang in ("de", "fr", "it"):
+        await scheduler.submit({"lang_code": lang, "strategy": "fast"})
+    await scheduler.submit({"lang_code": "es", "strategy": "full"})
+    clock.now += 6
+
+    first = await scheduler.claim_batch()
+    second = await scheduler.claim_batch()
+
+    assert sorted(first.langs) == ["de", "fr", "it"]
+    assert second.langs == ["es"] and second.strategy == "full"
+    assert await scheduler.claim_batch() is None
+
+
+async def test_interactive_requests_are_claimed_before_bulk(scheduler, clock) -> None:
+    await scheduler.submit({"lang_code": "zu", "priority": "bulk"})
+    await scheduler.submit({"lang_code": "xh", "priority": "bulk"})
+    clock.now += 1
+    await scheduler.submit({"lang_code": "en"})
+    # An interactive request promotes a language waiting in the bulk lane.
+    await scheduler.submit({"lang_code": "xh", "priority": "interactive"})
+    clock.now += 10
+
+    first = await scheduler.claim_batch()
+    second = await scheduler.claim_batch()
+
+    assert first.priority is BuildPriority.INTERACTIVE
+    assert sorted(first.langs) == ["en", "xh"]
+    assert second.priority is BuildPriority.BULK
+    assert second.langs == ["zu"]
+
+
+async def test_only_one_build_holds_the_fleet_lock(clock) -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    a = BuildScheduler(redis, clock=clock)
+    b = BuildScheduler(redis, clock=clock)
+
+    assert await a.acquire_lock() is True
+    assert await b.acquire_lock() is False
+    await b.release_lock()  # not the owner: no-op
+    assert await b.acquire_lock() is False
+    await a.release_lock()
+    assert await b.acquire_lock() is True
+
+
+async def test_ten_build_jobs_for_one_language_run_one_build(scheduler, clock) -> None:
+    ctx = {"build_scheduler": scheduler}
+    for i in range(10):
+        result = await worker.build_language(ctx, {"lang_code": "de", "strategy": "fast", "correlation_id": f"c{i}"})
+        assert result == "Scheduled build for de."
+    await worker.build_language(ctx, {"lang_code": "fr", "strategy": "fast"})
+    clock.now += 6
+
+    pgf_path = "/repo/gf/semantik_architect.pgf"
+    with (
+        patch.dict(os.environ, {"AW_PGF_PATH": pgf_path}, clear=False),
+        patch("app.workers.worker.settings.FILESYSTEM_REPO_PATH", "/repo"),
+        patch("app.workers.worker._run_indexer", new_callable=AsyncMock) as mock_indexer,
+        patch("app.workers.worker._run_orchestrator", new_callable=AsyncMock) as mock_orch,
+        patch("app.workers.worker.os.path.exists", return_value=True),
+        patch("app.workers.worker.runtime.reload", new_callable=AsyncMock),
+    ):
+        batch = await worker.dispatch_build_batch(ctx)
+        assert await worker.dispatch_build_batch(ctx) is None
+
+    assert sorted(batch.langs) == ["de", "fr"]
+    mock_indexer.assert_awaited_once()
+    mock_orch.assert_awaited_once()
+    assert sorted(mock_orch.call_args.kwargs["langs"]) == ["de", "fr"]
+    assert mock_orch.call_args.kwargs["clean"] is False
+    # The fleet lock is released after the build.
+    assert await scheduler.acquire_lock() is True
+
+
+async def test_failed_build_is_requeued_with_backoff_until_max_attempts(clock) -> None:
+    scheduler = BuildScheduler(
+        fakeredis.FakeAsyncRedis(), debounce_sec=5.0, max_attempts=2, retry_delay_sec=10.0, clock=clock
+    )
+    ctx = {"build_scheduler": scheduler}
+    await scheduler.submit({"lang_code": "de", "strategy": "fast", "event_id": "e1"})
+    clock.now += 6
+
+    with patch("app.workers.worker._build_languages", new_callable=AsyncMock, side_effect=RuntimeError("gf crashed")):
+        assert (await worker.dispatch_build_batch(ctx)).langs == ["de"]
+        # Not lost: pending again, due after the retry delay, ids preserved.
+        assert await scheduler.queue_depth() == {"interactive": 1, "bulk": 0}
+        assert await scheduler.claim_batch() is None
+        clock.now += 10
+
+        batch = await worker.dispatch_build_batch(ctx)
+        assert batch.requests[0]["event_ids"] == ["e1"]
+        assert batch.requests[0]["attempts"] == 1
+
+    # Second failure used up max_attempts: dropped, nothing left in flight.
+    assert await scheduler.queue_depth() == {"interactive": 0, "bulk": 0}
+    assert await scheduler.requeue_inflight() == []
+
+
+async def test_requests_left_in_flight_by_a_dead_worker_are_built_again(scheduler, clock) -> None:
+    await scheduler.submit({"lang_code": "fr", "strategy": "fast", "event_id": "e1"})
+    clock.now += 6
+    claimed = await scheduler.claim_batch()
+    assert claimed.langs == ["fr"]
+    # The worker dies here; a new request for the language arrives meanwhile.
+    await scheduler.submit({"lang_code": "fr", "strategy": "full", "event_id": "e2"})
+
+    ctx = {"build_scheduler": scheduler}
+    with patch("app.workers.worker._build_languages", new_callable=AsyncMock) as build:
+        assert await worker.dispatch_build_batch(ctx) is None  # recovered, not yet due
+        clock.now += 30
+        batch = await worker.dispatch_build_batch(ctx)
+
+    build.assert_awaited_once()
+    assert batch.langs == ["fr"]
+    assert batch.strategy == "full"
+    assert batch.requests[0]["event_ids"] == ["e1", "e2"]
+    assert await scheduler.requeue_inflight() == []
@@ -0,0 +1,171 @@
+# tests/integration/test_builder_pipeline.py
+import json
+import os
+import shutil
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from builder import compiler, pipeline
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LANGS = ("Eng", "Fre", "Ger", "Ita")
+
+FAKE_GF = """#!{python}
+import json, os, sys, time
+
+args = sys.argv[1:]
+files = args[args.index("-path") + 2:]
+started = time.time()
+failing = set(filter(None, os.environ.get("FAKE_GF_FAIL", "").split(",")))
+code = 0
+if failing & set(files):
+    sys.stderr.write("syntax error in " + ",".join(sorted(failing & set(files))) + "\\n")
+    code = 1
+else:
+    time.sleep(float(os.environ.get("FAKE_GF_DELAY", "0")))
+    for name in files:
+        open(name[:-3] + ".gfo", "w").write("object")
+    if len(files) > 1:
+        open("Wiki.pgf", "w").write("pgf")
+with open(os.environ["FAKE_GF_LOG"], "a") as log:
+    log.write(json.dumps({{"files": files, "start": started, "end": time.time()}}) + "\\n")
+sys.exit(code)
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    gf = bin_dir / "gf"
+    gf.write_text(FAKE_GF.format(python=sys.executable), encoding="utf-8")
+    gf.chmod(gf.stat().st_mode | stat.S_IEXEC)
+
+    root = tmp_path / "repo"
+    (root / "builder").mkdir(parents=True)
+    shutil.copy(REPO_ROOT / "builder" / "strategies.json", root / "builder" / "strategies.json")
+    languages = {}
+    for code in LANGS:
+        lang_dir = root / "gf-rgl" / "src" / code.lower()
+        lang_dir.mkdir(parents=True)
+        modules = {}
+        for module in ("Syntax", "Paradigms"):
+            path = lang_dir / f"{module}{code}.gf"
+            path.write_text(f"resource {module}{code} = {{}}", encoding="utf-8")
+            modules[module] = str(path.relative_to(root))
+        languages[code] = {"modules": modules}
+    inventory = root / "data" / "indices" / "rgl_inventory.json"
+    inventory.parent.mkdir(parents=True)
+    inventory.write_text(json.dumps({"languages": languages}), encoding="utf-8")
+
+    log = tmp_path / "gf_calls.jsonl"
+    monkeypatch.chdir(root)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_GF_LOG", str(log))
+    monkeypatch.delenv("FAKE_GF_FAIL", raising=False)
+    return root, log
+
+
+def _calls(log: Path):
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+
+def _failures(root: Path):
+    return json.loads((root / "data" / "reports" / "build_failures.json").read_text(encoding="utf-8"))
+
+
+def test_first_build_compiles_concretes_in_parallel_and_links(workspace, monkeypatch):
+    root, log = workspace
+    monkeypatch.setenv("FAKE_GF_DELAY", "0.5")
+
+    assert pipeline.run(jobs=4) is True
+
+    calls = _calls(log)
+    assert calls[0]["files"] == ["Wiki.gf"]
+    concretes = [c for c in calls if len(c["files"]) == 1 and c["files"] != ["Wiki.gf"]]
+    assert sorted(c["files"][0] for c in concretes) == [f"Wiki{code}.gf" for code in LANGS]
+    # All four compiles overlapped: each started before any of them finished.
+    assert max(c["start"] for c in concretes) < min(c["end"] for c in concretes)
+    assert calls[-1]["files"] == ["Wiki.gf"] + [f"Wiki{code}.gf" for code in LANGS]
+    assert (root / "gf" / "Wiki.pgf").exists()
+    assert _failures(root) == {}
+
+
+def test_unchanged_build_does_no_work(workspace):
+    root, log = workspace
+    assert pipeline.run(jobs=2) is True
+    mtimes = {p.name: p.stat().st_mtime_ns for p in (root / "gf").glob("Wiki*.gf")}
+    calls = len(_calls(log))
+
+    assert pipeline.run(jobs=2) is True
+
+    assert len(_calls(log)) == calls
+    assert {p.name: p.stat().st_mtime_ns for p in (root / "gf").glob("Wiki*.gf")} == mtimes
+
+
+def test_changed_rgl_input_recompiles_only_that_language(workspace):
+    root, log = workspace
+    assert pipeline.run(jobs=2) is True
+    calls = len(_calls(log))
+
+    (root / "gf-rgl" / "src" / "fre" / "ParadigmsFre.gf").write_text("resource ParadigmsFre = { -- v2 }", encoding="utf-8")
+    assert pipeline.run(jobs=2) is True
+
+    new_calls = [c["files"] for c in _calls(log)[calls:]]
+    assert new_calls == [["WikiFre.gf"], ["Wiki.gf"] + [f"Wiki{code}.gf" for code in LANGS]]
+
+
+def test_failures_are_reported_and_retried_on_every_run(workspace, monkeypatch):
+    root, log = workspace
+    monkeypatch.setenv("FAKE_GF_FAIL", "WikiIta.gf")
+
+    assert pipeline.run(jobs=2) is True
+    report = _failures(root)
+    assert list(report) == ["Ita"]
+    assert "syntax error in WikiIta.gf" in report["Ita"]["reason"]
+    assert _calls(log)[-1]["files"] == ["Wiki.gf", "WikiEng.gf", "WikiFre.gf", "WikiGer.gf"]
+
+    # Failures are never cached: same inputs retry only the failed language.
+    calls = len(_calls(log))
+    assert pipeline.run(jobs=2) is True
+    assert [c["files"] for c in _calls(log)[calls:]] == [["WikiIta.gf"]]
+    assert list(_failures(root)) == ["Ita"]
+    state = json.loads((root / "data" / "cache" / "builder_state.json").read_text(encoding="utf-8"))
+    assert "WikiIta.gf" not in state["languages"]
+
+    # Once gf succeeds (a transient failure, or a source patched by the
+    # healer), the language is compiled and linked in.
+    monkeypatch.delenv("FAKE_GF_FAIL")
+    calls = len(_calls(log))
+    assert compiler.run(jobs=2) is True
+    assert [c["files"] for c in _calls(log)[calls:]][0] == ["WikiIta.gf"]
+    assert _calls(log)[-1]["files"] == ["Wiki.gf"] + [f"Wiki{code}.gf" for code in LANGS]
+    assert _failures(root) == {}
+
+
+def test_runner_errors_are_reported_but_not_cached(workspace, monkeypatch):
+    root, log = workspace
+    assert pipeline.run(jobs=2) is True
+    (root / "gf-rgl" / "src" / "ger" / "SyntaxGer.gf").write_text("resource SyntaxGer = { -- v2 }", encoding="utf-8")
+
+    real_compile = compiler._compile_concrete
+
+    def flaky_compile(filename, path_arg, env):
+        if filename == "WikiGer.gf":
+            raise OSError("gf: Resource temporarily unavailable")
+        return real_compile(filename, path_arg, env)
+
+    monkeypatch.setattr(compiler, "_compile_concrete", flaky_compile)
+    assert compiler.run(jobs=2) is True
+    assert "Resource temporarily unavailable" in _failures(root)["Ger"]["reason"]
+
+    monkeypatch.setattr(compiler, "_compile_concrete", real_compile)
+    calls = len(_calls(log))
+    assert compiler.run(jobs=2) is True
+    assert [c["files"] for c in _calls(log)[calls:]][0] == ["WikiGer.gf"]
+    assert _failures(root) == {}
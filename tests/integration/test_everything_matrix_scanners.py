@@ -0,0 +1,121 @@
+# tests/integration/test_everything_matrix_scanners.py
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "tools" / "everything_matrix"))
+
+import app_scanner  # noqa: E402
+import lexicon_scanner  # noqa: E402
+import rgl_scanner  # noqa: E402
+from io_utils import FileResultCache  # noqa: E402
+
+ISO_TO_WIKI = {
+    "en": {"wiki": "Eng", "name": "English"},
+    "eng": {"wiki": "Eng", "name": "English"},
+    "fr": {"wiki": "Fre", "name": "French"},
+    "de": {"wiki": "Ger", "name": "German"},
+}
+
+
+def _entries(count, *, qid_every=1, forms_every=2):
+    return {
+        f"lemma_{i}": {
+            **({"qid": f"Q{i + 1}"} if i % qid_every == 0 else {}),
+            **({"forms": {"sg": f"lemma_{i}"}} if i % forms_every == 0 else {}),
+        }
+        for i in range(count)
+    }
+
+
+@pytest.fixture
+def lexicon(tmp_path):
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "iso_to_wiki.json").write_text(json.dumps(ISO_TO_WIKI), encoding="utf-8")
+    lex_root = tmp_path / "data" / "lexicon"
+    shards = {
+        "en": {"core.json": _entries(120), "people.json": _entries(80, qid_every=2), "science.json": _entries(30)},
+        "eng": {"core.json": _entries(5)},
+        "fr": {"core.json": _entries(40, qid_every=3), "wide.json": _entries(10)},
+        "de": {"core.json": _entries(60), "geography.json": _entries(300, forms_every=5)},
+    }
+    for lang, files in shards.items():
+        (lex_root / lang).mkdir(parents=True)
+        for name, entries in files.items():
+            (lex_root / lang / name).write_text(json.dumps({"_meta": {}, "entries": entries}), encoding="utf-8")
+    (lex_root / "de" / "broken.json").write_text("{not json", encoding="utf-8")
+    return lex_root
+
+
+def _scan(lex_root, **kwargs):
+    out = lexicon_scanner.scan_all_lexicons(lex_root, **kwargs)
+    return json.dumps(out), list(lexicon_scanner._SCAN_WARNINGS)
+
+
+def test_parallel_cached_lexicon_scan_matches_serial(lexicon):
+    expected, warnings = _scan(lexicon)
+    assert warnings == ["broken.json: Expecting property name enclosed in double quotes: line 1 column 2 (char 1)"]
+
+    # eng/ aliases en/ and is never read: 8 files in en/, fr/ and de/.
+    cache = FileResultCache()
+    assert _scan(lexicon, jobs=3, cache=cache) == (expected, warnings)
+    assert cache.stats() == {"files": 8, "hits": 0, "misses": 8}
+
+    # Warm cache: same output (and replayed warnings), nothing re-parsed.
+    cache.hits = cache.misses = 0
+    assert _scan(lexicon, jobs=3, cache=cache) == (expected, warnings)
+    assert (cache.hits, cache.misses) == (8, 0)
+
+
+def test_lexicon_cache_persists_and_reparses_only_changed_files(lexicon, tmp_path):
+    cache_file = tmp_path / "cache" / "lexicon_files.json"
+    cache = FileResultCache(cache_file, version="v1")
+    _scan(lexicon, jobs=2, cache=cache)
+    cache.save()
+
+    # A touched file (same content) is revalidated by hash, not re-parsed.
+    people = lexicon / "en" / "people.json"
+    st = people.stat()
+    os.utime(people, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    cache = FileResultCache(cache_file, version="v1")
+    _scan(lexicon, jobs=2, cache=cache)
+    assert (cache.hits, cache.misses) == (8, 0)
+
+    # An edited file is the only one re-parsed, and the result follows it.
+    (lexicon / "fr" / "core.json").write_text(json.dumps({"entries": _entries(250)}), encoding="utf-8")
+    cache = FileResultCache(cache_file, version="v1")
+    assert _scan(lexicon, jobs=2, cache=cache) == _scan(lexicon)
+    assert (cache.hits, cache.misses) == (7, 1)
+    assert json.loads(_scan(lexicon)[0])["fr"]["SEED"] == 10.0
+
+    # Another scanner version starts from scratch.
+    assert FileResultCache(cache_file, version="v2").entries == {}
+
+
+def test_parallel_rgl_walk_matches_os_walk(tmp_path):
+    src = tmp_path / "src"
+    for folder in ("english", "french", "api", "doc", ".git", "romance/sub/deep"):
+        (src / folder).mkdir(parents=True)
+        (src / folder / "Module.gf").write_text("x", encoding="utf-8")
+    (src / "Top.gf").write_text("x", encoding="utf-8")
+    os.symlink(src / "french", src / "french_link")
+
+    for include_api in (True, False):
+        serial = rgl_scanner._walk_pruned(str(src), {"doc"}, include_api)
+        assert rgl_scanner._walk_rgl(src, {"doc"}, include_api, jobs=3) == serial
+        roots = [Path(root).relative_to(src).as_posix() for root, _ in serial]
+        assert ("api" in roots) is include_api
+        assert not {"doc", ".git", "french_link"} & set(roots)
+
+
+def test_parallel_cached_app_scan_matches_serial():
+    expected = json.dumps(app_scanner.scan_application())
+    cache = FileResultCache()
+    assert json.dumps(app_scanner.scan_application(jobs=3, cache=cache)) == expected
+    misses = cache.misses
+    assert json.dumps(app_scanner.scan_application(jobs=3, cache=cache)) == expected
+    assert cache.misses == misses
@@ -0,0 +1,93 @@
+# tests/integration/test_pipeline_benchmark.py
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "tools" / "health"))
+
+import pipeline_benchmark  # noqa: E402
+
+
+class PartialRealizer:
+    """Knows the language but does not render the construction natively."""
+
+    def get_support_status(self, construction_id, lang_code):
+        return "partial"
+
+    async def realize(self, construction_plan):
+        raise AssertionError("partial cells must not be timed")
+
+
+def _broken_backend():
+    raise RuntimeError("backend not installed")
+
+
+def test_matrix_covers_every_cell_in_report_order():
+    matrix = pipeline_benchmark.build_matrix(
+        ["copula_locative", "transitive_event"], ["en", "fr"], ["family", "safe_mode"], "both"
+    )
+
+    assert len(matrix) == 2 * 2 * 2 * 2
+    assert matrix[:3] == [
+        ("copula_locative", "en", "family", True),
+        ("copula_locative", "en", "family", False),
+        ("copula_locative", "en", "safe_mode", True),
+    ]
+    assert {debug for *_, debug in pipeline_benchmark.build_matrix(["x"], ["en"], ["gf"], "on")} == {True}
+
+
+def test_unavailable_and_partial_backends_are_skipped_and_fallback_cells_are_measured(monkeypatch):
+    monkeypatch.setitem(pipeline_benchmark.BACKEND_FACTORIES, "gf", _broken_backend)
+    monkeypatch.setitem(pipeline_benchmark.BACKEND_FACTORIES, "family", PartialRealizer)
+    bench = pipeline_benchmark.PipelineBenchmark()
+    try:
+        unavailable = bench.run_cell("copula_locative", "en", "gf", iterations=2, alloc_iterations=0)
+        partial = bench.run_cell("copula_locative", "en", "family", iterations=2, alloc_iterations=0)
+        measured = bench.run_cell(
+            "copula_equative_classification", "en", "safe_mode", iterations=3, alloc_iterations=1
+        )
+    finally:
+        bench.close()
+
+    assert unavailable.status == "skipped"
+    assert unavailable.reason == "backend unavailable: backend not installed"
+    assert partial.status == "skipped"
+    assert partial.reason == "unsupported: realizer support status is 'partial'"
+
+    assert measured.status == "ok", measured.reason
+    assert measured.iterations == 3
+    assert measured.ops_per_sec > 0
+    assert set(measured.stages) >= {"plan", "select", "slots", "realize", "respond"}
+    assert measured.sample
+
+
+def test_baseline_gate_is_opt_in_and_host_bound(tmp_path, monkeypatch):
+    def run(*extra):
+        argv = ["pipeline_benchmark", "--constructions", "copula_locative", "--langs", "en"]
+        argv += ["--backends", "safe_mode", "--iterations", "2", "--alloc-iterations", "0", "--verbose", *extra]
+        monkeypatch.setattr(sys, "argv", argv)
+        with pytest.raises(SystemExit) as exit_info:
+            pipeline_benchmark.main()
+        return exit_info.value.code
+
+    baseline = tmp_path / "base.json"
+    assert run() == 0
+    assert not baseline.exists()
+
+    assert run("--baseline", str(baseline), "--update-baseline") == 0
+    stored = json.loads(baseline.read_text(encoding="utf-8"))
+    assert stored["host"] == pipeline_benchmark.host_fingerprint()
+    assert list(stored["cells"]) == ["copula_locative:en:safe_mode"]
+
+    # An impossible baseline from another host is reported, not gated on.
+    stored["cells"]["copula_locative:en:safe_mode"]["ops_per_sec"] = 1e12
+    stored["host"] = {**stored["host"], "node": "some-other-host"}
+    baseline.write_text(json.dumps(stored), encoding="utf-8")
+    assert run("--baseline", str(baseline)) == 0
+
+    stored["host"] = pipeline_benchmark.host_fingerprint()
+    baseline.write_text(json.dumps(stored), encoding="utf-8")
+    assert run("--baseline", str(baseline)) == 1
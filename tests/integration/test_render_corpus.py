@@ -0,0 +1,110 @@
+# tests/integration/test_render_corpus.py
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+import render_corpus  # noqa: E402
+
+LANGS = ["en", "fr"]
+
+
+class FakeGenerateText:
+    """Stands in for GenerateText: echoes the subject and records every call."""
+
+    calls: list = []
+
+    async def execute(self, lang, frame):
+        name = frame.subject.name
+        FakeGenerateText.calls.append((lang, name))
+        if name == "BOOM":
+            raise RuntimeError("realizer exploded")
+        # The first batch finishes last, so workers complete out of order.
+        if int(name[1:]) < 4:
+            await asyncio.sleep(0.2)
+        return SimpleNamespace(text=f"{lang}:{name}")
+
+
+def fake_factory():
+    return FakeGenerateText()
+
+
+def _write_input(path, names):
+    lines = []
+    for i, name in enumerate(names):
+        if name is None:
+            lines.append("{not json")
+        else:
+            lines.append(json.dumps({"id": f"Q{i}", "frame": {"frame_type": "bio", "name": name}}))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _args(tmp_path, **overrides):
+    argv = ["--input", str(tmp_path / "in.ndjson"), "--out", str(tmp_path / "out"), "--langs", *LANGS]
+    argv += ["--batch-size", "4", "--shard-size", "10", "--checkpoint-every", "1", "--progress-every", "0"]
+    args = render_corpus.build_parser().parse_args(argv)
+    for key, value in overrides.items():
+        setattr(args, key, value)
+    return args
+
+
+def _read_shards(out_dir, lang):
+    records = []
+    for path in sorted((out_dir / lang).glob("part-*.ndjson")):
+        records += [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    return records
+
+
+def test_shards_keep_input_order_across_workers_and_bad_records_become_error_lines(tmp_path):
+    names = [f"P{i}" for i in range(24)]
+    names[5] = None
+    names[13] = "BOOM"
+    _write_input(tmp_path / "in.ndjson", names)
+
+    summary = render_corpus.run(_args(tmp_path, workers=3, max_inflight=6), use_case_factory=fake_factory)
+
+    assert summary["aborted"] is None
+    assert summary["records"] == 24
+    assert summary["outputs"] == 48
+    assert summary["errors"] == 4
+    for lang in LANGS:
+        records = _read_shards(tmp_path / "out", lang)
+        assert [r["seq"] for r in records] == list(range(24))
+        assert sorted(p.name for p in (tmp_path / "out" / lang).iterdir()) == [
+            "part-00000.ndjson",
+            "part-00001.ndjson",
+            "part-00002.ndjson",
+        ]
+        assert records[0] == {"seq": 0, "id": "Q0", "lang": lang, "text": f"{lang}:P0"}
+        assert records[5]["error"].startswith("bad record:")
+        assert records[13] == {"seq": 13, "id": "Q13", "lang": lang, "error": "realizer exploded"}
+        assert all("text" in r for i, r in enumerate(records) if i not in (5, 13))
+
+
+def test_resume_skips_checkpointed_records_and_drops_uncheckpointed_output(tmp_path):
+    names = [f"P{i}" for i in range(12)]
+    _write_input(tmp_path / "in.ndjson", names)
+
+    FakeGenerateText.calls = []
+    first = render_corpus.run(_args(tmp_path, workers=0, limit=6), use_case_factory=fake_factory)
+    assert first["records"] == 6
+    assert {name for _, name in FakeGenerateText.calls} == {f"P{i}" for i in range(6)}
+
+    # Output a crash left behind after the last checkpoint must not survive the resume.
+    with (tmp_path / "out" / "en" / "part-00000.ndjson").open("a", encoding="utf-8") as f:
+        f.write('{"seq": 6, "lang": "en", "text": "torn"}\n')
+
+    FakeGenerateText.calls = []
+    second = render_corpus.run(_args(tmp_path, workers=0), use_case_factory=fake_factory)
+
+    assert second["processed_this_run"] == 6
+    assert second["outputs"] == 24
+    assert {name for _, name in FakeGenerateText.calls} == {f"P{i}" for i in range(6, 12)}
+    for lang in LANGS:
+        records = _read_shards(tmp_path / "out", lang)
+        assert [r["seq"] for r in records] == list(range(12))
+        assert [r["text"] for r in records] == [f"{lang}:P{i}" for i in range(12)]
@@ -0,0 +1,106 @@
+# tests/test_import_budget.py
+"""
+Import-time regression guard for the API and CLI entry points.
+
+Each entry point is imported in a fresh interpreter under `python -X importtime`.
+Two things are enforced:
+
+- the modules it must *not* pull in (heavy adapters belong behind lazy provider
+  resolution, not at import time), which is deterministic;
+- a cumulative import-time budget (best of a few runs), which catches broad
+  regressions. Scale it with ARCHITECT_IMPORT_BUDGET_SCALE on slow runners.
+
+`tools/health/startup_latency.py` prints the full per-entry-point report.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MARK = "--import-budget-start--"
+RUNS = 3
+
+BUDGET_SCALE = float(os.getenv("ARCHITECT_IMPORT_BUDGET_SCALE", "1.0"))
+
+# entry point -> (budget ms, modules that must stay unimported)
+ENTRY_POINTS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "app.core.domain": (
+        150.0,
+        ("fastapi", "redis", "boto3", "dependency_injector", "pydantic_settings", "opentelemetry"),
+    ),
+    "nlg.api": (
+        750.0,
+        ("fastapi", "redis", "boto3", "arq", "dependency_injector", "google.genai", "pgf"),
+    ),
+    "app.shared.container": (
+        1500.0,
+        (
+            "redis",
+            "boto3",
+            "arq",
+            "google.genai",
+            "pgf",
+            "opentelemetry.sdk",
+            "app.adapters.api.routers",
+        ),
+    ),
+    "app.adapters.api.main": (
+        2500.0,
+        ("boto3", "arq", "google.genai", "uvicorn", "opentelemetry.sdk"),
+    ),
+}
+
+
+def _import_once(module: str) -> Tuple[float, List[str]]:
+    """Return (cumulative import ms for `module`, modules imported for it)."""
+    code = f"import sys; sys.stderr.write({MARK!r} + '\\n'); import {module}"
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(REPO_ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(REPO_ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    _, _, tail = proc.stderr.partition(MARK)
+    total_us = 0
+    imported: List[str] = []
+    for line in tail.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        imported.append(name.strip())
+        if not name.startswith("  "):  # top level: its cumulative covers its subtree
+            total_us += int(cumulative)
+    return total_us / 1000.0, imported
+
+
+@pytest.mark.parametrize("module", sorted(ENTRY_POINTS))
+def test_entry_point_import_stays_lean(module: str) -> None:
+    budget_ms, forbidden = ENTRY_POINTS[module]
+
+    samples = [_import_once(module) for _ in range(RUNS)]
+    best_ms = min(ms for ms, _ in samples)
+    imported = samples[0][1]
+
+    leaked = sorted(
+        {f for f in forbidden for name in imported if name == f or name.startswith(f + ".")}
+    )
+    assert not leaked, f"importing {module} pulls in {leaked}"
+    assert best_ms <= budget_ms * BUDGET_SCALE, (
+        f"importing {module} took {best_ms:.0f} ms (budget {budget_ms * BUDGET_SCALE:.0f} ms); "
+        "run tools/health/startup_latency.py for the breakdown"
+    )
@@ -0,0 +1,134 @@
+# tests/test_lexicon_cache.py
+"""
+Tests for the bounded, per-language-locked lexicon index cache.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from app.adapters.persistence.lexicon import cache
+from app.adapters.persistence.lexicon.config import LexiconConfig, get_config, set_config
+
+
+def _write_shard(base: Path, lang: str, lemmas: list[str]) -> Path:
+    lang_dir = base / lang
+    lang_dir.mkdir(parents=True, exist_ok=True)
+    data = {"meta": {"language": lang, "schema_version": "2"}}
+    for lemma in lemmas:
+        data[lemma] = {"key": lemma, "lemma": lemma, "pos": "NOUN"}
+    path = lang_dir / "core.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def lexicon_env(tmp_path):
+    previous = get_config()
+
+    def configure(**kwargs) -> Path:
+        set_config(LexiconConfig(lexicon_dir=str(tmp_path), **kwargs))
+        return tmp_path
+
+    cache.clear_cache()
+    cache.reset_cache_stats()
+    yield configure
+    cache.clear_cache()
+    cache.reset_cache_stats()
+    set_config(previous)
+
+
+def test_lru_eviction_honours_max_langs(lexicon_env) -> None:
+    base = lexicon_env(cache_max_langs=2, cache_refresh_sec=0)
+    for lang in ("aa", "bb", "cc"):
+        _write_shard(base, lang, [f"{lang}_word"])
+
+    cache.get_or_build_index("aa")
+    cache.get_or_build_index("bb")
+    cache.get_or_build_index("aa")  # bb is now least recently used
+    cache.get_or_build_index("cc")
+
+    assert cache.cached_languages() == ["aa", "cc"]
+    stats = cache.cache_stats()
+    assert stats["misses"] == 3
+    assert stats["hits"] == 1
+    assert stats["evictions"] == 1
+    assert stats["evicted_bytes"] > 0
+
+
+def test_memory_budget_evicts_but_keeps_newest(lexicon_env) -> None:
+    base = lexicon_env(cache_max_bytes=1, cache_refresh_sec=0)
+    _write_shard(base, "aa", ["one"])
+    _write_shard(base, "bb", ["two"])
+
+    cache.get_or_build_index("aa")
+    cache.get_or_build_index("bb")
+
+    assert cache.cached_languages() == ["bb"]
+    assert cache.memory_report()["bb"] == cache.cache_stats()["cached_bytes"]
+
+
+def test_cold_build_does_not_block_other_languages(lexicon_env, monkeypatch) -> None:
+    base = lexicon_env(cache_refresh_sec=0)
+    _write_shard(base, "slow", ["slow_word"])
+    _write_shard(base, "fast", ["fast_word"])
+
+    release = threading.Event()
+    started = threading.Event()
+    real_load = cache.load_lexicon
+    calls: list[str] = []
+
+    def load(lang: str):
+        calls.append(lang)
+        if lang == "slow":
+            started.set()
+            release.wait(5)
+        return real_load(lang)
+
+    monkeypatch.setattr(cache, "load_lexicon", load)
+
+    slow_threads = [threading.Thread(target=cache.get_or_build_index, args=("slow",)) for _ in range(3)]
+    for t in slow_threads:
+        t.start()
+    assert started.wait(5)
+
+    cache.get_or_build_index("fast")
+    assert "fast" in cache.cached_languages()
+
+    release.set()
+    for t in slow_threads:
+        t.join(5)
+
+    # Single-flight: three concurrent requests, one build.
+    assert calls.count("slow") == 1
+    assert cache.cached_languages() == ["fast", "slow"]
+
+
+def test_changed_shard_is_served_stale_then_refreshed(lexicon_env) -> None:
+    base = lexicon_env(cache_refresh_sec=1)
+    shard = _write_shard(base, "aa", ["old"])
+
+    first = cache.get_or_build_index("aa")
+    assert first.lookup_any("old") is not None
+
+    _write_shard(base, "aa", ["old", "new"])
+    stat = shard.stat()
+    os.utime(shard, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+    cache._INDEX_CACHE["aa"].checked_at -= 5
+
+    # The triggering lookup still returns the stale index.
+    assert cache.get_or_build_index("aa") is first
+
+    deadline = time.monotonic() + 5
+    while cache.cache_stats()["refreshes"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    refreshed = cache.get_or_build_index("aa")
+    assert refreshed is not first
+    assert refreshed.lookup_any("new") is not None
@@ -170,4 +170,38 @@ def test_missing_lemma_returns_none_instead_of_crashing() -> None:
 
     assert index.lookup_profession("nonexistent") is None
     assert index.lookup_nationality("nonexistent") is None
-    assert index.lookup_any("nonexistent") is None
\ No newline at end of file
+    assert index.lookup_any("nonexistent") is None
+
+def test_lemma_and_qid_lookups_share_the_rich_entry_objects() -> None:
+    lex = make_minimal_lexicon_it()
+    lex.professions["fisico"].wikidata_qid = "Q169470"
+    index = LexiconIndex(lex)
+
+    phys = lex.professions["fisico"]
+    assert index.lookup_by_lemma("fisico") is phys
+    assert index.lookup_by_lemma("Fisico", pos="noun") is phys
+    assert index.lookup_by_qid("q169470") is phys
+    assert len(index) == 4
+
+
+def test_qid_keyed_entries_are_indexed_by_key() -> None:
+    lex = make_minimal_lexicon_it()
+    turing = BaseLexicalEntry(key="Q7251", lemma="Alan Turing", pos="NOUN", language="it")
+    lex.general_entries[turing.key] = turing
+    index = LexiconIndex(lex)
+
+    assert index.lookup_by_qid("Q7251") is turing
+
+
+def test_lookup_form_scans_records_for_matching_surface() -> None:
+    index = LexiconIndex(
+        {
+            "attore": {"lang": "it", "pos": "NOUN", "qid": "Q33999", "gender": "m", "number": "sg"},
+            "attrice": {"lang": "it", "pos": "NOUN", "qid": "Q33999", "gender": "f", "number": "sg"},
+        }
+    )
+
+    form = index.lookup_form(lemma="attore", features={"gender": "f", "number": "sg"}, pos="NOUN")
+    assert form is not None
+    assert form.surface == "attrice"
+    assert index.approx_size_bytes() > 0
@@ -0,0 +1,107 @@
+# tests/unit/discourse/test_discourse_state.py
+import random
+
+import pytest
+
+from app.core.domain.semantics.types import Entity
+from discourse.state import DiscourseState
+
+
+def _entity(i: int) -> Entity:
+    return Entity(id=f"Q{i}", name=f"Entity {i}", human=i % 2 == 0)
+
+
+class EagerState:
+    """The previous implementation's arithmetic: decay touches every entry, topic is a max()."""
+
+    def __init__(self) -> None:
+        self.salience = {}
+
+    def mention(self, key: str, boost: float) -> None:
+        self.salience.setdefault(key, 1.0)
+        self.salience[key] += boost
+
+    def advance(self, decay: float) -> None:
+        for key in self.salience:
+            self.salience[key] *= decay
+
+    def top(self) -> str:
+        return max(self.salience, key=lambda k: self.salience[k])
+
+
+def test_lazy_decay_matches_eager_decay_and_topic_choice() -> None:
+    rng = random.Random(7)
+    state = DiscourseState()
+    eager = EagerState()
+
+    for _ in range(300):
+        for _ in range(rng.randint(1, 3)):
+            i = rng.randrange(40)
+            boost = rng.choice([0.5, 1.0, 2.0])
+            state.mention(_entity(i), salience_boost=boost)
+            eager.mention(f"Q{i}", boost)
+        decay = rng.choice([0.5, 0.8, 0.9, 1.0])
+        state.advance_sentence(decay)
+        eager.advance(decay)
+
+        assert state.most_salient().key == eager.top()
+
+    for key, expected in eager.salience.items():
+        assert state.get_entry_by_key(key).salience == pytest.approx(expected, rel=1e-9, abs=1e-300)
+
+
+def test_salience_survives_thousands_of_decays_without_overflow() -> None:
+    state = DiscourseState()
+    state.mention(_entity(1))
+    for _ in range(5000):
+        state.advance_sentence(0.5)
+    state.mention(_entity(2), salience_boost=1e-9)
+
+    assert state.get_entry_by_key("Q1").salience == 0.0  # underflows cleanly
+    assert state.get_or_choose_topic().id == "Q2"
+
+
+def test_setter_zero_and_negative_salience_and_ties() -> None:
+    state = DiscourseState()
+    first = state.register_entity(_entity(1), initial_salience=0.0)
+    state.register_entity(_entity(2), initial_salience=0.0)
+    assert state.most_salient() is first  # ties keep registration order
+
+    state.get_entry_by_key("Q2").salience = -1.0
+    state.advance_sentence(0.5)
+    assert state.get_entry_by_key("Q2").salience == -0.5
+    assert state.most_salient() is first
+
+    state.advance_sentence(0.0)
+    assert first.salience == 0.0
+    state.get_entry_by_key("Q2").salience = 3.0
+    assert state.most_salient().key == "Q2"
+
+
+def test_index_stays_bounded_under_many_mentions() -> None:
+    state = DiscourseState()
+    for n in range(10_000):
+        state.mention(_entity(n % 10))
+    assert len(state._heap) <= 2 * 10 + 64
+
+
+def test_round_trip_is_compact_and_preserves_salience_and_topic() -> None:
+    state = DiscourseState()
+    state.mention(_entity(1), role="subject", as_topic=True)
+    state.mention(_entity(2))
+    state.get_entry_by_key("Q2").extra["note"] = "x"
+    for _ in range(50):
+        state.advance_sentence(0.9)
+
+    payload = state.dumps()
+    restored = DiscourseState.loads(payload)
+
+    assert '"gender"' not in payload and '": ' not in payload  # defaults dropped, no whitespace
+    assert restored.sentence_index == 50
+    assert restored.get_current_topic().id == "Q1"
+    assert restored.get_entry_by_key("Q1").roles == {"subject"}
+    assert restored.get_entry_by_key("Q2").extra == {"note": "x"}
+    assert restored.get_entry_by_key("Q1").salience == pytest.approx(2.0 * 0.9**50)
+    assert restored.get_entry_by_key("Q2").entity.human is True
+    restored.mention(_entity(3), salience_boost=10.0)
+    assert restored.most_salient().key == "Q3"
@@ -0,0 +1,144 @@
+# tests/unit/discourse/test_referring_expression_policy.py
+import itertools
+import random
+
+from app.core.domain.semantics.types import Entity
+from discourse.referring_expression import (
+    EntityFeatureCache,
+    EntityFeatures,
+    ReferringExpressionPolicy,
+    select_np_spec,
+)
+
+FLAGS = (
+    "allow_pronouns",
+    "pronouns_for_humans_only",
+    "allow_pronouns_on_first_mention",
+    "use_pronoun_for_topic_after_first_mention",
+    "use_pronoun_for_focus_after_first_mention",
+    "allow_unmarked_pronouns_after_first_mention",
+    "use_short_name_after_first_mention",
+    "allow_short_name_when_topic",
+)
+INFO_BOOLS = (
+    "is_first_mention",
+    "is_topic",
+    "is_focus",
+    "force_pronoun",
+    "force_name",
+    "force_short_name",
+    "force_description",
+    "avoid_pronoun",
+    "pronoun_ambiguous",
+)
+
+
+def _random_entity(rng: random.Random):
+    fields = {
+        "id": rng.choice([None, "", "Q1", "Q2"]),
+        "qid": rng.choice([None, "Q9"]),
+        "name": rng.choice([None, "", "Marie Curie", "Curie"]),
+        "label": rng.choice([None, "Label"]),
+        "short_name": rng.choice([None, "Curie", "Marie Curie"]),
+        "gender": rng.choice([None, "f", "Male", "nb", "feminine", "x", ""]),
+        "number": rng.choice([None, "pl", "sg", "plural"]),
+        "person": rng.choice([None, 1, 4, "2", "x"]),
+        "human": rng.choice([None, True, False, 0]),
+        "entity_type": rng.choice([None, "person", "city", "organization"]),
+        "type": rng.choice([None, "human", "event"]),
+        "head_lemma": rng.choice([None, "physicist"]),
+        "lemmas": rng.choice([None, ["chemist", " "], ("a",), "notalist"]),
+    }
+    entity = {k: v for k, v in fields.items() if v is not None or rng.random() < 0.2}
+    if rng.random() < 0.3:
+        # Some fields only in nested features / extra.
+        entity["features"] = {"short_name": "Sklodowska", "gender": "female"}
+        entity["extra"] = {"surname": "Curie", "human": True}
+    if rng.random() < 0.25:
+        return Entity.from_dict(entity)
+    return entity
+
+
+def _random_info(rng: random.Random):
+    if rng.random() < 0.05:
+        return None
+    info = {k: rng.choice([True, False, None]) for k in INFO_BOOLS if rng.random() < 0.5}
+    if rng.random() < 0.3:
+        info["competing_referents"] = rng.choice([0, 1, "2", None, "x"])
+    if rng.random() < 0.3:
+        info["recent_same_gender_human_mentions"] = rng.choice([0, 1, None])
+    return info
+
+
+def _random_profile(rng: random.Random):
+    roll = rng.random()
+    if roll < 0.1:
+        return {}
+    if roll < 0.15:
+        return {"referring_expression": "not a dict"}
+    return {"referring_expression": {k: rng.choice([True, False, None, 0, 1]) for k in FLAGS if rng.random() < 0.6}}
+
+
+def test_compiled_policy_matches_select_np_spec_on_random_inputs() -> None:
+    rng = random.Random(20240101)
+    for _ in range(5000):
+        entity = _random_entity(rng)
+        info = _random_info(rng)
+        profile = _random_profile(rng)
+        fallback = rng.random() < 0.8
+        policy = ReferringExpressionPolicy.from_profile(profile)
+
+        expected = select_np_spec(entity, info, profile, allow_description_fallback=fallback)
+        assert policy.select(entity, info, allow_description_fallback=fallback) == expected
+        assert policy.select(entity, info, allow_description_fallback=fallback, cache=EntityFeatureCache()) == expected
+
+
+def test_compiled_policy_matches_on_every_flag_combination() -> None:
+    entity = {"id": "Q7186", "name": "Marie Curie", "short_name": "Curie", "gender": "f", "human": True}
+    infos = [
+        dict(zip(("is_first_mention", "is_topic", "is_focus", "force_pronoun"), values))
+        for values in itertools.product([True, False], repeat=4)
+    ]
+    for values in itertools.product([True, False], repeat=len(FLAGS)):
+        profile = {"referring_expression": dict(zip(FLAGS, values))}
+        policy = ReferringExpressionPolicy.from_profile(profile)
+        for info in infos:
+            assert policy.select(entity, info) == select_np_spec(entity, info, profile)
+
+
+def test_feature_cache_is_keyed_by_entity_id_and_specs_are_independent() -> None:
+    cache = EntityFeatureCache()
+    policy = ReferringExpressionPolicy.from_profile({})
+
+    first = policy.select({"id": "Q1", "name": "Ada Lovelace", "human": True}, None, cache=cache)
+    again = policy.select({"id": "Q1", "name": "Ada Lovelace", "human": True}, {"is_first_mention": False}, cache=cache)
+    anonymous = {"name": "Someone"}
+    policy.select(anonymous, None, cache=cache)
+    policy.select(anonymous, None, cache=cache)
+
+    assert len(cache) == 2
+    first["features"]["gender"] = "masc"
+    assert again["features"]["gender"] is None
+    assert again["realization_type"] == "pronoun"
+
+
+def test_features_are_extracted_once_per_entity_per_document(monkeypatch) -> None:
+    extracted = []
+    original = EntityFeatures.extract.__func__
+
+    def counting_extract(cls, entity):
+        extracted.append(entity)
+        return original(cls, entity)
+
+    monkeypatch.setattr(EntityFeatures, "extract", classmethod(counting_extract))
+    profile = {"referring_expression": {"use_short_name_after_first_mention": True}}
+    entities = [{"id": f"Q{i}", "name": f"Person {i}", "short_name": f"P{i}", "entity_type": "person"} for i in range(20)]
+    # Each sentence gets a fresh payload copy, as GenerateDocument produces.
+    document = [(dict(entities[i % 20]), {"is_first_mention": i < 20, "is_topic": i % 7 == 0}) for i in range(400)]
+
+    policy = ReferringExpressionPolicy.from_profile(profile)
+    cache = EntityFeatureCache()
+    specs = [policy.select(entity, info, cache=cache) for entity, info in document]
+
+    assert len(extracted) == 20
+    assert specs == [select_np_spec(entity, info, profile) for entity, info in document]
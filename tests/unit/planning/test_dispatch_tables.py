@@ -0,0 +1,140 @@
+# tests/unit/planning/test_dispatch_tables.py
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from app.adapters.engines.construction_realizer import ConstructionRealizer
+from app.core.bridges.construction_selector import ConstructionSelector
+
+
+_FRAMES: list[dict[str, Any]] = [
+    {"frame_type": "bio", "subject": {"name": "Ada"}, "profession": "mathematician"},
+    {"frame_type": "relation.location", "subject": "Paris", "location": "France"},
+    {"frame_type": "relation.generic", "subject": "X", "adjective": "red"},
+    {"frame_type": "relation.generic", "owner": "Ada", "possessed": "book"},
+    {"frame_type": "event.generic", "participants": {"agent": "Ada", "patient": "engine"}},
+    {"frame_type": "event.generic", "participants": {"agent": "Ada", "recipient": "Bob"}},
+    {"frame_type": "event.generic", "participants": {"agent": "Ada"}, "voice": "passive"},
+    {"frame_type": "event.generic", "participants": {"agent": "Ada"}},
+    {"frame_type": "aggregate.generic", "items": ["a", "b"]},
+    {"frame_type": "entity.person", "main_event": {"participants": {"agent": "Ada"}}},
+]
+
+
+@pytest.mark.parametrize("frame", _FRAMES)
+@pytest.mark.parametrize("is_first_sentence", [True, False, None])
+def test_memoised_selection_matches_fresh_selector(frame, is_first_sentence) -> None:
+    warm = ConstructionSelector()
+    for _ in range(3):
+        warm.select(frame, lang_code="en", is_first_sentence=is_first_sentence)
+
+    cached = warm.select(frame, lang_code="en", is_first_sentence=is_first_sentence)
+    fresh = ConstructionSelector().select(frame, lang_code="en", is_first_sentence=is_first_sentence)
+
+    assert cached == fresh
+
+
+def test_memoised_selection_keeps_per_request_fields() -> None:
+    selector = ConstructionSelector()
+    first = selector.select(
+        {"frame_type": "bio", "subject": {"id": "Q1"}, "profession": "poet"},
+        lang_code="en",
+    )
+    second = selector.select(
+        {"frame_type": "bio", "subject": {"id": "Q2"}, "profession": "painter"},
+        lang_code="fr",
+    )
+
+    assert first.construction_id == second.construction_id
+    assert first.topic_entity_id == "Q1"
+    assert second.topic_entity_id == "Q2"
+    assert second.lang_code == "fr"
+
+
+class _CountingBackend:
+    def __init__(self, status: str) -> None:
+        self.status = status
+        self.calls = 0
+        self.capability_version = 0
+
+    def get_support_status(self, construction_id: str, lang_code: str) -> str:
+        self.calls += 1
+        return self.status
+
+    async def realize(self, construction_plan: Any) -> dict[str, Any]:
+        return {"text": "ok", "lang_code": "en", "construction_id": "x"}
+
+
+def test_dispatch_table_probes_backends_once_per_pair() -> None:
+    gf = _CountingBackend("unsupported")
+    family = _CountingBackend("full")
+    realizer = ConstructionRealizer(gf_realizer=gf, family_realizer=family)
+
+    for _ in range(5):
+        assert realizer.get_support_status("copula_locative", "en") == "full"
+
+    assert gf.calls == 1
+    assert family.calls == 1
+
+
+def test_dispatch_table_invalidates_when_capability_version_changes() -> None:
+    gf = _CountingBackend("unsupported")
+    realizer = ConstructionRealizer(gf_realizer=gf)
+
+    assert realizer.get_support_status("copula_locative", "en") == "unsupported"
+
+    gf.status = "full"
+    gf.capability_version += 1  # e.g. grammar reloaded
+
+    assert realizer.get_support_status("copula_locative", "en") == "full"
+    assert gf.calls == 2
+
+
+def test_precompute_dispatch_table_warms_every_pair() -> None:
+    gf = _CountingBackend("full")
+    realizer = ConstructionRealizer(gf_realizer=gf)
+
+    cached = realizer.precompute_dispatch_table(
+        ["copula_locative", "transitive_event"],
+        ["en", "fr", "de"],
+    )
+    assert cached == 6
+    assert gf.calls == 6
+
+    realizer.get_support_status("transitive_event", "fr")
+    assert gf.calls == 6
+
+    realizer.invalidate_dispatch_table()
+    realizer.get_support_status("transitive_event", "fr")
+    assert gf.calls == 7
+
+
+class _ReloadableBackend(_CountingBackend):
+    def __init__(self, status: str) -> None:
+        super().__init__(status)
+        self.listeners: list[Any] = []
+
+    def add_reload_listener(self, callback: Any) -> None:
+        self.listeners.append(callback)
+
+    def reload(self) -> None:
+        self.capability_version += 1
+        for callback in self.listeners:
+            callback()
+
+
+def test_backend_reload_rebuilds_the_warmed_pairs() -> None:
+    family = _ReloadableBackend("partial")
+    realizer = ConstructionRealizer(family_realizer=family)
+    realizer.precompute_dispatch_table(["copula_locative"], ["en", "fr"])
+    assert family.calls == 2
+
+    family.status = "full"
+    family.reload()
+
+    # Rebuilt at reload time, not on the next request.
+    assert family.calls == 4
+    assert realizer.get_support_status("copula_locative", "fr") == "full"
+    assert family.calls == 4
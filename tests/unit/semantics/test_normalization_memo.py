@@ -0,0 +1,138 @@
+# tests/unit/semantics/test_normalization_memo.py
+import ast
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+
+import pytest
+
+from app.core.domain.semantics import normalization as N
+from app.core.domain.semantics import roles as R
+from app.core.domain.semantics.types import BioFrame, Entity
+
+TESTS_DIR = Path(__file__).resolve().parents[2]
+
+
+def _reference_gender(raw: Any) -> str:
+    """normalize_gender as it was before the memo table."""
+    if raw is None:
+        return "unknown"
+    unwrapped = N._unwrap_zobject(raw)
+    if isinstance(unwrapped, Mapping):
+        qid = unwrapped.get("id") or unwrapped.get("wikidata_qid")
+        if isinstance(qid, str):
+            return _reference_gender(qid)
+    token = N._lower_ascii(unwrapped)
+    if not token:
+        return "unknown"
+    if token in N._WD_MALE: return "male"
+    if token in N._WD_FEMALE: return "female"
+    if token in N._WD_NONBINARY: return "nonbinary"
+    if token in {"m", "male", "man", "masculine"}: return "male"
+    if token in {"f", "female", "woman", "feminine"}: return "female"
+    if token in {"nonbinary", "non-binary", "nb", "enby"}: return "nonbinary"
+    if token in {"unknown", "unspecified", "na", "n/a", "none"}: return "unknown"
+    return "other"
+
+
+def _reference_bio_frame(payload: Any) -> BioFrame:
+    """normalize_bio_frame as it was before the flat fast path."""
+    sem = N.normalize_bio_semantics(payload)
+    entity = Entity(
+        name=sem.name,
+        gender=sem.gender,
+        lemmas=[sem.profession_lemma] if sem.profession_lemma else [],
+        extra=sem.extra,
+    )
+    return BioFrame(
+        main_entity=entity,
+        frame_type="bio",
+        primary_profession_lemmas=[sem.profession_lemma] if sem.profession_lemma else [],
+        nationality_lemmas=[sem.nationality_lemma] if sem.nationality_lemma else [],
+        extra=sem.extra,
+    )
+
+
+def _fixture_payloads() -> List[Dict[str, Any]]:
+    """Every literal dict in the test suite that carries a bio field."""
+    payloads = []
+    for path in sorted(TESTS_DIR.rglob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Dict):
+                continue
+            try:
+                value = ast.literal_eval(node)
+            except ValueError:
+                continue
+            if isinstance(value, dict) and N._BIO_KEYS & {k for k in value if isinstance(k, str)}:
+                payloads.append(value)
+    return payloads
+
+
+EDGE_PAYLOADS = [
+    {},
+    {"name": "  Marie Curie ", "gender": " F ", "profession": "physicist", "nationality": "Polish"},
+    {"name": "", "label": "Ada", "K1": "ignored", "sex": "woman", "occupation": "mathematician"},
+    {"name": "   ", "label": "not used", "gender": "   "},
+    {"name": None, "gender": None, "K2": "m", "prof_lemma": "", "K3": "poet", "citizenship": "French"},
+    {"name": {"Z1K1": "Z6", "Z6K1": "Douglas Adams"}, "gender": {"Z1K1": "Z9", "Z9K1": "Q6581097"}},
+    {"name": "Alan", "gender": {"id": "f"}, "profession": 7},
+    {"name": "Alan", "gender": 0, "label": "x", "qid": "Q7251", 1: "int key", "extra": {"a": 1}},
+    {"name": "Grace", "gender": "Q6581072", "lang": "EN", "frame_type": "bio", "subject": {"name": "Grace"}},
+    ["Ada", "f", "mathematician", "British", "EN"],
+    "Just a name",
+]
+
+
+def _random_payload(rng: random.Random) -> Dict[str, Any]:
+    values = [None, "", "  ", "Ada", " Lovelace ", "f", "Male", "nb", "other", 3, {"Z1K1": "Z6", "Z6K1": "x"}]
+    keys = sorted(N._BIO_KEYS) + ["id", "frame_type", "subject"]
+    return {k: rng.choice(values) for k in rng.sample(keys, rng.randint(0, len(keys)))}
+
+
+def test_fixtures_are_harvested() -> None:
+    assert len(_fixture_payloads()) >= 5
+
+
+@pytest.mark.parametrize("payload", _fixture_payloads() + EDGE_PAYLOADS)
+def test_bio_frame_matches_generic_path(payload) -> None:
+    frame = N.normalize_bio_frame(payload, "bio")
+    assert frame == _reference_bio_frame(payload)
+
+
+def test_bio_frame_matches_generic_path_on_random_payloads() -> None:
+    rng = random.Random(48)
+    for _ in range(3000):
+        payload = _random_payload(rng)
+        assert N.normalize_bio_frame(payload, "bio") == _reference_bio_frame(payload)
+
+
+def test_gender_memo_matches_reference_and_is_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(N, "_GENDER_MEMO", {})
+    monkeypatch.setattr(N, "_GENDER_MEMO_MAX", 8)
+    raws = [None, "", " ", "M", "female ", "Woman", "nb", "Q6581097", "q6581072", "xyz", 1, {"id": "f"},
+            {"Z1K1": "Z6", "Z6K1": "male"}] + [f"label{i}" for i in range(20)]
+    for raw in raws * 2:
+        assert N.normalize_gender(raw) == _reference_gender(raw)
+    assert len(N._GENDER_MEMO) <= 8
+
+
+def test_role_memo_matches_uncached_resolution_and_is_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(R, "_ROLE_MEMO", {})
+    monkeypatch.setattr(R, "_ROLE_MEMO_MAX", 16)
+    labels = list(R._ROLE_ALIASES) + sorted(R.ALL_ROLES) + [" Subject ", "AGENT", "Custom_Role", "custom_role"]
+    for label in labels * 2:
+        assert R.canonical_role(label) == R._resolve_role(label)
+    assert len(R._ROLE_MEMO) <= 16
+
+    assert R.normalize_roles({"subject": 1, "SUBJ": 2, "time": 3}) == {"SUBJ": 2, "TIME": 3}
+    assert R.canonicalize_labels(["object", "my-role"]) == {"object": "OBJ", "my-role": "MY-ROLE"}
+    assert R.canonical_role("my_role") is R.canonical_role(" My_Role ")
+
+
+@pytest.mark.parametrize("label", ["", "   "])
+def test_invalid_role_labels_still_raise(label) -> None:
+    with pytest.raises(ValueError):
+        R.canonical_role(label)
+    assert label not in R._ROLE_MEMO
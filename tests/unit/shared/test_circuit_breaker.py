@@ -0,0 +1,142 @@
+# tests/unit/shared/test_circuit_breaker.py
+import asyncio
+
+import pytest
+
+from app.shared.resilience import CircuitBreaker, CircuitBreakerOpenError, CircuitState
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _ok() -> str:
+    return "ok"
+
+
+async def _boom() -> None:
+    raise ConnectionError("down")
+
+
+def _breaker(clock: Clock, **kwargs) -> CircuitBreaker:
+    options = dict(
+        failure_threshold=4,
+        recovery_timeout=30,
+        window_size=10,
+        window_sec=60,
+        failure_rate_threshold=0.5,
+        half_open_max_calls=2,
+        clock=clock,
+    )
+    options.update(kwargs)
+    return CircuitBreaker("svc", **options)
+
+
+async def _fail(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        with pytest.raises(ConnectionError):
+            await breaker.a_call(_boom)
+
+
+async def test_trips_on_failure_rate_once_minimum_calls_are_in_window() -> None:
+    clock = Clock()
+    breaker = _breaker(clock)
+
+    await _fail(breaker, 3)
+    assert breaker.state == CircuitState.CLOSED  # below minimum_calls
+    assert await breaker.a_call(_ok) == "ok"  # 3/4 failed
+    assert breaker.state == CircuitState.OPEN
+
+    with pytest.raises(CircuitBreakerOpenError):
+        await breaker.a_call(_ok)
+
+
+async def test_old_failures_slide_out_of_the_window() -> None:
+    clock = Clock()
+    breaker = _breaker(clock)
+
+    await _fail(breaker, 3)
+    clock.now += 61  # those failures are now outside window_sec
+    for _ in range(3):
+        await breaker.a_call(_ok)
+    await _fail(breaker)
+
+    assert breaker.state == CircuitState.CLOSED  # 1/4 failed within the window
+
+
+async def test_trips_on_slow_call_rate() -> None:
+    clock = Clock()
+    breaker = _breaker(clock, slow_call_sec=1.0, slow_call_rate_threshold=0.75)
+
+    async def slow() -> str:
+        clock.now += 2.0
+        return "late"
+
+    for _ in range(3):
+        await breaker.a_call(slow)
+    await breaker.a_call(_ok)
+
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_half_open_admits_a_bounded_number_of_concurrent_probes() -> None:
+    clock = Clock()
+    breaker = _breaker(clock)
+    await _fail(breaker, 4)
+    clock.now += 31
+
+    gate = asyncio.Event()
+    entered = []
+
+    async def probe() -> str:
+        entered.append(1)
+        await gate.wait()
+        return "ok"
+
+    tasks = [asyncio.create_task(breaker.a_call(probe)) for _ in range(10)]
+    await asyncio.sleep(0)
+
+    assert len(entered) == 2  # the other 8 failed fast, never reaching the service
+    assert breaker.state == CircuitState.HALF_OPEN
+    gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert sum(1 for r in results if r == "ok") == 2
+    assert sum(1 for r in results if isinstance(r, CircuitBreakerOpenError)) == 8
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_failed_probe_reopens_and_cancelled_probe_frees_its_slot() -> None:
+    clock = Clock()
+    breaker = _breaker(clock, half_open_max_calls=1)
+    await _fail(breaker, 4)
+    clock.now += 31
+
+    async def hang() -> None:
+        await asyncio.sleep(3600)
+
+    task = asyncio.create_task(breaker.a_call(hang))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await _fail(breaker)  # the slot was released, so this probe runs
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitBreakerOpenError):
+        await breaker.a_call(_ok)
+
+
+def test_sync_call_and_forced_state() -> None:
+    clock = Clock()
+    breaker = _breaker(clock)
+
+    assert breaker.call(lambda: 42) == 42
+    breaker.state = "open"
+    with pytest.raises(CircuitBreakerOpenError):
+        breaker.call(lambda: 42)
+    assert breaker.snapshot()["state"] == "open"
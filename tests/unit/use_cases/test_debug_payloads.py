@@ -0,0 +1,97 @@
+# tests/unit/use_cases/test_debug_payloads.py
+from __future__ import annotations
+
+from typing import Any
+
+from app.adapters.api.contracts.generation_response_mapper import map_generation_response
+from app.adapters.engines.construction_realizer import ConstructionRealizer
+from app.adapters.result_cache import InMemoryResultCache
+from app.core.domain.frame import BioFrame
+from app.core.domain.models import Sentence, SurfaceResult
+from app.core.domain.planning.construction_plan import ConstructionPlan
+from app.core.use_cases.generate_text import GenerateText
+from app.shared.debug_payloads import NULL_TRACE, debug_payloads, debug_payloads_enabled
+
+
+def make_plan() -> ConstructionPlan:
+    return ConstructionPlan(
+        construction_id="copula_equative_classification",
+        lang_code="en",
+        slot_map={"subject": "Ada Lovelace", "predicate_nominal": "mathematician"},
+    )
+
+
+class StaticRealizer:
+    backend_name = "family"
+
+    async def realize(self, construction_plan: Any) -> SurfaceResult:
+        return SurfaceResult(
+            text="Ada Lovelace is a mathematician.",
+            lang_code="en",
+            construction_id="copula_equative_classification",
+            renderer_backend="family",
+            debug_info={"family": "germanic", "trace": ["a", "b"]},
+        )
+
+
+class CountingEngine:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, lang_code: str, frame: Any) -> Sentence:
+        self.calls += 1
+        return Sentence(text="Ada Lovelace is a mathematician.", lang_code=lang_code)
+
+
+def make_frame() -> BioFrame:
+    return BioFrame(frame_type="bio", subject={"name": "Ada Lovelace", "qid": "Q7259"})
+
+
+def test_null_trace_drops_everything() -> None:
+    NULL_TRACE.append("x")
+    NULL_TRACE.extend(["y"])
+    trace = NULL_TRACE
+    trace += ["z"]
+
+    assert list(NULL_TRACE) == []
+    assert debug_payloads_enabled() is True
+    with debug_payloads(False):
+        assert debug_payloads_enabled() is False
+    assert debug_payloads_enabled() is True
+
+
+async def test_realizer_skips_backend_trace_in_lean_mode() -> None:
+    realizer = ConstructionRealizer(family_realizer=StaticRealizer())
+
+    full = await realizer.realize(make_plan())
+    with debug_payloads(False):
+        lean = await realizer.realize(make_plan())
+
+    assert full.debug_info["backend_trace"]
+    assert "backend_trace" not in lean.debug_info
+    assert "family" not in lean.debug_info
+    assert lean.text == full.text
+    assert lean.renderer_backend == "family"
+
+
+async def test_generate_text_lean_mode_keeps_fallback_flag_only() -> None:
+    engine = CountingEngine()
+    cache = InMemoryResultCache()
+    use_case = GenerateText(engine=engine, result_cache=cache)
+
+    with debug_payloads(False):
+        lean = await use_case.execute("en", make_frame())
+
+    assert lean.debug_info["fallback_used"] is False
+    assert "runtime_path" not in lean.debug_info
+    assert "stage_timings" not in lean.debug_info
+    assert map_generation_response(lean, include_debug=False) == {
+        "text": "Ada Lovelace is a mathematician.",
+        "lang_code": "en",
+    }
+    # Lean results are not cached, so a later debug request gets full debug_info.
+    assert len(cache) == 0
+
+    full = await use_case.execute("en", make_frame())
+    assert full.debug_info["runtime_path"] == "legacy_engine"
+    assert engine.calls == 2
@@ -0,0 +1,111 @@
+# tests/unit/use_cases/test_generate_document.py
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from app.core.domain.exceptions import DomainError, InvalidFrameError
+from app.core.domain.frame import BioFrame
+from app.core.domain.models import Frame, Sentence
+from app.core.use_cases.generate_document import GenerateDocument
+
+
+def _bio(name: str = "Marie Curie", qid: str = "Q7186", gender: str = "f") -> BioFrame:
+    return BioFrame(
+        frame_type="bio",
+        subject={"name": name, "qid": qid, "gender": gender},
+        properties={"profession": "physicist"},
+    )
+
+
+def _event(frame_type: str, name: str = "Marie Curie", qid: str = "Q7186") -> Frame:
+    return Frame(frame_type=frame_type, subject={"name": name, "qid": qid})
+
+
+class RecordingGenerator:
+    """Fake GenerateText: echoes the realized subject and tracks concurrency."""
+
+    def __init__(self, delays: dict[str, float] | None = None, fail_on: str | None = None) -> None:
+        self.delays = delays or {}
+        self.fail_on = fail_on
+        self.frames: list[Any] = []
+        self.active = 0
+        self.max_active = 0
+        self.cancelled = 0
+
+    async def execute(self, lang_code: str, frame: Any) -> Sentence:
+        self.frames.append(frame)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        frame_type = str(frame.frame_type)
+        try:
+            await asyncio.sleep(self.delays.get(frame_type, 0.0))
+            if frame_type == self.fail_on:
+                raise DomainError(f"{frame_type} failed")
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+
+        subject = frame.subject
+        name = getattr(subject, "name", None) or subject.get("name")
+        return Sentence(text=f"{name}:{frame_type}.", lang_code=lang_code)
+
+
+async def test_sentences_are_planned_once_and_realized_concurrently_in_order() -> None:
+    generator = RecordingGenerator(delays={"death": 0.2, "birth": 0.2, "bio": 0.2})
+    use_case = GenerateDocument(generator, max_concurrency=8)
+    frames = [_event("death"), _event("birth"), _bio()]
+
+    started = time.perf_counter()
+    document = await use_case.execute("en", frames)
+    elapsed = time.perf_counter() - started
+
+    # Biography policy: definition, birth, death.
+    assert [s.debug_info["document"]["source_index"] for s in document.sentences] == [2, 1, 0]
+    assert document.text == "Marie Curie:bio. Marie Curie:birth. Marie Curie:death."
+    assert generator.max_active == 3
+    assert elapsed < 0.5
+    assert document.debug_info["planner_domain"] == "bio"
+
+
+async def test_later_mentions_of_the_topic_are_pronominalized_without_mutating_input() -> None:
+    generator = RecordingGenerator()
+    frames = [_bio(), _bio(), _bio("Pierre Curie", "Q37463", "m"), _bio()]
+    document = await GenerateDocument(generator).execute("en", frames, domain="generic")
+
+    decisions = [s.debug_info["document"]["referring_expression"] for s in document.sentences]
+    assert decisions == ["name", "pronoun", "name", "name"]
+    assert [s.text for s in document.sentences] == [
+        "Marie Curie:bio.",
+        "She:bio.",
+        "Pierre Curie:bio.",
+        "Marie Curie:bio.",
+    ]
+    rewritten = generator.frames[1]
+    assert rewritten.meta["gf_function"] == "UsePron"
+    assert rewritten.meta["gf_arg"] == "she_Pron"
+    assert frames[1].name == "Marie Curie"
+    assert "gf_function" not in frames[1].meta
+
+
+async def test_sentence_failure_cancels_siblings_and_fails_document() -> None:
+    generator = RecordingGenerator(delays={"death": 1.0}, fail_on="birth")
+    use_case = GenerateDocument(generator)
+
+    with pytest.raises(DomainError):
+        await use_case.execute("en", [_bio(), _event("birth"), _event("death")])
+    assert generator.cancelled == 1
+
+
+async def test_frame_set_limits_are_enforced() -> None:
+    use_case = GenerateDocument(RecordingGenerator(), max_frames=2)
+
+    with pytest.raises(InvalidFrameError):
+        await use_case.execute("en", [])
+    with pytest.raises(InvalidFrameError):
+        await use_case.execute("en", [_bio(), _bio(), _bio()])
@@ -0,0 +1,154 @@
+# tests/unit/use_cases/test_generation_result_cache.py
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import pytest
+
+from app.adapters.result_cache import InMemoryResultCache, RedisResultCache, VersionedResultCache
+from app.core.domain.frame import BioFrame
+from app.core.domain.models import Sentence
+from app.core.use_cases.generate_text import GenerateText
+from app.shared.config import settings
+
+
+def make_frame(name: str = "Marie Curie") -> BioFrame:
+    return BioFrame(
+        frame_type="bio",
+        subject={"name": name, "qid": "Q7186"},
+        properties={"profession": "physicist"},
+    )
+
+
+class CountingEngine:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, lang_code: str, frame: Any) -> Sentence:
+        self.calls += 1
+        return Sentence(text=f"{frame.subject.name} is a physicist.", lang_code=lang_code)
+
+
+class FailingPlanner:
+    async def plan(self, *args: Any, **kwargs: Any) -> Any:
+        raise RuntimeError("planner down")
+
+
+class NullRealizer:
+    async def realize(self, *args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("not reached")
+
+
+@pytest.fixture
+def pgf_file(tmp_path, monkeypatch):
+    path = tmp_path / "semantik_architect.pgf"
+    path.write_bytes(b"v1")
+    monkeypatch.setattr(settings, "PGF_PATH", str(path))
+    return path
+
+
+async def test_second_identical_request_is_served_from_cache(pgf_file) -> None:
+    engine = CountingEngine()
+    use_case = GenerateText(engine=engine, result_cache=InMemoryResultCache(), stage_timing=False)
+
+    first = await use_case.execute("en", make_frame())
+    second = await use_case.execute("en", make_frame())
+
+    assert engine.calls == 1
+    assert second.text == first.text
+    assert second.debug_info["result_cache"] == "hit"
+    assert "result_cache" not in first.debug_info
+
+
+async def test_bypass_and_fallback_results_are_not_cached(pgf_file) -> None:
+    engine = CountingEngine()
+    cache = InMemoryResultCache()
+    use_case = GenerateText(
+        engine=engine,
+        planner=FailingPlanner(),
+        realizer=NullRealizer(),
+        result_cache=cache,
+        stage_timing=False,
+    )
+
+    fallback = await use_case.execute("en", make_frame())
+    assert fallback.debug_info["runtime_path"] == "legacy_engine_fallback"
+    assert len(cache) == 0
+
+    plain = GenerateText(engine=engine, result_cache=cache, stage_timing=False)
+    await plain.execute("en", make_frame(), use_cache=False)
+    assert len(cache) == 0
+    assert engine.calls == 2
+
+
+async def test_key_tracks_frame_language_and_grammar_version(pgf_file) -> None:
+    cache = InMemoryResultCache(stamp_ttl_sec=0)
+
+    key = cache.make_key("en", make_frame())
+    assert key == cache.make_key("en", make_frame())
+    assert key != cache.make_key("fr", make_frame())
+    assert key != cache.make_key("en", make_frame("Pierre Curie"))
+
+    stat = pgf_file.stat()
+    pgf_file.write_bytes(b"v2-rebuilt")
+    os.utime(pgf_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.make_key("en", make_frame()) != key
+
+
+class SwappingEngine(CountingEngine):
+    """Engine whose loaded grammar changes while a request is being generated."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.grammar_version = "1:2"
+        self.swap_during_generate = False
+
+    async def generate(self, lang_code: str, frame: Any) -> Sentence:
+        if self.swap_during_generate:
+            self.grammar_version = "3:4"
+        return await super().generate(lang_code, frame)
+
+
+async def test_key_follows_the_loaded_grammar_not_the_file(pgf_file) -> None:
+    engine = SwappingEngine()
+    cache = InMemoryResultCache(engine=engine)
+    key = cache.make_key("en", make_frame())
+
+    # The file changes before the swap lands: the key must not move yet.
+    pgf_file.write_bytes(b"v2-rebuilt")
+    assert cache.make_key("en", make_frame()) == key
+
+    engine.grammar_version = "3:4"
+    assert cache.make_key("en", make_frame()) != key
+
+
+async def test_output_is_not_cached_when_the_grammar_swaps_mid_request(pgf_file) -> None:
+    engine = SwappingEngine()
+    cache = InMemoryResultCache(engine=engine)
+    use_case = GenerateText(engine=engine, result_cache=cache, stage_timing=False)
+
+    engine.swap_during_generate = True
+    await use_case.execute("en", make_frame())
+    assert len(cache) == 0
+
+    engine.swap_during_generate = False
+    await use_case.execute("en", make_frame())
+    assert len(cache) == 1
+
+
+async def test_redis_cache_round_trips_sentences(pgf_file) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    cache = RedisResultCache(client=fakeredis.FakeAsyncRedis(decode_responses=True), ttl_sec=60)
+
+    key = cache.make_key("en", make_frame())
+    assert await cache.get(key) is None
+
+    await cache.set(key, Sentence(text="Marie Curie is a physicist.", lang_code="en"))
+    hit = await cache.get(key)
+    assert hit is not None and hit.text == "Marie Curie is a physicist."
+
+
+def test_versioned_base_cache_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        VersionedResultCache()
@@ -7,7 +7,7 @@ import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 # Add project root for utils import
 root_dir = Path(__file__).resolve().parents[2]
@@ -16,6 +16,12 @@ if str(root_dir) not in sys.path:
 
 from utils.tool_run_logging import tool_logging
 
+try:
+    from .io_utils import FileResultCache, map_in_processes
+except ImportError:
+    sys.path.append(str(Path(__file__).resolve().parent))
+    from io_utils import FileResultCache, map_in_processes  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 SCANNER_VERSION = "app_scanner/2.2"
@@ -283,11 +289,52 @@ def _score_assets(has_profile: bool, has_flag: bool) -> int:
     return ABSENT
 
 
+def _route_entry_score(entry: Any) -> int:
+    if isinstance(entry, dict) and (entry.get("gold") is True or entry.get("validated") is True):
+        return FINAL
+
+    if entry in (None, {}, []):
+        return BETA
+
+    if isinstance(entry, dict):
+        for k in ("structure", "articles", "topology", "morphology", "rules"):
+            if k in entry and entry.get(k) not in (None, {}, [], ""):
+                return PRE_FINAL
+        return BETA
+
+    return BETA
+
+
+def _morphology_config_summary(path: Path) -> Dict[str, Any]:
+    """
+    Route scores a morphology config yields, independent of the language:
+      {"score": DRAFT|BETA} when it has no language container, else
+      {"languages": {key: score}} for every key in the container.
+    Several profiles share one config, so the summary is computed once per file.
+    """
+    obj = _read_json(path)
+    if not isinstance(obj, dict):
+        return {"score": DRAFT}
+
+    lang_container = None
+    if isinstance(obj.get("languages"), dict):
+        lang_container = obj["languages"]
+    elif isinstance(obj.get("langs"), dict):
+        lang_container = obj["langs"]
+
+    if not isinstance(lang_container, dict):
+        return {"score": BETA}
+
+    return {"languages": {k: _route_entry_score(v) for k, v in lang_container.items()}}
+
+
 def _score_routes(
     repo: Path,
     profile: Optional[Mapping[str, Any]],
     iso2_hint: Optional[str],
     iso3_hint: Optional[str],
+    *,
+    cache: Optional[FileResultCache] = None,
 ) -> int:
     if not profile:
         return ABSENT
@@ -300,40 +347,19 @@ def _score_routes(
     if not p.is_file():
         return PLANNED
 
-    obj = _read_json(p)
-    if not isinstance(obj, dict):
-        return DRAFT
-
-    lang_container = None
-    if isinstance(obj.get("languages"), dict):
-        lang_container = obj["languages"]
-    elif isinstance(obj.get("langs"), dict):
-        lang_container = obj["langs"]
-
-    if not isinstance(lang_container, dict):
-        return BETA
+    summary = cache.get_or_compute(p, _morphology_config_summary) if cache is not None else _morphology_config_summary(p)
+    if "score" in summary:
+        return int(summary["score"])
 
+    scores = summary["languages"]
     keys_to_try = [
         k for k in (iso2_hint, iso3_hint) if isinstance(k, str) and k.strip()
     ]
-    found_key = next((k for k in keys_to_try if k in lang_container), None)
+    found_key = next((k for k in keys_to_try if k in scores), None)
     if not found_key:
         return DRAFT
 
-    entry = lang_container.get(found_key)
-    if isinstance(entry, dict) and (entry.get("gold") is True or entry.get("validated") is True):
-        return FINAL
-
-    if entry in (None, {}, []):
-        return BETA
-
-    if isinstance(entry, dict):
-        for k in ("structure", "articles", "topology", "morphology", "rules"):
-            if k in entry and entry.get(k) not in (None, {}, [], ""):
-                return PRE_FINAL
-        return BETA
-
-    return BETA
+    return int(scores[found_key])
 
 
 @dataclass(frozen=True)
@@ -341,13 +367,7 @@ class _DialogSpec:
     path: Path
 
 
-def _score_assistant_dialog(
-    repo: Path, iso2: Optional[str], iso3: Optional[str], cfg: Mapping[str, Any]
-) -> int:
-    """
-    Assistant/dialog maturity from artifacts.
-    Default lookup: data/lexicon/<iso>/dialog.json (iso2 preferred, fallback iso3).
-    """
+def _dialog_candidates(repo: Path, iso2: Optional[str], iso3: Optional[str], cfg: Mapping[str, Any]) -> List[Path]:
     lex_root_rel = str(cfg.get("lexicon_root", "data/lexicon"))
     lex_root = repo / lex_root_rel
 
@@ -356,9 +376,23 @@ def _score_assistant_dialog(
         if isinstance(iso, str) and iso.strip():
             candidates.append(lex_root / iso / "dialog.json")
             candidates.append(lex_root / iso / "assistant.json")
+    return candidates
+
 
+def _score_assistant_dialog(
+    repo: Path,
+    iso2: Optional[str],
+    iso3: Optional[str],
+    cfg: Mapping[str, Any],
+    *,
+    cache: Optional[FileResultCache] = None,
+) -> int:
+    """
+    Assistant/dialog maturity from artifacts.
+    Default lookup: data/lexicon/<iso>/dialog.json (iso2 preferred, fallback iso3).
+    """
     found: Optional[_DialogSpec] = None
-    for p in candidates:
+    for p in _dialog_candidates(repo, iso2, iso3, cfg):
         if p.is_file():
             found = _DialogSpec(path=p)
             break
@@ -366,7 +400,13 @@ def _score_assistant_dialog(
     if not found:
         return ABSENT
 
-    obj = _read_json(found.path)
+    if cache is not None:
+        return int(cache.get_or_compute(found.path, _dialog_file_score))
+    return _dialog_file_score(found.path)
+
+
+def _dialog_file_score(path: Path) -> int:
+    obj = _read_json(path)
     if obj is None:
         return SCAFFOLDED
 
@@ -397,7 +437,48 @@ def _score_assistant_dialog(
     return FINAL
 
 
-def scan_application(*, key_mode: str = "iso2") -> Dict[str, Dict[str, int]]:
+def _score_language_job(
+    repo: str,
+    cfg: Mapping[str, Any],
+    profile: Optional[Mapping[str, Any]],
+    iso2: Optional[str],
+    iso3: Optional[str],
+    cache_entries: Optional[Dict[str, Dict[str, Any]]],
+) -> Tuple[Optional[int], int, Optional[Dict[str, Any]]]:
+    """
+    Route + dialog scores for one language (runs in a worker process or in-process).
+    The route score is None for languages without a profile.
+    """
+    cache = FileResultCache(entries=cache_entries) if cache_entries is not None else None
+    repo_path = Path(repo)
+    route = None
+    if profile is not None:
+        route = _score_routes(repo=repo_path, profile=profile, iso2_hint=iso2, iso3_hint=iso3, cache=cache)
+    asst = _score_assistant_dialog(repo=repo_path, iso2=iso2, iso3=iso3, cfg=cfg, cache=cache)
+    return route, asst, (cache.export() if cache is not None else None)
+
+
+def _job_cache_dirs(
+    repo: Path,
+    cfg: Mapping[str, Any],
+    profile: Optional[Mapping[str, Any]],
+    iso2: Optional[str],
+    iso3: Optional[str],
+) -> List[str]:
+    """Directories holding the files one language job may read (for FileResultCache.subset)."""
+    dirs = [str(p.parent) for p in _dialog_candidates(repo, iso2, iso3, cfg)]
+    mpath = profile.get("morphology_config_path") if profile else None
+    if isinstance(mpath, str) and mpath.strip():
+        dirs.append(str((repo / mpath).parent))
+    return dirs
+
+
+def scan_application(
+    *,
+    key_mode: str = "iso2",
+    jobs: Optional[int] = None,
+    cache: Optional[FileResultCache] = None,
+) -> Dict[str, Dict[str, int]]:
     """
     Scans the Application layer (Frontend & Backend Configs).
 
@@ -407,6 +488,10 @@ def scan_application(*, key_mode: str = "iso2") -> Dict[str, Dict[str, int]]:
     Output blocks per language:
       - app_profile, app_assets, app_routes, app_asst (0..10)
       - PROF, ASST, ROUT (0..10) for Everything Matrix Zone C
+
+    Route and dialog scoring run per language across `jobs` worker processes
+    (default: serial); `cache` reuses parsed morphology configs and dialog
+    files that did not change. Neither affects the output.
     """
     key_mode = (key_mode or "iso2").strip().casefold()
     if key_mode not in {"iso2", "wiki"}:
@@ -475,19 +560,40 @@ def scan_application(*, key_mode: str = "iso2") -> Dict[str, Dict[str, int]]:
         has_flag = flags_by_wiki.get(wiki, False)
         by_wiki.setdefault(wiki, {})["app_assets"] = _score_assets(has_profile, has_flag)
 
+    # 3+4) Per-language file checks (routes + dialog), fanned out.
+    # Profiles share a handful of morphology configs: summarize each one once
+    # here so the per-language jobs only look them up.
+    if cache is None:
+        cache = FileResultCache()  # in-memory, for this scan only
+    for prof in profiles_by_wiki.values():
+        mpath = prof.get("morphology_config_path")
+        if isinstance(mpath, str) and mpath.strip() and (repo / mpath).is_file():
+            cache.get_or_compute(repo / mpath, _morphology_config_summary)
+
+    calls = []
+    for wiki in by_wiki.keys():
+        prof = profiles_by_wiki.get(wiki)
+        iso2 = inv.get(wiki, {}).get("iso2")
+        iso3 = inv.get(wiki, {}).get("iso3")
+        entries = cache.subset(_job_cache_dirs(repo, cfg, prof, iso2, iso3))
+        calls.append((str(repo), cfg, prof, iso2, iso3, entries))
+
+    route_scores: Dict[str, Optional[int]] = {}
+    asst_scores: Dict[str, int] = {}
+    for wiki, (route_score, asst_score, exported) in zip(
+        by_wiki.keys(), map_in_processes(_score_language_job, calls, jobs=jobs)
+    ):
+        route_scores[wiki] = route_score
+        asst_scores[wiki] = asst_score
+        cache.absorb(exported)
+
     # 3) BACKEND ROUTES / WIRING (morphology config)
-    for wiki, prof in profiles_by_wiki.items():
-        iso2_hint = inv.get(wiki, {}).get("iso2")
-        iso3_hint = inv.get(wiki, {}).get("iso3")
-        route_score = _score_routes(repo=repo, profile=prof, iso2_hint=iso2_hint, iso3_hint=iso3_hint)
-        by_wiki.setdefault(wiki, {})["app_routes"] = route_score
+    for wiki in profiles_by_wiki.keys():
+        by_wiki.setdefault(wiki, {})["app_routes"] = route_scores[wiki]
 
     # 4) ASSISTANT / DIALOG readiness (from lexicon artifacts)
     for wiki in list(by_wiki.keys()):
-        iso2 = inv.get(wiki, {}).get("iso2")
-        iso3 = inv.get(wiki, {}).get("iso3")
-        asst_score = _score_assistant_dialog(repo=repo, iso2=iso2, iso3=iso3, cfg=cfg)
-        by_wiki.setdefault(wiki, {})["app_asst"] = asst_score
+        by_wiki.setdefault(wiki, {})["app_asst"] = asst_scores[wiki]
 
     # 5) Aliases / synthesis
     for wiki, blk in by_wiki.items():
@@ -521,13 +627,18 @@ def scan_application(*, key_mode: str = "iso2") -> Dict[str, Dict[str, int]]:
 # --- APIs expected by build_index.py (fast + iso2-keyed) ---
 
 
-def scan_all_apps(repo_root: Optional[Path] = None) -> Dict[str, Dict[str, int]]:
+def scan_all_apps(
+    repo_root: Optional[Path] = None,
+    *,
+    jobs: Optional[int] = None,
+    cache: Optional[FileResultCache] = None,
+) -> Dict[str, Dict[str, int]]:
     """
     Return app readiness keyed by iso2 (lowercase).
     `repo_root` is accepted for orchestrator compatibility; root is resolved internally.
     """
     _ = repo_root
-    return scan_application(key_mode="iso2")
+    return scan_application(key_mode="iso2", jobs=jobs, cache=cache)
 
 
 def scan_app_health(iso: str, repo_root: Optional[Path] = None) -> Dict[str, int]:
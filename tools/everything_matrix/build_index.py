@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import re
 import sys
 import time
@@ -22,7 +23,7 @@ CONFIG_FILE = BASE_DIR / "data" / "config" / "everything_matrix_config.json"
 # Sibling imports
 sys.path.append(str(Path(__file__).resolve().parent))
 
-from io_utils import atomic_write_json, directory_fingerprint, read_json  # noqa: E402
+from io_utils import FileResultCache, atomic_write_json, directory_fingerprint, read_json  # noqa: E402
 from norm import (  # noqa: E402
     build_name_map_iso2,
     build_wiki_to_iso2,
@@ -122,6 +123,8 @@ def _paths(repo: Path, cfg: Mapping[str, Any]) -> Dict[str, Path]:
     cfg_be = cfg.get("backend", {}) if isinstance(cfg.get("backend"), dict) else {}
 
     output_dir = repo / str(cfg_matrix.get("output_dir", "data/indices"))
+    # Per-file scanner results (mtime/size/sha256-validated); safe to delete.
+    scan_cache_dir = repo / str(cfg_matrix.get("scan_cache_dir", "data/cache/everything_matrix"))
     matrix_file = repo / str(cfg_matrix.get("everything_index", "data/indices/everything_matrix.json"))
     checksum_file = output_dir / "filesystem.checksum"
 
@@ -143,6 +146,7 @@ def _paths(repo: Path, cfg: Mapping[str, Any]) -> Dict[str, Path]:
 
     return {
         "output_dir": output_dir,
+        "scan_cache_dir": scan_cache_dir,
         "matrix_file": matrix_file,
         "checksum_file": checksum_file,
         "rgl_inventory_file": rgl_inventory_file,
@@ -162,7 +166,9 @@ def _paths(repo: Path, cfg: Mapping[str, Any]) -> Dict[str, Path]:
 # Prereq: RGL inventory is an input artifact (regen only if missing or --regen-rgl)
 # ---------------------------
 
-def _ensure_rgl_inventory(*, inventory_file: Path, regen: bool) -> Optional[Dict[str, Any]]:
+def _ensure_rgl_inventory(
+    *, inventory_file: Path, regen: bool, jobs: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
     if (not inventory_file.is_file()) or regen:
         if not rgl_scanner or not hasattr(rgl_scanner, "scan_rgl"):
             logger.warning("RGL inventory missing/regen requested, but rgl_scanner unavailable. Zone A will be zeros.")
@@ -170,7 +176,7 @@ def _ensure_rgl_inventory(*, inventory_file: Path, regen: bool) -> Optional[Dict
         logger.info("Regenerating RGL inventory via rgl_scanner.scan_rgl()")
         try:
             # Force write to disk so subsequent reads find the new data
-            rgl_scanner.scan_rgl(write_output=True, output_file=inventory_file)  # type: ignore[attr-defined]
+            rgl_scanner.scan_rgl(write_output=True, output_file=inventory_file, jobs=jobs)  # type: ignore[attr-defined]
         except Exception as e:
             logger.warning("rgl_scanner.scan_rgl() failed: %s", e)
 
@@ -251,13 +257,19 @@ def _folder_name_from_rgl_path(rgl_path: Any) -> str:
 # Updated to accept wiki_to_iso2 mapping for strict normalization
 # ---------------------------
 
-def _scan_all_lexicons(lex_root: Path, *, wiki_to_iso2: Mapping[str, str]) -> Dict[str, Dict[str, float]]:
+def _scan_all_lexicons(
+    lex_root: Path,
+    *,
+    wiki_to_iso2: Mapping[str, str],
+    jobs: Optional[int] = None,
+    cache: Optional[FileResultCache] = None,
+) -> Dict[str, Dict[str, float]]:
     zeros = {"SEED": 0.0, "CONC": 0.0, "WIDE": 0.0, "SEM": 0.0}
     if not lexicon_scanner or not hasattr(lexicon_scanner, "scan_all_lexicons"):
         logger.warning("lexicon_scanner.scan_all_lexicons missing; Zone B will be zeros.")
         return {}
     try:
-        out = lexicon_scanner.scan_all_lexicons(lex_root)  # type: ignore[attr-defined]
+        out = lexicon_scanner.scan_all_lexicons(lex_root, jobs=jobs, cache=cache)  # type: ignore[attr-defined]
     except Exception as e:
         logger.warning("lexicon_scanner.scan_all_lexicons failed; Zone B will be zeros. (%s)", e)
         return {}
@@ -273,13 +285,19 @@ def _scan_all_lexicons(lex_root: Path, *, wiki_to_iso2: Mapping[str, str]) -> Di
     return normed
 
 
-def _scan_all_apps(repo_root: Path, *, wiki_to_iso2: Mapping[str, str]) -> Dict[str, Dict[str, float]]:
+def _scan_all_apps(
+    repo_root: Path,
+    *,
+    wiki_to_iso2: Mapping[str, str],
+    jobs: Optional[int] = None,
+    cache: Optional[FileResultCache] = None,
+) -> Dict[str, Dict[str, float]]:
     zeros = {"PROF": 0.0, "ASST": 0.0, "ROUT": 0.0}
     if not app_scanner or not hasattr(app_scanner, "scan_all_apps"):
         logger.warning("app_scanner.scan_all_apps missing; Zone C will be zeros.")
         return {}
     try:
-        out = app_scanner.scan_all_apps(repo_root)  # type: ignore[attr-defined]
+        out = app_scanner.scan_all_apps(repo_root, jobs=jobs, cache=cache)  # type: ignore[attr-defined]
     except Exception as e:
         logger.warning("app_scanner.scan_all_apps failed; Zone C will be zeros. (%s)", e)
         return {}
@@ -320,6 +338,26 @@ def _scan_all_artifacts(gf_root: Path, *, wiki_to_iso2: Mapping[str, str]) -> Di
     return normed
 
 
+def _scan_cache(cache_dir: Path, name: str, scanner: Any, *, fresh: bool) -> Optional[FileResultCache]:
+    """Persistent per-file cache for one scanner (None if the scanner is unavailable)."""
+    if scanner is None:
+        return None
+    version = str(getattr(scanner, "LEXICON_SCANNER_VERSION", None) or getattr(scanner, "SCANNER_VERSION", name))
+    path = cache_dir / f"{name}_files.json"
+    if fresh:
+        return FileResultCache(path, version=version, entries={})
+    return FileResultCache(path, version=version)
+
+
+def _save_scan_cache(cache: Optional[FileResultCache]) -> None:
+    if cache is None:
+        return
+    try:
+        cache.save()
+    except OSError as e:
+        logger.warning("Could not save scanner cache %s: %s", cache.path, e)
+
+
 # ---------------------------
 # Orchestrator
 # ---------------------------
@@ -335,6 +373,14 @@ def scan_system() -> None:
     parser.add_argument("--regen-lex", action="store_true", help="Force Zone B rescan")
     parser.add_argument("--regen-app", action="store_true", help="Force Zone C rescan")
     parser.add_argument("--regen-qa", action="store_true", help="Force Zone D rescan")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        # Opt-in: on a repo this size process start-up costs more than the
+        # scans it would parallelise (pool ~60 ms vs serial ~30 ms).
+        default=int(os.getenv("EVERYTHING_MATRIX_JOBS", "1") or 1),
+        help="Worker processes per scanner (default: $EVERYTHING_MATRIX_JOBS or 1 = serial)",
+    )
 
     args, _ = parser.parse_known_args()
     if args.regen_rgl or args.regen_lex or args.regen_app or args.regen_qa:
@@ -406,8 +452,15 @@ def scan_system() -> None:
 
     logger.info("Everything Matrix build starting (scoring_version=%s).", scoring_version)
 
+    jobs = max(1, int(args.jobs))
+    scan_timings_ms: Dict[str, float] = {}
+
     # 1) Zone A source: rgl_inventory.json (regen only if missing or --regen-rgl)
-    rgl_inventory = _ensure_rgl_inventory(inventory_file=p["rgl_inventory_file"], regen=bool(args.regen_rgl))
+    t0 = time.perf_counter()
+    rgl_inventory = _ensure_rgl_inventory(
+        inventory_file=p["rgl_inventory_file"], regen=bool(args.regen_rgl), jobs=jobs
+    )
+    scan_timings_ms["rgl"] = round((time.perf_counter() - t0) * 1000, 2)
     rgl_by_iso2: Dict[str, Dict[str, Any]] = {}
     if isinstance(rgl_inventory, dict):
         rgl_by_iso2 = _normalize_inventory_by_iso2(rgl_inventory.get("languages"), wiki_to_iso2=wiki_to_iso2)
@@ -418,17 +471,29 @@ def scan_system() -> None:
     # 3) One-shot scans per zone (no per-iso rescans here)
     logger.info("--- Phase 1: One-Shot Scans ---")
 
+    lex_cache = _scan_cache(p["scan_cache_dir"], "lexicon", lexicon_scanner, fresh=bool(args.regen_lex))
+    app_cache = _scan_cache(p["scan_cache_dir"], "app", app_scanner, fresh=bool(args.regen_app))
+
     logger.info("Calling lexicon_scanner...")
-    lex_inv = _scan_all_lexicons(p["lex_root"], wiki_to_iso2=wiki_to_iso2)
-    logger.info(f"  -> Lexicon inventory: {len(lex_inv)} languages.")
+    t0 = time.perf_counter()
+    lex_inv = _scan_all_lexicons(p["lex_root"], wiki_to_iso2=wiki_to_iso2, jobs=jobs, cache=lex_cache)
+    scan_timings_ms["lexicon"] = round((time.perf_counter() - t0) * 1000, 2)
+    logger.info(f"  -> Lexicon inventory: {len(lex_inv)} languages ({scan_timings_ms['lexicon']} ms).")
 
     logger.info("Calling app_scanner...")
-    app_inv = _scan_all_apps(BASE_DIR, wiki_to_iso2=wiki_to_iso2)
-    logger.info(f"  -> App inventory: {len(app_inv)} languages.")
+    t0 = time.perf_counter()
+    app_inv = _scan_all_apps(BASE_DIR, wiki_to_iso2=wiki_to_iso2, jobs=jobs, cache=app_cache)
+    scan_timings_ms["app"] = round((time.perf_counter() - t0) * 1000, 2)
+    logger.info(f"  -> App inventory: {len(app_inv)} languages ({scan_timings_ms['app']} ms).")
 
     logger.info("Calling qa_scanner...")
+    t0 = time.perf_counter()
     qa_inv = _scan_all_artifacts(p["gf_root"], wiki_to_iso2=wiki_to_iso2)
-    logger.info(f"  -> QA inventory: {len(qa_inv)} languages.")
+    scan_timings_ms["qa"] = round((time.perf_counter() - t0) * 1000, 2)
+    logger.info(f"  -> QA inventory: {len(qa_inv)} languages ({scan_timings_ms['qa']} ms).")
+
+    _save_scan_cache(lex_cache)
+    _save_scan_cache(app_cache)
 
     # 4) Build universe (iso2)
     all_isos: Set[str] = set()
@@ -588,6 +653,13 @@ def scan_system() -> None:
             "skipped": sum(1 for l in matrix_langs.values() if l["verdict"]["build_strategy"] == "SKIP"),
             "runnable": sum(1 for l in matrix_langs.values() if bool(l["verdict"]["runnable"])),
         },
+        "scan": {
+            "jobs": jobs,
+            "timings_ms": scan_timings_ms,
+            "file_cache": {
+                name: cache.stats() for name, cache in (("lexicon", lex_cache), ("app", app_cache)) if cache is not None
+            },
+        },
         "languages": matrix_langs,
     }
 
@@ -4,8 +4,10 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 
 def read_json(path: Path) -> Optional[Any]:
@@ -69,3 +71,141 @@ def directory_fingerprint(*, content_roots: Iterable[Path], config_files: Iterab
             continue
 
     return hasher.hexdigest()
+
+
+
+# ---------------------------
+# Per-file result cache + process pool (shared by the scanners)
+# ---------------------------
+
+FILE_CACHE_FORMAT = 1
+
+
+def _sha256_file(path: Path) -> Optional[str]:
+    hasher = hashlib.sha256()
+    try:
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+    except OSError:
+        return None
+    return hasher.hexdigest()
+
+
+class FileResultCache:
+    """
+    Persistent per-file scan results keyed by absolute path.
+
+    An entry is reused while the file's (mtime_ns, size) is unchanged; when
+    only the mtime moved (checkout, touch) the sha256 of the content decides.
+    Results must be JSON-serializable and are returned shared: do not mutate.
+
+    `version` should name the scanner that produced the results, so a
+    scanner upgrade discards the old entries. Entries not looked up during a
+    run are dropped on `save()`.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        version: str = "",
+        entries: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        self.path = path
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.entries: Dict[str, Dict[str, Any]] = dict(entries) if entries is not None else {}
+        self._touched: Set[str] = set()
+
+        if entries is None and path is not None:
+            obj = read_json_dict(path)
+            if obj and obj.get("format") == FILE_CACHE_FORMAT and obj.get("version") == version:
+                files = obj.get("files")
+                if isinstance(files, dict):
+                    self.entries = {k: v for k, v in files.items() if isinstance(v, dict)}
+
+    def get_or_compute(self, path: Path, compute: Callable[[Path], Any]) -> Any:
+        key = str(path)
+        try:
+            st = path.stat()
+        except OSError:
+            return compute(path)
+
+        mtime_ns = getattr(st, "st_mtime_ns", int(st.st_mtime * 1e9))
+        entry = self.entries.get(key)
+        digest: Optional[str] = None
+        if entry is not None and entry.get("size") == st.st_size:
+            if entry.get("mtime_ns") == mtime_ns:
+                return self._hit(key, entry)
+            digest = _sha256_file(path)
+            if digest is not None and digest == entry.get("sha256"):
+                entry["mtime_ns"] = mtime_ns
+                return self._hit(key, entry)
+
+        if digest is None:
+            digest = _sha256_file(path)
+        result = compute(path)
+        self.misses += 1
+        self.entries[key] = {"mtime_ns": mtime_ns, "size": st.st_size, "sha256": digest, "result": result}
+        self._touched.add(key)
+        return result
+
+    def _hit(self, key: str, entry: Dict[str, Any]) -> Any:
+        self.hits += 1
+        self._touched.add(key)
+        return entry.get("result")
+
+    # --- worker hand-off ---
+
+    def subset(self, dirs: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Entries for files directly inside `dirs` (what one worker needs)."""
+        wanted = set(dirs)
+        return {k: v for k, v in self.entries.items() if os.path.dirname(k) in wanted}
+
+    def export(self) -> Dict[str, Any]:
+        """Entries looked up (or recomputed) here, plus counters, for `absorb()`."""
+        return {
+            "entries": {k: self.entries[k] for k in self._touched},
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def absorb(self, exported: Optional[Dict[str, Any]]) -> None:
+        if not exported:
+            return
+        entries = exported.get("entries") or {}
+        self.entries.update(entries)
+        self._touched.update(entries)
+        self.hits += int(exported.get("hits", 0))
+        self.misses += int(exported.get("misses", 0))
+
+    def stats(self) -> Dict[str, int]:
+        return {"files": len(self._touched), "hits": self.hits, "misses": self.misses}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        files = {k: self.entries[k] for k in sorted(self._touched)}
+        atomic_write_json(self.path, {"format": FILE_CACHE_FORMAT, "version": self.version, "files": files})
+
+
+def map_in_processes(fn: Callable[..., Any], calls: Sequence[Tuple[Any, ...]], *, jobs: Optional[int]) -> List[Any]:
+    """
+    `[fn(*args) for args in calls]`, fanned out over `jobs` worker processes.
+
+    Results keep the order of `calls`. Runs in-process when `jobs` <= 1,
+    when there is a single call, or when worker processes cannot be started
+    (restricted sandboxes); exceptions raised by `fn` propagate either way.
+    """
+    calls = list(calls)
+    workers = min(int(jobs or 1), len(calls))
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(calls) // (workers * 4))
+                return list(pool.map(fn, *zip(*calls), chunksize=chunksize))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass
+    return [fn(*args) for args in calls]
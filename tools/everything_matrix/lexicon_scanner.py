@@ -10,6 +10,12 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union, List
 
+try:
+    from .io_utils import FileResultCache, map_in_processes
+except ImportError:
+    sys.path.append(str(Path(__file__).resolve().parent))
+    from io_utils import FileResultCache, map_in_processes  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 LEXICON_SCANNER_VERSION = "lexicon_scanner/3.0"
@@ -22,6 +28,8 @@ LEXICON_SCANNER_VERSION = "lexicon_scanner/3.0"
 #
 # Notes:
 # - Side-effect free by default (no writes, no print, no logging config).
+# - Languages can be scanned in a process pool (jobs=N) and per-file counts
+#   reused across runs through a FileResultCache owned by the caller.
 # - Normalizes all discovered lexicon folders to canonical ISO-639-1 (iso2) keys,
 #   using config/iso_to_wiki.json (prefers iso2 when multiple codes map to same wiki).
 # - Deep per-language scan stays available as debug:
@@ -243,6 +251,33 @@ def _count_sections(sections: Mapping[str, Mapping[str, Any]]) -> int:
     return int(sum(len(sec) for sec in sections.values()))
 
 
+def _file_summary(path: Path) -> Dict[str, Any]:
+    """
+    Entry / QID / forms counts of one lexicon JSON file.
+    Load warnings are returned with the counts so cache hits can replay them.
+    """
+    start = len(_SCAN_WARNINGS)
+    payload = _safe_load_json(path)
+    warnings = _SCAN_WARNINGS[start:]
+    del _SCAN_WARNINGS[start:]
+
+    sections, _ = _extract_section_maps(payload)
+    qid_entries = 0
+    forms_entries = 0
+    for e in _iter_entry_dicts(sections):
+        if _entry_has_qid(e):
+            qid_entries += 1
+        if _entry_has_forms(e):
+            forms_entries += 1
+    return {"n": _count_sections(sections), "qid": qid_entries, "forms": forms_entries, "warnings": warnings}
+
+
+def _summarize(path: Path, cache: Optional[FileResultCache]) -> Dict[str, Any]:
+    summary = cache.get_or_compute(path, _file_summary) if cache is not None else _file_summary(path)
+    _SCAN_WARNINGS.extend(summary["warnings"])
+    return summary
+
+
 def _score_count(count: int, *, low: int, high: int) -> float:
     """
     Piecewise scale:
@@ -265,7 +300,12 @@ def _score_count(count: int, *, low: int, high: int) -> float:
 # -----------------------------------------------------------------------------
 # Single-language deep scan (debug tool)
 # -----------------------------------------------------------------------------
-def scan_lexicon_health(lang_code: str, lex_root: Path) -> Dict[str, float]:
+def scan_lexicon_health(
+    lang_code: str,
+    lex_root: Path,
+    *,
+    cache: Optional[FileResultCache] = None,
+) -> Dict[str, float]:
     """
     Deep scan of Zone B lexicon health for one language.
 
@@ -273,6 +313,8 @@ def scan_lexicon_health(lang_code: str, lex_root: Path) -> Dict[str, float]:
       - SEED, CONC, WIDE, SEM
       - COUNT_* diagnostics and ratios
 
+    With `cache`, per-file counts of unchanged JSON files are reused.
+
     NOTE: Zone C is NOT computed here anymore (moved to app_scanner per upgrade plan).
     """
     stats: Dict[str, float] = {
@@ -328,10 +370,8 @@ def scan_lexicon_health(lang_code: str, lex_root: Path) -> Dict[str, float]:
         return stats
 
     # 1) core.json => SEED
-    core_file = lang_path / "core.json"
-    core_payload = _safe_load_json(core_file)
-    core_sections, _ = _extract_section_maps(core_payload)
-    core_count = _count_sections(core_sections)
+    core = _summarize(lang_path / "core.json", cache)
+    core_count = core["n"]
     stats["COUNT_CORE"] = float(core_count)
     stats["SEED"] = _score_count(core_count, low=TARGETS["core_low"], high=TARGETS["core_high"])
 
@@ -357,23 +397,16 @@ def scan_lexicon_health(lang_code: str, lex_root: Path) -> Dict[str, float]:
 
     # include core entries in SEM totals too
     total_entries += core_count
-    for e in _iter_entry_dicts(core_sections):
-        if _entry_has_qid(e):
-            qid_entries += 1
-        if _entry_has_forms(e):
-            forms_entries += 1
+    qid_entries += core["qid"]
+    forms_entries += core["forms"]
 
     for fname, p in sorted(domain_files.items(), key=lambda kv: kv[0]):
-        payload = _safe_load_json(p)
-        sections, _ = _extract_section_maps(payload)
-        n = _count_sections(sections)
+        shard = _summarize(p, cache)
+        n = shard["n"]
 
         total_entries += n
-        for e in _iter_entry_dicts(sections):
-            if _entry_has_qid(e):
-                qid_entries += 1
-            if _entry_has_forms(e):
-                forms_entries += 1
+        qid_entries += shard["qid"]
+        forms_entries += shard["forms"]
 
         if fname == "people.json":
             people_count += n
@@ -416,16 +449,11 @@ def scan_lexicon_health(lang_code: str, lex_root: Path) -> Dict[str, float]:
     if wide_json.is_file():
         try:
             if wide_json.stat().st_size <= MAX_WIDE_BYTES_TO_LOAD:
-                payload = _safe_load_json(wide_json)
-                sections, _ = _extract_section_maps(payload)
-                wide_entries = _count_sections(sections)
-
-                total_entries += wide_entries
-                for e in _iter_entry_dicts(sections):
-                    if _entry_has_qid(e):
-                        qid_entries += 1
-                    if _entry_has_forms(e):
-                        forms_entries += 1
+                wide = _summarize(wide_json, cache)
+
+                total_entries += wide["n"]
+                qid_entries += wide["qid"]
+                forms_entries += wide["forms"]
         except OSError:
             pass
 
@@ -455,7 +483,26 @@ def scan_lexicon_health(lang_code: str, lex_root: Path) -> Dict[str, float]:
 # -----------------------------------------------------------------------------
 # Orchestrator contract: scan all lexicons once
 # -----------------------------------------------------------------------------
-def scan_all_lexicons(lex_root: Path) -> Dict[str, Dict[str, float]]:
+def _scan_language_job(
+    iso2: str,
+    lex_root: str,
+    cache_entries: Optional[Dict[str, Dict[str, Any]]],
+) -> Tuple[Dict[str, float], List[str], Optional[Dict[str, Any]]]:
+    """One language of scan_all_lexicons (runs in a worker process or in-process)."""
+    cache = FileResultCache(entries=cache_entries) if cache_entries is not None else None
+    start = len(_SCAN_WARNINGS)
+    stats = scan_lexicon_health(iso2, Path(lex_root), cache=cache)
+    warnings = _SCAN_WARNINGS[start:]
+    del _SCAN_WARNINGS[start:]
+    return stats, warnings, (cache.export() if cache is not None else None)
+
+
+def scan_all_lexicons(
+    lex_root: Path,
+    *,
+    jobs: Optional[int] = None,
+    cache: Optional[FileResultCache] = None,
+) -> Dict[str, Dict[str, float]]:
     """
     Contract for build_index.py (one-shot scan):
       returns {iso2: {"SEED":..,"CONC":..,"WIDE":..,"SEM":..}}
@@ -463,6 +510,11 @@ def scan_all_lexicons(lex_root: Path) -> Dict[str, Dict[str, float]]:
     Determinism:
       - If both "en/" and "eng/" exist and map to the same iso2, we prefer the
         2-letter folder ("en") over longer aliases.
+
+    Performance:
+      - Each iso2 is scanned once, across `jobs` worker processes (default: serial).
+      - `cache` (optional) skips re-parsing unchanged JSON files; the caller saves it.
+      - The result does not depend on `jobs` or on the cache state.
     """
     if not isinstance(lex_root, Path):
         return {}
@@ -485,16 +537,32 @@ def scan_all_lexicons(lex_root: Path) -> Dict[str, Dict[str, float]]:
 
     scan_start = time.time()
     folders = sorted(lex_root.iterdir(), key=lambda x: x.name.casefold())
-    
+
+    # Alias folders (en/, eng/) resolve to the same language: scan each iso2 once.
+    lang_folders: List[Tuple[Path, str]] = []
+    dirs_by_iso2: Dict[str, List[str]] = {}
     for p in folders:
         if not p.is_dir():
             continue
-
         iso2 = _norm_to_iso2(p.name, wiki_to_iso2=wiki_to_iso2)
         if not iso2:
             continue
-
-        stats = scan_lexicon_health(iso2, lex_root)
+        lang_folders.append((p, iso2))
+        dirs_by_iso2.setdefault(iso2, []).append(str(p))
+
+    calls = [
+        (iso2, str(lex_root), cache.subset(dirs) if cache is not None else None)
+        for iso2, dirs in dirs_by_iso2.items()
+    ]
+    results: Dict[str, Tuple[Dict[str, float], List[str]]] = {}
+    for (iso2, _, _), (stats, warnings, exported) in zip(calls, map_in_processes(_scan_language_job, calls, jobs=jobs)):
+        results[iso2] = (stats, warnings)
+        if cache is not None:
+            cache.absorb(exported)
+
+    for p, iso2 in lang_folders:
+        stats, warnings = results[iso2]
+        _SCAN_WARNINGS.extend(warnings)
         zone_b = {
             "SEED": float(stats.get("SEED", 0.0) or 0.0),
             "CONC": float(stats.get("CONC", 0.0) or 0.0),
@@ -542,6 +610,12 @@ def _main() -> None:
         default="",
         help="If set, scan only this language code (iso2/iso3/wiki alias).",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the batch scan (default: 1, serial).",
+    )
     args = ap.parse_args()
 
     # 2. Header
@@ -567,7 +641,7 @@ def _main() -> None:
         return
 
     # 4. Batch Mode
-    all_stats = scan_all_lexicons(lex_root)
+    all_stats = scan_all_lexicons(lex_root, jobs=args.jobs)
 
     # 5. Calculate Meta Stats
     total_lemmas = 0 # This is approximate since scan_all_lexicons returns scores, not raw counts
@@ -8,7 +8,7 @@ import re
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional, Set
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 # Add project root for utils import
 root_dir = Path(__file__).resolve().parents[2]
@@ -22,7 +22,7 @@ sys.path.append(str(Path(__file__).resolve().parent))
 
 try:
     # io_utils.py (canonical shared IO)
-    from io_utils import read_json, atomic_write_json  # type: ignore
+    from io_utils import read_json, atomic_write_json, map_in_processes  # type: ignore
     # norm.py (canonical shared normalization)
     from norm import build_wiki_to_iso2, load_iso_to_wiki  # type: ignore
 except Exception as e:
@@ -176,15 +176,76 @@ def _compute_blocks_from_modules(modules: Mapping[str, Any]) -> Dict[str, int]:
     }
 
 
+def _walk_pruned(top: str, ignored_folders: Iterable[str], include_api_folder: bool) -> List[Tuple[str, List[str]]]:
+    """os.walk(top) with scan_rgl's pruning rules; (root, files) in walk order."""
+    ignored = set(ignored_folders)
+    out: List[Tuple[str, List[str]]] = []
+    for root_dir, dirs, files in os.walk(top):
+        # Prune traversal
+        dirs[:] = [d for d in dirs if d not in ignored and not d.startswith(".")]
+
+        if not include_api_folder and Path(root_dir).name == "api":
+            dirs[:] = []
+            continue
+
+        out.append((root_dir, files))
+    return out
+
+
+def _walk_rgl(
+    base_path: Path,
+    ignored_folders: Set[str],
+    include_api_folder: bool,
+    *,
+    jobs: Optional[int],
+) -> List[Tuple[str, List[str]]]:
+    """
+    Same listing as _walk_pruned(base_path), with each top-level subtree
+    (one per language family / language) walked in a worker process.
+    Subtrees are concatenated in os.walk order, so the result is identical.
+    """
+    top = str(base_path)
+    if not jobs or jobs <= 1:
+        return _walk_pruned(top, ignored_folders, include_api_folder)
+
+    try:
+        root_dir, dirs, files = next(os.walk(top))
+    except StopIteration:
+        return []
+
+    dirs = [d for d in dirs if d not in ignored_folders and not d.startswith(".")]
+    if not include_api_folder and Path(root_dir).name == "api":
+        return []
+
+    # os.walk does not descend into symlinked directories (followlinks=False).
+    subtrees = [os.path.join(root_dir, d) for d in dirs if not os.path.islink(os.path.join(root_dir, d))]
+    ignored = sorted(ignored_folders)
+    walked = map_in_processes(
+        _walk_pruned,
+        [(sub, ignored, include_api_folder) for sub in subtrees],
+        jobs=jobs,
+    )
+
+    out: List[Tuple[str, List[str]]] = [(root_dir, files)]
+    for part in walked:
+        out.extend(part)
+    return out
+
+
 def scan_rgl(
     *,
     repo_root: Optional[Path] = None,
     write_output: bool = False,
     output_file: Optional[Path] = None,
     quiet: bool = True,
+    jobs: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Library entrypoint: scan_rgl(...) -> inventory dict
+
+    `jobs` > 1 walks the top-level RGL folders in worker processes; the
+    inventory is the same either way. Module detection only looks at file
+    names, so there is nothing to cache per file.
     """
     repo = repo_root or _repo_root()
     config = _load_config(repo)
@@ -212,16 +273,9 @@ def scan_rgl(
     inventory: Dict[str, Dict[str, Any]] = {}
     family_folders: Set[str] = set()
 
-    for root_dir, dirs, files in os.walk(base_path):
+    for root_dir, files in _walk_rgl(base_path, ignored_folders, include_api_folder, jobs=jobs):
         folder_name = Path(root_dir).name
 
-        # Prune traversal
-        dirs[:] = [d for d in dirs if d not in ignored_folders and not d.startswith(".")]
-
-        if not include_api_folder and folder_name == "api":
-            dirs[:] = []
-            continue
-
         gf_files = [f for f in files if f.endswith(".gf")]
         if not gf_files:
             continue
@@ -323,6 +377,7 @@ def main() -> None:
     parser.add_argument("--write", action="store_true", help="Write inventory file to disk")
     parser.add_argument("--output", type=str, default="", help="Override output file path (implies --write)")
     parser.add_argument("--quiet", action="store_true", help="Suppress progress output (JSON still printed)")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for the directory walk")
     args = parser.parse_args()
 
     with tool_logging("rgl_scanner") as ctx:
@@ -331,7 +386,9 @@ def main() -> None:
         write = bool(args.write or (out_path is not None))
 
         ctx.log_stage("Scanning GF-RGL")
-        data = scan_rgl(repo_root=repo, write_output=write, output_file=out_path, quiet=bool(args.quiet))
+        data = scan_rgl(
+            repo_root=repo, write_output=write, output_file=out_path, quiet=bool(args.quiet), jobs=args.jobs
+        )
 
         # Add log summary to meta for JSON consumer
         langs_found = len(data.get("languages", {}))
@@ -0,0 +1,156 @@
+"""
+Discourse State Scaling Benchmark.
+
+Drives `discourse.state.DiscourseState` through documents of growing length
+(N sentences over N entities, a few mentions per sentence, one salience
+decay and one topic choice per sentence) and reports the cost per sentence.
+
+With lazily decayed salience and the indexed topic query, the cost per
+sentence stays flat as N grows, i.e. the document costs O(N). `--eager`
+also times the previous strategy (decay every entry, max() over all
+entries) on the same workload for comparison; it grows linearly per
+sentence, i.e. O(N^2) per document.
+
+Usage:
+    python tools/health/discourse_benchmark.py
+    python tools/health/discourse_benchmark.py --sizes 1000 4000 16000 --eager
+    python tools/health/discourse_benchmark.py --max-growth 2.0 --json-out discourse.json
+
+Output:
+    Console report and exit code 1 if the per-sentence cost at the largest
+    size exceeds `--max-growth` x the cost at the smallest size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# -----------------------------------------------------------------------------
+# Project root & imports
+# -----------------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from app.core.domain.semantics.types import Entity  # noqa: E402
+from discourse.state import DiscourseState  # noqa: E402
+
+# Optional GUI-friendly logger
+try:
+    from utils.tool_logger import ToolLogger  # type: ignore
+
+    log = ToolLogger("discourse_benchmark")
+except Exception:  # pragma: no cover
+    class _FallbackLogger:
+        def header(self, d: Dict[str, Any]) -> None:
+            print("=== DISCOURSE STATE BENCHMARK ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+
+        def stage(self, name: str, msg: str) -> None:
+            print(f"[{name}] {msg}")
+
+        def info(self, msg: str = "") -> None:
+            print(msg)
+
+        def warning(self, msg: str) -> None:
+            print(f"[WARN] {msg}")
+
+        def error(self, msg: str) -> None:
+            print(f"[ERROR] {msg}")
+
+        def summary(self, d: Dict[str, Any], success: bool = True) -> None:
+            print("\n=== SUMMARY ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+            print("STATUS:", "OK" if success else "FAIL")
+
+    log = _FallbackLogger()
+
+
+def _workload(size: int, mentions: int, seed: int) -> List[List[int]]:
+    rng = random.Random(seed)
+    return [[rng.randrange(size) for _ in range(mentions)] for _ in range(size)]
+
+
+def run_indexed(entities: List[Entity], sentences: List[List[int]]) -> float:
+    state = DiscourseState()
+    started = time.perf_counter()
+    for sentence in sentences:
+        for i in sentence:
+            state.mention(entities[i])
+        state._current_topic_key = None  # force a salience-based choice
+        state.get_or_choose_topic()
+        state.advance_sentence(0.9)
+    return time.perf_counter() - started
+
+
+def run_eager(entities: List[Entity], sentences: List[List[int]]) -> float:
+    salience: Dict[str, float] = {}
+    started = time.perf_counter()
+    for sentence in sentences:
+        for i in sentence:
+            key = entities[i].id or ""
+            salience[key] = salience.get(key, 1.0) + 1.0
+        max(salience, key=salience.__getitem__)
+        for key in salience:
+            salience[key] *= 0.9
+    return time.perf_counter() - started
+
+
+def measure(run: Callable[[List[Entity], List[List[int]]], float], size: int, *, mentions: int, repeats: int) -> float:
+    """Best-of-`repeats` microseconds per sentence."""
+    entities = [Entity(id=f"Q{i}", name=f"Entity {i}") for i in range(size)]
+    sentences = _workload(size, mentions, seed=size)
+    best = min(run(entities, sentences) for _ in range(max(1, repeats)))
+    return best / size * 1e6
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check that discourse state costs O(1) per sentence.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[500, 2000, 8000], help="Sentences (= entities) per document")
+    parser.add_argument("--mentions", type=int, default=3, help="Mentions per sentence")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-growth", type=float, default=3.0, help="Allowed per-sentence cost ratio, largest vs smallest size")
+    parser.add_argument("--eager", action="store_true", help="Also time the decay-everything / max() strategy")
+    parser.add_argument("--json-out", type=str, default=None)
+    args = parser.parse_args(argv)
+
+    sizes = sorted(set(args.sizes))
+    log.header({"sizes": ", ".join(map(str, sizes)), "mentions": args.mentions, "repeats": args.repeats})
+
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        log.stage(str(size), "running ...")
+        row: Dict[str, Any] = {
+            "size": size,
+            "indexed_us_per_sentence": round(measure(run_indexed, size, mentions=args.mentions, repeats=args.repeats), 2),
+        }
+        line = f"  indexed {row['indexed_us_per_sentence']:>10.2f} us/sentence"
+        if args.eager:
+            row["eager_us_per_sentence"] = round(measure(run_eager, size, mentions=args.mentions, repeats=args.repeats), 2)
+            line += f"   eager {row['eager_us_per_sentence']:>10.2f} us/sentence"
+        log.info(line)
+        results.append(row)
+
+    growth = results[-1]["indexed_us_per_sentence"] / max(results[0]["indexed_us_per_sentence"], 1e-9)
+    success = growth <= args.max_growth
+    if not success:
+        log.error(f"per-sentence cost grew {growth:.2f}x from {sizes[0]} to {sizes[-1]} (max {args.max_growth}x)")
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    log.summary({"growth": f"{growth:.2f}x", "sizes": f"{sizes[0]}..{sizes[-1]}"}, success=success)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Lexicon Repository Write Benchmark.
+
+Measures sequential `save_entry()` throughput of the LexiconRepo backends
+against a throw-away directory:
+
+    journal  JournalLexiconRepository (append-only journal + compaction)
+    json     FileSystemLexiconRepository (rewrites lexicon.json per save)
+
+The JSON backend is O(n^2) in disk I/O, so it runs a smaller entry count by
+default (`--json-entries`); per-save latency is what should be compared.
+Every run also times QID lookups (`get_entries_by_concept`) and, for the
+journal backend, the final compaction into the JSON shard.
+
+Usage:
+    python tools/health/lexicon_repo_benchmark.py
+    python tools/health/lexicon_repo_benchmark.py --entries 50000 --backends journal
+    python tools/health/lexicon_repo_benchmark.py --batch-size 500
+    python tools/health/lexicon_repo_benchmark.py --update-baseline
+
+Output:
+    Console report and exit code 1 if journal saves/sec drops more than
+    `--threshold` below the stored baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# -----------------------------------------------------------------------------
+# Project root & imports
+# -----------------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Optional GUI-friendly logger
+try:
+    from utils.tool_logger import ToolLogger  # type: ignore
+
+    log = ToolLogger("lexicon_repo_benchmark")
+except Exception:  # pragma: no cover
+    class _FallbackLogger:
+        def header(self, d: Dict[str, Any]) -> None:
+            print("=== LEXICON REPO BENCHMARK ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+
+        def stage(self, name: str, msg: str) -> None:
+            print(f"[{name}] {msg}")
+
+        def info(self, msg: str = "") -> None:
+            print(msg)
+
+        def warning(self, msg: str) -> None:
+            print(f"[WARN] {msg}")
+
+        def error(self, msg: str) -> None:
+            print(f"[ERROR] {msg}")
+
+        def summary(self, d: Dict[str, Any], success: bool = True) -> None:
+            print("\n=== SUMMARY ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+            print("STATUS:", "OK" if success else "FAIL")
+
+    log = _FallbackLogger()
+
+try:
+    import structlog
+
+    from app.adapters.persistence.filesystem_repo import FileSystemLexiconRepository
+    from app.adapters.persistence.journal_lexicon_repo import JournalLexiconRepository
+    from app.core.domain.models import LexiconEntry
+except Exception as e:
+    print(f"[FATAL] Import failed: {e}", file=sys.stderr)
+    traceback.print_exc()
+    sys.exit(1)
+
+
+BASELINE_FILE = Path(__file__).resolve().parent / "lexicon_repo_baseline.json"
+BACKENDS = ("journal", "json")
+LANG = "xx"
+
+
+def _make_entries(count: int) -> List[LexiconEntry]:
+    # ~1 QID per 4 lemmas so the secondary index has fan-out to exercise.
+    return [
+        LexiconEntry(
+            lemma=f"lemma_{i:06d}",
+            pos="NOUN" if i % 3 else "VERB",
+            features={"qid": f"Q{i // 4 + 1}", "gender": "m" if i % 2 else "f"},
+            source="benchmark",
+        )
+        for i in range(count)
+    ]
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def run_backend(
+    backend: str,
+    entries: List[LexiconEntry],
+    *,
+    batch_size: int,
+    compact_every: int,
+    fsync: bool,
+    qid_queries: int,
+) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix=f"lexbench_{backend}_") as tmp:
+        if backend == "journal":
+            repo: Any = JournalLexiconRepository(tmp, compact_every=compact_every, fsync=fsync)
+        else:
+            repo = FileSystemLexiconRepository(tmp)
+
+        latencies_us: List[float] = []
+        started = time.perf_counter()
+
+        if batch_size > 0:
+            for offset in range(0, len(entries), batch_size):
+                chunk = entries[offset : offset + batch_size]
+                t0 = time.perf_counter()
+                await repo.save_entries(LANG, chunk)
+                latencies_us.append((time.perf_counter() - t0) * 1e6 / len(chunk))
+        else:
+            for entry in entries:
+                t0 = time.perf_counter()
+                await repo.save_entry(LANG, entry)
+                latencies_us.append((time.perf_counter() - t0) * 1e6)
+
+        save_elapsed = time.perf_counter() - started
+
+        query_us: List[float] = []
+        max_qid = max(1, len(entries) // 4)
+        for n in range(qid_queries):
+            qid = f"Q{(n * 7919) % max_qid + 1}"
+            t0 = time.perf_counter()
+            await repo.get_entries_by_concept(LANG, qid)
+            query_us.append((time.perf_counter() - t0) * 1e6)
+
+        compact_ms = 0.0
+        if backend == "journal":
+            t0 = time.perf_counter()
+            await repo.close()
+            compact_ms = (time.perf_counter() - t0) * 1e3
+
+        shard = Path(tmp) / "data" / "lexicon" / LANG / "lexicon.json"
+        shard_entries = len(json.loads(shard.read_text(encoding="utf-8"))) if shard.exists() else 0
+
+    return {
+        "backend": backend,
+        "entries": len(entries),
+        "batch_size": batch_size,
+        "total_sec": round(save_elapsed, 3),
+        "saves_per_sec": round(len(entries) / save_elapsed, 1) if save_elapsed else 0.0,
+        "save_p50_us": round(_percentile(latencies_us, 0.50), 1),
+        "save_p99_us": round(_percentile(latencies_us, 0.99), 1),
+        "save_mean_us": round(statistics.fmean(latencies_us), 1) if latencies_us else 0.0,
+        "qid_query_mean_us": round(statistics.fmean(query_us), 1) if query_us else 0.0,
+        "final_compaction_ms": round(compact_ms, 1),
+        "shard_entries": shard_entries,
+    }
+
+
+def _load_baseline() -> Dict[str, Any]:
+    if not BASELINE_FILE.exists():
+        return {}
+    try:
+        return json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark LexiconRepo write backends.")
+    parser.add_argument("--entries", type=int, default=50_000, help="Sequential saves for the journal backend")
+    parser.add_argument("--json-entries", type=int, default=2_000, help="Sequential saves for the JSON backend")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--batch-size", type=int, default=0, help="Use save_entries() in batches of N (0 = save_entry)")
+    parser.add_argument("--compact-every", type=int, default=5_000)
+    parser.add_argument("--fsync", action="store_true", help="fsync every journal append")
+    parser.add_argument("--qid-queries", type=int, default=1_000)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--json-out", type=str, default=None)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # Per-save info logs would dominate the timing loop.
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    log.header(
+        {
+            "backends": ", ".join(args.backends),
+            "journal_entries": args.entries,
+            "json_entries": args.json_entries,
+            "batch_size": args.batch_size,
+            "compact_every": args.compact_every,
+            "fsync": args.fsync,
+        }
+    )
+
+    results: List[Dict[str, Any]] = []
+    for backend in args.backends:
+        count = args.entries if backend == "journal" else args.json_entries
+        log.stage(backend, f"{count} saves ...")
+        result = asyncio.run(
+            run_backend(
+                backend,
+                _make_entries(count),
+                batch_size=args.batch_size,
+                compact_every=args.compact_every,
+                fsync=args.fsync,
+                qid_queries=args.qid_queries,
+            )
+        )
+        results.append(result)
+        log.info(
+            f"  {result['saves_per_sec']:>10.1f} saves/s  p50={result['save_p50_us']}us  "
+            f"p99={result['save_p99_us']}us  qid={result['qid_query_mean_us']}us  "
+            f"compact={result['final_compaction_ms']}ms  shard_entries={result['shard_entries']}"
+        )
+
+    success = True
+    baseline = _load_baseline()
+    journal = next((r for r in results if r["backend"] == "journal"), None)
+    if journal is not None and baseline.get("journal_saves_per_sec"):
+        floor = baseline["journal_saves_per_sec"] * (1.0 - args.threshold)
+        if journal["saves_per_sec"] < floor:
+            log.error(
+                f"journal saves/sec regressed: {journal['saves_per_sec']} < {floor:.1f} "
+                f"(baseline {baseline['journal_saves_per_sec']})"
+            )
+            success = False
+
+    if args.update_baseline and success and journal is not None:
+        BASELINE_FILE.write_text(
+            json.dumps({"journal_saves_per_sec": journal["saves_per_sec"]}, indent=2),
+            encoding="utf-8",
+        )
+        log.info(f"Baseline updated: {BASELINE_FILE}")
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    summary: Dict[str, Any] = {r["backend"]: f"{r['saves_per_sec']} saves/s" for r in results}
+    log.summary(summary, success=success)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
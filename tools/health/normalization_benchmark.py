@@ -0,0 +1,171 @@
+"""
+Frame Normalization Microbenchmark.
+
+Times the per-frame normalization hot path:
+
+- `semantics.roles.canonical_role` (memoized) against the uncached
+  resolution (`roles._resolve_role`) over a realistic label mix;
+- `semantics.normalization.normalize_gender` (memoized);
+- `semantics.normalization.normalize_bio_frame` on flat payloads (single-pass
+  fast path) against the generic `normalize_bio_semantics` route.
+
+Usage:
+    python tools/health/normalization_benchmark.py
+    python tools/health/normalization_benchmark.py --iterations 200000 --repeats 5
+    python tools/health/normalization_benchmark.py --min-speedup 1.2 --json-out normalization.json
+
+Output:
+    Console report (nanoseconds per call) and exit code 1 if the memoized /
+    fast path is slower than `--min-speedup` x the reference for roles or
+    bio frames.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# -----------------------------------------------------------------------------
+# Project root & imports
+# -----------------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from app.core.domain.semantics import normalization as N  # noqa: E402
+from app.core.domain.semantics import roles as R  # noqa: E402
+from app.core.domain.semantics.types import BioFrame, Entity  # noqa: E402
+
+# Optional GUI-friendly logger
+try:
+    from utils.tool_logger import ToolLogger  # type: ignore
+
+    log = ToolLogger("normalization_benchmark")
+except Exception:  # pragma: no cover
+    class _FallbackLogger:
+        def header(self, d: Dict[str, Any]) -> None:
+            print("=== FRAME NORMALIZATION BENCHMARK ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+
+        def stage(self, name: str, msg: str) -> None:
+            print(f"[{name}] {msg}")
+
+        def info(self, msg: str = "") -> None:
+            print(msg)
+
+        def warning(self, msg: str) -> None:
+            print(f"[WARN] {msg}")
+
+        def error(self, msg: str) -> None:
+            print(f"[ERROR] {msg}")
+
+        def summary(self, d: Dict[str, Any], success: bool = True) -> None:
+            print("\n=== SUMMARY ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+            print("STATUS:", "OK" if success else "FAIL")
+
+    log = _FallbackLogger()
+
+
+_LABELS = ["subject", "Subject", "SUBJ", "object", "agent", "time", " location ", "profession", "nationality"]
+_GENDERS = ["f", "female", "M", "male", "Q6581072", "nb", "unknown", " Female "]
+
+
+def _payloads(count: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"Person {i}",
+            "gender": rng.choice(_GENDERS),
+            "profession": rng.choice(["physicist", "poet", "mathematician"]),
+            "nationality": rng.choice(["Polish", "French", "British"]),
+            "id": f"Q{i}",
+            "frame_type": "bio",
+        }
+        for i in range(count)
+    ]
+
+
+def _generic_bio_frame(payload: Dict[str, Any]) -> BioFrame:
+    sem = N.normalize_bio_semantics(payload)
+    entity = Entity(name=sem.name, gender=sem.gender, lemmas=[sem.profession_lemma] if sem.profession_lemma else [], extra=sem.extra)
+    return BioFrame(
+        main_entity=entity,
+        frame_type="bio",
+        primary_profession_lemmas=[sem.profession_lemma] if sem.profession_lemma else [],
+        nationality_lemmas=[sem.nationality_lemma] if sem.nationality_lemma else [],
+        extra=sem.extra,
+    )
+
+
+def ns_per_call(fn: Callable[[Any], Any], inputs: Sequence[Any], *, repeats: int) -> float:
+    """Best-of-`repeats` nanoseconds per call over `inputs`."""
+    best = float("inf")
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        for item in inputs:
+            fn(item)
+        best = min(best, time.perf_counter() - started)
+    return best / max(1, len(inputs)) * 1e9
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time memoized role/gender normalization and the flat BioFrame fast path.")
+    parser.add_argument("--iterations", type=int, default=100000, help="Calls per role/gender measurement")
+    parser.add_argument("--frames", type=int, default=20000, help="Payloads per bio-frame measurement")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--min-speedup", type=float, default=1.0, help="Required reference/fast ratio for roles and bio frames")
+    parser.add_argument("--json-out", type=str, default=None)
+    args = parser.parse_args(argv)
+
+    log.header({"iterations": args.iterations, "frames": args.frames, "repeats": args.repeats})
+
+    labels = [_LABELS[i % len(_LABELS)] for i in range(args.iterations)]
+    genders = [_GENDERS[i % len(_GENDERS)] for i in range(args.iterations)]
+    payloads = _payloads(args.frames, seed=48)
+
+    results: Dict[str, Dict[str, float]] = {
+        "canonical_role": {
+            "reference_ns": ns_per_call(R._resolve_role, labels, repeats=args.repeats),
+            "fast_ns": ns_per_call(R.canonical_role, labels, repeats=args.repeats),
+        },
+        "normalize_gender": {
+            "fast_ns": ns_per_call(N.normalize_gender, genders, repeats=args.repeats),
+        },
+        "normalize_bio_frame": {
+            "reference_ns": ns_per_call(_generic_bio_frame, payloads, repeats=args.repeats),
+            "fast_ns": ns_per_call(lambda p: N.normalize_bio_frame(p, "bio"), payloads, repeats=args.repeats),
+        },
+    }
+
+    success = True
+    for name, row in results.items():
+        line = f"  {name:<20} fast {row['fast_ns']:>9.1f} ns/call"
+        if "reference_ns" in row:
+            row["speedup"] = row["reference_ns"] / max(row["fast_ns"], 1e-9)
+            line += f"   reference {row['reference_ns']:>9.1f} ns/call   x{row['speedup']:.2f}"
+            if row["speedup"] < args.min_speedup:
+                success = False
+                log.error(f"{name}: speedup x{row['speedup']:.2f} below --min-speedup {args.min_speedup}")
+        log.info(line)
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    log.summary(
+        {name: f"x{row['speedup']:.2f}" for name, row in results.items() if "speedup" in row},
+        success=success,
+    )
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
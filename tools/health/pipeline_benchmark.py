@@ -0,0 +1,758 @@
+"""
+Full-Pipeline Benchmark Suite.
+
+Times every planner-first runtime stage separately for a matrix of
+construction ids x languages x realizer backends:
+
+1. plan     -> FrameToPlanBridge.map_frame
+2. select   -> ConstructionSelector.select
+3. slots    -> FrameToSlotsBridge.build_slot_map
+4. resolve  -> LexicalResolver.resolve_slot_map
+5. realize  -> ConstructionRealizer.realize (one backend configured per cell)
+6. respond  -> map_generation_response + JSON body encoding, as /generate does
+
+Backends:
+    gf        GFConstructionAdapter (skipped when `pgf` / the PGF file is missing)
+    family    FamilyConstructionAdapter
+    safe_mode SafeModeConstructionAdapter
+    python    PythonGrammarEngine (pure-Python mock renderer)
+
+Each cell reports end-to-end ops/sec plus per-stage mean microseconds and
+peak allocated bytes per call (measured in a separate tracemalloc pass so the
+timing loop is not distorted by tracing overhead).
+
+`--debug-modes off|both` also runs each cell in lean mode (the
+`/generate?debug=false` path: no debug_info/backend_trace, fast JSON encoder)
+and reports per-request CPU time (process_time) saved against debug mode.
+
+Usage:
+    python tools/health/pipeline_benchmark.py
+    python tools/health/pipeline_benchmark.py --langs en fr --backends safe_mode family
+    python tools/health/pipeline_benchmark.py --constructions copula_equative_classification
+    python tools/health/pipeline_benchmark.py --baseline bench-base.json --update-baseline
+    python tools/health/pipeline_benchmark.py --baseline bench-base.json
+    python tools/health/pipeline_benchmark.py --json-out bench.json
+    python tools/health/pipeline_benchmark.py --debug-modes both --backends family
+
+Output:
+    Console report and exit code 1 if any cell errors (warmup or timed
+    iteration) or if no cell was measured at all. Cells whose backend is
+    unavailable, or whose realizer does not report "full" or "fallback_only"
+    support (`get_support_status`), are skipped.
+
+Baselines:
+    Absolute timings only mean something on the machine that recorded them,
+    so no baseline is committed and the regression gate is opt-in. Record one
+    with `--baseline PATH --update-baseline` (e.g. on the parent commit), then
+    rerun with `--baseline PATH` to fail on any cell that regresses by more
+    than `--threshold` (ops/sec drop or per-stage latency growth). A baseline
+    recorded on another host (node, machine, Python version) is not compared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# -----------------------------------------------------------------------------
+# Project root & imports
+# -----------------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Optional GUI-friendly logger
+try:
+    from utils.tool_logger import ToolLogger  # type: ignore
+
+    log = ToolLogger("pipeline_benchmark")
+except Exception:  # pragma: no cover
+    class _FallbackLogger:
+        def header(self, d: Dict[str, Any]) -> None:
+            print("=== PIPELINE BENCHMARK ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+
+        def stage(self, name: str, msg: str) -> None:
+            print(f"[{name}] {msg}")
+
+        def info(self, msg: str = "") -> None:
+            print(msg)
+
+        def warning(self, msg: str) -> None:
+            print(f"[WARN] {msg}")
+
+        def error(self, msg: str) -> None:
+            print(f"[ERROR] {msg}")
+
+        def summary(self, d: Dict[str, Any], success: bool = True) -> None:
+            print("\n=== SUMMARY ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+            print("STATUS:", "OK" if success else "FAIL")
+
+    log = _FallbackLogger()
+
+try:
+    import structlog
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from app.adapters.api.contracts.generation_response_mapper import map_generation_response
+    from app.adapters.api.responses import FastJSONResponse
+    from app.adapters.engines.construction_realizer import ConstructionRealizer
+    from app.core.bridges.construction_selector import ConstructionSelector
+    from app.core.bridges.frame_to_plan import FrameToPlanBridge
+    from app.core.bridges.frame_to_slots import FrameToSlotsBridge
+    from app.core.domain.planning.construction_plan import ConstructionPlan
+    from app.shared.debug_payloads import debug_payloads
+except Exception as e:
+    print(f"[FATAL] Import failed: {e}", file=sys.stderr)
+    traceback.print_exc()
+    sys.exit(1)
+
+
+STAGES: Tuple[str, ...] = ("plan", "select", "slots", "resolve", "realize", "respond")
+BACKENDS: Tuple[str, ...] = ("gf", "family", "safe_mode", "python")
+# Support statuses a single-backend cell can actually be timed under.
+_MEASURED_SUPPORT: Tuple[str, ...] = ("full", "fallback_only")
+
+# Small, stable fixtures: one frame per benchmarked construction.
+FRAME_FIXTURES: Dict[str, Dict[str, Any]] = {
+    "copula_equative_classification": {
+        "frame_type": "bio",
+        "subject": {"name": "Marie Curie", "qid": "Q7186", "gender": "female"},
+        "profession": "physicist",
+        "nationality": "polish",
+    },
+    "copula_locative": {
+        "frame_type": "relational.spatial_relation",
+        "subject": {"name": "Eiffel Tower", "qid": "Q243"},
+        "location": {"name": "Paris", "qid": "Q90"},
+    },
+    "intransitive_event": {
+        "frame_type": "event",
+        "event_type": "birth",
+        "subject": {"name": "Marie Curie", "qid": "Q7186"},
+        "time": {"year": 1867},
+    },
+    "transitive_event": {
+        "frame_type": "event",
+        "event_type": "discovery",
+        "agent": {"name": "Marie Curie", "qid": "Q7186"},
+        "patient": {"name": "polonium", "qid": "Q979"},
+        "predicate": "discover",
+    },
+}
+
+DEFAULT_LANGS: Tuple[str, ...] = ("en", "fr")
+
+
+def _cell_key(construction_id: str, lang: str, backend: str, debug: bool = True) -> str:
+    key = f"{construction_id}:{(lang or '').strip().lower()}:{backend}"
+    return key if debug else f"{key}:lean"
+
+
+def _quiet_runtime_logs() -> None:
+    """Drop info-level runtime logs so they do not dominate the timing loop."""
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING),
+    )
+
+
+# -----------------------------------------------------------------------------
+# Backend factories
+# -----------------------------------------------------------------------------
+
+
+def _build_gf_realizer() -> Any:
+    try:
+        import pgf  # type: ignore  # noqa: F401
+    except Exception:
+        raise RuntimeError("python module 'pgf' is not installed")
+
+    from app.adapters.engines.gf_construction_adapter import GFConstructionAdapter
+    from app.adapters.engines.gf_wrapper import GFGrammarEngine
+
+    engine = GFGrammarEngine()
+    if not engine.grammar:
+        err = getattr(engine, "last_load_error", None) or "unknown error"
+        raise RuntimeError(f"GF grammar not loaded: {err}")
+    return ConstructionRealizer(gf_realizer=GFConstructionAdapter(engine=engine))
+
+
+def _build_family_realizer() -> Any:
+    from app.adapters.engines.family_construction_adapter import (
+        FamilyConstructionAdapter,
+    )
+
+    return ConstructionRealizer(family_realizer=FamilyConstructionAdapter())
+
+
+def _build_safe_mode_realizer() -> Any:
+    from app.adapters.engines.safe_mode_construction_adapter import (
+        SafeModeConstructionAdapter,
+    )
+
+    return ConstructionRealizer(safe_mode_realizer=SafeModeConstructionAdapter())
+
+
+def _build_python_realizer() -> Any:
+    from app.adapters.engines.python_engine_wrapper import PythonGrammarEngine
+
+    # PythonGrammarEngine identifies itself as a safe_mode-class backend.
+    return ConstructionRealizer(safe_mode_realizer=PythonGrammarEngine())
+
+
+BACKEND_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "gf": _build_gf_realizer,
+    "family": _build_family_realizer,
+    "safe_mode": _build_safe_mode_realizer,
+    "python": _build_python_realizer,
+}
+
+
+def _build_lexical_resolver() -> Tuple[Optional[Any], Optional[str]]:
+    try:
+        from app.adapters.persistence.lexicon.lexical_resolution import LexicalResolver
+    except Exception as e:
+        return None, f"LexicalResolver unavailable: {e}"
+    return LexicalResolver(), None
+
+
+# -----------------------------------------------------------------------------
+# Benchmark core
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class CellResult:
+    construction_id: str
+    lang: str
+    backend: str
+    debug: bool = True
+    status: str = "ok"  # ok | skipped | error
+    reason: Optional[str] = None
+    iterations: int = 0
+    ops_per_sec: float = 0.0
+    cpu_us: float = 0.0
+    stages: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    errors: int = 0
+    sample: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "construction_id": self.construction_id,
+            "lang": self.lang,
+            "backend": self.backend,
+            "debug": self.debug,
+            "status": self.status,
+            "iterations": self.iterations,
+            "ops_per_sec": self.ops_per_sec,
+            "cpu_us": self.cpu_us,
+            "stages": self.stages,
+            "errors": self.errors,
+        }
+        if self.reason:
+            out["reason"] = self.reason
+        if self.sample is not None:
+            out["sample"] = self.sample
+        return out
+
+
+class PipelineBenchmark:
+    def __init__(self, *, verbose: bool = False) -> None:
+        self.verbose = verbose
+        self.plan_bridge = FrameToPlanBridge()
+        self.selector = ConstructionSelector()
+        self.slots_bridge = FrameToSlotsBridge()
+        self.resolver, self.resolver_error = _build_lexical_resolver()
+        self._loop = asyncio.new_event_loop()
+        self._realizers: Dict[str, Any] = {}
+        self._backend_errors: Dict[str, str] = {}
+
+    def close(self) -> None:
+        self._loop.close()
+
+    def realizer_for(self, backend: str) -> Tuple[Optional[Any], Optional[str]]:
+        if backend in self._realizers:
+            return self._realizers[backend], None
+        if backend in self._backend_errors:
+            return None, self._backend_errors[backend]
+
+        try:
+            realizer = BACKEND_FACTORIES[backend]()
+        except Exception as e:
+            self._backend_errors[backend] = str(e)
+            return None, str(e)
+
+        self._realizers[backend] = realizer
+        return realizer, None
+
+    def _stage_calls(
+        self,
+        construction_id: str,
+        lang: str,
+        realizer: Any,
+        *,
+        debug: bool = True,
+    ) -> List[Tuple[str, Callable[[Any], Any]]]:
+        """
+        Build the ordered stage callables. Each receives the previous stage's
+        output via a shared state dict so the chain mirrors the runtime.
+        """
+        frame = FRAME_FIXTURES[construction_id]
+        run = self._loop.run_until_complete
+
+        def _plan(state: Dict[str, Any]) -> Any:
+            state["planned"] = self.plan_bridge.map_frame(frame, lang_code=lang)
+
+        def _select(state: Dict[str, Any]) -> Any:
+            state["selection"] = self.selector.select(frame, lang_code=lang)
+
+        def _slots(state: Dict[str, Any]) -> Any:
+            slot_map = self.slots_bridge.build_slot_map(
+                frame, construction_id=construction_id
+            )
+            state["plan"] = ConstructionPlan(
+                construction_id=construction_id,
+                lang_code=lang,
+                slot_map=slot_map,
+            )
+
+        def _resolve(state: Dict[str, Any]) -> Any:
+            # Same contract as RealizeText._apply_lexical_resolution: the
+            # resolver returns a slot map carrying `lexical_bindings`, which
+            # belongs at plan level, not inside the slot map.
+            plan = state["plan"]
+            resolved = dict(
+                run(
+                    self.resolver.resolve_slot_map(  # type: ignore[union-attr]
+                        plan.slot_map, lang_code=lang, construction_id=construction_id
+                    )
+                )
+            )
+            bindings = resolved.pop("lexical_bindings", None) or {}
+            state["plan"] = plan.with_slot_map(resolved).with_lexical_bindings(bindings)
+
+        def _realize(state: Dict[str, Any]) -> Any:
+            state["result"] = run(realizer.realize(state["plan"]))
+
+        def _respond(state: Dict[str, Any]) -> Any:
+            payload = map_generation_response(state["result"], include_debug=debug)
+            if debug:
+                # Debug responses go through FastAPI's encoder and stdlib json.
+                state["body"] = JSONResponse(jsonable_encoder(payload)).body
+            else:
+                state["body"] = FastJSONResponse(payload).body
+
+        calls: List[Tuple[str, Callable[[Any], Any]]] = [
+            ("plan", _plan),
+            ("select", _select),
+            ("slots", _slots),
+        ]
+        if self.resolver is not None:
+            calls.append(("resolve", _resolve))
+        calls.append(("realize", _realize))
+        calls.append(("respond", _respond))
+        return calls
+
+    def run_cell(
+        self,
+        construction_id: str,
+        lang: str,
+        backend: str,
+        *,
+        iterations: int,
+        alloc_iterations: int,
+        debug: bool = True,
+    ) -> CellResult:
+        # The event loop runs realize() in tasks that copy the current context,
+        # so the flag set here reaches every component.
+        with debug_payloads(debug):
+            return self._run_cell(
+                construction_id,
+                lang,
+                backend,
+                iterations=iterations,
+                alloc_iterations=alloc_iterations,
+                debug=debug,
+            )
+
+    def _run_cell(
+        self,
+        construction_id: str,
+        lang: str,
+        backend: str,
+        *,
+        iterations: int,
+        alloc_iterations: int,
+        debug: bool,
+    ) -> CellResult:
+        cell = CellResult(construction_id=construction_id, lang=lang, backend=backend, debug=debug)
+
+        realizer, err = self.realizer_for(backend)
+        if realizer is None:
+            cell.status = "skipped"
+            cell.reason = f"backend unavailable: {err}"
+            return cell
+
+        # Capability is decided up front by the realizer itself; any exception
+        # after this point is a real failure of the measured pipeline.
+        # "partial" means the language is known but this construction is not
+        # rendered natively, so only "full" and "fallback_only" are measured.
+        support = realizer.get_support_status(construction_id, lang)
+        if support not in _MEASURED_SUPPORT:
+            cell.status = "skipped"
+            cell.reason = f"unsupported: realizer support status is {support!r}"
+            return cell
+
+        calls = self._stage_calls(construction_id, lang, realizer, debug=debug)
+
+        warmup_n = min(10, max(1, iterations))
+        try:
+            for _ in range(warmup_n):
+                state: Dict[str, Any] = {}
+                for _name, fn in calls:
+                    fn(state)
+        except Exception as e:
+            cell.status = "error"
+            cell.reason = f"warmup failed: {type(e).__name__}: {e}"
+            if self.verbose:
+                traceback.print_exc()
+            return cell
+
+        cell.sample = str(getattr(state.get("result"), "text", "") or "")
+        cell.iterations = iterations
+
+        totals = {name: 0.0 for name, _ in calls}
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            state = {}
+            try:
+                for name, fn in calls:
+                    t0 = time.perf_counter()
+                    fn(state)
+                    totals[name] += time.perf_counter() - t0
+            except Exception:
+                cell.errors += 1
+        total_s = max(1e-12, time.perf_counter() - start)
+        cpu_s = time.process_time() - cpu_start
+
+        alloc_peaks = {name: 0 for name, _ in calls}
+        if alloc_iterations > 0:
+            tracemalloc.start()
+            try:
+                for _ in range(alloc_iterations):
+                    state = {}
+                    for name, fn in calls:
+                        base, _peak = tracemalloc.get_traced_memory()
+                        tracemalloc.reset_peak()
+                        fn(state)
+                        _cur, peak = tracemalloc.get_traced_memory()
+                        alloc_peaks[name] += max(0, peak - base)
+            except Exception:
+                pass
+            finally:
+                tracemalloc.stop()
+
+        successes = max(0, iterations - cell.errors)
+        cell.ops_per_sec = round(successes / total_s, 2) if iterations else 0.0
+        cell.cpu_us = round((cpu_s / max(1, iterations)) * 1e6, 3)
+        for name, _ in calls:
+            cell.stages[name] = {
+                "mean_us": round((totals[name] / max(1, iterations)) * 1e6, 3),
+                "alloc_peak_bytes": (
+                    round(alloc_peaks[name] / alloc_iterations)
+                    if alloc_iterations
+                    else 0
+                ),
+            }
+
+        if cell.errors:
+            cell.status = "error"
+            cell.reason = f"{cell.errors}/{iterations} iterations failed"
+
+        return cell
+
+
+# -----------------------------------------------------------------------------
+# Baselines
+# -----------------------------------------------------------------------------
+
+
+def compare_cell(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = 0.15,
+) -> List[str]:
+    warnings: List[str] = []
+
+    def _num(d: Dict[str, Any], k: str) -> float:
+        try:
+            return float(d.get(k, 0) or 0)
+        except Exception:
+            return 0.0
+
+    base_ops = _num(baseline, "ops_per_sec")
+    curr_ops = _num(current, "ops_per_sec")
+    if base_ops > 0:
+        delta = (base_ops - curr_ops) / base_ops
+        if delta > threshold:
+            warnings.append(f"throughput_degraded: {curr_ops} ops/s vs {base_ops} ops/s (-{delta:.1%})")
+
+    base_stages = baseline.get("stages") or {}
+    curr_stages = current.get("stages") or {}
+    for stage in STAGES:
+        b = base_stages.get(stage)
+        c = curr_stages.get(stage)
+        if not isinstance(b, dict) or not isinstance(c, dict):
+            continue
+        base_us = _num(b, "mean_us")
+        curr_us = _num(c, "mean_us")
+        if base_us > 0:
+            delta = (curr_us - base_us) / base_us
+            if delta > threshold:
+                warnings.append(f"{stage}_latency_degraded: {curr_us}us vs {base_us}us (+{delta:.1%})")
+
+    return warnings
+
+
+def host_fingerprint() -> Dict[str, str]:
+    """What a timing baseline is only valid for."""
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+    }
+
+
+def _load_baselines(path: Path) -> Dict[str, Any]:
+    """Return {"host": {...}, "cells": {...}}; empty when missing or unreadable."""
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or not isinstance(data.get("cells"), dict):
+        return {}
+    return data
+
+
+def _save_baselines(path: Path, data: Dict[str, Any]) -> None:
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _format_cell(cell: CellResult) -> str:
+    key = _cell_key(cell.construction_id, cell.lang, cell.backend, cell.debug)
+    if cell.status == "skipped":
+        return f"{key:<52} SKIP  {cell.reason}"
+    stage_txt = " ".join(
+        f"{name}={vals['mean_us']:.1f}us/{vals['alloc_peak_bytes']}B"
+        for name, vals in cell.stages.items()
+    )
+    return f"{key:<57} {cell.ops_per_sec:>10.1f} ops/s  cpu={cell.cpu_us:.1f}us  {stage_txt}"
+
+
+def _report_debug_savings(cells: List[CellResult]) -> None:
+    """Per-request CPU saved by lean (debug=false) mode, for cells run both ways."""
+    by_key = {(c.construction_id, c.lang, c.backend, c.debug): c for c in cells if c.status == "ok"}
+    lines: List[str] = []
+    for (cid, lang, backend, debug), full in by_key.items():
+        lean = by_key.get((cid, lang, backend, False))
+        if not debug or lean is None or full.cpu_us <= 0:
+            continue
+        saved = full.cpu_us - lean.cpu_us
+        lines.append(
+            f"{_cell_key(cid, lang, backend):<52} debug={full.cpu_us:.1f}us lean={lean.cpu_us:.1f}us "
+            f"saved={saved:.1f}us ({saved / full.cpu_us:.1%})"
+        )
+    if lines:
+        log.info("")
+        log.info("CPU per request, debug=true vs debug=false:")
+        for line in lines:
+            log.info(line)
+
+
+def build_matrix(
+    constructions: List[str],
+    langs: List[str],
+    backends: List[str],
+    debug_modes: str = "on",
+) -> List[Tuple[str, str, str, bool]]:
+    """(construction_id, lang, backend, debug) for every cell, in report order."""
+    modes = {"on": (True,), "off": (False,), "both": (True, False)}[debug_modes]
+    return [
+        (cid, lang, backend, debug)
+        for cid in constructions
+        for lang in langs
+        for backend in backends
+        for debug in modes
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full-pipeline benchmark suite")
+    parser.add_argument(
+        "--constructions",
+        nargs="+",
+        default=list(FRAME_FIXTURES.keys()),
+        choices=list(FRAME_FIXTURES.keys()),
+        help="Construction ids to benchmark",
+    )
+    parser.add_argument("--langs", nargs="+", default=list(DEFAULT_LANGS), help="Language codes")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS), help="Realizer backends")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed iterations per cell")
+    parser.add_argument("--alloc-iterations", type=int, default=20, help="tracemalloc iterations per cell (0 disables)")
+    parser.add_argument("--baseline", default=None, help="Baseline JSON to compare against (opt-in regression gate)")
+    parser.add_argument("--update-baseline", action="store_true", help="Record the benchmarked cells into --baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Regression threshold (0.15 = 15%%)")
+    parser.add_argument("--json-out", default=None, help="Optional path to write the raw results as JSON")
+    parser.add_argument(
+        "--debug-modes",
+        default="on",
+        choices=("on", "off", "both"),
+        help="Run cells with debug payloads on, off (lean /generate?debug=false path), or both",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
+
+    args = parser.parse_args()
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline needs --baseline PATH")
+
+    trace_id = os.environ.get("TOOL_TRACE_ID", "N/A")
+    log.header(
+        {
+            "Trace ID": trace_id,
+            "Constructions": ", ".join(args.constructions),
+            "Langs": ", ".join(args.langs),
+            "Backends": ", ".join(args.backends),
+            "Iterations": args.iterations,
+            "Debug modes": args.debug_modes,
+            "CWD": os.getcwd(),
+        }
+    )
+
+    if not args.verbose:
+        _quiet_runtime_logs()
+
+    bench = PipelineBenchmark(verbose=args.verbose)
+    if bench.resolver_error:
+        log.warning(f"Stage 'resolve' skipped: {bench.resolver_error}")
+
+    cells: List[CellResult] = []
+    try:
+        for cid, lang, backend, debug in build_matrix(
+            args.constructions, args.langs, args.backends, args.debug_modes
+        ):
+            cell = bench.run_cell(
+                cid,
+                lang,
+                backend,
+                iterations=args.iterations,
+                alloc_iterations=args.alloc_iterations,
+                debug=debug,
+            )
+            cells.append(cell)
+            log.info(_format_cell(cell))
+    except Exception as e:
+        log.error(f"CRITICAL: Benchmark failed: {e}")
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        bench.close()
+
+    _report_debug_savings(cells)
+
+    results = {_cell_key(c.construction_id, c.lang, c.backend, c.debug): c.to_dict() for c in cells}
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    ran = [c for c in cells if c.status != "skipped"]
+    skipped = len(cells) - len(ran)
+    errored = [c for c in ran if c.status == "error"]
+
+    # Fail fast if any iteration failed: a cell is not valid if it produced errors.
+    if errored:
+        for c in errored:
+            log.error(f"{_cell_key(c.construction_id, c.lang, c.backend, c.debug)}: {c.reason}")
+        log.summary({"Cells": len(cells), "Skipped": skipped, "Errored": len(errored)}, success=False)
+        sys.exit(1)
+
+    if not ran:
+        log.error("No cell was measured: every cell was skipped.")
+        log.summary({"Cells": len(cells), "Skipped": skipped, "Measured": 0}, success=False)
+        sys.exit(1)
+
+    if not args.baseline:
+        log.summary({"Cells": len(cells), "Skipped": skipped, "Measured": len(ran)}, success=True)
+        sys.exit(0)
+
+    baseline_path = Path(args.baseline)
+    stored = _load_baselines(baseline_path)
+    host = host_fingerprint()
+
+    if args.update_baseline:
+        # Keep cells from earlier runs only if they were timed on this host.
+        cells_out = dict(stored.get("cells") or {}) if stored.get("host") == host else {}
+        for c in ran:
+            cells_out[_cell_key(c.construction_id, c.lang, c.backend, c.debug)] = c.to_dict()
+        _save_baselines(baseline_path, {"host": host, "cells": cells_out})
+        log.summary({"Baseline": str(baseline_path), "Cells": len(ran), "Status": "UPDATED"}, success=True)
+        sys.exit(0)
+
+    if stored and stored.get("host") != host:
+        log.warning(
+            f"Baseline {baseline_path} was recorded on {stored.get('host')}, not {host}; "
+            "timings are not comparable, regression check skipped."
+        )
+        log.summary({"Cells": len(cells), "Skipped": skipped, "Measured": len(ran)}, success=True)
+        sys.exit(0)
+
+    baselines = stored.get("cells") or {}
+    regressions: Dict[str, List[str]] = {}
+    missing = 0
+    for c in ran:
+        key = _cell_key(c.construction_id, c.lang, c.backend, c.debug)
+        base = baselines.get(key)
+        if not isinstance(base, dict):
+            missing += 1
+            continue
+        warnings = compare_cell(c.to_dict(), base, args.threshold)
+        if warnings:
+            regressions[key] = warnings
+
+    if regressions:
+        log.warning(f"PERFORMANCE REGRESSION (threshold={args.threshold:.0%})")
+        for key, warnings in regressions.items():
+            for w in warnings:
+                log.warning(f" - {key}: {w}")
+        log.summary({"Cells": len(cells), "Skipped": skipped, "Regressed": len(regressions)}, success=False)
+        sys.exit(1)
+
+    if missing:
+        log.warning(f"{missing} cell(s) have no baseline. Run with --update-baseline to record them.")
+
+    log.summary(
+        {"Cells": len(cells), "Skipped": skipped, "Regressed": 0, "Missing baseline": missing},
+        success=True,
+    )
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
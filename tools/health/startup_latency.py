@@ -0,0 +1,195 @@
+"""
+Startup Latency Report.
+
+Measures, for each API / CLI entry point, the cost of importing it in a fresh
+interpreter:
+
+    import_ms   cumulative `python -X importtime` time for the entry point
+    wall_ms     whole subprocess (interpreter startup + import + exit)
+    modules     number of modules the import pulled in
+
+and lists the heaviest modules (by cumulative time) of the fastest run, which
+is usually enough to find the adapter that slipped back into an eager import.
+
+Usage:
+    python tools/health/startup_latency.py
+    python tools/health/startup_latency.py --entry-points nlg.api app.core.domain --runs 10
+    python tools/health/startup_latency.py --top 25 --json-out startup.json
+
+Output:
+    Console report and exit code 1 if an entry point exceeds its budget
+    (see BUDGETS_MS; scale with --budget-scale).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# -----------------------------------------------------------------------------
+# Project root & imports
+# -----------------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Optional GUI-friendly logger
+try:
+    from utils.tool_logger import ToolLogger  # type: ignore
+
+    log = ToolLogger("startup_latency")
+except Exception:  # pragma: no cover
+    class _FallbackLogger:
+        def header(self, d: Dict[str, Any]) -> None:
+            print("=== STARTUP LATENCY REPORT ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+
+        def stage(self, name: str, msg: str) -> None:
+            print(f"[{name}] {msg}")
+
+        def info(self, msg: str = "") -> None:
+            print(msg)
+
+        def warning(self, msg: str) -> None:
+            print(f"[WARN] {msg}")
+
+        def error(self, msg: str) -> None:
+            print(f"[ERROR] {msg}")
+
+        def summary(self, d: Dict[str, Any], success: bool = True) -> None:
+            print("\n=== SUMMARY ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+            print("STATUS:", "OK" if success else "FAIL")
+
+    log = _FallbackLogger()
+
+
+# Same entry points and budgets as tests/test_import_budget.py.
+BUDGETS_MS: Dict[str, float] = {
+    "app.core.domain": 150.0,
+    "nlg.api": 750.0,
+    "app.shared.container": 1500.0,
+    "app.adapters.api.main": 2500.0,
+}
+_MARK = "--startup-latency-start--"
+
+
+def _parse_importtime(stderr: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """Return (total ms, [(module, cumulative ms)]) for imports after the marker."""
+    _, _, tail = stderr.partition(_MARK)
+    total_us = 0
+    modules: List[Tuple[str, float]] = []
+    for line in tail.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue
+        modules.append((name.strip(), int(cumulative) / 1000.0))
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000.0, modules
+
+
+def measure(entry_point: str) -> Dict[str, Any]:
+    code = f"import sys; sys.stderr.write({_MARK!r} + '\\n'); import {entry_point}"
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(PROJECT_ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(PROJECT_ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000.0
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+
+    import_ms, modules = _parse_importtime(proc.stderr)
+    return {"import_ms": import_ms, "wall_ms": wall_ms, "modules": modules}
+
+
+def run_entry_point(entry_point: str, *, runs: int, top: int) -> Dict[str, Any]:
+    samples = [measure(entry_point) for _ in range(max(1, runs))]
+    fastest = min(samples, key=lambda s: s["import_ms"])
+    heaviest = sorted(fastest["modules"], key=lambda m: m[1], reverse=True)[:top]
+    return {
+        "entry_point": entry_point,
+        "runs": len(samples),
+        "import_ms_min": round(fastest["import_ms"], 1),
+        "import_ms_median": round(statistics.median(s["import_ms"] for s in samples), 1),
+        "wall_ms_median": round(statistics.median(s["wall_ms"] for s in samples), 1),
+        "modules": len(fastest["modules"]),
+        "heaviest": [{"module": name, "cumulative_ms": round(ms, 1)} for name, ms in heaviest],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report import/startup latency of the API and CLI entry points.")
+    parser.add_argument("--entry-points", nargs="+", default=list(BUDGETS_MS))
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per entry point")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest modules to list per entry point")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply every budget (slow machines)")
+    parser.add_argument("--json-out", type=str, default=None)
+    args = parser.parse_args(argv)
+
+    log.header(
+        {
+            "entry_points": ", ".join(args.entry_points),
+            "runs": args.runs,
+            "python": sys.version.split()[0],
+        }
+    )
+
+    success = True
+    results: List[Dict[str, Any]] = []
+    for entry_point in args.entry_points:
+        log.stage(entry_point, f"{args.runs} cold imports ...")
+        try:
+            result = run_entry_point(entry_point, runs=args.runs, top=args.top)
+        except Exception as e:
+            log.error(f"{entry_point}: {e}")
+            success = False
+            continue
+        results.append(result)
+
+        budget = BUDGETS_MS.get(entry_point)
+        line = (
+            f"  import min={result['import_ms_min']}ms median={result['import_ms_median']}ms  "
+            f"wall median={result['wall_ms_median']}ms  modules={result['modules']}"
+        )
+        if budget is not None:
+            limit = budget * args.budget_scale
+            result["budget_ms"] = limit
+            line += f"  budget={limit:.0f}ms"
+            if result["import_ms_min"] > limit:
+                success = False
+                log.error(f"{entry_point} over budget: {result['import_ms_min']}ms > {limit:.0f}ms")
+        log.info(line)
+        for item in result["heaviest"]:
+            log.info(f"    {item['cumulative_ms']:>8.1f}ms  {item['module']}")
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    summary: Dict[str, Any] = {r["entry_point"]: f"{r['import_ms_min']} ms" for r in results}
+    log.summary(summary, success=success)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
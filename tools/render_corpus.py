@@ -0,0 +1,647 @@
+"""
+Offline Corpus Renderer.
+
+Streams AW / Ninai frames from an NDJSON (optionally .gz) file through the
+same frame parsing, planning and realization as `POST /generate/{lang}`, for
+a list of languages, across a process pool, and writes sharded NDJSON:
+
+    <out>/<lang>/part-00000.ndjson     records [0, shard_size)
+    <out>/<lang>/part-00001.ndjson     records [shard_size, 2*shard_size)
+    <out>/_checkpoint.json             resume state
+
+Input lines are either a bare frame payload or a wrapper
+`{"id": "...", "frame": {...}}`. Each output line is
+
+    {"seq": 12, "id": "Q7186", "lang": "fr", "text": "..."}      or
+    {"seq": 12, "id": "Q7186", "lang": "fr", "error": "..."}
+
+Guarantees:
+- Deterministic ordering: records are grouped into numbered batches and
+  written strictly in batch order, so every shard lists records in input
+  order regardless of which worker finished first.
+- Bounded memory: at most `--max-inflight` batches are submitted or waiting
+  to be written at any time.
+- Checkpoint / resume: every `--checkpoint-every` batches the shard files are
+  flushed and the next input sequence number plus the byte offset of each
+  open shard are stored atomically. Re-running with the same arguments
+  truncates anything written after the last checkpoint and continues.
+  Use `--fresh` to discard an existing checkpoint.
+
+Frames are parsed with `parse_generation_payload`, the HTTP request mapper:
+Ninai payloads (with a "function" key) go through `NinaiAdapter.parse`,
+bio/person payloads are normalised into `BioFrame`, anything else becomes a
+domain `Frame`. Rendering uses the container's `GenerateText` use case.
+
+Usage:
+    python tools/render_corpus.py --input frames.ndjson.gz --out out/ --langs en fr de
+    python tools/render_corpus.py --input frames.ndjson --out out/ --langs en --workers 8 --batch-size 128
+    python tools/render_corpus.py --input frames.ndjson --out out/ --langs en --workers 0   # inline, no pool
+
+Output:
+    Per-stage throughput (read / parse / generate / write) and exit code 1 if
+    the run aborted (worker crash, interrupted) or `--max-error-rate` was
+    exceeded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# -----------------------------------------------------------------------------
+# Project root & imports
+# -----------------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Optional GUI-friendly logger
+try:
+    from utils.tool_logger import ToolLogger  # type: ignore
+
+    log = ToolLogger("render_corpus")
+except Exception:  # pragma: no cover
+    class _FallbackLogger:
+        def header(self, d: Dict[str, Any]) -> None:
+            print("=== RENDER CORPUS ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+
+        def stage(self, name: str, msg: str) -> None:
+            print(f"[{name}] {msg}")
+
+        def info(self, msg: str = "") -> None:
+            print(msg)
+
+        def warning(self, msg: str) -> None:
+            print(f"[WARN] {msg}")
+
+        def error(self, msg: str) -> None:
+            print(f"[ERROR] {msg}")
+
+        def summary(self, d: Dict[str, Any], success: bool = True) -> None:
+            print("\n=== SUMMARY ===")
+            for k, v in d.items():
+                print(f"{k}: {v}")
+            print("STATUS:", "OK" if success else "FAIL")
+
+    log = _FallbackLogger()
+
+try:
+    import structlog
+
+    from app.adapters.api.contracts.generation_request_mapper import (
+        normalize_lang_code,
+        parse_generation_payload,
+        strip_lang_fields,
+    )
+except Exception as e:
+    print(f"[FATAL] Import failed: {e}", file=sys.stderr)
+    traceback.print_exc()
+    sys.exit(1)
+
+
+CHECKPOINT_FILENAME = "_checkpoint.json"
+CHECKPOINT_VERSION = 1
+STAGES: Tuple[str, ...] = ("read", "parse", "generate", "write")
+
+
+# -----------------------------------------------------------------------------
+# Counters
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class StageCounters:
+    """Items processed and seconds spent per pipeline stage."""
+
+    items: Dict[str, int] = field(default_factory=lambda: {s: 0 for s in STAGES})
+    seconds: Dict[str, float] = field(default_factory=lambda: {s: 0.0 for s in STAGES})
+
+    def add(self, stage: str, items: int, seconds: float) -> None:
+        self.items[stage] = self.items.get(stage, 0) + items
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    def merge(self, other: Dict[str, Tuple[int, float]]) -> None:
+        for stage, (items, seconds) in other.items():
+            self.add(stage, items, seconds)
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {}
+        for stage in STAGES:
+            items = self.items.get(stage, 0)
+            secs = self.seconds.get(stage, 0.0)
+            out[stage] = {
+                "items": items,
+                "seconds": round(secs, 3),
+                "per_sec": round(items / secs, 1) if secs > 0 else 0.0,
+            }
+        return out
+
+
+# -----------------------------------------------------------------------------
+# Worker side
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class BatchResult:
+    batch_id: int
+    last_seq: int
+    # lang -> (seq, output line), in seq order
+    lines: Dict[str, List[Tuple[int, str]]]
+    errors: int
+    counters: Dict[str, Tuple[int, float]]
+
+
+def _default_use_case_factory() -> Any:
+    from app.shared.container import container
+
+    return container.generate_text_use_case()
+
+
+def _quiet_runtime_logs() -> None:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+def _unwrap_record(record: Any) -> Tuple[Optional[str], Dict[str, Any]]:
+    if not isinstance(record, dict):
+        raise ValueError("record must be a JSON object")
+    frame = record.get("frame")
+    if isinstance(frame, dict):
+        rid = record.get("id")
+        return (str(rid) if rid is not None else None), frame
+
+    rid = record.get("id") or record.get("qid")
+    if rid is None and isinstance(record.get("subject"), dict):
+        rid = record["subject"].get("qid")
+    return (str(rid) if rid is not None else None), record
+
+
+def _dump(obj: Dict[str, Any]) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+class CorpusRenderer:
+    """
+    Renders batches of raw NDJSON lines. One instance per worker process.
+    """
+
+    def __init__(self, use_case_factory: Callable[[], Any] = _default_use_case_factory) -> None:
+        self.use_case = use_case_factory()
+        self._loop = asyncio.new_event_loop()
+
+    def close(self) -> None:
+        self._loop.close()
+
+    async def _generate_all(self, jobs: List[Tuple[str, Any]]) -> List[Any]:
+        return await asyncio.gather(
+            *(self.use_case.execute(lang, frame) for lang, frame in jobs),
+            return_exceptions=True,
+        )
+
+    def render(self, batch_id: int, items: List[Tuple[int, str]], langs: List[str]) -> BatchResult:
+        counters: Dict[str, Tuple[int, float]] = {}
+        slots: Dict[str, List[Optional[Dict[str, Any]]]] = {lang: [None] * len(items) for lang in langs}
+        jobs: List[Tuple[str, int, Dict[str, Any], Any]] = []
+        errors = 0
+
+        started = time.perf_counter()
+        for pos, (seq, line) in enumerate(items):
+            rid: Optional[str] = None
+            try:
+                rid, payload = _unwrap_record(json.loads(line))
+                payload = strip_lang_fields(payload)
+            except Exception as e:
+                for lang in langs:
+                    slots[lang][pos] = {"seq": seq, "id": rid, "lang": lang, "error": f"bad record: {e}"}
+                errors += len(langs)
+                continue
+
+            for lang in langs:
+                base = {"seq": seq, "id": rid, "lang": lang}
+                try:
+                    # Parsed per language: GenerateText may annotate the frame in place.
+                    frame = parse_generation_payload(payload, lang)
+                except Exception as e:
+                    slots[lang][pos] = {**base, "error": str(e)}
+                    errors += 1
+                    continue
+                jobs.append((lang, pos, base, frame))
+        counters["parse"] = (len(items) * len(langs), time.perf_counter() - started)
+
+        started = time.perf_counter()
+        results = self._loop.run_until_complete(
+            self._generate_all([(lang, frame) for lang, _, _, frame in jobs])
+        )
+        for (lang, pos, base, _), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                slots[lang][pos] = {**base, "error": str(result) or type(result).__name__}
+                errors += 1
+            else:
+                slots[lang][pos] = {**base, "text": str(getattr(result, "text", "") or "")}
+        counters["generate"] = (len(jobs), time.perf_counter() - started)
+
+        lines = {
+            lang: [(rec["seq"], _dump(rec)) for rec in recs if rec is not None] for lang, recs in slots.items()
+        }
+        return BatchResult(
+            batch_id=batch_id,
+            last_seq=items[-1][0],
+            lines=lines,
+            errors=errors,
+            counters=counters,
+        )
+
+
+_WORKER: Optional[CorpusRenderer] = None
+
+
+def _init_worker(verbose: bool, use_case_factory: Callable[[], Any] = _default_use_case_factory) -> None:
+    global _WORKER
+    if not verbose:
+        _quiet_runtime_logs()
+    _WORKER = CorpusRenderer(use_case_factory)
+
+
+def _render_in_worker(batch_id: int, items: List[Tuple[int, str]], langs: List[str]) -> BatchResult:
+    assert _WORKER is not None, "worker not initialised"
+    return _WORKER.render(batch_id, items, langs)
+
+
+class _InlineExecutor:
+    """Executor stand-in for --workers 0: renders synchronously in-process."""
+
+    def __init__(self, renderer: CorpusRenderer) -> None:
+        self.renderer = renderer
+
+    def submit(self, fn: Callable[..., BatchResult], *args: Any) -> "Future[BatchResult]":
+        future: "Future[BatchResult]" = Future()
+        try:
+            future.set_result(self.renderer.render(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        self.renderer.close()
+
+
+# -----------------------------------------------------------------------------
+# Main side: input, output shards, checkpoints
+# -----------------------------------------------------------------------------
+
+
+def _open_text(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def iter_records(path: Path, *, start_seq: int = 0) -> Iterator[Tuple[int, str]]:
+    """Yield (seq, line) for every non-blank input line with seq >= start_seq."""
+    seq = 0
+    with _open_text(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if seq >= start_seq:
+                yield seq, line
+            seq += 1
+
+
+class ShardWriter:
+    def __init__(self, out_dir: Path, langs: List[str], shard_size: int) -> None:
+        self.out_dir = out_dir
+        self.langs = langs
+        self.shard_size = shard_size
+        self._open: Dict[str, Tuple[int, IO[str]]] = {}
+
+    def shard_path(self, lang: str, shard: int) -> Path:
+        return self.out_dir / lang / f"part-{shard:05d}.ndjson"
+
+    def _handle(self, lang: str, shard: int) -> IO[str]:
+        current = self._open.get(lang)
+        if current is not None and current[0] == shard:
+            return current[1]
+        if current is not None:
+            current[1].close()
+        path = self.shard_path(lang, shard)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fh = path.open("a", encoding="utf-8")
+        self._open[lang] = (shard, fh)
+        return fh
+
+    def write_batch(self, result: BatchResult) -> int:
+        written = 0
+        for lang in self.langs:
+            for seq, line in result.lines.get(lang, ()):
+                self._handle(lang, seq // self.shard_size).write(line + "\n")
+                written += 1
+        return written
+
+    def flush(self, *, fsync: bool = False) -> None:
+        for _, fh in self._open.values():
+            fh.flush()
+            if fsync:
+                os.fsync(fh.fileno())
+
+    def close(self) -> None:
+        for _, fh in self._open.values():
+            fh.close()
+        self._open.clear()
+
+    def offsets(self, next_seq: int) -> Dict[str, int]:
+        """Byte size of each language's shard that `next_seq` falls into."""
+        shard = next_seq // self.shard_size
+        out: Dict[str, int] = {}
+        for lang in self.langs:
+            path = self.shard_path(lang, shard)
+            out[lang] = path.stat().st_size if path.exists() else 0
+        return out
+
+    def rewind(self, next_seq: int, offsets: Dict[str, int]) -> None:
+        """Drop output written after the checkpoint that produced (next_seq, offsets)."""
+        shard = next_seq // self.shard_size
+        for lang in self.langs:
+            lang_dir = self.out_dir / lang
+            if not lang_dir.is_dir():
+                continue
+            for path in lang_dir.glob("part-*.ndjson"):
+                try:
+                    idx = int(path.stem.split("-", 1)[1])
+                except (IndexError, ValueError):
+                    continue
+                if idx > shard:
+                    path.unlink()
+            current = self.shard_path(lang, shard)
+            if current.exists():
+                with current.open("rb+") as f:
+                    f.truncate(int(offsets.get(lang, 0)))
+
+
+def _checkpoint_identity(args: argparse.Namespace, langs: List[str]) -> Dict[str, Any]:
+    return {
+        "version": CHECKPOINT_VERSION,
+        "input": str(Path(args.input).resolve()),
+        "langs": langs,
+        "shard_size": args.shard_size,
+    }
+
+
+def load_checkpoint(out_dir: Path) -> Optional[Dict[str, Any]]:
+    path = out_dir / CHECKPOINT_FILENAME
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_checkpoint(out_dir: Path, data: Dict[str, Any]) -> None:
+    path = out_dir / CHECKPOINT_FILENAME
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _batches(records: Iterator[Tuple[int, str]], size: int, counters: StageCounters) -> Iterator[List[Tuple[int, str]]]:
+    batch: List[Tuple[int, str]] = []
+    started = time.perf_counter()
+    for item in records:
+        batch.append(item)
+        if len(batch) >= size:
+            counters.add("read", len(batch), time.perf_counter() - started)
+            yield batch
+            batch = []
+            started = time.perf_counter()
+    if batch:
+        counters.add("read", len(batch), time.perf_counter() - started)
+        yield batch
+
+
+# -----------------------------------------------------------------------------
+# Pipeline
+# -----------------------------------------------------------------------------
+
+
+def run(args: argparse.Namespace, *, use_case_factory: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """
+    Execute the pipeline described by `args` and return a summary dict.
+
+    `use_case_factory` replaces the container-built GenerateText. With a
+    process pool it is passed to every worker's initializer, so it must be
+    picklable (a module-level callable).
+    """
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    langs = [normalize_lang_code(lang) for lang in args.langs]
+    identity = _checkpoint_identity(args, langs)
+
+    writer = ShardWriter(out_dir, langs, args.shard_size)
+    counters = StageCounters()
+    next_seq = 0
+    errors = 0
+    outputs = 0
+
+    checkpoint = None if args.fresh else load_checkpoint(out_dir)
+    if checkpoint is not None:
+        mismatched = {k: (checkpoint.get(k), v) for k, v in identity.items() if checkpoint.get(k) != v}
+        if mismatched:
+            raise SystemExit(
+                f"Checkpoint in {out_dir} was written with different arguments {mismatched}; "
+                "use --fresh to discard it."
+            )
+        next_seq = int(checkpoint.get("next_seq", 0))
+        errors = int(checkpoint.get("errors", 0))
+        outputs = int(checkpoint.get("outputs", 0))
+        writer.rewind(next_seq, checkpoint.get("offsets") or {})
+        log.stage("resume", f"Resuming at record {next_seq}")
+    elif args.fresh:
+        writer.rewind(0, {})
+        (out_dir / CHECKPOINT_FILENAME).unlink(missing_ok=True)
+
+    resumed_from = next_seq
+
+    if args.workers <= 0:
+        executor: Any = _InlineExecutor(CorpusRenderer(use_case_factory or _default_use_case_factory))
+        submit = lambda batch_id, items: executor.submit(None, batch_id, items, langs)  # noqa: E731
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(args.verbose, use_case_factory or _default_use_case_factory),
+        )
+        submit = lambda batch_id, items: executor.submit(_render_in_worker, batch_id, items, langs)  # noqa: E731
+
+    max_inflight = max(1, args.max_inflight or (2 * max(1, args.workers)))
+    pending: Dict[int, "Future[BatchResult]"] = {}
+    ready: Dict[int, BatchResult] = {}
+    next_write = 0
+    batches_since_checkpoint = 0
+    started = time.perf_counter()
+    last_progress = started
+    aborted: Optional[str] = None
+
+    def checkpoint_now() -> None:
+        writer.flush(fsync=args.fsync)
+        save_checkpoint(
+            out_dir,
+            {
+                **identity,
+                "next_seq": next_seq,
+                "offsets": writer.offsets(next_seq),
+                "errors": errors,
+                "outputs": outputs,
+                "updated_at": time.time(),
+            },
+        )
+
+    def drain(block: bool) -> None:
+        nonlocal next_write, next_seq, errors, outputs, batches_since_checkpoint, last_progress
+        if pending:
+            done, _ = wait(list(pending.values()), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            for batch_id in [b for b, fut in pending.items() if fut in done]:
+                ready[batch_id] = pending.pop(batch_id).result()
+
+        # Strict batch order keeps every shard in input order.
+        while next_write in ready:
+            result = ready.pop(next_write)
+            t0 = time.perf_counter()
+            outputs += writer.write_batch(result)
+            counters.add("write", sum(len(v) for v in result.lines.values()), time.perf_counter() - t0)
+            counters.merge(result.counters)
+            errors += result.errors
+            next_seq = result.last_seq + 1
+            next_write += 1
+            batches_since_checkpoint += 1
+            if batches_since_checkpoint >= args.checkpoint_every:
+                checkpoint_now()
+                batches_since_checkpoint = 0
+
+        now = time.perf_counter()
+        if args.progress_every and now - last_progress >= args.progress_every:
+            last_progress = now
+            rate = (next_seq - resumed_from) / (now - started) if now > started else 0.0
+            log.stage("progress", f"records={next_seq} outputs={outputs} errors={errors} ({rate:.1f} records/s)")
+
+    try:
+        batch_id = 0
+        for items in _batches(iter_records(Path(args.input), start_seq=next_seq), args.batch_size, counters):
+            if args.limit and items[0][0] >= args.limit:
+                break
+            if args.limit:
+                items = [it for it in items if it[0] < args.limit]
+            while len(pending) + len(ready) >= max_inflight:
+                drain(block=True)
+            pending[batch_id] = submit(batch_id, items)
+            batch_id += 1
+            drain(block=False)
+
+        while pending or ready:
+            drain(block=True)
+            if ready and not pending and next_write not in ready:  # pragma: no cover - defensive
+                raise RuntimeError(f"batch {next_write} missing from results")
+    except KeyboardInterrupt:
+        aborted = "interrupted"
+    except Exception as e:
+        aborted = f"{type(e).__name__}: {e}"
+    finally:
+        executor.shutdown(wait=aborted is None, cancel_futures=aborted is not None)
+        checkpoint_now()
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    processed = next_seq - resumed_from
+    return {
+        "records": next_seq,
+        "processed_this_run": processed,
+        "outputs": outputs,
+        "errors": errors,
+        "elapsed_sec": round(elapsed, 3),
+        "records_per_sec": round(processed / elapsed, 1) if elapsed > 0 else 0.0,
+        "stages": counters.report(),
+        "aborted": aborted,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Render an NDJSON frame corpus into sharded NDJSON text.")
+    parser.add_argument("--input", required=True, help="NDJSON (or .ndjson.gz) file of AW / Ninai frames")
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--langs", nargs="+", required=True, help="Target language codes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (0 = inline)")
+    parser.add_argument("--batch-size", type=int, default=64, help="Records per worker task")
+    parser.add_argument("--max-inflight", type=int, default=0, help="Max batches submitted but not yet written (default 2 x workers)")
+    parser.add_argument("--shard-size", type=int, default=100_000, help="Records per output shard")
+    parser.add_argument("--checkpoint-every", type=int, default=16, help="Write a checkpoint every N batches")
+    parser.add_argument("--fsync", action="store_true", help="fsync shards before each checkpoint")
+    parser.add_argument("--fresh", action="store_true", help="Ignore and remove an existing checkpoint and output")
+    parser.add_argument("--limit", type=int, default=0, help="Stop after N input records (0 = all)")
+    parser.add_argument("--max-error-rate", type=float, default=1.0, help="Fail if errors / outputs exceeds this")
+    parser.add_argument("--progress-every", type=float, default=10.0, help="Seconds between progress lines (0 = off)")
+    parser.add_argument("--json-out", default=None, help="Optional path for the run summary as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Keep runtime info logs enabled")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    args.batch_size = max(1, args.batch_size)
+    args.shard_size = max(1, args.shard_size)
+    args.checkpoint_every = max(1, args.checkpoint_every)
+
+    if not args.verbose:
+        _quiet_runtime_logs()
+
+    log.header(
+        {
+            "Input": args.input,
+            "Out": args.out,
+            "Langs": ", ".join(args.langs),
+            "Workers": args.workers,
+            "Batch size": args.batch_size,
+            "Shard size": args.shard_size,
+        }
+    )
+
+    summary = run(args)
+
+    for stage, row in summary["stages"].items():
+        log.info(f"  {stage:<9} {row['items']:>10} items  {row['seconds']:>9.3f}s  {row['per_sec']:>10.1f}/s")
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    error_rate = summary["errors"] / summary["outputs"] if summary["outputs"] else 0.0
+    success = summary["aborted"] is None and error_rate <= args.max_error_rate
+    if summary["aborted"]:
+        log.error(f"Run aborted ({summary['aborted']}); re-run with the same arguments to resume.")
+    elif error_rate > args.max_error_rate:
+        log.error(f"Error rate {error_rate:.2%} exceeds --max-error-rate {args.max_error_rate:.2%}")
+
+    log.summary(
+        {
+            "Records": summary["records"],
+            "Outputs": summary["outputs"],
+            "Errors": summary["errors"],
+            "Records/s": summary["records_per_sec"],
+        },
+        success=success,
+    )
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())